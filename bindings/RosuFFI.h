@@ -85,6 +85,26 @@ typedef struct ownedstring ownedstring;
 
 typedef struct performance performance;
 
+typedef struct topplays topplays;
+
+typedef struct profileengine profileengine;
+
+typedef struct ratecurve ratecurve;
+
+typedef struct modsweep modsweep;
+
+typedef struct seekablegradual seekablegradual;
+
+typedef struct straintimeline straintimeline;
+
+typedef struct oszarchive oszarchive;
+
+typedef struct beatmaploader beatmaploader;
+
+typedef struct attributestore attributestore;
+
+typedef struct difficultybatch difficultybatch;
+
 typedef enum ffierror
     {
     FFIERROR_OK = 0,
@@ -95,9 +115,86 @@ typedef enum ffierror
     FFIERROR_INVALIDSTRING = 500,
     FFIERROR_SERIALIZEERROR = 600,
     FFIERROR_CONVERTERROR = 700,
+    FFIERROR_INVALIDLENGTH = 800,
+    FFIERROR_ARCHIVEERROR = 900,
     FFIERROR_UNKNOWN = 1000,
     } ffierror;
 
+/// A strain skill of any mode.
+typedef enum skill
+    {
+    /// osu!standard
+    SKILL_AIM = 0,
+    /// osu!standard
+    SKILL_JUMPAIM = 1,
+    /// osu!standard
+    SKILL_FLOWAIM = 2,
+    /// osu!standard
+    SKILL_PRECISION = 3,
+    /// osu!standard
+    SKILL_SPEED = 4,
+    /// osu!standard and osu!taiko
+    SKILL_STAMINA = 5,
+    /// osu!taiko
+    SKILL_COLOR = 6,
+    /// osu!taiko
+    SKILL_RHYTHM = 7,
+    /// osu!catch
+    SKILL_MOVEMENT = 8,
+    /// osu!mania
+    SKILL_STRAIN = 9,
+    } skill;
+
+/// Result of a single hit object, named after osu!lazer's hit results.
+typedef enum judgement
+    {
+    JUDGEMENT_MISS = 0,
+    /// 50
+    JUDGEMENT_MEH = 1,
+    /// 100
+    JUDGEMENT_OK = 2,
+    /// 200 in osu!mania
+    JUDGEMENT_GOOD = 3,
+    /// 300, or a fruit in osu!catch
+    JUDGEMENT_GREAT = 4,
+    /// 320 in osu!mania
+    JUDGEMENT_PERFECT = 5,
+    /// Droplet in osu!catch
+    JUDGEMENT_LARGETICKHIT = 6,
+    /// Tiny droplet in osu!catch
+    JUDGEMENT_SMALLTICKHIT = 7,
+    /// Missed tiny droplet in osu!catch
+    JUDGEMENT_SMALLTICKMISS = 8,
+    } judgement;
+
+/// Flags of [`ScoreParams::set`], one per field of [`ScoreParams`].
+typedef enum scoreparam
+    {
+    SCOREPARAM_MODE = 1,
+    SCOREPARAM_MODS = 2,
+    SCOREPARAM_PASSEDOBJECTS = 4,
+    SCOREPARAM_CLOCKRATE = 8,
+    SCOREPARAM_AR = 16,
+    SCOREPARAM_CS = 32,
+    SCOREPARAM_HP = 64,
+    SCOREPARAM_OD = 128,
+    SCOREPARAM_HARDROCKOFFSETS = 256,
+    SCOREPARAM_ACCURACY = 512,
+    SCOREPARAM_MISSES = 1024,
+    SCOREPARAM_COMBO = 2048,
+    SCOREPARAM_HITRESULTPRIORITY = 4096,
+    SCOREPARAM_LAZER = 8192,
+    SCOREPARAM_LARGETICKHITS = 16384,
+    SCOREPARAM_SMALLTICKHITS = 32768,
+    SCOREPARAM_SLIDERENDHITS = 65536,
+    SCOREPARAM_N300 = 131072,
+    SCOREPARAM_N100 = 262144,
+    SCOREPARAM_N50 = 524288,
+    SCOREPARAM_NKATU = 1048576,
+    SCOREPARAM_NGEKI = 2097152,
+    SCOREPARAM_STATE = 4194304,
+    } scoreparam;
+
 /// The result of a difficulty calculation on an osu!catch map.
 typedef struct catchdifficultyattributes
     {
@@ -392,6 +489,63 @@ typedef struct sliceu8
     uint64_t len;
     } sliceu8;
 
+///A pointer to an array of data someone else owns which may not be modified.
+typedef struct sliceu32
+    {
+    ///Pointer to start of immutable data.
+    const uint32_t* data;
+    ///Number of elements.
+    uint64_t len;
+    } sliceu32;
+
+///A pointer to an array of data someone else owns which may be modified.
+typedef struct slicemutf64
+    {
+    ///Pointer to start of mutable data.
+    double* data;
+    ///Number of elements.
+    uint64_t len;
+    } slicemutf64;
+
+/// Score statistics for [`Performance::calculate_batch`], one row per score.
+///
+/// Every column is optional: empty columns are left unset, non-empty columns
+/// must have exactly one element per row.
+typedef struct scorecolumns
+    {
+    sliceu32 n300;
+    sliceu32 n100;
+    sliceu32 n50;
+    sliceu32 n_katu;
+    sliceu32 n_geki;
+    sliceu32 misses;
+    sliceu32 max_combo;
+    sliceu32 large_tick_hits;
+    sliceu32 slider_end_hits;
+    /// Legacy mod bits, overriding the mods of the [`Performance`] per row.
+    sliceu32 mods;
+    } scorecolumns;
+
+/// Output columns for [`Performance::calculate_batch`] and
+/// [`Performance::calculate_grid`].
+///
+/// `pp` decides the amount of rows. Every other column may be left empty,
+/// otherwise it must be as long as `pp`. Components that do not exist for
+/// the map's mode are written as `0.0`.
+typedef struct performancecolumns
+    {
+    slicemutf64 pp;
+    slicemutf64 pp_aim;
+    slicemutf64 pp_jump_aim;
+    slicemutf64 pp_flow_aim;
+    slicemutf64 pp_precision;
+    slicemutf64 pp_speed;
+    slicemutf64 pp_stamina;
+    slicemutf64 pp_acc;
+    slicemutf64 pp_difficulty;
+    slicemutf64 effective_miss_count;
+    } performancecolumns;
+
 ///Option type containing boolean flag and maybe valid data.
 typedef struct optioncatchdifficultyattributes
     {
@@ -533,6 +687,320 @@ typedef struct optionperformanceattributes
     uint8_t is_some;
     } optionperformanceattributes;
 
+/// Everything a [`performance::Performance`] can be configured with, as a
+/// single plain struct that is passed by pointer instead of through one call
+/// per setter.
+///
+/// Only fields whose [`ScoreParam`] is in `set` are used. The others must
+/// still hold valid values since the struct is read as a whole, i.e. `mode`,
+/// `hitresult_priority` and the enums in `state` must be one of their
+/// variants and every `bool` must be `0` or `1`. A zero-initialized struct
+/// is valid.
+typedef struct scoreparams
+    {
+    /// Bitwise OR of the [`ScoreParam`]s of all used fields.
+    uint32_t set;
+    mode mode;
+    /// Legacy mod bits.
+    uint32_t mods;
+    uint32_t passed_objects;
+    double clock_rate;
+    float ar;
+    float cs;
+    float hp;
+    float od;
+    bool hardrock_offsets;
+    double accuracy;
+    uint32_t misses;
+    uint32_t combo;
+    hitresultpriority hitresult_priority;
+    bool lazer;
+    uint32_t large_tick_hits;
+    uint32_t small_tick_hits;
+    uint32_t slider_end_hits;
+    uint32_t n300;
+    uint32_t n100;
+    uint32_t n50;
+    uint32_t n_katu;
+    uint32_t n_geki;
+    scorestate state;
+    } scoreparams;
+
+/// A single play to score with a [`ProfileEngine`].
+typedef struct profilescore
+    {
+    uint64_t user_id;
+    /// Key the beatmap was added to the [`ProfileEngine`] with.
+    uint64_t beatmap;
+    /// Legacy mod bits.
+    uint32_t mods;
+    bool lazer;
+    scorestate state;
+    } profilescore;
+
+/// Weighted totals of a single user, see [`ProfileEngine::totals`].
+///
+/// Every skill is weighted on its own, i.e. plays are sorted by that
+/// skill's pp before the weights are applied, like on pp+ profiles.
+typedef struct profiletotal
+    {
+    uint64_t user_id;
+    /// Weighted pp of all plays including [`ProfileTotal::bonus_pp`].
+    double pp;
+    /// Bonus pp for the amount of beatmaps the user has a play on.
+    double bonus_pp;
+    double pp_aim;
+    double pp_jump_aim;
+    double pp_flow_aim;
+    double pp_precision;
+    double pp_speed;
+    double pp_stamina;
+    double pp_acc;
+    /// Amount of beatmaps that count towards the totals.
+    uint32_t plays;
+    /// Amount of plays that were skipped because their beatmap was never
+    /// added or failed to parse.
+    uint32_t failed;
+    } profiletotal;
+
+///A pointer to an array of data someone else owns which may not be modified.
+typedef struct sliceprofilescore
+    {
+    ///Pointer to start of immutable data.
+    const profilescore* data;
+    ///Number of elements.
+    uint64_t len;
+    } sliceprofilescore;
+
+///A pointer to an array of data someone else owns which may be modified.
+typedef struct slicemutprofiletotal
+    {
+    ///Pointer to start of mutable data.
+    profiletotal* data;
+    ///Number of elements.
+    uint64_t len;
+    } slicemutprofiletotal;
+
+/// Result of [`performance_min_accuracy`] and [`performance_max_misses`].
+typedef struct pptarget
+    {
+    /// Whether the target pp can be reached at all with the given settings.
+    ///
+    /// If not, the other fields describe the best possible score instead.
+    bool reachable;
+    /// Accuracy of `state` in percent, as calculated for the given origin.
+    double accuracy;
+    uint32_t misses;
+    /// pp of the resulting score, at least the target if reachable.
+    double pp;
+    /// Hit results of the resulting score.
+    scorestate state;
+    } pptarget;
+
+///A pointer to an array of data someone else owns which may not be modified.
+typedef struct slicef64
+    {
+    ///Pointer to start of immutable data.
+    const double* data;
+    ///Number of elements.
+    uint64_t len;
+    } slicef64;
+
+/// Star rating at a clock rate, see [`RateCurve::estimate`].
+typedef struct rateestimate
+    {
+    double clock_rate;
+    double stars;
+    /// Estimated upper bound of the interpolation error in stars.
+    ///
+    /// `0` if `clock_rate` is a grid point.
+    double error_bound;
+    } rateestimate;
+
+///Option type containing boolean flag and maybe valid data.
+typedef struct optionrateestimate
+    {
+    ///Element that is maybe valid.
+    rateestimate t;
+    ///Byte where `1` means element `t` is valid.
+    uint8_t is_some;
+    } optionrateestimate;
+
+///A pointer to an array of data someone else owns which may be modified.
+typedef struct slicemutbeatmapattributes
+    {
+    ///Pointer to start of mutable data.
+    beatmapattributes* data;
+    ///Number of elements.
+    uint64_t len;
+    } slicemutbeatmapattributes;
+
+/// A stretch of consecutive strain sections, see [`StrainTimeline::hardest_windows`].
+typedef struct strainwindow
+    {
+    /// Index of the first section.
+    uint32_t section;
+    /// Start of the first section in milliseconds of map time.
+    double start_time;
+    /// End of the last section in milliseconds of map time.
+    double end_time;
+    /// Mean strain peak of the sections.
+    double strain;
+    } strainwindow;
+
+///A pointer to an array of data someone else owns which may be modified.
+typedef struct slicemutstrainwindow
+    {
+    ///Pointer to start of mutable data.
+    strainwindow* data;
+    ///Number of elements.
+    uint64_t len;
+    } slicemutstrainwindow;
+
+///A pointer to an array of data someone else owns which may be modified.
+typedef struct slicemutf32
+    {
+    ///Pointer to start of mutable data.
+    float* data;
+    ///Number of elements.
+    uint64_t len;
+    } slicemutf32;
+
+///A pointer to an array of data someone else owns which may be modified.
+typedef struct slicemutu32
+    {
+    ///Pointer to start of mutable data.
+    uint32_t* data;
+    ///Number of elements.
+    uint64_t len;
+    } slicemutu32;
+
+/// Output columns for [`Beatmap::hit_object_columns`].
+///
+/// Every column may be left empty, otherwise it must hold one element per
+/// hit object. `kind` holds [`HitObjectKind`] values. `expected_dist` is NaN
+/// for objects without one and `repeats` is `0` for anything but sliders.
+/// `duration` is `end_time - start_time`: `0` for circles, the time until
+/// the tail for sliders and the length of spinners and holds.
+/// `duration` and `end_time` are NaN for sliders without an expected distance.
+///
+/// [`Beatmap::hit_object_columns`]: super::Beatmap::hit_object_columns
+typedef struct hitobjectcolumns
+    {
+    slicemutf64 start_time;
+    slicemutf32 x;
+    slicemutf32 y;
+    slicemutu32 kind;
+    slicemutu32 repeats;
+    slicemutf64 expected_dist;
+    slicemutf64 duration;
+    slicemutf64 end_time;
+    } hitobjectcolumns;
+
+/// Output columns for [`GradualDifficulty::collect`].
+///
+/// `stars` decides the amount of processed objects and may not exceed
+/// [`GradualDifficulty::len`]. Every other column may be left empty,
+/// otherwise it must be as long as `stars`. Values that do not exist for
+/// the map's mode are written as `0`.
+typedef struct gradualdifficultycolumns
+    {
+    slicemutf64 stars;
+    slicemutf64 aim;
+    slicemutf64 jump;
+    slicemutf64 flow;
+    slicemutf64 precision;
+    slicemutf64 speed;
+    slicemutf64 stamina;
+    slicemutf64 accuracy;
+    slicemutf64 rhythm;
+    slicemutf64 color;
+    slicemutu32 max_combo;
+    } gradualdifficultycolumns;
+
+/// Judgement of a hit object for [`GradualPerformance::replay`].
+///
+/// The tick and slider end fields are only relevant for osu!standard
+/// scores set on osu!lazer, see [`ScoreState`] for their meaning.
+typedef struct objectjudgement
+    {
+    judgement result;
+    uint32_t large_tick_hits;
+    uint32_t large_tick_misses;
+    uint32_t small_tick_hits;
+    bool slider_end_hit;
+    } objectjudgement;
+
+///A pointer to an array of data someone else owns which may not be modified.
+typedef struct sliceobjectjudgement
+    {
+    ///Pointer to start of immutable data.
+    const objectjudgement* data;
+    ///Number of elements.
+    uint64_t len;
+    } sliceobjectjudgement;
+
+/// Outcome of loading a single file of a [`BeatmapLoader`] or a single
+/// beatmap of a `DifficultyBatch`.
+typedef struct loadresult
+    {
+    /// [`FFIError::Ok`] if the file was parsed, otherwise why it wasn't.
+    ffierror error;
+    /// Time spent reading and parsing the file in milliseconds, for a
+    /// `DifficultyBatch` including the calculation.
+    double millis;
+    } loadresult;
+
+///A pointer to an array of data someone else owns which may be modified.
+typedef struct slicemutloadresult
+    {
+    ///Pointer to start of mutable data.
+    loadresult* data;
+    ///Number of elements.
+    uint64_t len;
+    } slicemutloadresult;
+
+/// Counters of the parsed beatmap cache.
+typedef struct beatmapcachestats
+    {
+    /// Lookups that were answered from the cache.
+    uint64_t hits;
+    /// Lookups that had to parse the beatmap.
+    uint64_t misses;
+    /// Entries that were dropped to make room for new ones.
+    uint64_t evictions;
+    /// Size of the `.osu` content of all cached beatmaps.
+    uint64_t bytes;
+    /// Maximum of `bytes`, `0` if caching is disabled.
+    uint64_t capacity;
+    /// Amount of cached beatmaps.
+    uint32_t len;
+    } beatmapcachestats;
+
+/// Counters of the difficulty attribute cache.
+typedef struct difficultycachestats
+    {
+    /// Lookups that were answered from the cache.
+    uint64_t hits;
+    /// Lookups that had to calculate the attributes.
+    uint64_t misses;
+    /// Entries that were dropped to make room for new ones.
+    uint64_t evictions;
+    /// Amount of cached entries.
+    uint32_t len;
+    /// Maximum amount of cached entries, `0` if caching is disabled.
+    uint32_t capacity;
+    } difficultycachestats;
+
+///A pointer to an array of data someone else owns which may be modified.
+typedef struct slicemutdifficultyattributes
+    {
+    ///Pointer to start of mutable data.
+    difficultyattributes* data;
+    ///Number of elements.
+    uint64_t len;
+    } slicemutdifficultyattributes;
+
 
 /// Destroys the given instance.
 ///
@@ -562,7 +1030,7 @@ void beatmap_attributes_hp(beatmapattributesbuilder* context, float hp);
 
 void beatmap_attributes_od(beatmapattributesbuilder* context, float od);
 
-double beatmap_attributes_get_clock_rate(beatmapattributesbuilder* context);
+double beatmap_attributes_get_clock_rate(const beatmapattributesbuilder* context);
 
 beatmapattributes beatmap_attributes_build(const beatmapattributesbuilder* context, const beatmap* beatmap);
 
@@ -578,34 +1046,75 @@ ffierror beatmap_from_bytes(beatmap** context, sliceu8 data);
 
 ffierror beatmap_from_path(beatmap** context, const char* path);
 
+/// Like [`Beatmap::from_path`] but parses straight from a memory mapping
+/// of the file instead of reading it into a buffer first.
+///
+/// The file must not be truncated while it is being parsed.
+ffierror beatmap_from_path_mmap(beatmap** context, const char* path);
+
+/// Like [`Beatmap::from_bytes`] but shares the parsed beatmap with
+/// earlier calls for the same content, see [`beatmap_cache_stats`].
+///
+/// [`beatmap_cache_stats`]: cache::beatmap_cache_stats
+ffierror beatmap_from_bytes_cached(beatmap** context, sliceu8 data);
+
+/// Like [`Beatmap::from_path`] but shares the parsed beatmap with
+/// earlier calls for the same content, see [`beatmap_cache_stats`].
+///
+/// [`beatmap_cache_stats`]: cache::beatmap_cache_stats
+ffierror beatmap_from_path_cached(beatmap** context, const char* path);
+
+/// Move the `index`th beatmap out of a loader after [`BeatmapLoader::load`].
+///
+/// Fails with [`FFIError::Null`] if that file failed to load or was
+/// already taken.
+///
+/// [`BeatmapLoader::load`]: loader::BeatmapLoader::load
+ffierror beatmap_from_loader(beatmap** context, beatmaploader* loader, uint32_t index);
+
+/// Decompress and parse the `index`th `.osu` entry of an archive.
+ffierror beatmap_from_archive(beatmap** context, oszarchive* archive, uint32_t index);
+
 ffierror beatmap_from_clone(beatmap** context, const beatmap* beatmap);
 
 /// Convert a Beatmap to the specified mode
 bool beatmap_convert(beatmap* context, mode mode, const mods* mods);
 
-double beatmap_bpm(beatmap* context);
+/// MD5 of the `.osu` content as lowercase hex, as used by osu! itself.
+void beatmap_md5(const beatmap* context, ownedstring* str);
 
-double beatmap_total_break_time(beatmap* context);
+/// Export every hit object into parallel arrays in a single call, see
+/// [`HitObjectColumns`].
+///
+/// [`HitObjectColumns`]: hitobjects::HitObjectColumns
+ffierror beatmap_hit_object_columns(const beatmap* context, hitobjectcolumns out);
 
-int32_t beatmap_version(beatmap* context);
+/// Amount of hit objects.
+uint32_t beatmap_n_hit_objects(const beatmap* context);
 
-bool beatmap_is_convert(beatmap* context);
+double beatmap_bpm(const beatmap* context);
 
-float beatmap_stack_leniency(beatmap* context);
+double beatmap_total_break_time(const beatmap* context);
 
-mode beatmap_mode(beatmap* context);
+int32_t beatmap_version(const beatmap* context);
 
-float beatmap_ar(beatmap* context);
+bool beatmap_is_convert(const beatmap* context);
 
-float beatmap_cs(beatmap* context);
+float beatmap_stack_leniency(const beatmap* context);
 
-float beatmap_hp(beatmap* context);
+mode beatmap_mode(const beatmap* context);
 
-float beatmap_od(beatmap* context);
+float beatmap_ar(const beatmap* context);
 
-double beatmap_slider_multiplier(beatmap* context);
+float beatmap_cs(const beatmap* context);
 
-double beatmap_slider_tick_rate(beatmap* context);
+float beatmap_hp(const beatmap* context);
+
+float beatmap_od(const beatmap* context);
+
+double beatmap_slider_multiplier(const beatmap* context);
+
+double beatmap_slider_tick_rate(const beatmap* context);
 
 /// Check whether hitobjects appear too suspicious for further calculation.
 ///
@@ -613,7 +1122,7 @@ double beatmap_slider_tick_rate(beatmap* context);
 /// the limits of osu! itself. Difficulty- and/or performance calculation
 /// should likely be avoided on these maps due to potential performance
 /// issues.
-optiontoosuspicious beatmap_check_suspicion(beatmap* context);
+optiontoosuspicious beatmap_check_suspicion(const beatmap* context);
 
 /// Destroys the given instance.
 ///
@@ -625,9 +1134,9 @@ ffierror hitobjects_destroy(hitobjects** context);
 
 ffierror hitobjects_new(hitobjects** context, const beatmap* beatmap);
 
-uint32_t hitobjects_len(hitobjects* context);
+uint32_t hitobjects_len(const hitobjects* context);
 
-optionhitobject hitobjects_get(hitobjects* context, uint32_t index);
+optionhitobject hitobjects_get(const hitobjects* context, uint32_t index);
 
 optionhitobject hitobjects_next(hitobjects* context);
 
@@ -669,7 +1178,7 @@ void difficulty_lazer(difficulty* context, bool lazer);
 
 difficultyattributes difficulty_calculate(const difficulty* context, const beatmap* beatmap);
 
-double difficulty_get_clock_rate(difficulty* context);
+double difficulty_get_clock_rate(const difficulty* context);
 
 /// Destroys the given instance.
 ///
@@ -739,7 +1248,27 @@ performanceattributes performance_calculate(const performance* context, const be
 
 performanceattributes performance_calculate_from_difficulty(const performance* context, difficultyattributes difficulty_attr);
 
-double performance_get_clock_rate(performance* context);
+/// Calculate the performance of many scores on the same difficulty
+/// attributes in one call.
+///
+/// Each row of `scores` is applied on top of this [`Performance`] and the
+/// results are written into the matching row of `out`.
+ffierror performance_calculate_batch(const performance* context, const difficultyattributes* difficulty_attr, scorecolumns scores, performancecolumns out);
+
+/// Calculate the performance for every combination of accuracy and
+/// miss count on the same difficulty attributes in one call.
+///
+/// `accuracies` are in percent, i.e. between `0` and `100`. Every cell is
+/// this [`Performance`] with the cell's accuracy and misses set, so hit
+/// results are generated just like for a single calculation. `combos` is either
+/// empty, which means the best possible combo, or holds one combo per
+/// entry of `misses`.
+///
+/// The result for `accuracies[i]` and `misses[j]` is written into row
+/// `i * misses.len() + j` of `out`, which must hold that many rows.
+ffierror performance_calculate_grid(const performance* context, const difficultyattributes* difficulty_attr, slicef64 accuracies, sliceu32 misses, sliceu32 combos, performancecolumns out);
+
+double performance_get_clock_rate(const performance* context);
 
 /// Destroys the given instance.
 ///
@@ -761,6 +1290,10 @@ optiondifficultyattributes gradual_difficulty_nth(gradualdifficulty* context, ui
 
 uint32_t gradual_difficulty_len(const gradualdifficulty* context);
 
+/// Process the next `out.stars.len()` hit objects and write the
+/// attributes after each of them into `out`, see [`GradualDifficultyColumns`].
+ffierror gradual_difficulty_collect(gradualdifficulty* context, gradualdifficultycolumns out);
+
 /// Destroys the given instance.
 ///
 /// # Safety
@@ -793,6 +1326,404 @@ optionperformanceattributes gradual_performance_nth(gradualperformance* context,
 /// Returns the amount of remaining objects.
 uint32_t gradual_performance_len(const gradualperformance* context);
 
+/// Process the next `judgements.len()` hit objects, one judgement each,
+/// and write the pp after each of them into `pp`.
+///
+/// The score state and combo are accumulated natively across calls,
+/// starting from an empty score. `pp` must be exactly as long as
+/// `judgements` and `judgements` may not exceed [`GradualPerformance::len`].
+ffierror gradual_performance_replay(gradualperformance* context, sliceobjectjudgement judgements, slicemutf64 pp);
+
+/// Returns the score state accumulated by [`GradualPerformance::replay`].
+scorestate gradual_performance_replay_state(const gradualperformance* context);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror difficulty_batch_destroy(difficultybatch** context);
+
+ffierror difficulty_batch_new(difficultybatch** context);
+
+void difficulty_batch_add_beatmap(difficultybatch* context, const beatmap* beatmap);
+
+/// Add a beatmap by path. It is parsed on the thread pool during [`DifficultyBatch::calculate`].
+ffierror difficulty_batch_add_path(difficultybatch* context, const char* path);
+
+void difficulty_batch_add_difficulty(difficultybatch* context, const difficulty* difficulty);
+
+/// Amount of worker threads, `0` uses the global pool with one thread per logical core.
+void difficulty_batch_threads(difficultybatch* context, uint32_t threads);
+
+/// Amount of results, i.e. beatmaps times difficulties.
+uint32_t difficulty_batch_len(const difficultybatch* context);
+
+/// Calculate every combination of beatmap and difficulty.
+///
+/// `out` must hold [`DifficultyBatch::len`] elements. The attributes of
+/// the `i`th beatmap with the `j`th difficulty are written to
+/// `out[i * difficulties + j]`.
+///
+/// `results` must hold one element per added beatmap. A beatmap that
+/// fails to load only sets the error of its own [`LoadResult`] and leaves
+/// its attributes at their default, the others are still calculated.
+ffierror difficulty_batch_calculate(const difficultybatch* context, slicemutdifficultyattributes out, slicemutloadresult results);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror attribute_store_destroy(attributestore** context);
+
+/// Open the store at `path` for reading and appending, creating it if it doesn't exist.
+ffierror attribute_store_open(attributestore** context, const char* path);
+
+/// Open an existing store at `path` for reading only.
+ffierror attribute_store_open_read_only(attributestore** context, const char* path);
+
+/// Look up the attributes of a key.
+///
+/// Returns a pointer into the mapped file or null if the key is unknown.
+/// The pointer stays valid until the store is destroyed.
+const difficultyattributes* attribute_store_get(const attributestore* context, uint64_t beatmap, uint32_t mods, double clock_rate, bool lazer);
+
+/// Append the attributes of a key to the file.
+ffierror attribute_store_insert(attributestore* context, uint64_t beatmap, uint32_t mods, double clock_rate, bool lazer, const difficultyattributes* attributes);
+
+/// Map records appended since the last refresh and look up their keys.
+///
+/// If there are any, the file is mapped anew. The previous mapping is
+/// kept until the store is destroyed, so pointers returned by
+/// [`AttributeStore::get`] stay valid. A writable store also rewrites
+/// the index once enough records were appended after it.
+ffierror attribute_store_refresh(attributestore* context);
+
+/// Write the sorted key table of all records mapped so far to
+/// `<path>.index`, so opening the store doesn't need to read them.
+///
+/// The table is written to a temporary file first and then renamed, so
+/// other processes read either the old or the new index. Fails for
+/// read-only stores.
+ffierror attribute_store_write_index(attributestore* context);
+
+/// Amount of distinct keys.
+uint32_t attribute_store_len(const attributestore* context);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror beatmap_loader_destroy(beatmaploader** context);
+
+ffierror beatmap_loader_new(beatmaploader** context);
+
+ffierror beatmap_loader_add_path(beatmaploader* context, const char* path);
+
+/// Add every `.osu` file below `root`, including subdirectories, in
+/// lexicographic order.
+///
+/// Only fails if `root` can't be read, unreadable entries below it are skipped.
+ffierror beatmap_loader_add_directory(beatmaploader* context, const char* root);
+
+/// Amount of worker threads, `0` uses the global pool with one thread per logical core.
+void beatmap_loader_threads(beatmaploader* context, uint32_t threads);
+
+/// Amount of added files.
+uint32_t beatmap_loader_len(const beatmaploader* context);
+
+/// Path of the `index`th file.
+ffierror beatmap_loader_path(const beatmaploader* context, uint32_t index, ownedstring* str);
+
+/// Load all added files.
+///
+/// Fails only if the thread pool can't be created; errors of single
+/// files are reported by [`BeatmapLoader::results`].
+ffierror beatmap_loader_load(beatmaploader* context);
+
+/// Write the [`LoadResult`] of every file, in the order they were added.
+///
+/// `out` must hold [`BeatmapLoader::len`] elements.
+ffierror beatmap_loader_results(const beatmaploader* context, slicemutloadresult out);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror osz_archive_destroy(oszarchive** context);
+
+/// Open the archive at `path` through a memory mapping.
+ffierror osz_archive_from_path(oszarchive** context, const char* path);
+
+/// Open an archive held in memory. `data` is copied.
+ffierror osz_archive_from_bytes(oszarchive** context, sliceu8 data);
+
+/// Amount of `.osu` entries.
+uint32_t osz_archive_len(const oszarchive* context);
+
+/// File name of the `index`th `.osu` entry inside the archive.
+ffierror osz_archive_name(const oszarchive* context, uint32_t index, ownedstring* str);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror strain_timeline_destroy(straintimeline** context);
+
+ffierror strain_timeline_new(straintimeline** context, const difficulty* difficulty, const beatmap* beatmap);
+
+/// Amount of sections.
+uint32_t strain_timeline_len(const straintimeline* context);
+
+/// Length of a section in milliseconds of map time.
+double strain_timeline_section_len(const straintimeline* context);
+
+/// Whether the map's mode has the skill.
+bool strain_timeline_has(const straintimeline* context, skill skill);
+
+/// Write the start time of every section, `out` must hold
+/// [`StrainTimeline::len`] elements.
+ffierror strain_timeline_start_times(const straintimeline* context, slicemutf64 out);
+
+/// Write the peaks of a skill, `out` must hold [`StrainTimeline::len`]
+/// elements. Fails with [`FFIError::Null`] if the mode has no such skill.
+ffierror strain_timeline_peaks_of(const straintimeline* context, skill skill, slicemutf64 out);
+
+/// Find the hardest non-overlapping windows of `window` consecutive
+/// sections for a skill, hardest first.
+///
+/// Writes up to `out.len()` windows and returns how many were written.
+uint32_t strain_timeline_hardest_windows(const straintimeline* context, skill skill, uint32_t window, slicemutstrainwindow out);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror seekable_gradual_destroy(seekablegradual** context);
+
+/// Create a [`SeekableGradual`] for a map of any mode.
+ffierror seekable_gradual_new(seekablegradual** context, const difficulty* difficulty, const beatmap* beatmap);
+
+/// Create a [`SeekableGradual`] for a [`Beatmap`] on a specific [`GameMode`].
+ffierror seekable_gradual_new_with_mode(seekablegradual** context, const difficulty* difficulty, const beatmap* beatmap, mode mode);
+
+/// Create a copy of `other` at its current position and with its replayed
+/// score, which can then continue independently.
+///
+/// The first fork calculates the checkpoints of all remaining objects of
+/// `other` once; after that, forking is only a reference count increment
+/// and both share the checkpoints.
+ffierror seekable_gradual_fork(seekablegradual** context, seekablegradual* other);
+
+/// Keep the attributes after every `interval`th object as a checkpoint,
+/// `1` by default.
+///
+/// Larger intervals keep fewer attributes but seeking back to an object
+/// between checkpoints replays from the start of the map. Changing the
+/// interval drops the checkpoints kept so far, the position stays.
+/// `0` is treated as `1`.
+void seekable_gradual_checkpoint_interval(seekablegradual* context, uint32_t interval);
+
+/// Move to the state after processing the hit object at `index` and
+/// return the difficulty attributes at that point.
+///
+/// Only the position changes, the score of [`SeekableGradual::replay`]
+/// is kept as is.
+///
+/// Returns `None` and keeps the current position if `index` is out of range.
+optiondifficultyattributes seekable_gradual_seek(seekablegradual* context, uint32_t index);
+
+/// Move back to the state before any hit object was processed.
+void seekable_gradual_rewind(seekablegradual* context);
+
+/// Returns the amount of processed objects at the current position.
+uint32_t seekable_gradual_position(const seekablegradual* context);
+
+/// Returns the total amount of objects.
+uint32_t seekable_gradual_len(const seekablegradual* context);
+
+/// Difficulty attributes at the current position, `None` before the
+/// first object.
+optiondifficultyattributes seekable_gradual_difficulty(const seekablegradual* context);
+
+/// Performance attributes of `state` at the current position, `None`
+/// before the first object.
+optionperformanceattributes seekable_gradual_performance(const seekablegradual* context, scorestate state);
+
+/// Process the next `judgements.len()` hit objects after the current
+/// position, one judgement each, and write the pp after each of them
+/// into `pp`.
+///
+/// Works like [`GradualPerformance::replay`], the score is accumulated
+/// across calls and copied by [`SeekableGradual::fork`].
+ffierror seekable_gradual_replay(seekablegradual* context, sliceobjectjudgement judgements, slicemutf64 pp);
+
+/// Returns the score accumulated by [`SeekableGradual::replay`].
+scorestate seekable_gradual_replay_state(const seekablegradual* context);
+
+/// Evaluate many hypothetical continuations of the replayed score from
+/// the current position without moving it.
+///
+/// `judgements` holds the judgements of all branches back to back and
+/// `branch_lens` how many of them belong to each branch. The pp of the
+/// score at the end of every branch is written into `pp`, which must be
+/// as long as `branch_lens`. Branches are evaluated on the global thread pool.
+ffierror seekable_gradual_evaluate_branches(seekablegradual* context, sliceobjectjudgement judgements, sliceu32 branch_lens, slicemutf64 pp);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror mod_sweep_destroy(modsweep** context);
+
+ffierror mod_sweep_new(modsweep** context, const difficulty* base);
+
+/// Add a mod set by legacy bits.
+void mod_sweep_add_bits(modsweep* context, uint32_t bits, bool lazer);
+
+/// Add a mod set by acronyms, e.g. `"HDDT"`.
+ffierror mod_sweep_add_acronyms(modsweep* context, const char* str, bool lazer);
+
+/// Add a mod set including the mods' settings.
+void mod_sweep_add_mods(modsweep* context, const mods* mods, bool lazer);
+
+/// Amount of added mod sets.
+uint32_t mod_sweep_len(const modsweep* context);
+
+/// Calculate `beatmap` with every mod set in the order they were added.
+///
+/// `attributes` must hold [`ModSweep::len`] elements. `beatmap_attributes`
+/// is either empty or of the same length and then receives the
+/// [`BeatmapAttributes`] of every mod set, including its hit windows.
+ffierror mod_sweep_calculate(const modsweep* context, const beatmap* beatmap, slicemutdifficultyattributes attributes, slicemutbeatmapattributes beatmap_attributes);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror rate_curve_destroy(ratecurve** context);
+
+/// Calculate `steps` evenly spaced clock rates from `min_rate` to
+/// `max_rate`, both inclusive, with the other settings of `difficulty`.
+///
+/// Requires at least two steps and `min_rate < max_rate`.
+ffierror rate_curve_new(ratecurve** context, const difficulty* difficulty, const beatmap* beatmap, double min_rate, double max_rate, uint32_t steps);
+
+/// Amount of grid points.
+uint32_t rate_curve_len(const ratecurve* context);
+
+/// Clock rate of the `index`th grid point.
+double rate_curve_rate(const ratecurve* context, uint32_t index);
+
+/// Full difficulty attributes of the `index`th grid point.
+optiondifficultyattributes rate_curve_attributes(const ratecurve* context, uint32_t index);
+
+/// Write the clock rate and star rating of every grid point into `rates`
+/// and `stars`, both of which must hold [`RateCurve::len`] elements.
+ffierror rate_curve_grid(const ratecurve* context, slicemutf64 rates, slicemutf64 stars);
+
+/// Interpolate the star rating at `clock_rate`.
+///
+/// The error bound is derived from the curvature of the neighbouring grid
+/// points: linear interpolation is off by at most `h² / 8 * |f''|` for a
+/// grid spacing `h`, with `f''` estimated by second differences.
+///
+/// Returns `None` if `clock_rate` lies outside of the grid.
+optionrateestimate rate_curve_estimate(const ratecurve* context, double clock_rate);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror profile_engine_destroy(profileengine** context);
+
+ffierror profile_engine_new(profileengine** context);
+
+/// Add a parsed beatmap under `key`, replacing any beatmap previously
+/// added with the same key.
+void profile_engine_add_beatmap(profileengine* context, uint64_t key, const beatmap* beatmap);
+
+/// Add a beatmap by path under `key`. It is parsed on the thread pool
+/// during [`ProfileEngine::calculate`].
+ffierror profile_engine_add_path(profileengine* context, uint64_t key, const char* path);
+
+void profile_engine_add_scores(profileengine* context, sliceprofilescore scores);
+
+/// Amount of worker threads, `0` uses the global pool with one thread per logical core.
+void profile_engine_threads(profileengine* context, uint32_t threads);
+
+/// Amount of added scores.
+uint32_t profile_engine_len(const profileengine* context);
+
+/// Amount of distinct users of the last [`ProfileEngine::calculate`].
+uint32_t profile_engine_users(const profileengine* context);
+
+/// Score every added play and sum up the totals of every user.
+ffierror profile_engine_calculate(profileengine* context);
+
+/// Write the totals of every user, sorted by user id.
+///
+/// `out` must hold [`ProfileEngine::users`] elements.
+ffierror profile_engine_totals(const profileengine* context, slicemutprofiletotal out);
+
+/// Write the pp of every score in the order they were added, `NaN` for
+/// scores whose beatmap is missing.
+///
+/// `out` must hold [`ProfileEngine::len`] elements.
+ffierror profile_engine_score_pp(const profileengine* context, slicemutf64 out);
+
+/// Destroys the given instance.
+///
+/// # Safety
+///
+/// The passed parameter MUST have been created with the corresponding init function;
+/// passing any other value results in undefined behavior.
+ffierror top_plays_destroy(topplays** context);
+
+ffierror top_plays_new(topplays** context);
+
+/// Add a play on `beatmap`, replacing the current play on it if the new
+/// one is worth more pp.
+///
+/// Returns whether the top list changed.
+bool top_plays_insert(topplays* context, uint64_t beatmap, const performanceattributes* attributes);
+
+/// Same as [`TopPlays::insert`] for a play that is worth `pp`.
+bool top_plays_insert_pp(topplays* context, uint64_t beatmap, double pp);
+
+/// Remove the play on `beatmap`, returns whether there was one.
+bool top_plays_remove(topplays* context, uint64_t beatmap);
+
+/// Amount of plays, i.e. beatmaps with a play.
+uint32_t top_plays_len(const topplays* context);
+
+/// Weighted pp of all plays including bonus pp.
+double top_plays_total(const topplays* context);
+
+/// What [`TopPlays::total`] would be after [`TopPlays::insert`] with
+/// the same arguments, without changing the top list.
+double top_plays_total_after(const topplays* context, uint64_t beatmap, const performanceattributes* attributes);
+
+/// Same as [`TopPlays::total_after`] for a play that is worth `pp`.
+double top_plays_total_after_pp(const topplays* context, uint64_t beatmap, double pp);
+
 /// Destroys the given instance.
 ///
 /// # Safety
@@ -829,21 +1760,21 @@ void mods_remove_unknown_mods(mods* context);
 
 void mods_sanitize(mods* context);
 
-uint32_t mods_bits(mods* context);
+uint32_t mods_bits(const mods* context);
 
-uint32_t mods_len(mods* context);
+uint32_t mods_len(const mods* context);
 
-void mods_json(mods* context, ownedstring* str);
+void mods_json(const mods* context, ownedstring* str);
 
 bool mods_insert_json(mods* context, const char* str, bool deny_unknown_fields);
 
 bool mods_insert(mods* context, const char* str);
 
-bool mods_contains(mods* context, const char* str);
+bool mods_contains(const mods* context, const char* str);
 
 void mods_clear(mods* context);
 
-optionf64 mods_clock_rate(mods* context);
+optionf64 mods_clock_rate(const mods* context);
 
 void debug_difficylty_attributes(const difficultyattributes* res, ownedstring* str);
 
@@ -853,6 +1784,56 @@ void debug_score_state(const scorestate* res, ownedstring* str);
 
 double calculate_accuacy(const scorestate* state, const difficultyattributes* difficulty, osuscoreorigin origin);
 
+difficultycachestats difficulty_cache_stats();
+
+/// Set the maximum amount of cached difficulty attributes, `0` disables the cache.
+void difficulty_cache_capacity(uint32_t capacity);
+
+/// Drop all cached difficulty attributes and reset the counters.
+void difficulty_cache_clear();
+
+beatmapcachestats beatmap_cache_stats();
+
+/// Set the maximum size in bytes of the `.osu` content of cached beatmaps, `0` disables the cache.
+void beatmap_cache_capacity(uint64_t capacity);
+
+/// Drop all cached beatmaps and reset the counters.
+///
+/// Beatmaps that are still in use stay valid.
+void beatmap_cache_clear();
+
+/// Find the lowest accuracy that reaches `target_pp`.
+///
+/// Everything except the accuracy is taken from `performance`, e.g. its miss
+/// count, combo, mods or whether the score is set on lazer. `origin` only
+/// decides how the accuracy of the resulting state is reported.
+pptarget performance_min_accuracy(const performance* performance, const difficultyattributes* difficulty_attr, double target_pp, osuscoreorigin origin);
+
+/// Find the highest miss count that still reaches `target_pp`.
+///
+/// Everything except the miss count is taken from `performance`; without an
+/// accuracy set, it is the highest possible one for each miss count. `origin`
+/// only decides how the accuracy of the resulting state is reported.
+pptarget performance_max_misses(const performance* performance, const difficultyattributes* difficulty_attr, double target_pp, osuscoreorigin origin);
+
+/// Calculate the performance of a score on `beatmap` in a single call.
+///
+/// The difficulty is calculated as part of the call, which allocates, and
+/// the difficulty attribute cache is not used. For many scores on the same
+/// beatmap and settings, calculate the difficulty once and use
+/// [`performance_calculate_params_from_difficulty`] instead.
+performanceattributes performance_calculate_params(const scoreparams* params, const beatmap* beatmap);
+
+/// Calculate the performance of a score from already calculated difficulty
+/// attributes in a single call.
+///
+/// This is the hot path for many scores: there is no difficulty calculation
+/// and no cache lookup, only the performance calculation itself.
+///
+/// Fields that only affect the difficulty, e.g. the clock rate or `passed_objects`,
+/// must already be reflected in `difficulty_attr`.
+performanceattributes performance_calculate_params_from_difficulty(const scoreparams* params, const difficultyattributes* difficulty_attr);
+
 
 #ifdef __cplusplus
 }
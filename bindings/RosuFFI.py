@@ -26,8 +26,16 @@ def init_lib(path):
     c_lib.beatmap_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
     c_lib.beatmap_from_bytes.argtypes = [ctypes.POINTER(ctypes.c_void_p), Sliceu8]
     c_lib.beatmap_from_path.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_char)]
+    c_lib.beatmap_from_path_mmap.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_char)]
+    c_lib.beatmap_from_bytes_cached.argtypes = [ctypes.POINTER(ctypes.c_void_p), Sliceu8]
+    c_lib.beatmap_from_path_cached.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_char)]
+    c_lib.beatmap_from_archive.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_uint32]
+    c_lib.beatmap_from_loader.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_uint32]
     c_lib.beatmap_from_clone.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p]
     c_lib.beatmap_convert.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p]
+    c_lib.beatmap_md5.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    c_lib.beatmap_hit_object_columns.argtypes = [ctypes.c_void_p, HitObjectColumns]
+    c_lib.beatmap_n_hit_objects.argtypes = [ctypes.c_void_p]
     c_lib.beatmap_bpm.argtypes = [ctypes.c_void_p]
     c_lib.beatmap_total_break_time.argtypes = [ctypes.c_void_p]
     c_lib.beatmap_version.argtypes = [ctypes.c_void_p]
@@ -94,6 +102,8 @@ def init_lib(path):
     c_lib.performance_generate_state_from_difficulty.argtypes = [ctypes.c_void_p, DifficultyAttributes]
     c_lib.performance_calculate.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
     c_lib.performance_calculate_from_difficulty.argtypes = [ctypes.c_void_p, DifficultyAttributes]
+    c_lib.performance_calculate_batch.argtypes = [ctypes.c_void_p, ctypes.POINTER(DifficultyAttributes), ScoreColumns, PerformanceColumns]
+    c_lib.performance_calculate_grid.argtypes = [ctypes.c_void_p, ctypes.POINTER(DifficultyAttributes), Slicef64, Sliceu32, Sliceu32, PerformanceColumns]
     c_lib.performance_get_clock_rate.argtypes = [ctypes.c_void_p]
     c_lib.gradual_difficulty_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
     c_lib.gradual_difficulty_new.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_void_p]
@@ -101,6 +111,7 @@ def init_lib(path):
     c_lib.gradual_difficulty_next.argtypes = [ctypes.c_void_p]
     c_lib.gradual_difficulty_nth.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
     c_lib.gradual_difficulty_len.argtypes = [ctypes.c_void_p]
+    c_lib.gradual_difficulty_collect.argtypes = [ctypes.c_void_p, GradualDifficultyColumns]
     c_lib.gradual_performance_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
     c_lib.gradual_performance_new.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_void_p]
     c_lib.gradual_performance_new_with_mode.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
@@ -108,6 +119,94 @@ def init_lib(path):
     c_lib.gradual_performance_last.argtypes = [ctypes.c_void_p, ScoreState]
     c_lib.gradual_performance_nth.argtypes = [ctypes.c_void_p, ScoreState, ctypes.c_uint32]
     c_lib.gradual_performance_len.argtypes = [ctypes.c_void_p]
+    c_lib.gradual_performance_replay.argtypes = [ctypes.c_void_p, SliceObjectJudgement, SliceMutf64]
+    c_lib.gradual_performance_replay_state.argtypes = [ctypes.c_void_p]
+    c_lib.difficulty_batch_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.difficulty_batch_new.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.difficulty_batch_add_beatmap.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    c_lib.difficulty_batch_add_path.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_char)]
+    c_lib.difficulty_batch_add_difficulty.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    c_lib.difficulty_batch_threads.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    c_lib.difficulty_batch_len.argtypes = [ctypes.c_void_p]
+    c_lib.difficulty_batch_calculate.argtypes = [ctypes.c_void_p, SliceMutDifficultyAttributes, SliceMutLoadResult]
+    c_lib.attribute_store_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.attribute_store_open.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_char)]
+    c_lib.attribute_store_open_read_only.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_char)]
+    c_lib.attribute_store_get.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.c_uint32, ctypes.c_double, ctypes.c_bool]
+    c_lib.attribute_store_insert.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.c_uint32, ctypes.c_double, ctypes.c_bool, ctypes.POINTER(DifficultyAttributes)]
+    c_lib.attribute_store_refresh.argtypes = [ctypes.c_void_p]
+    c_lib.attribute_store_write_index.argtypes = [ctypes.c_void_p]
+    c_lib.attribute_store_len.argtypes = [ctypes.c_void_p]
+    c_lib.beatmap_loader_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.beatmap_loader_new.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.beatmap_loader_add_path.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_char)]
+    c_lib.beatmap_loader_add_directory.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_char)]
+    c_lib.beatmap_loader_threads.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    c_lib.beatmap_loader_len.argtypes = [ctypes.c_void_p]
+    c_lib.beatmap_loader_path.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p]
+    c_lib.beatmap_loader_load.argtypes = [ctypes.c_void_p]
+    c_lib.beatmap_loader_results.argtypes = [ctypes.c_void_p, SliceMutLoadResult]
+    c_lib.osz_archive_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.osz_archive_from_path.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_char)]
+    c_lib.osz_archive_from_bytes.argtypes = [ctypes.POINTER(ctypes.c_void_p), Sliceu8]
+    c_lib.osz_archive_len.argtypes = [ctypes.c_void_p]
+    c_lib.osz_archive_name.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p]
+    c_lib.strain_timeline_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.strain_timeline_new.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_void_p]
+    c_lib.strain_timeline_len.argtypes = [ctypes.c_void_p]
+    c_lib.strain_timeline_section_len.argtypes = [ctypes.c_void_p]
+    c_lib.strain_timeline_has.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    c_lib.strain_timeline_start_times.argtypes = [ctypes.c_void_p, SliceMutf64]
+    c_lib.strain_timeline_peaks_of.argtypes = [ctypes.c_void_p, ctypes.c_int, SliceMutf64]
+    c_lib.strain_timeline_hardest_windows.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_uint32, SliceMutStrainWindow]
+    c_lib.seekable_gradual_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.seekable_gradual_new.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_void_p]
+    c_lib.seekable_gradual_new_with_mode.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
+    c_lib.seekable_gradual_fork.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p]
+    c_lib.seekable_gradual_checkpoint_interval.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    c_lib.seekable_gradual_seek.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    c_lib.seekable_gradual_rewind.argtypes = [ctypes.c_void_p]
+    c_lib.seekable_gradual_position.argtypes = [ctypes.c_void_p]
+    c_lib.seekable_gradual_len.argtypes = [ctypes.c_void_p]
+    c_lib.seekable_gradual_difficulty.argtypes = [ctypes.c_void_p]
+    c_lib.seekable_gradual_performance.argtypes = [ctypes.c_void_p, ScoreState]
+    c_lib.seekable_gradual_replay.argtypes = [ctypes.c_void_p, SliceObjectJudgement, SliceMutf64]
+    c_lib.seekable_gradual_replay_state.argtypes = [ctypes.c_void_p]
+    c_lib.seekable_gradual_evaluate_branches.argtypes = [ctypes.c_void_p, SliceObjectJudgement, Sliceu32, SliceMutf64]
+    c_lib.mod_sweep_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.mod_sweep_new.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p]
+    c_lib.mod_sweep_add_bits.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_bool]
+    c_lib.mod_sweep_add_acronyms.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_char), ctypes.c_bool]
+    c_lib.mod_sweep_add_mods.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool]
+    c_lib.mod_sweep_len.argtypes = [ctypes.c_void_p]
+    c_lib.mod_sweep_calculate.argtypes = [ctypes.c_void_p, ctypes.c_void_p, SliceMutDifficultyAttributes, SliceMutBeatmapAttributes]
+    c_lib.rate_curve_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.rate_curve_new.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_void_p, ctypes.c_double, ctypes.c_double, ctypes.c_uint32]
+    c_lib.rate_curve_len.argtypes = [ctypes.c_void_p]
+    c_lib.rate_curve_rate.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    c_lib.rate_curve_attributes.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    c_lib.rate_curve_grid.argtypes = [ctypes.c_void_p, SliceMutf64, SliceMutf64]
+    c_lib.rate_curve_estimate.argtypes = [ctypes.c_void_p, ctypes.c_double]
+    c_lib.profile_engine_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.profile_engine_new.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.profile_engine_add_beatmap.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.c_void_p]
+    c_lib.profile_engine_add_path.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.POINTER(ctypes.c_char)]
+    c_lib.profile_engine_add_scores.argtypes = [ctypes.c_void_p, SliceProfileScore]
+    c_lib.profile_engine_threads.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    c_lib.profile_engine_len.argtypes = [ctypes.c_void_p]
+    c_lib.profile_engine_users.argtypes = [ctypes.c_void_p]
+    c_lib.profile_engine_calculate.argtypes = [ctypes.c_void_p]
+    c_lib.profile_engine_totals.argtypes = [ctypes.c_void_p, SliceMutProfileTotal]
+    c_lib.profile_engine_score_pp.argtypes = [ctypes.c_void_p, SliceMutf64]
+    c_lib.top_plays_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.top_plays_new.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+    c_lib.top_plays_insert.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.POINTER(PerformanceAttributes)]
+    c_lib.top_plays_insert_pp.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.c_double]
+    c_lib.top_plays_remove.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+    c_lib.top_plays_len.argtypes = [ctypes.c_void_p]
+    c_lib.top_plays_total.argtypes = [ctypes.c_void_p]
+    c_lib.top_plays_total_after.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.POINTER(PerformanceAttributes)]
+    c_lib.top_plays_total_after_pp.argtypes = [ctypes.c_void_p, ctypes.c_uint64, ctypes.c_double]
     c_lib.string_destroy.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
     c_lib.string_from_c_str.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_char)]
     c_lib.string_empty.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
@@ -132,6 +231,16 @@ def init_lib(path):
     c_lib.debug_performance_attributes.argtypes = [ctypes.POINTER(PerformanceAttributes), ctypes.c_void_p]
     c_lib.debug_score_state.argtypes = [ctypes.POINTER(ScoreState), ctypes.c_void_p]
     c_lib.calculate_accuacy.argtypes = [ctypes.POINTER(ScoreState), ctypes.POINTER(DifficultyAttributes), ctypes.c_int]
+    c_lib.difficulty_cache_stats.argtypes = []
+    c_lib.difficulty_cache_capacity.argtypes = [ctypes.c_uint32]
+    c_lib.difficulty_cache_clear.argtypes = []
+    c_lib.beatmap_cache_stats.argtypes = []
+    c_lib.beatmap_cache_capacity.argtypes = [ctypes.c_uint64]
+    c_lib.beatmap_cache_clear.argtypes = []
+    c_lib.performance_min_accuracy.argtypes = [ctypes.c_void_p, ctypes.POINTER(DifficultyAttributes), ctypes.c_double, ctypes.c_int]
+    c_lib.performance_max_misses.argtypes = [ctypes.c_void_p, ctypes.POINTER(DifficultyAttributes), ctypes.c_double, ctypes.c_int]
+    c_lib.performance_calculate_params.argtypes = [ctypes.POINTER(ScoreParams), ctypes.c_void_p]
+    c_lib.performance_calculate_params_from_difficulty.argtypes = [ctypes.POINTER(ScoreParams), ctypes.POINTER(DifficultyAttributes)]
 
     c_lib.beatmap_attributes_destroy.restype = ctypes.c_int
     c_lib.beatmap_attributes_new.restype = ctypes.c_int
@@ -141,8 +250,15 @@ def init_lib(path):
     c_lib.beatmap_destroy.restype = ctypes.c_int
     c_lib.beatmap_from_bytes.restype = ctypes.c_int
     c_lib.beatmap_from_path.restype = ctypes.c_int
+    c_lib.beatmap_from_path_mmap.restype = ctypes.c_int
+    c_lib.beatmap_from_bytes_cached.restype = ctypes.c_int
+    c_lib.beatmap_from_path_cached.restype = ctypes.c_int
+    c_lib.beatmap_from_archive.restype = ctypes.c_int
+    c_lib.beatmap_from_loader.restype = ctypes.c_int
     c_lib.beatmap_from_clone.restype = ctypes.c_int
     c_lib.beatmap_convert.restype = ctypes.c_bool
+    c_lib.beatmap_hit_object_columns.restype = ctypes.c_int
+    c_lib.beatmap_n_hit_objects.restype = ctypes.c_uint32
     c_lib.beatmap_bpm.restype = ctypes.c_double
     c_lib.beatmap_total_break_time.restype = ctypes.c_double
     c_lib.beatmap_version.restype = ctypes.c_int32
@@ -174,6 +290,8 @@ def init_lib(path):
     c_lib.performance_generate_state_from_difficulty.restype = ScoreState
     c_lib.performance_calculate.restype = PerformanceAttributes
     c_lib.performance_calculate_from_difficulty.restype = PerformanceAttributes
+    c_lib.performance_calculate_batch.restype = ctypes.c_int
+    c_lib.performance_calculate_grid.restype = ctypes.c_int
     c_lib.performance_get_clock_rate.restype = ctypes.c_double
     c_lib.gradual_difficulty_destroy.restype = ctypes.c_int
     c_lib.gradual_difficulty_new.restype = ctypes.c_int
@@ -181,6 +299,7 @@ def init_lib(path):
     c_lib.gradual_difficulty_next.restype = OptionDifficultyAttributes
     c_lib.gradual_difficulty_nth.restype = OptionDifficultyAttributes
     c_lib.gradual_difficulty_len.restype = ctypes.c_uint32
+    c_lib.gradual_difficulty_collect.restype = ctypes.c_int
     c_lib.gradual_performance_destroy.restype = ctypes.c_int
     c_lib.gradual_performance_new.restype = ctypes.c_int
     c_lib.gradual_performance_new_with_mode.restype = ctypes.c_int
@@ -188,6 +307,83 @@ def init_lib(path):
     c_lib.gradual_performance_last.restype = OptionPerformanceAttributes
     c_lib.gradual_performance_nth.restype = OptionPerformanceAttributes
     c_lib.gradual_performance_len.restype = ctypes.c_uint32
+    c_lib.gradual_performance_replay.restype = ctypes.c_int
+    c_lib.gradual_performance_replay_state.restype = ScoreState
+    c_lib.difficulty_batch_destroy.restype = ctypes.c_int
+    c_lib.difficulty_batch_new.restype = ctypes.c_int
+    c_lib.difficulty_batch_add_path.restype = ctypes.c_int
+    c_lib.difficulty_batch_len.restype = ctypes.c_uint32
+    c_lib.difficulty_batch_calculate.restype = ctypes.c_int
+    c_lib.attribute_store_destroy.restype = ctypes.c_int
+    c_lib.attribute_store_open.restype = ctypes.c_int
+    c_lib.attribute_store_open_read_only.restype = ctypes.c_int
+    c_lib.attribute_store_get.restype = ctypes.POINTER(DifficultyAttributes)
+    c_lib.attribute_store_insert.restype = ctypes.c_int
+    c_lib.attribute_store_refresh.restype = ctypes.c_int
+    c_lib.attribute_store_write_index.restype = ctypes.c_int
+    c_lib.attribute_store_len.restype = ctypes.c_uint32
+    c_lib.beatmap_loader_destroy.restype = ctypes.c_int
+    c_lib.beatmap_loader_new.restype = ctypes.c_int
+    c_lib.beatmap_loader_add_path.restype = ctypes.c_int
+    c_lib.beatmap_loader_add_directory.restype = ctypes.c_int
+    c_lib.beatmap_loader_len.restype = ctypes.c_uint32
+    c_lib.beatmap_loader_path.restype = ctypes.c_int
+    c_lib.beatmap_loader_load.restype = ctypes.c_int
+    c_lib.beatmap_loader_results.restype = ctypes.c_int
+    c_lib.osz_archive_destroy.restype = ctypes.c_int
+    c_lib.osz_archive_from_path.restype = ctypes.c_int
+    c_lib.osz_archive_from_bytes.restype = ctypes.c_int
+    c_lib.osz_archive_len.restype = ctypes.c_uint32
+    c_lib.osz_archive_name.restype = ctypes.c_int
+    c_lib.strain_timeline_destroy.restype = ctypes.c_int
+    c_lib.strain_timeline_new.restype = ctypes.c_int
+    c_lib.strain_timeline_len.restype = ctypes.c_uint32
+    c_lib.strain_timeline_section_len.restype = ctypes.c_double
+    c_lib.strain_timeline_has.restype = ctypes.c_bool
+    c_lib.strain_timeline_start_times.restype = ctypes.c_int
+    c_lib.strain_timeline_peaks_of.restype = ctypes.c_int
+    c_lib.strain_timeline_hardest_windows.restype = ctypes.c_uint32
+    c_lib.seekable_gradual_destroy.restype = ctypes.c_int
+    c_lib.seekable_gradual_new.restype = ctypes.c_int
+    c_lib.seekable_gradual_new_with_mode.restype = ctypes.c_int
+    c_lib.seekable_gradual_fork.restype = ctypes.c_int
+    c_lib.seekable_gradual_seek.restype = OptionDifficultyAttributes
+    c_lib.seekable_gradual_position.restype = ctypes.c_uint32
+    c_lib.seekable_gradual_len.restype = ctypes.c_uint32
+    c_lib.seekable_gradual_difficulty.restype = OptionDifficultyAttributes
+    c_lib.seekable_gradual_performance.restype = OptionPerformanceAttributes
+    c_lib.seekable_gradual_replay.restype = ctypes.c_int
+    c_lib.seekable_gradual_replay_state.restype = ScoreState
+    c_lib.seekable_gradual_evaluate_branches.restype = ctypes.c_int
+    c_lib.mod_sweep_destroy.restype = ctypes.c_int
+    c_lib.mod_sweep_new.restype = ctypes.c_int
+    c_lib.mod_sweep_add_acronyms.restype = ctypes.c_int
+    c_lib.mod_sweep_len.restype = ctypes.c_uint32
+    c_lib.mod_sweep_calculate.restype = ctypes.c_int
+    c_lib.rate_curve_destroy.restype = ctypes.c_int
+    c_lib.rate_curve_new.restype = ctypes.c_int
+    c_lib.rate_curve_len.restype = ctypes.c_uint32
+    c_lib.rate_curve_rate.restype = ctypes.c_double
+    c_lib.rate_curve_attributes.restype = OptionDifficultyAttributes
+    c_lib.rate_curve_grid.restype = ctypes.c_int
+    c_lib.rate_curve_estimate.restype = OptionRateEstimate
+    c_lib.profile_engine_destroy.restype = ctypes.c_int
+    c_lib.profile_engine_new.restype = ctypes.c_int
+    c_lib.profile_engine_add_path.restype = ctypes.c_int
+    c_lib.profile_engine_len.restype = ctypes.c_uint32
+    c_lib.profile_engine_users.restype = ctypes.c_uint32
+    c_lib.profile_engine_calculate.restype = ctypes.c_int
+    c_lib.profile_engine_totals.restype = ctypes.c_int
+    c_lib.profile_engine_score_pp.restype = ctypes.c_int
+    c_lib.top_plays_destroy.restype = ctypes.c_int
+    c_lib.top_plays_new.restype = ctypes.c_int
+    c_lib.top_plays_insert.restype = ctypes.c_bool
+    c_lib.top_plays_insert_pp.restype = ctypes.c_bool
+    c_lib.top_plays_remove.restype = ctypes.c_bool
+    c_lib.top_plays_len.restype = ctypes.c_uint32
+    c_lib.top_plays_total.restype = ctypes.c_double
+    c_lib.top_plays_total_after.restype = ctypes.c_double
+    c_lib.top_plays_total_after_pp.restype = ctypes.c_double
     c_lib.string_destroy.restype = ctypes.c_int
     c_lib.string_from_c_str.restype = ctypes.c_int
     c_lib.string_empty.restype = ctypes.c_int
@@ -205,6 +401,12 @@ def init_lib(path):
     c_lib.mods_contains.restype = ctypes.c_bool
     c_lib.mods_clock_rate.restype = Optionf64
     c_lib.calculate_accuacy.restype = ctypes.c_double
+    c_lib.difficulty_cache_stats.restype = DifficultyCacheStats
+    c_lib.beatmap_cache_stats.restype = BeatmapCacheStats
+    c_lib.performance_min_accuracy.restype = PpTarget
+    c_lib.performance_max_misses.restype = PpTarget
+    c_lib.performance_calculate_params.restype = PerformanceAttributes
+    c_lib.performance_calculate_params_from_difficulty.restype = PerformanceAttributes
 
     c_lib.beatmap_attributes_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.beatmap_attributes_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
@@ -212,7 +414,13 @@ def init_lib(path):
     c_lib.beatmap_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.beatmap_from_bytes.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.beatmap_from_path.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_from_path_mmap.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_from_bytes_cached.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_from_path_cached.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_from_archive.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_from_loader.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.beatmap_from_clone.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_hit_object_columns.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.hitobjects_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.hitobjects_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.difficulty_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
@@ -221,12 +429,62 @@ def init_lib(path):
     c_lib.performance_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.performance_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.performance_s_mods.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.performance_calculate_batch.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.performance_calculate_grid.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.gradual_difficulty_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.gradual_difficulty_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.gradual_difficulty_new_with_mode.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.gradual_difficulty_collect.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.gradual_performance_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.gradual_performance_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.gradual_performance_new_with_mode.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.gradual_performance_replay.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.difficulty_batch_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.difficulty_batch_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.difficulty_batch_add_path.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.difficulty_batch_calculate.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.attribute_store_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.attribute_store_open.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.attribute_store_open_read_only.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.attribute_store_insert.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.attribute_store_refresh.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.attribute_store_write_index.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_loader_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_loader_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_loader_add_path.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_loader_add_directory.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_loader_path.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_loader_load.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.beatmap_loader_results.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.osz_archive_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.osz_archive_from_path.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.osz_archive_from_bytes.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.osz_archive_name.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.strain_timeline_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.strain_timeline_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.strain_timeline_start_times.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.strain_timeline_peaks_of.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.seekable_gradual_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.seekable_gradual_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.seekable_gradual_new_with_mode.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.seekable_gradual_fork.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.seekable_gradual_replay.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.seekable_gradual_evaluate_branches.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.mod_sweep_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.mod_sweep_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.mod_sweep_add_acronyms.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.mod_sweep_calculate.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.rate_curve_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.rate_curve_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.rate_curve_grid.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.profile_engine_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.profile_engine_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.profile_engine_add_path.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.profile_engine_calculate.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.profile_engine_totals.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.profile_engine_score_pp.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.top_plays_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
+    c_lib.top_plays_new.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.string_destroy.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.string_from_c_str.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
     c_lib.string_empty.errcheck = lambda rval, _fptr, _args: _errcheck(rval, 0)
@@ -249,6 +507,66 @@ def debug_score_state(res: ctypes.POINTER(ScoreState), str: ctypes.c_void_p):
 def calculate_accuacy(state: ctypes.POINTER(ScoreState), difficulty: ctypes.POINTER(DifficultyAttributes), origin: ctypes.c_int) -> float:
     return c_lib.calculate_accuacy(state, difficulty, origin)
 
+def difficulty_cache_stats() -> DifficultyCacheStats:
+    return c_lib.difficulty_cache_stats()
+
+def difficulty_cache_capacity(capacity: int):
+    """ Set the maximum amount of cached difficulty attributes, `0` disables the cache."""
+    return c_lib.difficulty_cache_capacity(capacity)
+
+def difficulty_cache_clear():
+    """ Drop all cached difficulty attributes and reset the counters."""
+    return c_lib.difficulty_cache_clear()
+
+def beatmap_cache_stats() -> BeatmapCacheStats:
+    return c_lib.beatmap_cache_stats()
+
+def beatmap_cache_capacity(capacity: int):
+    """ Set the maximum size in bytes of the `.osu` content of cached beatmaps, `0` disables the cache."""
+    return c_lib.beatmap_cache_capacity(capacity)
+
+def beatmap_cache_clear():
+    """ Drop all cached beatmaps and reset the counters.
+
+ Beatmaps that are still in use stay valid."""
+    return c_lib.beatmap_cache_clear()
+
+def performance_min_accuracy(performance: ctypes.c_void_p, difficulty_attr: ctypes.POINTER(DifficultyAttributes), target_pp: float, origin: ctypes.c_int) -> PpTarget:
+    """ Find the lowest accuracy that reaches `target_pp`.
+
+ Everything except the accuracy is taken from `performance`, e.g. its miss
+ count, combo, mods or whether the score is set on lazer. `origin` only
+ decides how the accuracy of the resulting state is reported."""
+    return c_lib.performance_min_accuracy(performance, difficulty_attr, target_pp, origin)
+
+def performance_max_misses(performance: ctypes.c_void_p, difficulty_attr: ctypes.POINTER(DifficultyAttributes), target_pp: float, origin: ctypes.c_int) -> PpTarget:
+    """ Find the highest miss count that still reaches `target_pp`.
+
+ Everything except the miss count is taken from `performance`; without an
+ accuracy set, it is the highest possible one for each miss count. `origin`
+ only decides how the accuracy of the resulting state is reported."""
+    return c_lib.performance_max_misses(performance, difficulty_attr, target_pp, origin)
+
+def performance_calculate_params(params: ctypes.POINTER(ScoreParams), beatmap: ctypes.c_void_p) -> PerformanceAttributes:
+    """ Calculate the performance of a score on `beatmap` in a single call.
+
+ The difficulty is calculated as part of the call, which allocates, and
+ the difficulty attribute cache is not used. For many scores on the same
+ beatmap and settings, calculate the difficulty once and use
+ [`performance_calculate_params_from_difficulty`] instead."""
+    return c_lib.performance_calculate_params(params, beatmap)
+
+def performance_calculate_params_from_difficulty(params: ctypes.POINTER(ScoreParams), difficulty_attr: ctypes.POINTER(DifficultyAttributes)) -> PerformanceAttributes:
+    """ Calculate the performance of a score from already calculated difficulty
+ attributes in a single call.
+
+ This is the hot path for many scores: there is no difficulty calculation
+ and no cache lookup, only the performance calculation itself.
+
+ Fields that only affect the difficulty, e.g. the clock rate or `passed_objects`,
+ must already be reflected in `difficulty_attr`."""
+    return c_lib.performance_calculate_params_from_difficulty(params, difficulty_attr)
+
 
 
 
@@ -348,9 +666,82 @@ class FFIError:
     InvalidString = 500
     SerializeError = 600
     ConvertError = 700
+    InvalidLength = 800
+    ArchiveError = 900
     Unknown = 1000
 
 
+class Skill:
+    """ A strain skill of any mode."""
+    #  osu!standard
+    Aim = 0
+    #  osu!standard
+    JumpAim = 1
+    #  osu!standard
+    FlowAim = 2
+    #  osu!standard
+    Precision = 3
+    #  osu!standard
+    Speed = 4
+    #  osu!standard and osu!taiko
+    Stamina = 5
+    #  osu!taiko
+    Color = 6
+    #  osu!taiko
+    Rhythm = 7
+    #  osu!catch
+    Movement = 8
+    #  osu!mania
+    Strain = 9
+
+class Judgement:
+    """ Result of a single hit object, named after osu!lazer's hit results."""
+    Miss = 0
+    #  50
+    Meh = 1
+    #  100
+    Ok = 2
+    #  200 in osu!mania
+    Good = 3
+    #  300, or a fruit in osu!catch
+    Great = 4
+    #  320 in osu!mania
+    Perfect = 5
+    #  Droplet in osu!catch
+    LargeTickHit = 6
+    #  Tiny droplet in osu!catch
+    SmallTickHit = 7
+    #  Missed tiny droplet in osu!catch
+    SmallTickMiss = 8
+
+
+class ScoreParam:
+    """ Flags of [`ScoreParams::set`], one per field of [`ScoreParams`]."""
+    Mode = 1
+    Mods = 2
+    PassedObjects = 4
+    ClockRate = 8
+    Ar = 16
+    Cs = 32
+    Hp = 64
+    Od = 128
+    HardrockOffsets = 256
+    Accuracy = 512
+    Misses = 1024
+    Combo = 2048
+    HitresultPriority = 4096
+    Lazer = 8192
+    LargeTickHits = 16384
+    SmallTickHits = 32768
+    SliderEndHits = 65536
+    N300 = 131072
+    N100 = 262144
+    N50 = 524288
+    NKatu = 1048576
+    NGeki = 2097152
+    State = 4194304
+
+
 class CatchDifficultyAttributes(ctypes.Structure):
     """ The result of a difficulty calculation on an osu!catch map."""
 
@@ -1777,310 +2168,377 @@ class Sliceu8(ctypes.Structure):
         return rval
 
 
-class OptionCatchDifficultyAttributes(ctypes.Structure):
-    """May optionally hold a value."""
-
+class Sliceu32(ctypes.Structure):
+    # These fields represent the underlying C data layout
     _fields_ = [
-        ("_t", CatchDifficultyAttributes),
-        ("_is_some", ctypes.c_uint8),
+        ("data", ctypes.POINTER(ctypes.c_uint32)),
+        ("len", ctypes.c_uint64),
     ]
 
-    @property
-    def value(self) -> CatchDifficultyAttributes:
-        """Returns the value if it exists, or None."""
-        if self._is_some == 1:
-            return self._t
-        else:
-            return None
+    def __len__(self):
+        return self.len
 
-    def is_some(self) -> bool:
-        """Returns true if the value exists."""
-        return self._is_some == 1
+    def __getitem__(self, i) -> int:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
 
-    def is_none(self) -> bool:
-        """Returns true if the value does not exist."""
-        return self._is_some != 0
+        if index >= self.len:
+            raise IndexError("Index out of range")
 
+        return self.data[index]
 
-class OptionManiaDifficultyAttributes(ctypes.Structure):
-    """May optionally hold a value."""
+    def copied(self) -> Sliceu32:
+        """Returns a shallow, owned copy of the underlying slice.
 
-    _fields_ = [
-        ("_t", ManiaDifficultyAttributes),
-        ("_is_some", ctypes.c_uint8),
-    ]
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (ctypes.c_uint32 * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(ctypes.c_uint32))
+        rval = Sliceu32(data=ctypes.cast(array, ctypes.POINTER(ctypes.c_uint32)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
 
-    @property
-    def value(self) -> ManiaDifficultyAttributes:
-        """Returns the value if it exists, or None."""
-        if self._is_some == 1:
-            return self._t
-        else:
-            return None
+    def __iter__(self) -> typing.Iterable[ctypes.c_uint32]:
+        return _Iter(self)
 
-    def is_some(self) -> bool:
-        """Returns true if the value exists."""
-        return self._is_some == 1
+    def iter(self) -> typing.Iterable[ctypes.c_uint32]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
 
-    def is_none(self) -> bool:
-        """Returns true if the value does not exist."""
-        return self._is_some != 0
+    def first(self) -> int:
+        """Returns the first element of this slice."""
+        return self[0]
 
+    def last(self) -> int:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
 
-class OptionOsuDifficultyAttributes(ctypes.Structure):
-    """May optionally hold a value."""
 
+class SliceMutf64(ctypes.Structure):
+    # These fields represent the underlying C data layout
     _fields_ = [
-        ("_t", OsuDifficultyAttributes),
-        ("_is_some", ctypes.c_uint8),
+        ("data", ctypes.POINTER(ctypes.c_double)),
+        ("len", ctypes.c_uint64),
     ]
 
-    @property
-    def value(self) -> OsuDifficultyAttributes:
-        """Returns the value if it exists, or None."""
-        if self._is_some == 1:
-            return self._t
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> float:
+        if i < 0:
+            index = self.len+i
         else:
-            return None
+            index = i
 
-    def is_some(self) -> bool:
-        """Returns true if the value exists."""
-        return self._is_some == 1
+        if index >= self.len:
+            raise IndexError("Index out of range")
 
-    def is_none(self) -> bool:
-        """Returns true if the value does not exist."""
-        return self._is_some != 0
+        return self.data[index]
 
+    def __setitem__(self, i, v: float):
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
 
-class OptionTaikoDifficultyAttributes(ctypes.Structure):
-    """May optionally hold a value."""
+        if index >= self.len:
+            raise IndexError("Index out of range")
 
-    _fields_ = [
-        ("_t", TaikoDifficultyAttributes),
-        ("_is_some", ctypes.c_uint8),
-    ]
+        self.data[index] = v
 
-    @property
-    def value(self) -> TaikoDifficultyAttributes:
-        """Returns the value if it exists, or None."""
-        if self._is_some == 1:
-            return self._t
-        else:
-            return None
+    def copied(self) -> SliceMutf64:
+        """Returns a shallow, owned copy of the underlying slice.
 
-    def is_some(self) -> bool:
-        """Returns true if the value exists."""
-        return self._is_some == 1
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (ctypes.c_double * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(ctypes.c_double))
+        rval = SliceMutf64(data=ctypes.cast(array, ctypes.POINTER(ctypes.c_double)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
 
-    def is_none(self) -> bool:
-        """Returns true if the value does not exist."""
-        return self._is_some != 0
+    def __iter__(self) -> typing.Iterable[ctypes.c_double]:
+        return _Iter(self)
 
+    def iter(self) -> typing.Iterable[ctypes.c_double]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
 
-class BeatmapAttributes(ctypes.Structure):
-    """ Summary struct for a [`Beatmap`]'s attributes."""
+    def first(self) -> float:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> float:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+class ScoreColumns(ctypes.Structure):
+    """ Score statistics for [`Performance::calculate_batch`], one row per score.
+
+ Every column is optional: empty columns are left unset, non-empty columns
+ must have exactly one element per row."""
 
     # These fields represent the underlying C data layout
     _fields_ = [
-        ("ar", ctypes.c_double),
-        ("od", ctypes.c_double),
-        ("cs", ctypes.c_double),
-        ("hp", ctypes.c_double),
-        ("clock_rate", ctypes.c_double),
-        ("hit_windows", HitWindows),
+        ("n300", Sliceu32),
+        ("n100", Sliceu32),
+        ("n50", Sliceu32),
+        ("n_katu", Sliceu32),
+        ("n_geki", Sliceu32),
+        ("misses", Sliceu32),
+        ("max_combo", Sliceu32),
+        ("large_tick_hits", Sliceu32),
+        ("slider_end_hits", Sliceu32),
+        ("mods", Sliceu32),
     ]
 
-    def __init__(self, ar: float = None, od: float = None, cs: float = None, hp: float = None, clock_rate: float = None, hit_windows: HitWindows = None):
-        if ar is not None:
-            self.ar = ar
-        if od is not None:
-            self.od = od
-        if cs is not None:
-            self.cs = cs
-        if hp is not None:
-            self.hp = hp
-        if clock_rate is not None:
-            self.clock_rate = clock_rate
-        if hit_windows is not None:
-            self.hit_windows = hit_windows
+    def __init__(self, n300: Sliceu32 = None, n100: Sliceu32 = None, n50: Sliceu32 = None, n_katu: Sliceu32 = None, n_geki: Sliceu32 = None, misses: Sliceu32 = None, max_combo: Sliceu32 = None, large_tick_hits: Sliceu32 = None, slider_end_hits: Sliceu32 = None, mods: Sliceu32 = None):
+        if n300 is not None:
+            self.n300 = n300
+        if n100 is not None:
+            self.n100 = n100
+        if n50 is not None:
+            self.n50 = n50
+        if n_katu is not None:
+            self.n_katu = n_katu
+        if n_geki is not None:
+            self.n_geki = n_geki
+        if misses is not None:
+            self.misses = misses
+        if max_combo is not None:
+            self.max_combo = max_combo
+        if large_tick_hits is not None:
+            self.large_tick_hits = large_tick_hits
+        if slider_end_hits is not None:
+            self.slider_end_hits = slider_end_hits
+        if mods is not None:
+            self.mods = mods
 
     @property
-    def ar(self) -> float:
-        """ The approach rate."""
-        return ctypes.Structure.__get__(self, "ar")
+    def n300(self) -> Sliceu32:
+        return ctypes.Structure.__get__(self, "n300")
 
-    @ar.setter
-    def ar(self, value: float):
-        """ The approach rate."""
-        return ctypes.Structure.__set__(self, "ar", value)
+    @n300.setter
+    def n300(self, value: Sliceu32):
+        return ctypes.Structure.__set__(self, "n300", value)
 
     @property
-    def od(self) -> float:
-        """ The overall difficulty."""
-        return ctypes.Structure.__get__(self, "od")
+    def n100(self) -> Sliceu32:
+        return ctypes.Structure.__get__(self, "n100")
 
-    @od.setter
-    def od(self, value: float):
-        """ The overall difficulty."""
-        return ctypes.Structure.__set__(self, "od", value)
+    @n100.setter
+    def n100(self, value: Sliceu32):
+        return ctypes.Structure.__set__(self, "n100", value)
 
     @property
-    def cs(self) -> float:
-        """ The circle size."""
-        return ctypes.Structure.__get__(self, "cs")
+    def n50(self) -> Sliceu32:
+        return ctypes.Structure.__get__(self, "n50")
 
-    @cs.setter
-    def cs(self, value: float):
-        """ The circle size."""
-        return ctypes.Structure.__set__(self, "cs", value)
+    @n50.setter
+    def n50(self, value: Sliceu32):
+        return ctypes.Structure.__set__(self, "n50", value)
 
     @property
-    def hp(self) -> float:
-        """ The health drain rate"""
-        return ctypes.Structure.__get__(self, "hp")
+    def n_katu(self) -> Sliceu32:
+        return ctypes.Structure.__get__(self, "n_katu")
 
-    @hp.setter
-    def hp(self, value: float):
-        """ The health drain rate"""
-        return ctypes.Structure.__set__(self, "hp", value)
+    @n_katu.setter
+    def n_katu(self, value: Sliceu32):
+        return ctypes.Structure.__set__(self, "n_katu", value)
 
     @property
-    def clock_rate(self) -> float:
-        """ The clock rate with respect to mods."""
-        return ctypes.Structure.__get__(self, "clock_rate")
+    def n_geki(self) -> Sliceu32:
+        return ctypes.Structure.__get__(self, "n_geki")
 
-    @clock_rate.setter
-    def clock_rate(self, value: float):
-        """ The clock rate with respect to mods."""
-        return ctypes.Structure.__set__(self, "clock_rate", value)
+    @n_geki.setter
+    def n_geki(self, value: Sliceu32):
+        return ctypes.Structure.__set__(self, "n_geki", value)
 
     @property
-    def hit_windows(self) -> HitWindows:
-        """ The hit windows for approach rate and overall difficulty."""
-        return ctypes.Structure.__get__(self, "hit_windows")
+    def misses(self) -> Sliceu32:
+        return ctypes.Structure.__get__(self, "misses")
 
-    @hit_windows.setter
-    def hit_windows(self, value: HitWindows):
-        """ The hit windows for approach rate and overall difficulty."""
-        return ctypes.Structure.__set__(self, "hit_windows", value)
+    @misses.setter
+    def misses(self, value: Sliceu32):
+        return ctypes.Structure.__set__(self, "misses", value)
 
+    @property
+    def max_combo(self) -> Sliceu32:
+        return ctypes.Structure.__get__(self, "max_combo")
 
-class DifficultyAttributes(ctypes.Structure):
+    @max_combo.setter
+    def max_combo(self, value: Sliceu32):
+        return ctypes.Structure.__set__(self, "max_combo", value)
+
+    @property
+    def large_tick_hits(self) -> Sliceu32:
+        return ctypes.Structure.__get__(self, "large_tick_hits")
+
+    @large_tick_hits.setter
+    def large_tick_hits(self, value: Sliceu32):
+        return ctypes.Structure.__set__(self, "large_tick_hits", value)
+
+    @property
+    def slider_end_hits(self) -> Sliceu32:
+        return ctypes.Structure.__get__(self, "slider_end_hits")
+
+    @slider_end_hits.setter
+    def slider_end_hits(self, value: Sliceu32):
+        return ctypes.Structure.__set__(self, "slider_end_hits", value)
+
+    @property
+    def mods(self) -> Sliceu32:
+        """ Legacy mod bits, overriding the mods of the [`Performance`] per row."""
+        return ctypes.Structure.__get__(self, "mods")
+
+    @mods.setter
+    def mods(self, value: Sliceu32):
+        """ Legacy mod bits, overriding the mods of the [`Performance`] per row."""
+        return ctypes.Structure.__set__(self, "mods", value)
+
+
+class PerformanceColumns(ctypes.Structure):
+    """ Output columns for [`Performance::calculate_batch`] and
+ [`Performance::calculate_grid`].
+
+ `pp` decides the amount of rows. Every other column may be left empty,
+ otherwise it must be as long as `pp`. Components that do not exist for
+ the map's mode are written as `0.0`."""
 
     # These fields represent the underlying C data layout
     _fields_ = [
-        ("osu", OptionOsuDifficultyAttributes),
-        ("taiko", OptionTaikoDifficultyAttributes),
-        ("fruit", OptionCatchDifficultyAttributes),
-        ("mania", OptionManiaDifficultyAttributes),
-        ("mode", ctypes.c_int),
+        ("pp", SliceMutf64),
+        ("pp_aim", SliceMutf64),
+        ("pp_jump_aim", SliceMutf64),
+        ("pp_flow_aim", SliceMutf64),
+        ("pp_precision", SliceMutf64),
+        ("pp_speed", SliceMutf64),
+        ("pp_stamina", SliceMutf64),
+        ("pp_acc", SliceMutf64),
+        ("pp_difficulty", SliceMutf64),
+        ("effective_miss_count", SliceMutf64),
     ]
 
-    def __init__(self, osu: OptionOsuDifficultyAttributes = None, taiko: OptionTaikoDifficultyAttributes = None, fruit: OptionCatchDifficultyAttributes = None, mania: OptionManiaDifficultyAttributes = None, mode: ctypes.c_int = None):
-        if osu is not None:
-            self.osu = osu
-        if taiko is not None:
-            self.taiko = taiko
-        if fruit is not None:
-            self.fruit = fruit
-        if mania is not None:
-            self.mania = mania
-        if mode is not None:
-            self.mode = mode
+    def __init__(self, pp: SliceMutf64 = None, pp_aim: SliceMutf64 = None, pp_jump_aim: SliceMutf64 = None, pp_flow_aim: SliceMutf64 = None, pp_precision: SliceMutf64 = None, pp_speed: SliceMutf64 = None, pp_stamina: SliceMutf64 = None, pp_acc: SliceMutf64 = None, pp_difficulty: SliceMutf64 = None, effective_miss_count: SliceMutf64 = None):
+        if pp is not None:
+            self.pp = pp
+        if pp_aim is not None:
+            self.pp_aim = pp_aim
+        if pp_jump_aim is not None:
+            self.pp_jump_aim = pp_jump_aim
+        if pp_flow_aim is not None:
+            self.pp_flow_aim = pp_flow_aim
+        if pp_precision is not None:
+            self.pp_precision = pp_precision
+        if pp_speed is not None:
+            self.pp_speed = pp_speed
+        if pp_stamina is not None:
+            self.pp_stamina = pp_stamina
+        if pp_acc is not None:
+            self.pp_acc = pp_acc
+        if pp_difficulty is not None:
+            self.pp_difficulty = pp_difficulty
+        if effective_miss_count is not None:
+            self.effective_miss_count = effective_miss_count
 
     @property
-    def osu(self) -> OptionOsuDifficultyAttributes:
-        return ctypes.Structure.__get__(self, "osu")
+    def pp(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "pp")
 
-    @osu.setter
-    def osu(self, value: OptionOsuDifficultyAttributes):
-        return ctypes.Structure.__set__(self, "osu", value)
+    @pp.setter
+    def pp(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "pp", value)
 
     @property
-    def taiko(self) -> OptionTaikoDifficultyAttributes:
-        return ctypes.Structure.__get__(self, "taiko")
+    def pp_aim(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "pp_aim")
 
-    @taiko.setter
-    def taiko(self, value: OptionTaikoDifficultyAttributes):
-        return ctypes.Structure.__set__(self, "taiko", value)
+    @pp_aim.setter
+    def pp_aim(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "pp_aim", value)
 
     @property
-    def fruit(self) -> OptionCatchDifficultyAttributes:
-        return ctypes.Structure.__get__(self, "fruit")
+    def pp_jump_aim(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "pp_jump_aim")
 
-    @fruit.setter
-    def fruit(self, value: OptionCatchDifficultyAttributes):
-        return ctypes.Structure.__set__(self, "fruit", value)
+    @pp_jump_aim.setter
+    def pp_jump_aim(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "pp_jump_aim", value)
 
     @property
-    def mania(self) -> OptionManiaDifficultyAttributes:
-        return ctypes.Structure.__get__(self, "mania")
+    def pp_flow_aim(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "pp_flow_aim")
 
-    @mania.setter
-    def mania(self, value: OptionManiaDifficultyAttributes):
-        return ctypes.Structure.__set__(self, "mania", value)
+    @pp_flow_aim.setter
+    def pp_flow_aim(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "pp_flow_aim", value)
 
     @property
-    def mode(self) -> ctypes.c_int:
-        return ctypes.Structure.__get__(self, "mode")
+    def pp_precision(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "pp_precision")
 
-    @mode.setter
-    def mode(self, value: ctypes.c_int):
-        return ctypes.Structure.__set__(self, "mode", value)
+    @pp_precision.setter
+    def pp_precision(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "pp_precision", value)
 
+    @property
+    def pp_speed(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "pp_speed")
 
-class HitObject(ctypes.Structure):
+    @pp_speed.setter
+    def pp_speed(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "pp_speed", value)
 
-    # These fields represent the underlying C data layout
-    _fields_ = [
-        ("pos", Pos),
-        ("start_time", ctypes.c_double),
-        ("data", HitObjectData),
-    ]
+    @property
+    def pp_stamina(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "pp_stamina")
 
-    def __init__(self, pos: Pos = None, start_time: float = None, data: HitObjectData = None):
-        if pos is not None:
-            self.pos = pos
-        if start_time is not None:
-            self.start_time = start_time
-        if data is not None:
-            self.data = data
+    @pp_stamina.setter
+    def pp_stamina(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "pp_stamina", value)
 
     @property
-    def pos(self) -> Pos:
-        return ctypes.Structure.__get__(self, "pos")
+    def pp_acc(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "pp_acc")
 
-    @pos.setter
-    def pos(self, value: Pos):
-        return ctypes.Structure.__set__(self, "pos", value)
+    @pp_acc.setter
+    def pp_acc(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "pp_acc", value)
 
     @property
-    def start_time(self) -> float:
-        return ctypes.Structure.__get__(self, "start_time")
+    def pp_difficulty(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "pp_difficulty")
 
-    @start_time.setter
-    def start_time(self, value: float):
-        return ctypes.Structure.__set__(self, "start_time", value)
+    @pp_difficulty.setter
+    def pp_difficulty(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "pp_difficulty", value)
 
     @property
-    def data(self) -> HitObjectData:
-        return ctypes.Structure.__get__(self, "data")
+    def effective_miss_count(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "effective_miss_count")
 
-    @data.setter
-    def data(self, value: HitObjectData):
-        return ctypes.Structure.__set__(self, "data", value)
+    @effective_miss_count.setter
+    def effective_miss_count(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "effective_miss_count", value)
 
 
-class OptionCatchPerformanceAttributes(ctypes.Structure):
+class OptionCatchDifficultyAttributes(ctypes.Structure):
     """May optionally hold a value."""
 
     _fields_ = [
-        ("_t", CatchPerformanceAttributes),
+        ("_t", CatchDifficultyAttributes),
         ("_is_some", ctypes.c_uint8),
     ]
 
     @property
-    def value(self) -> CatchPerformanceAttributes:
+    def value(self) -> CatchDifficultyAttributes:
         """Returns the value if it exists, or None."""
         if self._is_some == 1:
             return self._t
@@ -2096,16 +2554,16 @@ class OptionCatchPerformanceAttributes(ctypes.Structure):
         return self._is_some != 0
 
 
-class OptionManiaPerformanceAttributes(ctypes.Structure):
+class OptionManiaDifficultyAttributes(ctypes.Structure):
     """May optionally hold a value."""
 
     _fields_ = [
-        ("_t", ManiaPerformanceAttributes),
+        ("_t", ManiaDifficultyAttributes),
         ("_is_some", ctypes.c_uint8),
     ]
 
     @property
-    def value(self) -> ManiaPerformanceAttributes:
+    def value(self) -> ManiaDifficultyAttributes:
         """Returns the value if it exists, or None."""
         if self._is_some == 1:
             return self._t
@@ -2121,16 +2579,16 @@ class OptionManiaPerformanceAttributes(ctypes.Structure):
         return self._is_some != 0
 
 
-class OptionOsuPerformanceAttributes(ctypes.Structure):
+class OptionOsuDifficultyAttributes(ctypes.Structure):
     """May optionally hold a value."""
 
     _fields_ = [
-        ("_t", OsuPerformanceAttributes),
+        ("_t", OsuDifficultyAttributes),
         ("_is_some", ctypes.c_uint8),
     ]
 
     @property
-    def value(self) -> OsuPerformanceAttributes:
+    def value(self) -> OsuDifficultyAttributes:
         """Returns the value if it exists, or None."""
         if self._is_some == 1:
             return self._t
@@ -2146,16 +2604,16 @@ class OptionOsuPerformanceAttributes(ctypes.Structure):
         return self._is_some != 0
 
 
-class OptionTaikoPerformanceAttributes(ctypes.Structure):
+class OptionTaikoDifficultyAttributes(ctypes.Structure):
     """May optionally hold a value."""
 
     _fields_ = [
-        ("_t", TaikoPerformanceAttributes),
+        ("_t", TaikoDifficultyAttributes),
         ("_is_some", ctypes.c_uint8),
     ]
 
     @property
-    def value(self) -> TaikoPerformanceAttributes:
+    def value(self) -> TaikoDifficultyAttributes:
         """Returns the value if it exists, or None."""
         if self._is_some == 1:
             return self._t
@@ -2171,63 +2629,151 @@ class OptionTaikoPerformanceAttributes(ctypes.Structure):
         return self._is_some != 0
 
 
-class PerformanceAttributes(ctypes.Structure):
+class BeatmapAttributes(ctypes.Structure):
+    """ Summary struct for a [`Beatmap`]'s attributes."""
 
     # These fields represent the underlying C data layout
     _fields_ = [
-        ("osu", OptionOsuPerformanceAttributes),
-        ("taiko", OptionTaikoPerformanceAttributes),
-        ("fruit", OptionCatchPerformanceAttributes),
-        ("mania", OptionManiaPerformanceAttributes),
-        ("mode", ctypes.c_int),
+        ("ar", ctypes.c_double),
+        ("od", ctypes.c_double),
+        ("cs", ctypes.c_double),
+        ("hp", ctypes.c_double),
+        ("clock_rate", ctypes.c_double),
+        ("hit_windows", HitWindows),
     ]
 
-    def __init__(self, osu: OptionOsuPerformanceAttributes = None, taiko: OptionTaikoPerformanceAttributes = None, fruit: OptionCatchPerformanceAttributes = None, mania: OptionManiaPerformanceAttributes = None, mode: ctypes.c_int = None):
-        if osu is not None:
-            self.osu = osu
-        if taiko is not None:
-            self.taiko = taiko
-        if fruit is not None:
-            self.fruit = fruit
-        if mania is not None:
-            self.mania = mania
-        if mode is not None:
-            self.mode = mode
+    def __init__(self, ar: float = None, od: float = None, cs: float = None, hp: float = None, clock_rate: float = None, hit_windows: HitWindows = None):
+        if ar is not None:
+            self.ar = ar
+        if od is not None:
+            self.od = od
+        if cs is not None:
+            self.cs = cs
+        if hp is not None:
+            self.hp = hp
+        if clock_rate is not None:
+            self.clock_rate = clock_rate
+        if hit_windows is not None:
+            self.hit_windows = hit_windows
 
     @property
-    def osu(self) -> OptionOsuPerformanceAttributes:
-        return ctypes.Structure.__get__(self, "osu")
+    def ar(self) -> float:
+        """ The approach rate."""
+        return ctypes.Structure.__get__(self, "ar")
 
-    @osu.setter
-    def osu(self, value: OptionOsuPerformanceAttributes):
-        return ctypes.Structure.__set__(self, "osu", value)
+    @ar.setter
+    def ar(self, value: float):
+        """ The approach rate."""
+        return ctypes.Structure.__set__(self, "ar", value)
 
     @property
-    def taiko(self) -> OptionTaikoPerformanceAttributes:
-        return ctypes.Structure.__get__(self, "taiko")
+    def od(self) -> float:
+        """ The overall difficulty."""
+        return ctypes.Structure.__get__(self, "od")
 
-    @taiko.setter
-    def taiko(self, value: OptionTaikoPerformanceAttributes):
-        return ctypes.Structure.__set__(self, "taiko", value)
+    @od.setter
+    def od(self, value: float):
+        """ The overall difficulty."""
+        return ctypes.Structure.__set__(self, "od", value)
 
     @property
-    def fruit(self) -> OptionCatchPerformanceAttributes:
-        return ctypes.Structure.__get__(self, "fruit")
+    def cs(self) -> float:
+        """ The circle size."""
+        return ctypes.Structure.__get__(self, "cs")
 
-    @fruit.setter
-    def fruit(self, value: OptionCatchPerformanceAttributes):
-        return ctypes.Structure.__set__(self, "fruit", value)
+    @cs.setter
+    def cs(self, value: float):
+        """ The circle size."""
+        return ctypes.Structure.__set__(self, "cs", value)
 
     @property
-    def mania(self) -> OptionManiaPerformanceAttributes:
-        return ctypes.Structure.__get__(self, "mania")
+    def hp(self) -> float:
+        """ The health drain rate"""
+        return ctypes.Structure.__get__(self, "hp")
 
-    @mania.setter
-    def mania(self, value: OptionManiaPerformanceAttributes):
-        return ctypes.Structure.__set__(self, "mania", value)
+    @hp.setter
+    def hp(self, value: float):
+        """ The health drain rate"""
+        return ctypes.Structure.__set__(self, "hp", value)
 
     @property
-    def mode(self) -> ctypes.c_int:
+    def clock_rate(self) -> float:
+        """ The clock rate with respect to mods."""
+        return ctypes.Structure.__get__(self, "clock_rate")
+
+    @clock_rate.setter
+    def clock_rate(self, value: float):
+        """ The clock rate with respect to mods."""
+        return ctypes.Structure.__set__(self, "clock_rate", value)
+
+    @property
+    def hit_windows(self) -> HitWindows:
+        """ The hit windows for approach rate and overall difficulty."""
+        return ctypes.Structure.__get__(self, "hit_windows")
+
+    @hit_windows.setter
+    def hit_windows(self, value: HitWindows):
+        """ The hit windows for approach rate and overall difficulty."""
+        return ctypes.Structure.__set__(self, "hit_windows", value)
+
+
+class DifficultyAttributes(ctypes.Structure):
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("osu", OptionOsuDifficultyAttributes),
+        ("taiko", OptionTaikoDifficultyAttributes),
+        ("fruit", OptionCatchDifficultyAttributes),
+        ("mania", OptionManiaDifficultyAttributes),
+        ("mode", ctypes.c_int),
+    ]
+
+    def __init__(self, osu: OptionOsuDifficultyAttributes = None, taiko: OptionTaikoDifficultyAttributes = None, fruit: OptionCatchDifficultyAttributes = None, mania: OptionManiaDifficultyAttributes = None, mode: ctypes.c_int = None):
+        if osu is not None:
+            self.osu = osu
+        if taiko is not None:
+            self.taiko = taiko
+        if fruit is not None:
+            self.fruit = fruit
+        if mania is not None:
+            self.mania = mania
+        if mode is not None:
+            self.mode = mode
+
+    @property
+    def osu(self) -> OptionOsuDifficultyAttributes:
+        return ctypes.Structure.__get__(self, "osu")
+
+    @osu.setter
+    def osu(self, value: OptionOsuDifficultyAttributes):
+        return ctypes.Structure.__set__(self, "osu", value)
+
+    @property
+    def taiko(self) -> OptionTaikoDifficultyAttributes:
+        return ctypes.Structure.__get__(self, "taiko")
+
+    @taiko.setter
+    def taiko(self, value: OptionTaikoDifficultyAttributes):
+        return ctypes.Structure.__set__(self, "taiko", value)
+
+    @property
+    def fruit(self) -> OptionCatchDifficultyAttributes:
+        return ctypes.Structure.__get__(self, "fruit")
+
+    @fruit.setter
+    def fruit(self, value: OptionCatchDifficultyAttributes):
+        return ctypes.Structure.__set__(self, "fruit", value)
+
+    @property
+    def mania(self) -> OptionManiaDifficultyAttributes:
+        return ctypes.Structure.__get__(self, "mania")
+
+    @mania.setter
+    def mania(self, value: OptionManiaDifficultyAttributes):
+        return ctypes.Structure.__set__(self, "mania", value)
+
+    @property
+    def mode(self) -> ctypes.c_int:
         return ctypes.Structure.__get__(self, "mode")
 
     @mode.setter
@@ -2235,92 +2781,2790 @@ class PerformanceAttributes(ctypes.Structure):
         return ctypes.Structure.__set__(self, "mode", value)
 
 
-class OptionDifficultyAttributes(ctypes.Structure):
+class HitObject(ctypes.Structure):
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("pos", Pos),
+        ("start_time", ctypes.c_double),
+        ("data", HitObjectData),
+    ]
+
+    def __init__(self, pos: Pos = None, start_time: float = None, data: HitObjectData = None):
+        if pos is not None:
+            self.pos = pos
+        if start_time is not None:
+            self.start_time = start_time
+        if data is not None:
+            self.data = data
+
+    @property
+    def pos(self) -> Pos:
+        return ctypes.Structure.__get__(self, "pos")
+
+    @pos.setter
+    def pos(self, value: Pos):
+        return ctypes.Structure.__set__(self, "pos", value)
+
+    @property
+    def start_time(self) -> float:
+        return ctypes.Structure.__get__(self, "start_time")
+
+    @start_time.setter
+    def start_time(self, value: float):
+        return ctypes.Structure.__set__(self, "start_time", value)
+
+    @property
+    def data(self) -> HitObjectData:
+        return ctypes.Structure.__get__(self, "data")
+
+    @data.setter
+    def data(self, value: HitObjectData):
+        return ctypes.Structure.__set__(self, "data", value)
+
+
+class OptionCatchPerformanceAttributes(ctypes.Structure):
     """May optionally hold a value."""
 
     _fields_ = [
-        ("_t", DifficultyAttributes),
+        ("_t", CatchPerformanceAttributes),
         ("_is_some", ctypes.c_uint8),
     ]
 
     @property
-    def value(self) -> DifficultyAttributes:
+    def value(self) -> CatchPerformanceAttributes:
+        """Returns the value if it exists, or None."""
+        if self._is_some == 1:
+            return self._t
+        else:
+            return None
+
+    def is_some(self) -> bool:
+        """Returns true if the value exists."""
+        return self._is_some == 1
+
+    def is_none(self) -> bool:
+        """Returns true if the value does not exist."""
+        return self._is_some != 0
+
+
+class OptionManiaPerformanceAttributes(ctypes.Structure):
+    """May optionally hold a value."""
+
+    _fields_ = [
+        ("_t", ManiaPerformanceAttributes),
+        ("_is_some", ctypes.c_uint8),
+    ]
+
+    @property
+    def value(self) -> ManiaPerformanceAttributes:
+        """Returns the value if it exists, or None."""
+        if self._is_some == 1:
+            return self._t
+        else:
+            return None
+
+    def is_some(self) -> bool:
+        """Returns true if the value exists."""
+        return self._is_some == 1
+
+    def is_none(self) -> bool:
+        """Returns true if the value does not exist."""
+        return self._is_some != 0
+
+
+class OptionOsuPerformanceAttributes(ctypes.Structure):
+    """May optionally hold a value."""
+
+    _fields_ = [
+        ("_t", OsuPerformanceAttributes),
+        ("_is_some", ctypes.c_uint8),
+    ]
+
+    @property
+    def value(self) -> OsuPerformanceAttributes:
+        """Returns the value if it exists, or None."""
+        if self._is_some == 1:
+            return self._t
+        else:
+            return None
+
+    def is_some(self) -> bool:
+        """Returns true if the value exists."""
+        return self._is_some == 1
+
+    def is_none(self) -> bool:
+        """Returns true if the value does not exist."""
+        return self._is_some != 0
+
+
+class OptionTaikoPerformanceAttributes(ctypes.Structure):
+    """May optionally hold a value."""
+
+    _fields_ = [
+        ("_t", TaikoPerformanceAttributes),
+        ("_is_some", ctypes.c_uint8),
+    ]
+
+    @property
+    def value(self) -> TaikoPerformanceAttributes:
         """Returns the value if it exists, or None."""
         if self._is_some == 1:
             return self._t
         else:
             return None
 
-    def is_some(self) -> bool:
-        """Returns true if the value exists."""
-        return self._is_some == 1
+    def is_some(self) -> bool:
+        """Returns true if the value exists."""
+        return self._is_some == 1
+
+    def is_none(self) -> bool:
+        """Returns true if the value does not exist."""
+        return self._is_some != 0
+
+
+class PerformanceAttributes(ctypes.Structure):
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("osu", OptionOsuPerformanceAttributes),
+        ("taiko", OptionTaikoPerformanceAttributes),
+        ("fruit", OptionCatchPerformanceAttributes),
+        ("mania", OptionManiaPerformanceAttributes),
+        ("mode", ctypes.c_int),
+    ]
+
+    def __init__(self, osu: OptionOsuPerformanceAttributes = None, taiko: OptionTaikoPerformanceAttributes = None, fruit: OptionCatchPerformanceAttributes = None, mania: OptionManiaPerformanceAttributes = None, mode: ctypes.c_int = None):
+        if osu is not None:
+            self.osu = osu
+        if taiko is not None:
+            self.taiko = taiko
+        if fruit is not None:
+            self.fruit = fruit
+        if mania is not None:
+            self.mania = mania
+        if mode is not None:
+            self.mode = mode
+
+    @property
+    def osu(self) -> OptionOsuPerformanceAttributes:
+        return ctypes.Structure.__get__(self, "osu")
+
+    @osu.setter
+    def osu(self, value: OptionOsuPerformanceAttributes):
+        return ctypes.Structure.__set__(self, "osu", value)
+
+    @property
+    def taiko(self) -> OptionTaikoPerformanceAttributes:
+        return ctypes.Structure.__get__(self, "taiko")
+
+    @taiko.setter
+    def taiko(self, value: OptionTaikoPerformanceAttributes):
+        return ctypes.Structure.__set__(self, "taiko", value)
+
+    @property
+    def fruit(self) -> OptionCatchPerformanceAttributes:
+        return ctypes.Structure.__get__(self, "fruit")
+
+    @fruit.setter
+    def fruit(self, value: OptionCatchPerformanceAttributes):
+        return ctypes.Structure.__set__(self, "fruit", value)
+
+    @property
+    def mania(self) -> OptionManiaPerformanceAttributes:
+        return ctypes.Structure.__get__(self, "mania")
+
+    @mania.setter
+    def mania(self, value: OptionManiaPerformanceAttributes):
+        return ctypes.Structure.__set__(self, "mania", value)
+
+    @property
+    def mode(self) -> ctypes.c_int:
+        return ctypes.Structure.__get__(self, "mode")
+
+    @mode.setter
+    def mode(self, value: ctypes.c_int):
+        return ctypes.Structure.__set__(self, "mode", value)
+
+
+class OptionDifficultyAttributes(ctypes.Structure):
+    """May optionally hold a value."""
+
+    _fields_ = [
+        ("_t", DifficultyAttributes),
+        ("_is_some", ctypes.c_uint8),
+    ]
+
+    @property
+    def value(self) -> DifficultyAttributes:
+        """Returns the value if it exists, or None."""
+        if self._is_some == 1:
+            return self._t
+        else:
+            return None
+
+    def is_some(self) -> bool:
+        """Returns true if the value exists."""
+        return self._is_some == 1
+
+    def is_none(self) -> bool:
+        """Returns true if the value does not exist."""
+        return self._is_some != 0
+
+
+class OptionHitObject(ctypes.Structure):
+    """May optionally hold a value."""
+
+    _fields_ = [
+        ("_t", HitObject),
+        ("_is_some", ctypes.c_uint8),
+    ]
+
+    @property
+    def value(self) -> HitObject:
+        """Returns the value if it exists, or None."""
+        if self._is_some == 1:
+            return self._t
+        else:
+            return None
+
+    def is_some(self) -> bool:
+        """Returns true if the value exists."""
+        return self._is_some == 1
+
+    def is_none(self) -> bool:
+        """Returns true if the value does not exist."""
+        return self._is_some != 0
+
+
+class OptionPerformanceAttributes(ctypes.Structure):
+    """May optionally hold a value."""
+
+    _fields_ = [
+        ("_t", PerformanceAttributes),
+        ("_is_some", ctypes.c_uint8),
+    ]
+
+    @property
+    def value(self) -> PerformanceAttributes:
+        """Returns the value if it exists, or None."""
+        if self._is_some == 1:
+            return self._t
+        else:
+            return None
+
+    def is_some(self) -> bool:
+        """Returns true if the value exists."""
+        return self._is_some == 1
+
+    def is_none(self) -> bool:
+        """Returns true if the value does not exist."""
+        return self._is_some != 0
+
+
+
+
+class SliceMutDifficultyAttributes(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(DifficultyAttributes)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> DifficultyAttributes:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def __setitem__(self, i, v: DifficultyAttributes):
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        self.data[index] = v
+
+    def copied(self) -> SliceMutDifficultyAttributes:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (DifficultyAttributes * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(DifficultyAttributes))
+        rval = SliceMutDifficultyAttributes(data=ctypes.cast(array, ctypes.POINTER(DifficultyAttributes)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[DifficultyAttributes]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[DifficultyAttributes]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> DifficultyAttributes:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> DifficultyAttributes:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+
+
+class DifficultyCacheStats(ctypes.Structure):
+    """ Counters of the difficulty attribute cache."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("hits", ctypes.c_uint64),
+        ("misses", ctypes.c_uint64),
+        ("evictions", ctypes.c_uint64),
+        ("len", ctypes.c_uint32),
+        ("capacity", ctypes.c_uint32),
+    ]
+
+    def __init__(self, hits: int = None, misses: int = None, evictions: int = None, len: int = None, capacity: int = None):
+        if hits is not None:
+            self.hits = hits
+        if misses is not None:
+            self.misses = misses
+        if evictions is not None:
+            self.evictions = evictions
+        if len is not None:
+            self.len = len
+        if capacity is not None:
+            self.capacity = capacity
+
+    @property
+    def hits(self) -> int:
+        """ Lookups that were answered from the cache."""
+        return ctypes.Structure.__get__(self, "hits")
+
+    @hits.setter
+    def hits(self, value: int):
+        """ Lookups that were answered from the cache."""
+        return ctypes.Structure.__set__(self, "hits", value)
+
+    @property
+    def misses(self) -> int:
+        """ Lookups that had to calculate the attributes."""
+        return ctypes.Structure.__get__(self, "misses")
+
+    @misses.setter
+    def misses(self, value: int):
+        """ Lookups that had to calculate the attributes."""
+        return ctypes.Structure.__set__(self, "misses", value)
+
+    @property
+    def evictions(self) -> int:
+        """ Entries that were dropped to make room for new ones."""
+        return ctypes.Structure.__get__(self, "evictions")
+
+    @evictions.setter
+    def evictions(self, value: int):
+        """ Entries that were dropped to make room for new ones."""
+        return ctypes.Structure.__set__(self, "evictions", value)
+
+    @property
+    def len(self) -> int:
+        """ Amount of cached entries."""
+        return ctypes.Structure.__get__(self, "len")
+
+    @len.setter
+    def len(self, value: int):
+        """ Amount of cached entries."""
+        return ctypes.Structure.__set__(self, "len", value)
+
+    @property
+    def capacity(self) -> int:
+        """ Maximum amount of cached entries, `0` if caching is disabled."""
+        return ctypes.Structure.__get__(self, "capacity")
+
+    @capacity.setter
+    def capacity(self, value: int):
+        """ Maximum amount of cached entries, `0` if caching is disabled."""
+        return ctypes.Structure.__set__(self, "capacity", value)
+
+
+
+
+class BeatmapCacheStats(ctypes.Structure):
+    """ Counters of the parsed beatmap cache."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("hits", ctypes.c_uint64),
+        ("misses", ctypes.c_uint64),
+        ("evictions", ctypes.c_uint64),
+        ("bytes", ctypes.c_uint64),
+        ("capacity", ctypes.c_uint64),
+        ("len", ctypes.c_uint32),
+    ]
+
+    def __init__(self, hits: int = None, misses: int = None, evictions: int = None, bytes: int = None, capacity: int = None, len: int = None):
+        if hits is not None:
+            self.hits = hits
+        if misses is not None:
+            self.misses = misses
+        if evictions is not None:
+            self.evictions = evictions
+        if bytes is not None:
+            self.bytes = bytes
+        if capacity is not None:
+            self.capacity = capacity
+        if len is not None:
+            self.len = len
+
+    @property
+    def hits(self) -> int:
+        """ Lookups that were answered from the cache."""
+        return ctypes.Structure.__get__(self, "hits")
+
+    @hits.setter
+    def hits(self, value: int):
+        """ Lookups that were answered from the cache."""
+        return ctypes.Structure.__set__(self, "hits", value)
+
+    @property
+    def misses(self) -> int:
+        """ Lookups that had to parse the beatmap."""
+        return ctypes.Structure.__get__(self, "misses")
+
+    @misses.setter
+    def misses(self, value: int):
+        """ Lookups that had to parse the beatmap."""
+        return ctypes.Structure.__set__(self, "misses", value)
+
+    @property
+    def evictions(self) -> int:
+        """ Entries that were dropped to make room for new ones."""
+        return ctypes.Structure.__get__(self, "evictions")
+
+    @evictions.setter
+    def evictions(self, value: int):
+        """ Entries that were dropped to make room for new ones."""
+        return ctypes.Structure.__set__(self, "evictions", value)
+
+    @property
+    def bytes(self) -> int:
+        """ Size of the `.osu` content of all cached beatmaps."""
+        return ctypes.Structure.__get__(self, "bytes")
+
+    @bytes.setter
+    def bytes(self, value: int):
+        """ Size of the `.osu` content of all cached beatmaps."""
+        return ctypes.Structure.__set__(self, "bytes", value)
+
+    @property
+    def capacity(self) -> int:
+        """ Maximum of `bytes`, `0` if caching is disabled."""
+        return ctypes.Structure.__get__(self, "capacity")
+
+    @capacity.setter
+    def capacity(self, value: int):
+        """ Maximum of `bytes`, `0` if caching is disabled."""
+        return ctypes.Structure.__set__(self, "capacity", value)
+
+    @property
+    def len(self) -> int:
+        """ Amount of cached beatmaps."""
+        return ctypes.Structure.__get__(self, "len")
+
+    @len.setter
+    def len(self, value: int):
+        """ Amount of cached beatmaps."""
+        return ctypes.Structure.__set__(self, "len", value)
+
+
+
+
+class LoadResult(ctypes.Structure):
+    """ Outcome of loading a single file of a [`BeatmapLoader`] or a single
+ beatmap of a `DifficultyBatch`."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("error", ctypes.c_int),
+        ("millis", ctypes.c_double),
+    ]
+
+    def __init__(self, error: ctypes.c_int = None, millis: float = None):
+        if error is not None:
+            self.error = error
+        if millis is not None:
+            self.millis = millis
+
+    @property
+    def error(self) -> ctypes.c_int:
+        """ [`FFIError::Ok`] if the file was parsed, otherwise why it wasn't."""
+        return ctypes.Structure.__get__(self, "error")
+
+    @error.setter
+    def error(self, value: ctypes.c_int):
+        """ [`FFIError::Ok`] if the file was parsed, otherwise why it wasn't."""
+        return ctypes.Structure.__set__(self, "error", value)
+
+    @property
+    def millis(self) -> float:
+        """ Time spent reading and parsing the file in milliseconds, for a
+ `DifficultyBatch` including the calculation."""
+        return ctypes.Structure.__get__(self, "millis")
+
+    @millis.setter
+    def millis(self, value: float):
+        """ Time spent reading and parsing the file in milliseconds, for a
+ `DifficultyBatch` including the calculation."""
+        return ctypes.Structure.__set__(self, "millis", value)
+
+
+class SliceMutLoadResult(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(LoadResult)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> LoadResult:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def __setitem__(self, i, v: LoadResult):
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        self.data[index] = v
+
+    def copied(self) -> SliceMutLoadResult:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (LoadResult * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(LoadResult))
+        rval = SliceMutLoadResult(data=ctypes.cast(array, ctypes.POINTER(LoadResult)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[LoadResult]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[LoadResult]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> LoadResult:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> LoadResult:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+
+
+class SliceMutf32(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(ctypes.c_float)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> float:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def __setitem__(self, i, v: float):
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        self.data[index] = v
+
+    def copied(self) -> SliceMutf32:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (ctypes.c_float * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(ctypes.c_float))
+        rval = SliceMutf32(data=ctypes.cast(array, ctypes.POINTER(ctypes.c_float)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[ctypes.c_float]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[ctypes.c_float]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> float:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> float:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+class SliceMutu32(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(ctypes.c_uint32)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> int:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def __setitem__(self, i, v: int):
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        self.data[index] = v
+
+    def copied(self) -> SliceMutu32:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (ctypes.c_uint32 * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(ctypes.c_uint32))
+        rval = SliceMutu32(data=ctypes.cast(array, ctypes.POINTER(ctypes.c_uint32)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[ctypes.c_uint32]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[ctypes.c_uint32]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> int:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> int:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+class HitObjectColumns(ctypes.Structure):
+    """ Output columns for [`Beatmap::hit_object_columns`].
+
+ Every column may be left empty, otherwise it must hold one element per
+ hit object. `kind` holds [`HitObjectKind`] values. `expected_dist` is NaN
+ for objects without one and `repeats` is `0` for anything but sliders.
+ `duration` is `end_time - start_time`: `0` for circles, the time until
+ the tail for sliders and the length of spinners and holds.
+ `duration` and `end_time` are NaN for sliders without an expected distance.
+
+ [`Beatmap::hit_object_columns`]: super::Beatmap::hit_object_columns"""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("start_time", SliceMutf64),
+        ("x", SliceMutf32),
+        ("y", SliceMutf32),
+        ("kind", SliceMutu32),
+        ("repeats", SliceMutu32),
+        ("expected_dist", SliceMutf64),
+        ("duration", SliceMutf64),
+        ("end_time", SliceMutf64),
+    ]
+
+    def __init__(self, start_time: SliceMutf64 = None, x: SliceMutf32 = None, y: SliceMutf32 = None, kind: SliceMutu32 = None, repeats: SliceMutu32 = None, expected_dist: SliceMutf64 = None, duration: SliceMutf64 = None, end_time: SliceMutf64 = None):
+        if start_time is not None:
+            self.start_time = start_time
+        if x is not None:
+            self.x = x
+        if y is not None:
+            self.y = y
+        if kind is not None:
+            self.kind = kind
+        if repeats is not None:
+            self.repeats = repeats
+        if expected_dist is not None:
+            self.expected_dist = expected_dist
+        if duration is not None:
+            self.duration = duration
+        if end_time is not None:
+            self.end_time = end_time
+
+    @property
+    def start_time(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "start_time")
+
+    @start_time.setter
+    def start_time(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "start_time", value)
+
+    @property
+    def x(self) -> SliceMutf32:
+        return ctypes.Structure.__get__(self, "x")
+
+    @x.setter
+    def x(self, value: SliceMutf32):
+        return ctypes.Structure.__set__(self, "x", value)
+
+    @property
+    def y(self) -> SliceMutf32:
+        return ctypes.Structure.__get__(self, "y")
+
+    @y.setter
+    def y(self, value: SliceMutf32):
+        return ctypes.Structure.__set__(self, "y", value)
+
+    @property
+    def kind(self) -> SliceMutu32:
+        return ctypes.Structure.__get__(self, "kind")
+
+    @kind.setter
+    def kind(self, value: SliceMutu32):
+        return ctypes.Structure.__set__(self, "kind", value)
+
+    @property
+    def repeats(self) -> SliceMutu32:
+        return ctypes.Structure.__get__(self, "repeats")
+
+    @repeats.setter
+    def repeats(self, value: SliceMutu32):
+        return ctypes.Structure.__set__(self, "repeats", value)
+
+    @property
+    def expected_dist(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "expected_dist")
+
+    @expected_dist.setter
+    def expected_dist(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "expected_dist", value)
+
+    @property
+    def duration(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "duration")
+
+    @duration.setter
+    def duration(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "duration", value)
+
+    @property
+    def end_time(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "end_time")
+
+    @end_time.setter
+    def end_time(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "end_time", value)
+
+
+
+
+class StrainWindow(ctypes.Structure):
+    """ A stretch of consecutive strain sections, see [`StrainTimeline::hardest_windows`]."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("section", ctypes.c_uint32),
+        ("start_time", ctypes.c_double),
+        ("end_time", ctypes.c_double),
+        ("strain", ctypes.c_double),
+    ]
+
+    def __init__(self, section: int = None, start_time: float = None, end_time: float = None, strain: float = None):
+        if section is not None:
+            self.section = section
+        if start_time is not None:
+            self.start_time = start_time
+        if end_time is not None:
+            self.end_time = end_time
+        if strain is not None:
+            self.strain = strain
+
+    @property
+    def section(self) -> int:
+        """ Index of the first section."""
+        return ctypes.Structure.__get__(self, "section")
+
+    @section.setter
+    def section(self, value: int):
+        """ Index of the first section."""
+        return ctypes.Structure.__set__(self, "section", value)
+
+    @property
+    def start_time(self) -> float:
+        """ Start of the first section in milliseconds of map time."""
+        return ctypes.Structure.__get__(self, "start_time")
+
+    @start_time.setter
+    def start_time(self, value: float):
+        """ Start of the first section in milliseconds of map time."""
+        return ctypes.Structure.__set__(self, "start_time", value)
+
+    @property
+    def end_time(self) -> float:
+        """ End of the last section in milliseconds of map time."""
+        return ctypes.Structure.__get__(self, "end_time")
+
+    @end_time.setter
+    def end_time(self, value: float):
+        """ End of the last section in milliseconds of map time."""
+        return ctypes.Structure.__set__(self, "end_time", value)
+
+    @property
+    def strain(self) -> float:
+        """ Mean strain peak of the sections."""
+        return ctypes.Structure.__get__(self, "strain")
+
+    @strain.setter
+    def strain(self, value: float):
+        """ Mean strain peak of the sections."""
+        return ctypes.Structure.__set__(self, "strain", value)
+
+
+class SliceMutStrainWindow(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(StrainWindow)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> StrainWindow:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def __setitem__(self, i, v: StrainWindow):
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        self.data[index] = v
+
+    def copied(self) -> SliceMutStrainWindow:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (StrainWindow * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(StrainWindow))
+        rval = SliceMutStrainWindow(data=ctypes.cast(array, ctypes.POINTER(StrainWindow)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[StrainWindow]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[StrainWindow]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> StrainWindow:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> StrainWindow:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+
+
+class GradualDifficultyColumns(ctypes.Structure):
+    """ Output columns for [`GradualDifficulty::collect`].
+
+ `stars` decides the amount of processed objects and may not exceed
+ [`GradualDifficulty::len`]. Every other column may be left empty,
+ otherwise it must be as long as `stars`. Values that do not exist for
+ the map's mode are written as `0`."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("stars", SliceMutf64),
+        ("aim", SliceMutf64),
+        ("jump", SliceMutf64),
+        ("flow", SliceMutf64),
+        ("precision", SliceMutf64),
+        ("speed", SliceMutf64),
+        ("stamina", SliceMutf64),
+        ("accuracy", SliceMutf64),
+        ("rhythm", SliceMutf64),
+        ("color", SliceMutf64),
+        ("max_combo", SliceMutu32),
+    ]
+
+    def __init__(self, stars: SliceMutf64 = None, aim: SliceMutf64 = None, jump: SliceMutf64 = None, flow: SliceMutf64 = None, precision: SliceMutf64 = None, speed: SliceMutf64 = None, stamina: SliceMutf64 = None, accuracy: SliceMutf64 = None, rhythm: SliceMutf64 = None, color: SliceMutf64 = None, max_combo: SliceMutu32 = None):
+        if stars is not None:
+            self.stars = stars
+        if aim is not None:
+            self.aim = aim
+        if jump is not None:
+            self.jump = jump
+        if flow is not None:
+            self.flow = flow
+        if precision is not None:
+            self.precision = precision
+        if speed is not None:
+            self.speed = speed
+        if stamina is not None:
+            self.stamina = stamina
+        if accuracy is not None:
+            self.accuracy = accuracy
+        if rhythm is not None:
+            self.rhythm = rhythm
+        if color is not None:
+            self.color = color
+        if max_combo is not None:
+            self.max_combo = max_combo
+
+    @property
+    def stars(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "stars")
+
+    @stars.setter
+    def stars(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "stars", value)
+
+    @property
+    def aim(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "aim")
+
+    @aim.setter
+    def aim(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "aim", value)
+
+    @property
+    def jump(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "jump")
+
+    @jump.setter
+    def jump(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "jump", value)
+
+    @property
+    def flow(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "flow")
+
+    @flow.setter
+    def flow(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "flow", value)
+
+    @property
+    def precision(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "precision")
+
+    @precision.setter
+    def precision(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "precision", value)
+
+    @property
+    def speed(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "speed")
+
+    @speed.setter
+    def speed(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "speed", value)
+
+    @property
+    def stamina(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "stamina")
+
+    @stamina.setter
+    def stamina(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "stamina", value)
+
+    @property
+    def accuracy(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "accuracy")
+
+    @accuracy.setter
+    def accuracy(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "accuracy", value)
+
+    @property
+    def rhythm(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "rhythm")
+
+    @rhythm.setter
+    def rhythm(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "rhythm", value)
+
+    @property
+    def color(self) -> SliceMutf64:
+        return ctypes.Structure.__get__(self, "color")
+
+    @color.setter
+    def color(self, value: SliceMutf64):
+        return ctypes.Structure.__set__(self, "color", value)
+
+    @property
+    def max_combo(self) -> SliceMutu32:
+        return ctypes.Structure.__get__(self, "max_combo")
+
+    @max_combo.setter
+    def max_combo(self, value: SliceMutu32):
+        return ctypes.Structure.__set__(self, "max_combo", value)
+
+
+
+
+class ObjectJudgement(ctypes.Structure):
+    """ Judgement of a hit object for [`GradualPerformance::replay`].
+
+ The tick and slider end fields are only relevant for osu!standard
+ scores set on osu!lazer, see [`ScoreState`] for their meaning."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("result", ctypes.c_int),
+        ("large_tick_hits", ctypes.c_uint32),
+        ("large_tick_misses", ctypes.c_uint32),
+        ("small_tick_hits", ctypes.c_uint32),
+        ("slider_end_hit", ctypes.c_bool),
+    ]
+
+    def __init__(self, result: ctypes.c_int = None, large_tick_hits: int = None, large_tick_misses: int = None, small_tick_hits: int = None, slider_end_hit: bool = None):
+        if result is not None:
+            self.result = result
+        if large_tick_hits is not None:
+            self.large_tick_hits = large_tick_hits
+        if large_tick_misses is not None:
+            self.large_tick_misses = large_tick_misses
+        if small_tick_hits is not None:
+            self.small_tick_hits = small_tick_hits
+        if slider_end_hit is not None:
+            self.slider_end_hit = slider_end_hit
+
+    @property
+    def result(self) -> ctypes.c_int:
+        return ctypes.Structure.__get__(self, "result")
+
+    @result.setter
+    def result(self, value: ctypes.c_int):
+        return ctypes.Structure.__set__(self, "result", value)
+
+    @property
+    def large_tick_hits(self) -> int:
+        return ctypes.Structure.__get__(self, "large_tick_hits")
+
+    @large_tick_hits.setter
+    def large_tick_hits(self, value: int):
+        return ctypes.Structure.__set__(self, "large_tick_hits", value)
+
+    @property
+    def large_tick_misses(self) -> int:
+        return ctypes.Structure.__get__(self, "large_tick_misses")
+
+    @large_tick_misses.setter
+    def large_tick_misses(self, value: int):
+        return ctypes.Structure.__set__(self, "large_tick_misses", value)
+
+    @property
+    def small_tick_hits(self) -> int:
+        return ctypes.Structure.__get__(self, "small_tick_hits")
+
+    @small_tick_hits.setter
+    def small_tick_hits(self, value: int):
+        return ctypes.Structure.__set__(self, "small_tick_hits", value)
+
+    @property
+    def slider_end_hit(self) -> bool:
+        return ctypes.Structure.__get__(self, "slider_end_hit")
+
+    @slider_end_hit.setter
+    def slider_end_hit(self, value: bool):
+        return ctypes.Structure.__set__(self, "slider_end_hit", value)
+
+
+class SliceObjectJudgement(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(ObjectJudgement)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> ObjectJudgement:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def copied(self) -> SliceObjectJudgement:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (ObjectJudgement * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(ObjectJudgement))
+        rval = SliceObjectJudgement(data=ctypes.cast(array, ctypes.POINTER(ObjectJudgement)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[ObjectJudgement]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[ObjectJudgement]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> ObjectJudgement:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> ObjectJudgement:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+
+
+class SliceMutBeatmapAttributes(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(BeatmapAttributes)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> BeatmapAttributes:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def __setitem__(self, i, v: BeatmapAttributes):
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        self.data[index] = v
+
+    def copied(self) -> SliceMutBeatmapAttributes:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (BeatmapAttributes * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(BeatmapAttributes))
+        rval = SliceMutBeatmapAttributes(data=ctypes.cast(array, ctypes.POINTER(BeatmapAttributes)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[BeatmapAttributes]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[BeatmapAttributes]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> BeatmapAttributes:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> BeatmapAttributes:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+
+
+class RateEstimate(ctypes.Structure):
+    """ Star rating at a clock rate, see [`RateCurve::estimate`]."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("clock_rate", ctypes.c_double),
+        ("stars", ctypes.c_double),
+        ("error_bound", ctypes.c_double),
+    ]
+
+    def __init__(self, clock_rate: float = None, stars: float = None, error_bound: float = None):
+        if clock_rate is not None:
+            self.clock_rate = clock_rate
+        if stars is not None:
+            self.stars = stars
+        if error_bound is not None:
+            self.error_bound = error_bound
+
+    @property
+    def clock_rate(self) -> float:
+        return ctypes.Structure.__get__(self, "clock_rate")
+
+    @clock_rate.setter
+    def clock_rate(self, value: float):
+        return ctypes.Structure.__set__(self, "clock_rate", value)
+
+    @property
+    def stars(self) -> float:
+        return ctypes.Structure.__get__(self, "stars")
+
+    @stars.setter
+    def stars(self, value: float):
+        return ctypes.Structure.__set__(self, "stars", value)
+
+    @property
+    def error_bound(self) -> float:
+        """ Estimated upper bound of the interpolation error in stars.
+
+ `0` if `clock_rate` is a grid point."""
+        return ctypes.Structure.__get__(self, "error_bound")
+
+    @error_bound.setter
+    def error_bound(self, value: float):
+        """ Estimated upper bound of the interpolation error in stars.
+
+ `0` if `clock_rate` is a grid point."""
+        return ctypes.Structure.__set__(self, "error_bound", value)
+
+
+class OptionRateEstimate(ctypes.Structure):
+    """May optionally hold a value."""
+
+    _fields_ = [
+        ("_t", RateEstimate),
+        ("_is_some", ctypes.c_uint8),
+    ]
+
+    @property
+    def value(self) -> RateEstimate:
+        """Returns the value if it exists, or None."""
+        if self._is_some == 1:
+            return self._t
+        else:
+            return None
+
+    def is_some(self) -> bool:
+        """Returns true if the value exists."""
+        return self._is_some == 1
+
+    def is_none(self) -> bool:
+        """Returns true if the value does not exist."""
+        return self._is_some != 0
+
+
+
+
+class Slicef64(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(ctypes.c_double)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> float:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def copied(self) -> Slicef64:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (ctypes.c_double * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(ctypes.c_double))
+        rval = Slicef64(data=ctypes.cast(array, ctypes.POINTER(ctypes.c_double)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[ctypes.c_double]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[ctypes.c_double]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> float:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> float:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+
+
+class PpTarget(ctypes.Structure):
+    """ Result of [`performance_min_accuracy`] and [`performance_max_misses`]."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("reachable", ctypes.c_bool),
+        ("accuracy", ctypes.c_double),
+        ("misses", ctypes.c_uint32),
+        ("pp", ctypes.c_double),
+        ("state", ScoreState),
+    ]
+
+    def __init__(self, reachable: bool = None, accuracy: float = None, misses: int = None, pp: float = None, state: ScoreState = None):
+        if reachable is not None:
+            self.reachable = reachable
+        if accuracy is not None:
+            self.accuracy = accuracy
+        if misses is not None:
+            self.misses = misses
+        if pp is not None:
+            self.pp = pp
+        if state is not None:
+            self.state = state
+
+    @property
+    def reachable(self) -> bool:
+        """ Whether the target pp can be reached at all with the given settings.
+
+ If not, the other fields describe the best possible score instead."""
+        return ctypes.Structure.__get__(self, "reachable")
+
+    @reachable.setter
+    def reachable(self, value: bool):
+        """ Whether the target pp can be reached at all with the given settings.
+
+ If not, the other fields describe the best possible score instead."""
+        return ctypes.Structure.__set__(self, "reachable", value)
+
+    @property
+    def accuracy(self) -> float:
+        """ Accuracy of `state` in percent, as calculated for the given origin."""
+        return ctypes.Structure.__get__(self, "accuracy")
+
+    @accuracy.setter
+    def accuracy(self, value: float):
+        """ Accuracy of `state` in percent, as calculated for the given origin."""
+        return ctypes.Structure.__set__(self, "accuracy", value)
+
+    @property
+    def misses(self) -> int:
+        return ctypes.Structure.__get__(self, "misses")
+
+    @misses.setter
+    def misses(self, value: int):
+        return ctypes.Structure.__set__(self, "misses", value)
+
+    @property
+    def pp(self) -> float:
+        """ pp of the resulting score, at least the target if reachable."""
+        return ctypes.Structure.__get__(self, "pp")
+
+    @pp.setter
+    def pp(self, value: float):
+        """ pp of the resulting score, at least the target if reachable."""
+        return ctypes.Structure.__set__(self, "pp", value)
+
+    @property
+    def state(self) -> ScoreState:
+        """ Hit results of the resulting score."""
+        return ctypes.Structure.__get__(self, "state")
+
+    @state.setter
+    def state(self, value: ScoreState):
+        """ Hit results of the resulting score."""
+        return ctypes.Structure.__set__(self, "state", value)
+
+
+
+
+class ProfileScore(ctypes.Structure):
+    """  A single play to score with a [`ProfileEngine`]."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("user_id", ctypes.c_uint64),
+        ("beatmap", ctypes.c_uint64),
+        ("mods", ctypes.c_uint32),
+        ("lazer", ctypes.c_bool),
+        ("state", ScoreState),
+    ]
+
+    def __init__(self, user_id: int = None, beatmap: int = None, mods: int = None, lazer: bool = None, state: ScoreState = None):
+        if user_id is not None:
+            self.user_id = user_id
+        if beatmap is not None:
+            self.beatmap = beatmap
+        if mods is not None:
+            self.mods = mods
+        if lazer is not None:
+            self.lazer = lazer
+        if state is not None:
+            self.state = state
+
+    @property
+    def user_id(self) -> int:
+        return ctypes.Structure.__get__(self, "user_id")
+
+    @user_id.setter
+    def user_id(self, value: int):
+        return ctypes.Structure.__set__(self, "user_id", value)
+
+    @property
+    def beatmap(self) -> int:
+        """ Key the beatmap was added to the [`ProfileEngine`] with."""
+        return ctypes.Structure.__get__(self, "beatmap")
+
+    @beatmap.setter
+    def beatmap(self, value: int):
+        """ Key the beatmap was added to the [`ProfileEngine`] with."""
+        return ctypes.Structure.__set__(self, "beatmap", value)
+
+    @property
+    def mods(self) -> int:
+        """ Legacy mod bits."""
+        return ctypes.Structure.__get__(self, "mods")
+
+    @mods.setter
+    def mods(self, value: int):
+        """ Legacy mod bits."""
+        return ctypes.Structure.__set__(self, "mods", value)
+
+    @property
+    def lazer(self) -> bool:
+        return ctypes.Structure.__get__(self, "lazer")
+
+    @lazer.setter
+    def lazer(self, value: bool):
+        return ctypes.Structure.__set__(self, "lazer", value)
+
+    @property
+    def state(self) -> ScoreState:
+        return ctypes.Structure.__get__(self, "state")
+
+    @state.setter
+    def state(self, value: ScoreState):
+        return ctypes.Structure.__set__(self, "state", value)
+
+
+class ProfileTotal(ctypes.Structure):
+    """  Weighted totals of a single user, see [`ProfileEngine::totals`].
+
+ Every skill is weighted on its own, i.e. plays are sorted by that
+ skill's pp before the weights are applied, like on pp+ profiles."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("user_id", ctypes.c_uint64),
+        ("pp", ctypes.c_double),
+        ("bonus_pp", ctypes.c_double),
+        ("pp_aim", ctypes.c_double),
+        ("pp_jump_aim", ctypes.c_double),
+        ("pp_flow_aim", ctypes.c_double),
+        ("pp_precision", ctypes.c_double),
+        ("pp_speed", ctypes.c_double),
+        ("pp_stamina", ctypes.c_double),
+        ("pp_acc", ctypes.c_double),
+        ("plays", ctypes.c_uint32),
+        ("failed", ctypes.c_uint32),
+    ]
+
+    def __init__(self, user_id: int = None, pp: float = None, bonus_pp: float = None, pp_aim: float = None, pp_jump_aim: float = None, pp_flow_aim: float = None, pp_precision: float = None, pp_speed: float = None, pp_stamina: float = None, pp_acc: float = None, plays: int = None, failed: int = None):
+        if user_id is not None:
+            self.user_id = user_id
+        if pp is not None:
+            self.pp = pp
+        if bonus_pp is not None:
+            self.bonus_pp = bonus_pp
+        if pp_aim is not None:
+            self.pp_aim = pp_aim
+        if pp_jump_aim is not None:
+            self.pp_jump_aim = pp_jump_aim
+        if pp_flow_aim is not None:
+            self.pp_flow_aim = pp_flow_aim
+        if pp_precision is not None:
+            self.pp_precision = pp_precision
+        if pp_speed is not None:
+            self.pp_speed = pp_speed
+        if pp_stamina is not None:
+            self.pp_stamina = pp_stamina
+        if pp_acc is not None:
+            self.pp_acc = pp_acc
+        if plays is not None:
+            self.plays = plays
+        if failed is not None:
+            self.failed = failed
+
+    @property
+    def user_id(self) -> int:
+        return ctypes.Structure.__get__(self, "user_id")
+
+    @user_id.setter
+    def user_id(self, value: int):
+        return ctypes.Structure.__set__(self, "user_id", value)
+
+    @property
+    def pp(self) -> float:
+        """ Weighted pp of all plays including [`ProfileTotal::bonus_pp`]."""
+        return ctypes.Structure.__get__(self, "pp")
+
+    @pp.setter
+    def pp(self, value: float):
+        """ Weighted pp of all plays including [`ProfileTotal::bonus_pp`]."""
+        return ctypes.Structure.__set__(self, "pp", value)
+
+    @property
+    def bonus_pp(self) -> float:
+        """ Bonus pp for the amount of beatmaps the user has a play on."""
+        return ctypes.Structure.__get__(self, "bonus_pp")
+
+    @bonus_pp.setter
+    def bonus_pp(self, value: float):
+        """ Bonus pp for the amount of beatmaps the user has a play on."""
+        return ctypes.Structure.__set__(self, "bonus_pp", value)
+
+    @property
+    def pp_aim(self) -> float:
+        return ctypes.Structure.__get__(self, "pp_aim")
+
+    @pp_aim.setter
+    def pp_aim(self, value: float):
+        return ctypes.Structure.__set__(self, "pp_aim", value)
+
+    @property
+    def pp_jump_aim(self) -> float:
+        return ctypes.Structure.__get__(self, "pp_jump_aim")
+
+    @pp_jump_aim.setter
+    def pp_jump_aim(self, value: float):
+        return ctypes.Structure.__set__(self, "pp_jump_aim", value)
+
+    @property
+    def pp_flow_aim(self) -> float:
+        return ctypes.Structure.__get__(self, "pp_flow_aim")
+
+    @pp_flow_aim.setter
+    def pp_flow_aim(self, value: float):
+        return ctypes.Structure.__set__(self, "pp_flow_aim", value)
+
+    @property
+    def pp_precision(self) -> float:
+        return ctypes.Structure.__get__(self, "pp_precision")
+
+    @pp_precision.setter
+    def pp_precision(self, value: float):
+        return ctypes.Structure.__set__(self, "pp_precision", value)
+
+    @property
+    def pp_speed(self) -> float:
+        return ctypes.Structure.__get__(self, "pp_speed")
+
+    @pp_speed.setter
+    def pp_speed(self, value: float):
+        return ctypes.Structure.__set__(self, "pp_speed", value)
+
+    @property
+    def pp_stamina(self) -> float:
+        return ctypes.Structure.__get__(self, "pp_stamina")
+
+    @pp_stamina.setter
+    def pp_stamina(self, value: float):
+        return ctypes.Structure.__set__(self, "pp_stamina", value)
+
+    @property
+    def pp_acc(self) -> float:
+        return ctypes.Structure.__get__(self, "pp_acc")
+
+    @pp_acc.setter
+    def pp_acc(self, value: float):
+        return ctypes.Structure.__set__(self, "pp_acc", value)
+
+    @property
+    def plays(self) -> int:
+        """ Amount of beatmaps that count towards the totals."""
+        return ctypes.Structure.__get__(self, "plays")
+
+    @plays.setter
+    def plays(self, value: int):
+        """ Amount of beatmaps that count towards the totals."""
+        return ctypes.Structure.__set__(self, "plays", value)
+
+    @property
+    def failed(self) -> int:
+        """ Amount of plays that were skipped because their beatmap was never
+ added or failed to parse."""
+        return ctypes.Structure.__get__(self, "failed")
+
+    @failed.setter
+    def failed(self, value: int):
+        """ Amount of plays that were skipped because their beatmap was never
+ added or failed to parse."""
+        return ctypes.Structure.__set__(self, "failed", value)
+
+
+class SliceProfileScore(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(ProfileScore)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> ProfileScore:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def copied(self) -> SliceProfileScore:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (ProfileScore * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(ProfileScore))
+        rval = SliceProfileScore(data=ctypes.cast(array, ctypes.POINTER(ProfileScore)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[ProfileScore]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[ProfileScore]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> ProfileScore:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> ProfileScore:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+class SliceMutProfileTotal(ctypes.Structure):
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("data", ctypes.POINTER(ProfileTotal)),
+        ("len", ctypes.c_uint64),
+    ]
+
+    def __len__(self):
+        return self.len
+
+    def __getitem__(self, i) -> ProfileTotal:
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        return self.data[index]
+
+    def __setitem__(self, i, v: ProfileTotal):
+        if i < 0:
+            index = self.len+i
+        else:
+            index = i
+
+        if index >= self.len:
+            raise IndexError("Index out of range")
+
+        self.data[index] = v
+
+    def copied(self) -> SliceMutProfileTotal:
+        """Returns a shallow, owned copy of the underlying slice.
+
+        The returned object owns the immediate data, but not the targets of any contained
+        pointers. In other words, if your struct contains any pointers the returned object
+        may only be used as long as these pointers are valid. If the struct did not contain
+        any pointers the returned object is valid indefinitely."""
+        array = (ProfileTotal * len(self))()
+        ctypes.memmove(array, self.data, len(self) * ctypes.sizeof(ProfileTotal))
+        rval = SliceMutProfileTotal(data=ctypes.cast(array, ctypes.POINTER(ProfileTotal)), len=len(self))
+        rval.owned = array  # Store array in returned slice to prevent memory deallocation
+        return rval
+
+    def __iter__(self) -> typing.Iterable[ProfileTotal]:
+        return _Iter(self)
+
+    def iter(self) -> typing.Iterable[ProfileTotal]:
+        """Convenience method returning a value iterator."""
+        return iter(self)
+
+    def first(self) -> ProfileTotal:
+        """Returns the first element of this slice."""
+        return self[0]
+
+    def last(self) -> ProfileTotal:
+        """Returns the last element of this slice."""
+        return self[len(self)-1]
+
+
+
+
+class ScoreParams(ctypes.Structure):
+    """  Everything a [`performance::Performance`] can be configured with, as a
+ single plain struct that is passed by pointer instead of through one call
+ per setter.
+
+ Only fields whose [`ScoreParam`] is in `set` are used. The others must
+ still hold valid values since the struct is read as a whole, i.e. `mode`,
+ `hitresult_priority` and the enums in `state` must be one of their
+ variants and every `bool` must be `0` or `1`. A zero-initialized struct
+ is valid."""
+
+    # These fields represent the underlying C data layout
+    _fields_ = [
+        ("set", ctypes.c_uint32),
+        ("mode", ctypes.c_int),
+        ("mods", ctypes.c_uint32),
+        ("passed_objects", ctypes.c_uint32),
+        ("clock_rate", ctypes.c_double),
+        ("ar", ctypes.c_float),
+        ("cs", ctypes.c_float),
+        ("hp", ctypes.c_float),
+        ("od", ctypes.c_float),
+        ("hardrock_offsets", ctypes.c_bool),
+        ("accuracy", ctypes.c_double),
+        ("misses", ctypes.c_uint32),
+        ("combo", ctypes.c_uint32),
+        ("hitresult_priority", ctypes.c_int),
+        ("lazer", ctypes.c_bool),
+        ("large_tick_hits", ctypes.c_uint32),
+        ("small_tick_hits", ctypes.c_uint32),
+        ("slider_end_hits", ctypes.c_uint32),
+        ("n300", ctypes.c_uint32),
+        ("n100", ctypes.c_uint32),
+        ("n50", ctypes.c_uint32),
+        ("n_katu", ctypes.c_uint32),
+        ("n_geki", ctypes.c_uint32),
+        ("state", ScoreState),
+    ]
+
+    def __init__(self, set: int = None, mode: ctypes.c_int = None, mods: int = None, passed_objects: int = None, clock_rate: float = None, ar: float = None, cs: float = None, hp: float = None, od: float = None, hardrock_offsets: bool = None, accuracy: float = None, misses: int = None, combo: int = None, hitresult_priority: ctypes.c_int = None, lazer: bool = None, large_tick_hits: int = None, small_tick_hits: int = None, slider_end_hits: int = None, n300: int = None, n100: int = None, n50: int = None, n_katu: int = None, n_geki: int = None, state: ScoreState = None):
+        if set is not None:
+            self.set = set
+        if mode is not None:
+            self.mode = mode
+        if mods is not None:
+            self.mods = mods
+        if passed_objects is not None:
+            self.passed_objects = passed_objects
+        if clock_rate is not None:
+            self.clock_rate = clock_rate
+        if ar is not None:
+            self.ar = ar
+        if cs is not None:
+            self.cs = cs
+        if hp is not None:
+            self.hp = hp
+        if od is not None:
+            self.od = od
+        if hardrock_offsets is not None:
+            self.hardrock_offsets = hardrock_offsets
+        if accuracy is not None:
+            self.accuracy = accuracy
+        if misses is not None:
+            self.misses = misses
+        if combo is not None:
+            self.combo = combo
+        if hitresult_priority is not None:
+            self.hitresult_priority = hitresult_priority
+        if lazer is not None:
+            self.lazer = lazer
+        if large_tick_hits is not None:
+            self.large_tick_hits = large_tick_hits
+        if small_tick_hits is not None:
+            self.small_tick_hits = small_tick_hits
+        if slider_end_hits is not None:
+            self.slider_end_hits = slider_end_hits
+        if n300 is not None:
+            self.n300 = n300
+        if n100 is not None:
+            self.n100 = n100
+        if n50 is not None:
+            self.n50 = n50
+        if n_katu is not None:
+            self.n_katu = n_katu
+        if n_geki is not None:
+            self.n_geki = n_geki
+        if state is not None:
+            self.state = state
+
+    @property
+    def set(self) -> int:
+        """ Bitwise OR of the [`ScoreParam`]s of all used fields."""
+        return ctypes.Structure.__get__(self, "set")
+
+    @set.setter
+    def set(self, value: int):
+        """ Bitwise OR of the [`ScoreParam`]s of all used fields."""
+        return ctypes.Structure.__set__(self, "set", value)
+
+    @property
+    def mode(self) -> ctypes.c_int:
+        return ctypes.Structure.__get__(self, "mode")
+
+    @mode.setter
+    def mode(self, value: ctypes.c_int):
+        return ctypes.Structure.__set__(self, "mode", value)
+
+    @property
+    def mods(self) -> int:
+        """ Legacy mod bits."""
+        return ctypes.Structure.__get__(self, "mods")
+
+    @mods.setter
+    def mods(self, value: int):
+        """ Legacy mod bits."""
+        return ctypes.Structure.__set__(self, "mods", value)
+
+    @property
+    def passed_objects(self) -> int:
+        return ctypes.Structure.__get__(self, "passed_objects")
+
+    @passed_objects.setter
+    def passed_objects(self, value: int):
+        return ctypes.Structure.__set__(self, "passed_objects", value)
+
+    @property
+    def clock_rate(self) -> float:
+        return ctypes.Structure.__get__(self, "clock_rate")
+
+    @clock_rate.setter
+    def clock_rate(self, value: float):
+        return ctypes.Structure.__set__(self, "clock_rate", value)
+
+    @property
+    def ar(self) -> float:
+        return ctypes.Structure.__get__(self, "ar")
+
+    @ar.setter
+    def ar(self, value: float):
+        return ctypes.Structure.__set__(self, "ar", value)
+
+    @property
+    def cs(self) -> float:
+        return ctypes.Structure.__get__(self, "cs")
+
+    @cs.setter
+    def cs(self, value: float):
+        return ctypes.Structure.__set__(self, "cs", value)
+
+    @property
+    def hp(self) -> float:
+        return ctypes.Structure.__get__(self, "hp")
+
+    @hp.setter
+    def hp(self, value: float):
+        return ctypes.Structure.__set__(self, "hp", value)
+
+    @property
+    def od(self) -> float:
+        return ctypes.Structure.__get__(self, "od")
+
+    @od.setter
+    def od(self, value: float):
+        return ctypes.Structure.__set__(self, "od", value)
+
+    @property
+    def hardrock_offsets(self) -> bool:
+        return ctypes.Structure.__get__(self, "hardrock_offsets")
+
+    @hardrock_offsets.setter
+    def hardrock_offsets(self, value: bool):
+        return ctypes.Structure.__set__(self, "hardrock_offsets", value)
+
+    @property
+    def accuracy(self) -> float:
+        return ctypes.Structure.__get__(self, "accuracy")
+
+    @accuracy.setter
+    def accuracy(self, value: float):
+        return ctypes.Structure.__set__(self, "accuracy", value)
+
+    @property
+    def misses(self) -> int:
+        return ctypes.Structure.__get__(self, "misses")
+
+    @misses.setter
+    def misses(self, value: int):
+        return ctypes.Structure.__set__(self, "misses", value)
+
+    @property
+    def combo(self) -> int:
+        return ctypes.Structure.__get__(self, "combo")
+
+    @combo.setter
+    def combo(self, value: int):
+        return ctypes.Structure.__set__(self, "combo", value)
+
+    @property
+    def hitresult_priority(self) -> ctypes.c_int:
+        return ctypes.Structure.__get__(self, "hitresult_priority")
+
+    @hitresult_priority.setter
+    def hitresult_priority(self, value: ctypes.c_int):
+        return ctypes.Structure.__set__(self, "hitresult_priority", value)
+
+    @property
+    def lazer(self) -> bool:
+        return ctypes.Structure.__get__(self, "lazer")
+
+    @lazer.setter
+    def lazer(self, value: bool):
+        return ctypes.Structure.__set__(self, "lazer", value)
+
+    @property
+    def large_tick_hits(self) -> int:
+        return ctypes.Structure.__get__(self, "large_tick_hits")
+
+    @large_tick_hits.setter
+    def large_tick_hits(self, value: int):
+        return ctypes.Structure.__set__(self, "large_tick_hits", value)
+
+    @property
+    def small_tick_hits(self) -> int:
+        return ctypes.Structure.__get__(self, "small_tick_hits")
+
+    @small_tick_hits.setter
+    def small_tick_hits(self, value: int):
+        return ctypes.Structure.__set__(self, "small_tick_hits", value)
+
+    @property
+    def slider_end_hits(self) -> int:
+        return ctypes.Structure.__get__(self, "slider_end_hits")
+
+    @slider_end_hits.setter
+    def slider_end_hits(self, value: int):
+        return ctypes.Structure.__set__(self, "slider_end_hits", value)
+
+    @property
+    def n300(self) -> int:
+        return ctypes.Structure.__get__(self, "n300")
+
+    @n300.setter
+    def n300(self, value: int):
+        return ctypes.Structure.__set__(self, "n300", value)
+
+    @property
+    def n100(self) -> int:
+        return ctypes.Structure.__get__(self, "n100")
+
+    @n100.setter
+    def n100(self, value: int):
+        return ctypes.Structure.__set__(self, "n100", value)
+
+    @property
+    def n50(self) -> int:
+        return ctypes.Structure.__get__(self, "n50")
+
+    @n50.setter
+    def n50(self, value: int):
+        return ctypes.Structure.__set__(self, "n50", value)
+
+    @property
+    def n_katu(self) -> int:
+        return ctypes.Structure.__get__(self, "n_katu")
+
+    @n_katu.setter
+    def n_katu(self, value: int):
+        return ctypes.Structure.__set__(self, "n_katu", value)
+
+    @property
+    def n_geki(self) -> int:
+        return ctypes.Structure.__get__(self, "n_geki")
+
+    @n_geki.setter
+    def n_geki(self, value: int):
+        return ctypes.Structure.__set__(self, "n_geki", value)
+
+    @property
+    def state(self) -> ScoreState:
+        return ctypes.Structure.__get__(self, "state")
+
+    @state.setter
+    def state(self, value: ScoreState):
+        return ctypes.Structure.__set__(self, "state", value)
+
+
+
+
+class callbacks:
+    """Helpers to define callbacks."""
+
+
+class BeatmapAttributesBuilder:
+    __api_lock = object()
+
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == BeatmapAttributesBuilder.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
+
+    @property
+    def _as_parameter_(self):
+        return self._ctx
+
+    @staticmethod
+    def new() -> BeatmapAttributesBuilder:
+        """"""
+        ctx = ctypes.c_void_p()
+        c_lib.beatmap_attributes_new(ctx, )
+        self = BeatmapAttributesBuilder(BeatmapAttributesBuilder.__api_lock, ctx)
+        return self
+
+    def __del__(self):
+        c_lib.beatmap_attributes_destroy(self._ctx, )
+    def mode(self, mode: ctypes.c_int):
+        """"""
+        return c_lib.beatmap_attributes_mode(self._ctx, mode)
+
+    def p_mods(self, mods: ctypes.c_void_p):
+        """"""
+        return c_lib.beatmap_attributes_p_mods(self._ctx, mods)
+
+    def i_mods(self, mods: int):
+        """"""
+        return c_lib.beatmap_attributes_i_mods(self._ctx, mods)
+
+    def s_mods(self, str: bytes):
+        """"""
+        if not hasattr(str, "__ctypes_from_outparam__"):
+            str = ctypes.cast(str, ctypes.POINTER(ctypes.c_char))
+        return c_lib.beatmap_attributes_s_mods(self._ctx, str)
+
+    def clock_rate(self, clock_rate: float):
+        """"""
+        return c_lib.beatmap_attributes_clock_rate(self._ctx, clock_rate)
+
+    def ar(self, ar: float):
+        """"""
+        return c_lib.beatmap_attributes_ar(self._ctx, ar)
+
+    def cs(self, cs: float):
+        """"""
+        return c_lib.beatmap_attributes_cs(self._ctx, cs)
+
+    def hp(self, hp: float):
+        """"""
+        return c_lib.beatmap_attributes_hp(self._ctx, hp)
+
+    def od(self, od: float):
+        """"""
+        return c_lib.beatmap_attributes_od(self._ctx, od)
+
+    def get_clock_rate(self, ) -> float:
+        """"""
+        return c_lib.beatmap_attributes_get_clock_rate(self._ctx, )
+
+    def build(self, beatmap: ctypes.c_void_p) -> BeatmapAttributes:
+        """"""
+        return c_lib.beatmap_attributes_build(self._ctx, beatmap)
+
+
+
+class Beatmap:
+    __api_lock = object()
+
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == Beatmap.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
+
+    @property
+    def _as_parameter_(self):
+        return self._ctx
+
+    @staticmethod
+    def from_bytes(data: Sliceu8 | ctypes.Array[ctypes.c_uint8]) -> Beatmap:
+        """"""
+        ctx = ctypes.c_void_p()
+        if hasattr(data, "_length_") and getattr(data, "_type_", "") == ctypes.c_uint8:
+            data = Sliceu8(data=ctypes.cast(data, ctypes.POINTER(ctypes.c_uint8)), len=len(data))
+
+        c_lib.beatmap_from_bytes(ctx, data)
+        self = Beatmap(Beatmap.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def from_path(path: bytes) -> Beatmap:
+        """"""
+        ctx = ctypes.c_void_p()
+        if not hasattr(path, "__ctypes_from_outparam__"):
+            path = ctypes.cast(path, ctypes.POINTER(ctypes.c_char))
+        c_lib.beatmap_from_path(ctx, path)
+        self = Beatmap(Beatmap.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def from_path_mmap(path: bytes) -> Beatmap:
+        """ Like [`Beatmap::from_path`] but parses straight from a memory mapping
+ of the file instead of reading it into a buffer first.
+
+ The file must not be truncated while it is being parsed."""
+        ctx = ctypes.c_void_p()
+        if not hasattr(path, "__ctypes_from_outparam__"):
+            path = ctypes.cast(path, ctypes.POINTER(ctypes.c_char))
+        c_lib.beatmap_from_path_mmap(ctx, path)
+        self = Beatmap(Beatmap.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def from_bytes_cached(data: Sliceu8 | ctypes.Array[ctypes.c_uint8]) -> Beatmap:
+        """ Like [`Beatmap::from_bytes`] but shares the parsed beatmap with
+ earlier calls for the same content, see [`beatmap_cache_stats`].
+
+ [`beatmap_cache_stats`]: cache::beatmap_cache_stats"""
+        ctx = ctypes.c_void_p()
+        if hasattr(data, "_length_") and getattr(data, "_type_", "") == ctypes.c_uint8:
+            data = Sliceu8(data=ctypes.cast(data, ctypes.POINTER(ctypes.c_uint8)), len=len(data))
+
+        c_lib.beatmap_from_bytes_cached(ctx, data)
+        self = Beatmap(Beatmap.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def from_path_cached(path: bytes) -> Beatmap:
+        """ Like [`Beatmap::from_path`] but shares the parsed beatmap with
+ earlier calls for the same content, see [`beatmap_cache_stats`].
+
+ [`beatmap_cache_stats`]: cache::beatmap_cache_stats"""
+        ctx = ctypes.c_void_p()
+        if not hasattr(path, "__ctypes_from_outparam__"):
+            path = ctypes.cast(path, ctypes.POINTER(ctypes.c_char))
+        c_lib.beatmap_from_path_cached(ctx, path)
+        self = Beatmap(Beatmap.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def from_loader(loader: ctypes.c_void_p, index: int) -> Beatmap:
+        """ Move the `index`th beatmap out of a loader after [`BeatmapLoader::load`].
+
+Fails with [`FFIError::Null`] if that file failed to load or was
+already taken.
+
+[`BeatmapLoader::load`]: loader::BeatmapLoader::load"""
+        ctx = ctypes.c_void_p()
+        c_lib.beatmap_from_loader(ctx, loader, index)
+        self = Beatmap(Beatmap.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def from_archive(archive: ctypes.c_void_p, index: int) -> Beatmap:
+        """ Decompress and parse the `index`th `.osu` entry of an archive."""
+        ctx = ctypes.c_void_p()
+        c_lib.beatmap_from_archive(ctx, archive, index)
+        self = Beatmap(Beatmap.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def from_clone(beatmap: ctypes.c_void_p) -> Beatmap:
+        """"""
+        ctx = ctypes.c_void_p()
+        c_lib.beatmap_from_clone(ctx, beatmap)
+        self = Beatmap(Beatmap.__api_lock, ctx)
+        return self
+
+    def __del__(self):
+        c_lib.beatmap_destroy(self._ctx, )
+    def convert(self, mode: ctypes.c_int, mods: ctypes.c_void_p) -> bool:
+        """ Convert a Beatmap to the specified mode"""
+        return c_lib.beatmap_convert(self._ctx, mode, mods)
+
+    def md5(self, str: ctypes.c_void_p):
+        """ MD5 of the `.osu` content as lowercase hex, as used by osu! itself."""
+        return c_lib.beatmap_md5(self._ctx, str)
+
+    def hit_object_columns(self, out: HitObjectColumns):
+        """ Export every hit object into parallel arrays in a single call, see
+ [`HitObjectColumns`].
+
+ [`HitObjectColumns`]: hitobjects::HitObjectColumns"""
+        return c_lib.beatmap_hit_object_columns(self._ctx, out)
+
+    def n_hit_objects(self, ) -> int:
+        """ Amount of hit objects."""
+        return c_lib.beatmap_n_hit_objects(self._ctx, )
+
+    def bpm(self, ) -> float:
+        """"""
+        return c_lib.beatmap_bpm(self._ctx, )
+
+    def total_break_time(self, ) -> float:
+        """"""
+        return c_lib.beatmap_total_break_time(self._ctx, )
+
+    def version(self, ) -> int:
+        """"""
+        return c_lib.beatmap_version(self._ctx, )
+
+    def is_convert(self, ) -> bool:
+        """"""
+        return c_lib.beatmap_is_convert(self._ctx, )
+
+    def stack_leniency(self, ) -> float:
+        """"""
+        return c_lib.beatmap_stack_leniency(self._ctx, )
+
+    def mode(self, ) -> ctypes.c_int:
+        """"""
+        return c_lib.beatmap_mode(self._ctx, )
+
+    def ar(self, ) -> float:
+        """"""
+        return c_lib.beatmap_ar(self._ctx, )
+
+    def cs(self, ) -> float:
+        """"""
+        return c_lib.beatmap_cs(self._ctx, )
+
+    def hp(self, ) -> float:
+        """"""
+        return c_lib.beatmap_hp(self._ctx, )
+
+    def od(self, ) -> float:
+        """"""
+        return c_lib.beatmap_od(self._ctx, )
+
+    def slider_multiplier(self, ) -> float:
+        """"""
+        return c_lib.beatmap_slider_multiplier(self._ctx, )
+
+    def slider_tick_rate(self, ) -> float:
+        """"""
+        return c_lib.beatmap_slider_tick_rate(self._ctx, )
+
+    def check_suspicion(self, ) -> OptionTooSuspicious:
+        """ Check whether hitobjects appear too suspicious for further calculation.
+
+ Sometimes a [`Beatmap`] isn't created for gameplay but rather to test
+ the limits of osu! itself. Difficulty- and/or performance calculation
+ should likely be avoided on these maps due to potential performance
+ issues."""
+        return c_lib.beatmap_check_suspicion(self._ctx, )
+
+
+
+class HitObjects:
+    __api_lock = object()
+
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == HitObjects.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
+
+    @property
+    def _as_parameter_(self):
+        return self._ctx
+
+    @staticmethod
+    def new(beatmap: ctypes.c_void_p) -> HitObjects:
+        """"""
+        ctx = ctypes.c_void_p()
+        c_lib.hitobjects_new(ctx, beatmap)
+        self = HitObjects(HitObjects.__api_lock, ctx)
+        return self
+
+    def __del__(self):
+        c_lib.hitobjects_destroy(self._ctx, )
+    def len(self, ) -> int:
+        """"""
+        return c_lib.hitobjects_len(self._ctx, )
+
+    def get(self, index: int) -> OptionHitObject:
+        """"""
+        return c_lib.hitobjects_get(self._ctx, index)
+
+    def next(self, ) -> OptionHitObject:
+        """"""
+        return c_lib.hitobjects_next(self._ctx, )
+
+    def prev(self, ) -> OptionHitObject:
+        """"""
+        return c_lib.hitobjects_prev(self._ctx, )
+
+    def reset(self, ):
+        """"""
+        return c_lib.hitobjects_reset(self._ctx, )
+
+
+
+class Difficulty:
+    __api_lock = object()
+
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == Difficulty.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
+
+    @property
+    def _as_parameter_(self):
+        return self._ctx
+
+    @staticmethod
+    def new() -> Difficulty:
+        """"""
+        ctx = ctypes.c_void_p()
+        c_lib.difficulty_new(ctx, )
+        self = Difficulty(Difficulty.__api_lock, ctx)
+        return self
+
+    def __del__(self):
+        c_lib.difficulty_destroy(self._ctx, )
+    def p_mods(self, mods: ctypes.c_void_p):
+        """"""
+        return c_lib.difficulty_p_mods(self._ctx, mods)
+
+    def i_mods(self, mods: int):
+        """"""
+        return c_lib.difficulty_i_mods(self._ctx, mods)
+
+    def s_mods(self, str: bytes):
+        """"""
+        if not hasattr(str, "__ctypes_from_outparam__"):
+            str = ctypes.cast(str, ctypes.POINTER(ctypes.c_char))
+        return c_lib.difficulty_s_mods(self._ctx, str)
+
+    def passed_objects(self, passed_objects: int):
+        """"""
+        return c_lib.difficulty_passed_objects(self._ctx, passed_objects)
+
+    def clock_rate(self, clock_rate: float):
+        """"""
+        return c_lib.difficulty_clock_rate(self._ctx, clock_rate)
+
+    def ar(self, ar: float):
+        """"""
+        return c_lib.difficulty_ar(self._ctx, ar)
+
+    def cs(self, cs: float):
+        """"""
+        return c_lib.difficulty_cs(self._ctx, cs)
+
+    def hp(self, hp: float):
+        """"""
+        return c_lib.difficulty_hp(self._ctx, hp)
+
+    def od(self, od: float):
+        """"""
+        return c_lib.difficulty_od(self._ctx, od)
+
+    def hardrock_offsets(self, hardrock_offsets: bool):
+        """"""
+        return c_lib.difficulty_hardrock_offsets(self._ctx, hardrock_offsets)
+
+    def lazer(self, lazer: bool):
+        """"""
+        return c_lib.difficulty_lazer(self._ctx, lazer)
+
+    def calculate(self, beatmap: ctypes.c_void_p) -> DifficultyAttributes:
+        """"""
+        return c_lib.difficulty_calculate(self._ctx, beatmap)
+
+    def get_clock_rate(self, ) -> float:
+        """"""
+        return c_lib.difficulty_get_clock_rate(self._ctx, )
+
+
+
+class Performance:
+    __api_lock = object()
+
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == Performance.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
+
+    @property
+    def _as_parameter_(self):
+        return self._ctx
+
+    @staticmethod
+    def new() -> Performance:
+        """"""
+        ctx = ctypes.c_void_p()
+        c_lib.performance_new(ctx, )
+        self = Performance(Performance.__api_lock, ctx)
+        return self
+
+    def __del__(self):
+        c_lib.performance_destroy(self._ctx, )
+    def mode(self, mode: ctypes.c_int):
+        """"""
+        return c_lib.performance_mode(self._ctx, mode)
+
+    def p_mods(self, mods: ctypes.c_void_p):
+        """"""
+        return c_lib.performance_p_mods(self._ctx, mods)
+
+    def i_mods(self, mods: int):
+        """"""
+        return c_lib.performance_i_mods(self._ctx, mods)
+
+    def s_mods(self, str: bytes):
+        """"""
+        if not hasattr(str, "__ctypes_from_outparam__"):
+            str = ctypes.cast(str, ctypes.POINTER(ctypes.c_char))
+        return c_lib.performance_s_mods(self._ctx, str)
+
+    def passed_objects(self, passed_objects: int):
+        """"""
+        return c_lib.performance_passed_objects(self._ctx, passed_objects)
+
+    def clock_rate(self, clock_rate: float):
+        """"""
+        return c_lib.performance_clock_rate(self._ctx, clock_rate)
+
+    def ar(self, ar: float):
+        """"""
+        return c_lib.performance_ar(self._ctx, ar)
+
+    def cs(self, cs: float):
+        """"""
+        return c_lib.performance_cs(self._ctx, cs)
+
+    def hp(self, hp: float):
+        """"""
+        return c_lib.performance_hp(self._ctx, hp)
+
+    def od(self, od: float):
+        """"""
+        return c_lib.performance_od(self._ctx, od)
+
+    def hardrock_offsets(self, hardrock_offsets: bool):
+        """"""
+        return c_lib.performance_hardrock_offsets(self._ctx, hardrock_offsets)
+
+    def state(self, state: ScoreState):
+        """"""
+        return c_lib.performance_state(self._ctx, state)
+
+    def accuracy(self, accuracy: float):
+        """"""
+        return c_lib.performance_accuracy(self._ctx, accuracy)
+
+    def misses(self, misses: int):
+        """"""
+        return c_lib.performance_misses(self._ctx, misses)
+
+    def combo(self, combo: int):
+        """"""
+        return c_lib.performance_combo(self._ctx, combo)
+
+    def hitresult_priority(self, hitresult_priority: ctypes.c_int):
+        """"""
+        return c_lib.performance_hitresult_priority(self._ctx, hitresult_priority)
+
+    def lazer(self, lazer: bool):
+        """"""
+        return c_lib.performance_lazer(self._ctx, lazer)
+
+    def large_tick_hits(self, large_tick_hits: int):
+        """"""
+        return c_lib.performance_large_tick_hits(self._ctx, large_tick_hits)
+
+    def small_tick_hits(self, small_tick_hits: int):
+        """"""
+        return c_lib.performance_small_tick_hits(self._ctx, small_tick_hits)
+
+    def slider_end_hits(self, slider_end_hits: int):
+        """"""
+        return c_lib.performance_slider_end_hits(self._ctx, slider_end_hits)
+
+    def n300(self, n300: int):
+        """"""
+        return c_lib.performance_n300(self._ctx, n300)
+
+    def n100(self, n100: int):
+        """"""
+        return c_lib.performance_n100(self._ctx, n100)
+
+    def n50(self, n50: int):
+        """"""
+        return c_lib.performance_n50(self._ctx, n50)
+
+    def n_katu(self, n_katu: int):
+        """"""
+        return c_lib.performance_n_katu(self._ctx, n_katu)
+
+    def n_geki(self, n_geki: int):
+        """"""
+        return c_lib.performance_n_geki(self._ctx, n_geki)
+
+    def generate_state(self, beatmap: ctypes.c_void_p) -> ScoreState:
+        """"""
+        return c_lib.performance_generate_state(self._ctx, beatmap)
+
+    def generate_state_from_difficulty(self, difficulty_attr: DifficultyAttributes) -> ScoreState:
+        """"""
+        return c_lib.performance_generate_state_from_difficulty(self._ctx, difficulty_attr)
+
+    def calculate(self, beatmap: ctypes.c_void_p) -> PerformanceAttributes:
+        """"""
+        return c_lib.performance_calculate(self._ctx, beatmap)
+
+    def calculate_from_difficulty(self, difficulty_attr: DifficultyAttributes) -> PerformanceAttributes:
+        """"""
+        return c_lib.performance_calculate_from_difficulty(self._ctx, difficulty_attr)
+
+    def calculate_batch(self, difficulty_attr: ctypes.POINTER(DifficultyAttributes), scores: ScoreColumns, out: PerformanceColumns):
+        """ Calculate the performance of many scores on the same difficulty
+ attributes in one call.
+
+ Each row of `scores` is applied on top of this [`Performance`] and the
+ results are written into the matching row of `out`."""
+        return c_lib.performance_calculate_batch(self._ctx, difficulty_attr, scores, out)
+
+    def calculate_grid(self, difficulty_attr: ctypes.POINTER(DifficultyAttributes), accuracies: Slicef64, misses: Sliceu32, combos: Sliceu32, out: PerformanceColumns):
+        """ Calculate the performance for every combination of accuracy and
+ miss count on the same difficulty attributes in one call.
+
+ `accuracies` are in percent, i.e. between `0` and `100`. Every cell is
+ this [`Performance`] with the cell's accuracy and misses set, so hit
+ results are generated just like for a single calculation. `combos` is either
+ empty, which means the best possible combo, or holds one combo per
+ entry of `misses`.
+
+ The result for `accuracies[i]` and `misses[j]` is written into row
+ `i * misses.len() + j` of `out`, which must hold that many rows."""
+        return c_lib.performance_calculate_grid(self._ctx, difficulty_attr, accuracies, misses, combos, out)
+
+    def get_clock_rate(self, ) -> float:
+        """"""
+        return c_lib.performance_get_clock_rate(self._ctx, )
+
+
+
+class GradualDifficulty:
+    __api_lock = object()
+
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == GradualDifficulty.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
+
+    @property
+    def _as_parameter_(self):
+        return self._ctx
+
+    @staticmethod
+    def new(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p) -> GradualDifficulty:
+        """ Create a [`GradualDifficulty`] for a map of any mode."""
+        ctx = ctypes.c_void_p()
+        c_lib.gradual_difficulty_new(ctx, difficulty, beatmap)
+        self = GradualDifficulty(GradualDifficulty.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def new_with_mode(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p, mode: ctypes.c_int) -> GradualDifficulty:
+        """ Create a [`GradualDifficulty`] for a [`Beatmap`] on a specific [`GameMode`]."""
+        ctx = ctypes.c_void_p()
+        c_lib.gradual_difficulty_new_with_mode(ctx, difficulty, beatmap, mode)
+        self = GradualDifficulty(GradualDifficulty.__api_lock, ctx)
+        return self
+
+    def __del__(self):
+        c_lib.gradual_difficulty_destroy(self._ctx, )
+    def next(self, ) -> OptionDifficultyAttributes:
+        """"""
+        return c_lib.gradual_difficulty_next(self._ctx, )
+
+    def nth(self, n: int) -> OptionDifficultyAttributes:
+        """"""
+        return c_lib.gradual_difficulty_nth(self._ctx, n)
+
+    def len(self, ) -> int:
+        """"""
+        return c_lib.gradual_difficulty_len(self._ctx, )
+
+    def collect(self, out: GradualDifficultyColumns):
+        """ Process the next `out.stars.len()` hit objects and write the
+ attributes after each of them into `out`, see [`GradualDifficultyColumns`]."""
+        return c_lib.gradual_difficulty_collect(self._ctx, out)
 
-    def is_none(self) -> bool:
-        """Returns true if the value does not exist."""
-        return self._is_some != 0
 
 
-class OptionHitObject(ctypes.Structure):
-    """May optionally hold a value."""
+class GradualPerformance:
+    __api_lock = object()
 
-    _fields_ = [
-        ("_t", HitObject),
-        ("_is_some", ctypes.c_uint8),
-    ]
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == GradualPerformance.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
 
     @property
-    def value(self) -> HitObject:
-        """Returns the value if it exists, or None."""
-        if self._is_some == 1:
-            return self._t
-        else:
-            return None
-
-    def is_some(self) -> bool:
-        """Returns true if the value exists."""
-        return self._is_some == 1
+    def _as_parameter_(self):
+        return self._ctx
 
-    def is_none(self) -> bool:
-        """Returns true if the value does not exist."""
-        return self._is_some != 0
+    @staticmethod
+    def new(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p) -> GradualPerformance:
+        """ Create a [`GradualPerformance`] for a map of any mode."""
+        ctx = ctypes.c_void_p()
+        c_lib.gradual_performance_new(ctx, difficulty, beatmap)
+        self = GradualPerformance(GradualPerformance.__api_lock, ctx)
+        return self
 
+    @staticmethod
+    def new_with_mode(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p, mode: ctypes.c_int) -> GradualPerformance:
+        """ Create a [`GradualPerformance`] for a [`Beatmap`] on a specific [`GameMode`]."""
+        ctx = ctypes.c_void_p()
+        c_lib.gradual_performance_new_with_mode(ctx, difficulty, beatmap, mode)
+        self = GradualPerformance(GradualPerformance.__api_lock, ctx)
+        return self
 
-class OptionPerformanceAttributes(ctypes.Structure):
-    """May optionally hold a value."""
+    def __del__(self):
+        c_lib.gradual_performance_destroy(self._ctx, )
+    def next(self, state: ScoreState) -> OptionPerformanceAttributes:
+        """ Process the next hit object and calculate the performance attributes
+ for the resulting score state."""
+        return c_lib.gradual_performance_next(self._ctx, state)
 
-    _fields_ = [
-        ("_t", PerformanceAttributes),
-        ("_is_some", ctypes.c_uint8),
-    ]
+    def last(self, state: ScoreState) -> OptionPerformanceAttributes:
+        """ Process all remaining hit objects and calculate the final performance
+ attributes."""
+        return c_lib.gradual_performance_last(self._ctx, state)
 
-    @property
-    def value(self) -> PerformanceAttributes:
-        """Returns the value if it exists, or None."""
-        if self._is_some == 1:
-            return self._t
-        else:
-            return None
+    def nth(self, state: ScoreState, n: int) -> OptionPerformanceAttributes:
+        """ Process everything up to the next `n`th hitobject and calculate the
+ performance attributes for the resulting score state.
 
-    def is_some(self) -> bool:
-        """Returns true if the value exists."""
-        return self._is_some == 1
+ Note that the count is zero-indexed, so `n=0` will process 1 object,
+ `n=1` will process 2, and so on."""
+        return c_lib.gradual_performance_nth(self._ctx, state, n)
 
-    def is_none(self) -> bool:
-        """Returns true if the value does not exist."""
-        return self._is_some != 0
+    def len(self, ) -> int:
+        """ Returns the amount of remaining objects."""
+        return c_lib.gradual_performance_len(self._ctx, )
 
+    def replay(self, judgements: SliceObjectJudgement, pp: SliceMutf64):
+        """ Process the next `judgements.len()` hit objects, one judgement each,
+ and write the pp after each of them into `pp`.
 
+ The score state and combo are accumulated natively across calls,
+ starting from an empty score. `pp` must be exactly as long as
+ `judgements` and `judgements` may not exceed [`GradualPerformance::len`]."""
+        return c_lib.gradual_performance_replay(self._ctx, judgements, pp)
 
+    def replay_state(self, ) -> ScoreState:
+        """ Returns the score state accumulated by [`GradualPerformance::replay`]."""
+        return c_lib.gradual_performance_replay_state(self._ctx, )
 
-class callbacks:
-    """Helpers to define callbacks."""
 
 
-class BeatmapAttributesBuilder:
+class DifficultyBatch:
     __api_lock = object()
 
     def __init__(self, api_lock, ctx):
-        assert(api_lock == BeatmapAttributesBuilder.__api_lock), "You must create this with a static constructor." 
+        assert(api_lock == DifficultyBatch.__api_lock), "You must create this with a static constructor." 
         self._ctx = ctx
 
     @property
@@ -2328,68 +5572,56 @@ class BeatmapAttributesBuilder:
         return self._ctx
 
     @staticmethod
-    def new() -> BeatmapAttributesBuilder:
+    def new() -> DifficultyBatch:
         """"""
         ctx = ctypes.c_void_p()
-        c_lib.beatmap_attributes_new(ctx, )
-        self = BeatmapAttributesBuilder(BeatmapAttributesBuilder.__api_lock, ctx)
+        c_lib.difficulty_batch_new(ctx, )
+        self = DifficultyBatch(DifficultyBatch.__api_lock, ctx)
         return self
 
     def __del__(self):
-        c_lib.beatmap_attributes_destroy(self._ctx, )
-    def mode(self, mode: ctypes.c_int):
-        """"""
-        return c_lib.beatmap_attributes_mode(self._ctx, mode)
-
-    def p_mods(self, mods: ctypes.c_void_p):
-        """"""
-        return c_lib.beatmap_attributes_p_mods(self._ctx, mods)
-
-    def i_mods(self, mods: int):
-        """"""
-        return c_lib.beatmap_attributes_i_mods(self._ctx, mods)
-
-    def s_mods(self, str: bytes):
+        c_lib.difficulty_batch_destroy(self._ctx, )
+    def add_beatmap(self, beatmap: ctypes.c_void_p):
         """"""
-        if not hasattr(str, "__ctypes_from_outparam__"):
-            str = ctypes.cast(str, ctypes.POINTER(ctypes.c_char))
-        return c_lib.beatmap_attributes_s_mods(self._ctx, str)
+        return c_lib.difficulty_batch_add_beatmap(self._ctx, beatmap)
 
-    def clock_rate(self, clock_rate: float):
-        """"""
-        return c_lib.beatmap_attributes_clock_rate(self._ctx, clock_rate)
+    def add_path(self, path: bytes):
+        """ Add a beatmap by path. It is parsed on the thread pool during [`DifficultyBatch::calculate`]."""
+        if not hasattr(path, "__ctypes_from_outparam__"):
+            path = ctypes.cast(path, ctypes.POINTER(ctypes.c_char))
+        return c_lib.difficulty_batch_add_path(self._ctx, path)
 
-    def ar(self, ar: float):
+    def add_difficulty(self, difficulty: ctypes.c_void_p):
         """"""
-        return c_lib.beatmap_attributes_ar(self._ctx, ar)
+        return c_lib.difficulty_batch_add_difficulty(self._ctx, difficulty)
 
-    def cs(self, cs: float):
-        """"""
-        return c_lib.beatmap_attributes_cs(self._ctx, cs)
+    def threads(self, threads: int):
+        """ Amount of worker threads, `0` uses the global pool with one thread per logical core."""
+        return c_lib.difficulty_batch_threads(self._ctx, threads)
 
-    def hp(self, hp: float):
-        """"""
-        return c_lib.beatmap_attributes_hp(self._ctx, hp)
+    def len(self, ) -> int:
+        """ Amount of results, i.e. beatmaps times difficulties."""
+        return c_lib.difficulty_batch_len(self._ctx, )
 
-    def od(self, od: float):
-        """"""
-        return c_lib.beatmap_attributes_od(self._ctx, od)
+    def calculate(self, out: SliceMutDifficultyAttributes, results: SliceMutLoadResult):
+        """ Calculate every combination of beatmap and difficulty.
 
-    def get_clock_rate(self, ) -> float:
-        """"""
-        return c_lib.beatmap_attributes_get_clock_rate(self._ctx, )
+ `out` must hold [`DifficultyBatch::len`] elements. The attributes of
+ the `i`th beatmap with the `j`th difficulty are written to
+ `out[i * difficulties + j]`.
 
-    def build(self, beatmap: ctypes.c_void_p) -> BeatmapAttributes:
-        """"""
-        return c_lib.beatmap_attributes_build(self._ctx, beatmap)
+ `results` must hold one element per added beatmap. A beatmap that
+ fails to load only sets the error of its own [`LoadResult`] and leaves
+ its attributes at their default, the others are still calculated."""
+        return c_lib.difficulty_batch_calculate(self._ctx, out, results)
 
 
 
-class Beatmap:
+class AttributeStore:
     __api_lock = object()
 
     def __init__(self, api_lock, ctx):
-        assert(api_lock == Beatmap.__api_lock), "You must create this with a static constructor." 
+        assert(api_lock == AttributeStore.__api_lock), "You must create this with a static constructor." 
         self._ctx = ctx
 
     @property
@@ -2397,104 +5629,174 @@ class Beatmap:
         return self._ctx
 
     @staticmethod
-    def from_bytes(data: Sliceu8 | ctypes.Array[ctypes.c_uint8]) -> Beatmap:
-        """"""
+    def open(path: bytes) -> AttributeStore:
+        """ Open the store at `path` for reading and appending, creating it if it doesn't exist."""
         ctx = ctypes.c_void_p()
-        if hasattr(data, "_length_") and getattr(data, "_type_", "") == ctypes.c_uint8:
-            data = Sliceu8(data=ctypes.cast(data, ctypes.POINTER(ctypes.c_uint8)), len=len(data))
-
-        c_lib.beatmap_from_bytes(ctx, data)
-        self = Beatmap(Beatmap.__api_lock, ctx)
+        if not hasattr(path, "__ctypes_from_outparam__"):
+            path = ctypes.cast(path, ctypes.POINTER(ctypes.c_char))
+        c_lib.attribute_store_open(ctx, path)
+        self = AttributeStore(AttributeStore.__api_lock, ctx)
         return self
 
     @staticmethod
-    def from_path(path: bytes) -> Beatmap:
-        """"""
+    def open_read_only(path: bytes) -> AttributeStore:
+        """ Open an existing store at `path` for reading only."""
         ctx = ctypes.c_void_p()
         if not hasattr(path, "__ctypes_from_outparam__"):
             path = ctypes.cast(path, ctypes.POINTER(ctypes.c_char))
-        c_lib.beatmap_from_path(ctx, path)
-        self = Beatmap(Beatmap.__api_lock, ctx)
+        c_lib.attribute_store_open_read_only(ctx, path)
+        self = AttributeStore(AttributeStore.__api_lock, ctx)
         return self
 
+    def __del__(self):
+        c_lib.attribute_store_destroy(self._ctx, )
+    def get(self, beatmap: int, mods: int, clock_rate: float, lazer: bool) -> ctypes.POINTER(DifficultyAttributes):
+        """ Look up the attributes of a key.
+
+ Returns a pointer into the mapped file or null if the key is unknown.
+ The pointer stays valid until the store is destroyed."""
+        return c_lib.attribute_store_get(self._ctx, beatmap, mods, clock_rate, lazer)
+
+    def insert(self, beatmap: int, mods: int, clock_rate: float, lazer: bool, attributes: ctypes.POINTER(DifficultyAttributes)):
+        """ Append the attributes of a key to the file."""
+        return c_lib.attribute_store_insert(self._ctx, beatmap, mods, clock_rate, lazer, attributes)
+
+    def refresh(self, ):
+        """ Map records appended since the last refresh and look up their keys.
+
+ If there are any, the file is mapped anew. The previous mapping is
+ kept until the store is destroyed, so pointers returned by
+ [`AttributeStore::get`] stay valid. A writable store also rewrites
+ the index once enough records were appended after it."""
+        return c_lib.attribute_store_refresh(self._ctx, )
+
+    def write_index(self, ):
+        """ Write the sorted key table of all records mapped so far to
+ `<path>.index`, so opening the store doesn't need to read them.
+
+ The table is written to a temporary file first and then renamed, so
+ other processes read either the old or the new index. Fails for
+ read-only stores."""
+        return c_lib.attribute_store_write_index(self._ctx, )
+
+    def len(self, ) -> int:
+        """ Amount of distinct keys."""
+        return c_lib.attribute_store_len(self._ctx, )
+
+
+
+class BeatmapLoader:
+    __api_lock = object()
+
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == BeatmapLoader.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
+
+    @property
+    def _as_parameter_(self):
+        return self._ctx
+
     @staticmethod
-    def from_clone(beatmap: ctypes.c_void_p) -> Beatmap:
+    def new() -> BeatmapLoader:
         """"""
         ctx = ctypes.c_void_p()
-        c_lib.beatmap_from_clone(ctx, beatmap)
-        self = Beatmap(Beatmap.__api_lock, ctx)
+        c_lib.beatmap_loader_new(ctx, )
+        self = BeatmapLoader(BeatmapLoader.__api_lock, ctx)
         return self
 
     def __del__(self):
-        c_lib.beatmap_destroy(self._ctx, )
-    def convert(self, mode: ctypes.c_int, mods: ctypes.c_void_p) -> bool:
-        """ Convert a Beatmap to the specified mode"""
-        return c_lib.beatmap_convert(self._ctx, mode, mods)
-
-    def bpm(self, ) -> float:
+        c_lib.beatmap_loader_destroy(self._ctx, )
+    def add_path(self, path: bytes):
         """"""
-        return c_lib.beatmap_bpm(self._ctx, )
+        if not hasattr(path, "__ctypes_from_outparam__"):
+            path = ctypes.cast(path, ctypes.POINTER(ctypes.c_char))
+        return c_lib.beatmap_loader_add_path(self._ctx, path)
 
-    def total_break_time(self, ) -> float:
-        """"""
-        return c_lib.beatmap_total_break_time(self._ctx, )
+    def add_directory(self, root: bytes):
+        """ Add every `.osu` file below `root`, including subdirectories, in
+ lexicographic order.
 
-    def version(self, ) -> int:
-        """"""
-        return c_lib.beatmap_version(self._ctx, )
+ Only fails if `root` can't be read, unreadable entries below it are skipped."""
+        if not hasattr(root, "__ctypes_from_outparam__"):
+            root = ctypes.cast(root, ctypes.POINTER(ctypes.c_char))
+        return c_lib.beatmap_loader_add_directory(self._ctx, root)
 
-    def is_convert(self, ) -> bool:
-        """"""
-        return c_lib.beatmap_is_convert(self._ctx, )
+    def threads(self, threads: int):
+        """ Amount of worker threads, `0` uses the global pool with one thread per logical core."""
+        return c_lib.beatmap_loader_threads(self._ctx, threads)
 
-    def stack_leniency(self, ) -> float:
-        """"""
-        return c_lib.beatmap_stack_leniency(self._ctx, )
+    def len(self, ) -> int:
+        """ Amount of added files."""
+        return c_lib.beatmap_loader_len(self._ctx, )
 
-    def mode(self, ) -> ctypes.c_int:
-        """"""
-        return c_lib.beatmap_mode(self._ctx, )
+    def path(self, index: int, str: ctypes.c_void_p):
+        """ Path of the `index`th file."""
+        return c_lib.beatmap_loader_path(self._ctx, index, str)
 
-    def ar(self, ) -> float:
-        """"""
-        return c_lib.beatmap_ar(self._ctx, )
+    def load(self, ):
+        """ Load all added files.
 
-    def cs(self, ) -> float:
-        """"""
-        return c_lib.beatmap_cs(self._ctx, )
+ Fails only if the thread pool can't be created; errors of single
+ files are reported by [`BeatmapLoader::results`]."""
+        return c_lib.beatmap_loader_load(self._ctx, )
 
-    def hp(self, ) -> float:
-        """"""
-        return c_lib.beatmap_hp(self._ctx, )
+    def results(self, out: SliceMutLoadResult):
+        """ Write the [`LoadResult`] of every file, in the order they were added.
 
-    def od(self, ) -> float:
-        """"""
-        return c_lib.beatmap_od(self._ctx, )
+ `out` must hold [`BeatmapLoader::len`] elements."""
+        return c_lib.beatmap_loader_results(self._ctx, out)
 
-    def slider_multiplier(self, ) -> float:
-        """"""
-        return c_lib.beatmap_slider_multiplier(self._ctx, )
 
-    def slider_tick_rate(self, ) -> float:
-        """"""
-        return c_lib.beatmap_slider_tick_rate(self._ctx, )
 
-    def check_suspicion(self, ) -> OptionTooSuspicious:
-        """ Check whether hitobjects appear too suspicious for further calculation.
+class OszArchive:
+    __api_lock = object()
 
- Sometimes a [`Beatmap`] isn't created for gameplay but rather to test
- the limits of osu! itself. Difficulty- and/or performance calculation
- should likely be avoided on these maps due to potential performance
- issues."""
-        return c_lib.beatmap_check_suspicion(self._ctx, )
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == OszArchive.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
 
+    @property
+    def _as_parameter_(self):
+        return self._ctx
+
+    @staticmethod
+    def from_path(path: bytes) -> OszArchive:
+        """ Open the archive at `path` through a memory mapping."""
+        ctx = ctypes.c_void_p()
+        if not hasattr(path, "__ctypes_from_outparam__"):
+            path = ctypes.cast(path, ctypes.POINTER(ctypes.c_char))
+        c_lib.osz_archive_from_path(ctx, path)
+        self = OszArchive(OszArchive.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def from_bytes(data: Sliceu8 | ctypes.Array[ctypes.c_uint8]) -> OszArchive:
+        """ Open an archive held in memory. `data` is copied."""
+        ctx = ctypes.c_void_p()
+        if hasattr(data, "_length_") and getattr(data, "_type_", "") == ctypes.c_uint8:
+            data = Sliceu8(data=ctypes.cast(data, ctypes.POINTER(ctypes.c_uint8)), len=len(data))
 
+        c_lib.osz_archive_from_bytes(ctx, data)
+        self = OszArchive(OszArchive.__api_lock, ctx)
+        return self
 
-class HitObjects:
+    def __del__(self):
+        c_lib.osz_archive_destroy(self._ctx, )
+    def len(self, ) -> int:
+        """ Amount of `.osu` entries."""
+        return c_lib.osz_archive_len(self._ctx, )
+
+    def name(self, index: int, str: ctypes.c_void_p):
+        """ File name of the `index`th `.osu` entry inside the archive."""
+        return c_lib.osz_archive_name(self._ctx, index, str)
+
+
+
+class StrainTimeline:
     __api_lock = object()
 
     def __init__(self, api_lock, ctx):
-        assert(api_lock == HitObjects.__api_lock), "You must create this with a static constructor." 
+        assert(api_lock == StrainTimeline.__api_lock), "You must create this with a static constructor." 
         self._ctx = ctx
 
     @property
@@ -2502,42 +5804,51 @@ class HitObjects:
         return self._ctx
 
     @staticmethod
-    def new(beatmap: ctypes.c_void_p) -> HitObjects:
+    def new(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p) -> StrainTimeline:
         """"""
         ctx = ctypes.c_void_p()
-        c_lib.hitobjects_new(ctx, beatmap)
-        self = HitObjects(HitObjects.__api_lock, ctx)
+        c_lib.strain_timeline_new(ctx, difficulty, beatmap)
+        self = StrainTimeline(StrainTimeline.__api_lock, ctx)
         return self
 
     def __del__(self):
-        c_lib.hitobjects_destroy(self._ctx, )
+        c_lib.strain_timeline_destroy(self._ctx, )
     def len(self, ) -> int:
-        """"""
-        return c_lib.hitobjects_len(self._ctx, )
+        """ Amount of sections."""
+        return c_lib.strain_timeline_len(self._ctx, )
 
-    def get(self, index: int) -> OptionHitObject:
-        """"""
-        return c_lib.hitobjects_get(self._ctx, index)
+    def section_len(self, ) -> float:
+        """ Length of a section in milliseconds of map time."""
+        return c_lib.strain_timeline_section_len(self._ctx, )
 
-    def next(self, ) -> OptionHitObject:
-        """"""
-        return c_lib.hitobjects_next(self._ctx, )
+    def has(self, skill: ctypes.c_int) -> bool:
+        """ Whether the map's mode has the skill."""
+        return c_lib.strain_timeline_has(self._ctx, skill)
 
-    def prev(self, ) -> OptionHitObject:
-        """"""
-        return c_lib.hitobjects_prev(self._ctx, )
+    def start_times(self, out: SliceMutf64):
+        """ Write the start time of every section, `out` must hold
+ [`StrainTimeline::len`] elements."""
+        return c_lib.strain_timeline_start_times(self._ctx, out)
 
-    def reset(self, ):
-        """"""
-        return c_lib.hitobjects_reset(self._ctx, )
+    def peaks_of(self, skill: ctypes.c_int, out: SliceMutf64):
+        """ Write the peaks of a skill, `out` must hold [`StrainTimeline::len`]
+ elements. Fails with [`FFIError::Null`] if the mode has no such skill."""
+        return c_lib.strain_timeline_peaks_of(self._ctx, skill, out)
 
+    def hardest_windows(self, skill: ctypes.c_int, window: int, out: SliceMutStrainWindow) -> int:
+        """ Find the hardest non-overlapping windows of `window` consecutive
+ sections for a skill, hardest first.
 
+ Writes up to `out.len()` windows and returns how many were written."""
+        return c_lib.strain_timeline_hardest_windows(self._ctx, skill, window, out)
 
-class Difficulty:
+
+
+class SeekableGradual:
     __api_lock = object()
 
     def __init__(self, api_lock, ctx):
-        assert(api_lock == Difficulty.__api_lock), "You must create this with a static constructor." 
+        assert(api_lock == SeekableGradual.__api_lock), "You must create this with a static constructor." 
         self._ctx = ctx
 
     @property
@@ -2545,76 +5856,108 @@ class Difficulty:
         return self._ctx
 
     @staticmethod
-    def new() -> Difficulty:
-        """"""
+    def new(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p) -> SeekableGradual:
+        """ Create a [`SeekableGradual`] for a map of any mode."""
         ctx = ctypes.c_void_p()
-        c_lib.difficulty_new(ctx, )
-        self = Difficulty(Difficulty.__api_lock, ctx)
+        c_lib.seekable_gradual_new(ctx, difficulty, beatmap)
+        self = SeekableGradual(SeekableGradual.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def new_with_mode(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p, mode: ctypes.c_int) -> SeekableGradual:
+        """ Create a [`SeekableGradual`] for a [`Beatmap`] on a specific [`GameMode`]."""
+        ctx = ctypes.c_void_p()
+        c_lib.seekable_gradual_new_with_mode(ctx, difficulty, beatmap, mode)
+        self = SeekableGradual(SeekableGradual.__api_lock, ctx)
+        return self
+
+    @staticmethod
+    def fork(other: ctypes.c_void_p) -> SeekableGradual:
+        """ Create a copy of `other` at its current position and with its replayed
+ score, which can then continue independently.
+
+ The first fork calculates the checkpoints of all remaining objects of
+ `other` once; after that, forking is only a reference count increment
+ and both share the checkpoints."""
+        ctx = ctypes.c_void_p()
+        c_lib.seekable_gradual_fork(ctx, other)
+        self = SeekableGradual(SeekableGradual.__api_lock, ctx)
         return self
 
     def __del__(self):
-        c_lib.difficulty_destroy(self._ctx, )
-    def p_mods(self, mods: ctypes.c_void_p):
-        """"""
-        return c_lib.difficulty_p_mods(self._ctx, mods)
+        c_lib.seekable_gradual_destroy(self._ctx, )
+    def checkpoint_interval(self, interval: int):
+        """ Keep the attributes after every `interval`th object as a checkpoint,
+ `1` by default.
 
-    def i_mods(self, mods: int):
-        """"""
-        return c_lib.difficulty_i_mods(self._ctx, mods)
+ Larger intervals keep fewer attributes but seeking back to an object
+ between checkpoints replays from the start of the map. Changing the
+ interval drops the checkpoints kept so far, the position stays.
+ `0` is treated as `1`."""
+        return c_lib.seekable_gradual_checkpoint_interval(self._ctx, interval)
 
-    def s_mods(self, str: bytes):
-        """"""
-        if not hasattr(str, "__ctypes_from_outparam__"):
-            str = ctypes.cast(str, ctypes.POINTER(ctypes.c_char))
-        return c_lib.difficulty_s_mods(self._ctx, str)
+    def seek(self, index: int) -> OptionDifficultyAttributes:
+        """ Move to the state after processing the hit object at `index` and
+ return the difficulty attributes at that point.
 
-    def passed_objects(self, passed_objects: int):
-        """"""
-        return c_lib.difficulty_passed_objects(self._ctx, passed_objects)
+ Only the position changes, the score of [`SeekableGradual::replay`]
+ is kept as is.
 
-    def clock_rate(self, clock_rate: float):
-        """"""
-        return c_lib.difficulty_clock_rate(self._ctx, clock_rate)
+ Returns `None` and keeps the current position if `index` is out of range."""
+        return c_lib.seekable_gradual_seek(self._ctx, index)
 
-    def ar(self, ar: float):
-        """"""
-        return c_lib.difficulty_ar(self._ctx, ar)
+    def rewind(self, ):
+        """ Move back to the state before any hit object was processed."""
+        return c_lib.seekable_gradual_rewind(self._ctx, )
 
-    def cs(self, cs: float):
-        """"""
-        return c_lib.difficulty_cs(self._ctx, cs)
+    def position(self, ) -> int:
+        """ Returns the amount of processed objects at the current position."""
+        return c_lib.seekable_gradual_position(self._ctx, )
 
-    def hp(self, hp: float):
-        """"""
-        return c_lib.difficulty_hp(self._ctx, hp)
+    def len(self, ) -> int:
+        """ Returns the total amount of objects."""
+        return c_lib.seekable_gradual_len(self._ctx, )
 
-    def od(self, od: float):
-        """"""
-        return c_lib.difficulty_od(self._ctx, od)
+    def difficulty(self, ) -> OptionDifficultyAttributes:
+        """ Difficulty attributes at the current position, `None` before the
+ first object."""
+        return c_lib.seekable_gradual_difficulty(self._ctx, )
 
-    def hardrock_offsets(self, hardrock_offsets: bool):
-        """"""
-        return c_lib.difficulty_hardrock_offsets(self._ctx, hardrock_offsets)
+    def performance(self, state: ScoreState) -> OptionPerformanceAttributes:
+        """ Performance attributes of `state` at the current position, `None`
+ before the first object."""
+        return c_lib.seekable_gradual_performance(self._ctx, state)
 
-    def lazer(self, lazer: bool):
-        """"""
-        return c_lib.difficulty_lazer(self._ctx, lazer)
+    def replay(self, judgements: SliceObjectJudgement, pp: SliceMutf64):
+        """ Process the next `judgements.len()` hit objects after the current
+ position, one judgement each, and write the pp after each of them
+ into `pp`.
 
-    def calculate(self, beatmap: ctypes.c_void_p) -> DifficultyAttributes:
-        """"""
-        return c_lib.difficulty_calculate(self._ctx, beatmap)
+ Works like [`GradualPerformance::replay`], the score is accumulated
+ across calls and copied by [`SeekableGradual::fork`]."""
+        return c_lib.seekable_gradual_replay(self._ctx, judgements, pp)
 
-    def get_clock_rate(self, ) -> float:
-        """"""
-        return c_lib.difficulty_get_clock_rate(self._ctx, )
+    def replay_state(self, ) -> ScoreState:
+        """ Returns the score accumulated by [`SeekableGradual::replay`]."""
+        return c_lib.seekable_gradual_replay_state(self._ctx, )
 
+    def evaluate_branches(self, judgements: SliceObjectJudgement, branch_lens: Sliceu32, pp: SliceMutf64):
+        """ Evaluate many hypothetical continuations of the replayed score from
+ the current position without moving it.
 
+ `judgements` holds the judgements of all branches back to back and
+ `branch_lens` how many of them belong to each branch. The pp of the
+ score at the end of every branch is written into `pp`, which must be
+ as long as `branch_lens`. Branches are evaluated on the global thread pool."""
+        return c_lib.seekable_gradual_evaluate_branches(self._ctx, judgements, branch_lens, pp)
 
-class Performance:
+
+
+class ModSweep:
     __api_lock = object()
 
     def __init__(self, api_lock, ctx):
-        assert(api_lock == Performance.__api_lock), "You must create this with a static constructor." 
+        assert(api_lock == ModSweep.__api_lock), "You must create this with a static constructor." 
         self._ctx = ctx
 
     @property
@@ -2622,144 +5965,101 @@ class Performance:
         return self._ctx
 
     @staticmethod
-    def new() -> Performance:
+    def new(base: ctypes.c_void_p) -> ModSweep:
         """"""
         ctx = ctypes.c_void_p()
-        c_lib.performance_new(ctx, )
-        self = Performance(Performance.__api_lock, ctx)
+        c_lib.mod_sweep_new(ctx, base)
+        self = ModSweep(ModSweep.__api_lock, ctx)
         return self
 
     def __del__(self):
-        c_lib.performance_destroy(self._ctx, )
-    def mode(self, mode: ctypes.c_int):
-        """"""
-        return c_lib.performance_mode(self._ctx, mode)
+        c_lib.mod_sweep_destroy(self._ctx, )
+    def add_bits(self, bits: int, lazer: bool):
+        """ Add a mod set by legacy bits."""
+        return c_lib.mod_sweep_add_bits(self._ctx, bits, lazer)
 
-    def p_mods(self, mods: ctypes.c_void_p):
-        """"""
-        return c_lib.performance_p_mods(self._ctx, mods)
-
-    def i_mods(self, mods: int):
-        """"""
-        return c_lib.performance_i_mods(self._ctx, mods)
-
-    def s_mods(self, str: bytes):
-        """"""
+    def add_acronyms(self, str: ctypes.POINTER(ctypes.c_char), lazer: bool):
+        """ Add a mod set by acronyms, e.g. `"HDDT"`."""
         if not hasattr(str, "__ctypes_from_outparam__"):
             str = ctypes.cast(str, ctypes.POINTER(ctypes.c_char))
-        return c_lib.performance_s_mods(self._ctx, str)
-
-    def passed_objects(self, passed_objects: int):
-        """"""
-        return c_lib.performance_passed_objects(self._ctx, passed_objects)
-
-    def clock_rate(self, clock_rate: float):
-        """"""
-        return c_lib.performance_clock_rate(self._ctx, clock_rate)
-
-    def ar(self, ar: float):
-        """"""
-        return c_lib.performance_ar(self._ctx, ar)
-
-    def cs(self, cs: float):
-        """"""
-        return c_lib.performance_cs(self._ctx, cs)
-
-    def hp(self, hp: float):
-        """"""
-        return c_lib.performance_hp(self._ctx, hp)
-
-    def od(self, od: float):
-        """"""
-        return c_lib.performance_od(self._ctx, od)
-
-    def hardrock_offsets(self, hardrock_offsets: bool):
-        """"""
-        return c_lib.performance_hardrock_offsets(self._ctx, hardrock_offsets)
-
-    def state(self, state: ScoreState):
-        """"""
-        return c_lib.performance_state(self._ctx, state)
+        return c_lib.mod_sweep_add_acronyms(self._ctx, str, lazer)
 
-    def accuracy(self, accuracy: float):
-        """"""
-        return c_lib.performance_accuracy(self._ctx, accuracy)
+    def add_mods(self, mods: ctypes.c_void_p, lazer: bool):
+        """ Add a mod set including the mods' settings."""
+        return c_lib.mod_sweep_add_mods(self._ctx, mods, lazer)
 
-    def misses(self, misses: int):
-        """"""
-        return c_lib.performance_misses(self._ctx, misses)
+    def len(self, ) -> int:
+        """ Amount of added mod sets."""
+        return c_lib.mod_sweep_len(self._ctx, )
 
-    def combo(self, combo: int):
-        """"""
-        return c_lib.performance_combo(self._ctx, combo)
+    def calculate(self, beatmap: ctypes.c_void_p, attributes: SliceMutDifficultyAttributes, beatmap_attributes: SliceMutBeatmapAttributes):
+        """ Calculate `beatmap` with every mod set in the order they were added.
 
-    def hitresult_priority(self, hitresult_priority: ctypes.c_int):
-        """"""
-        return c_lib.performance_hitresult_priority(self._ctx, hitresult_priority)
+ `attributes` must hold [`ModSweep::len`] elements. `beatmap_attributes`
+ is either empty or of the same length and then receives the
+ [`BeatmapAttributes`] of every mod set, including its hit windows."""
+        return c_lib.mod_sweep_calculate(self._ctx, beatmap, attributes, beatmap_attributes)
 
-    def lazer(self, lazer: bool):
-        """"""
-        return c_lib.performance_lazer(self._ctx, lazer)
 
-    def large_tick_hits(self, large_tick_hits: int):
-        """"""
-        return c_lib.performance_large_tick_hits(self._ctx, large_tick_hits)
 
-    def small_tick_hits(self, small_tick_hits: int):
-        """"""
-        return c_lib.performance_small_tick_hits(self._ctx, small_tick_hits)
+class RateCurve:
+    __api_lock = object()
 
-    def slider_end_hits(self, slider_end_hits: int):
-        """"""
-        return c_lib.performance_slider_end_hits(self._ctx, slider_end_hits)
+    def __init__(self, api_lock, ctx):
+        assert(api_lock == RateCurve.__api_lock), "You must create this with a static constructor." 
+        self._ctx = ctx
 
-    def n300(self, n300: int):
-        """"""
-        return c_lib.performance_n300(self._ctx, n300)
+    @property
+    def _as_parameter_(self):
+        return self._ctx
 
-    def n100(self, n100: int):
-        """"""
-        return c_lib.performance_n100(self._ctx, n100)
+    @staticmethod
+    def new(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p, min_rate: float, max_rate: float, steps: int) -> RateCurve:
+        """ Calculate `steps` evenly spaced clock rates from `min_rate` to
+ `max_rate`, both inclusive, with the other settings of `difficulty`.
 
-    def n50(self, n50: int):
-        """"""
-        return c_lib.performance_n50(self._ctx, n50)
+ Requires at least two steps and `min_rate < max_rate`."""
+        ctx = ctypes.c_void_p()
+        c_lib.rate_curve_new(ctx, difficulty, beatmap, min_rate, max_rate, steps)
+        self = RateCurve(RateCurve.__api_lock, ctx)
+        return self
 
-    def n_katu(self, n_katu: int):
-        """"""
-        return c_lib.performance_n_katu(self._ctx, n_katu)
+    def __del__(self):
+        c_lib.rate_curve_destroy(self._ctx, )
+    def len(self, ) -> int:
+        """ Amount of grid points."""
+        return c_lib.rate_curve_len(self._ctx, )
 
-    def n_geki(self, n_geki: int):
-        """"""
-        return c_lib.performance_n_geki(self._ctx, n_geki)
+    def rate(self, index: int) -> float:
+        """ Clock rate of the `index`th grid point."""
+        return c_lib.rate_curve_rate(self._ctx, index)
 
-    def generate_state(self, beatmap: ctypes.c_void_p) -> ScoreState:
-        """"""
-        return c_lib.performance_generate_state(self._ctx, beatmap)
+    def attributes(self, index: int) -> OptionDifficultyAttributes:
+        """ Full difficulty attributes of the `index`th grid point."""
+        return c_lib.rate_curve_attributes(self._ctx, index)
 
-    def generate_state_from_difficulty(self, difficulty_attr: DifficultyAttributes) -> ScoreState:
-        """"""
-        return c_lib.performance_generate_state_from_difficulty(self._ctx, difficulty_attr)
+    def grid(self, rates: SliceMutf64, stars: SliceMutf64):
+        """ Write the clock rate and star rating of every grid point into `rates`
+ and `stars`, both of which must hold [`RateCurve::len`] elements."""
+        return c_lib.rate_curve_grid(self._ctx, rates, stars)
 
-    def calculate(self, beatmap: ctypes.c_void_p) -> PerformanceAttributes:
-        """"""
-        return c_lib.performance_calculate(self._ctx, beatmap)
+    def estimate(self, clock_rate: float) -> OptionRateEstimate:
+        """ Interpolate the star rating at `clock_rate`.
 
-    def calculate_from_difficulty(self, difficulty_attr: DifficultyAttributes) -> PerformanceAttributes:
-        """"""
-        return c_lib.performance_calculate_from_difficulty(self._ctx, difficulty_attr)
+ The error bound is derived from the curvature of the neighbouring grid
+ points: linear interpolation is off by at most `h² / 8 * |f''|` for a
+ grid spacing `h`, with `f''` estimated by second differences.
 
-    def get_clock_rate(self, ) -> float:
-        """"""
-        return c_lib.performance_get_clock_rate(self._ctx, )
+ Returns `None` if `clock_rate` lies outside of the grid."""
+        return c_lib.rate_curve_estimate(self._ctx, clock_rate)
 
 
 
-class GradualDifficulty:
+class ProfileEngine:
     __api_lock = object()
 
     def __init__(self, api_lock, ctx):
-        assert(api_lock == GradualDifficulty.__api_lock), "You must create this with a static constructor." 
+        assert(api_lock == ProfileEngine.__api_lock), "You must create this with a static constructor." 
         self._ctx = ctx
 
     @property
@@ -2767,42 +6067,67 @@ class GradualDifficulty:
         return self._ctx
 
     @staticmethod
-    def new(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p) -> GradualDifficulty:
-        """ Create a [`GradualDifficulty`] for a map of any mode."""
-        ctx = ctypes.c_void_p()
-        c_lib.gradual_difficulty_new(ctx, difficulty, beatmap)
-        self = GradualDifficulty(GradualDifficulty.__api_lock, ctx)
-        return self
-
-    @staticmethod
-    def new_with_mode(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p, mode: ctypes.c_int) -> GradualDifficulty:
-        """ Create a [`GradualDifficulty`] for a [`Beatmap`] on a specific [`GameMode`]."""
+    def new() -> ProfileEngine:
+        """"""
         ctx = ctypes.c_void_p()
-        c_lib.gradual_difficulty_new_with_mode(ctx, difficulty, beatmap, mode)
-        self = GradualDifficulty(GradualDifficulty.__api_lock, ctx)
+        c_lib.profile_engine_new(ctx, )
+        self = ProfileEngine(ProfileEngine.__api_lock, ctx)
         return self
 
     def __del__(self):
-        c_lib.gradual_difficulty_destroy(self._ctx, )
-    def next(self, ) -> OptionDifficultyAttributes:
-        """"""
-        return c_lib.gradual_difficulty_next(self._ctx, )
+        c_lib.profile_engine_destroy(self._ctx, )
+    def add_beatmap(self, key: int, beatmap: ctypes.c_void_p):
+        """ Add a parsed beatmap under `key`, replacing any beatmap previously
+ added with the same key."""
+        return c_lib.profile_engine_add_beatmap(self._ctx, key, beatmap)
+
+    def add_path(self, key: int, path: bytes):
+        """ Add a beatmap by path under `key`. It is parsed on the thread pool
+ during [`ProfileEngine::calculate`]."""
+        if not hasattr(path, "__ctypes_from_outparam__"):
+            path = ctypes.cast(path, ctypes.POINTER(ctypes.c_char))
+        return c_lib.profile_engine_add_path(self._ctx, key, path)
 
-    def nth(self, n: int) -> OptionDifficultyAttributes:
+    def add_scores(self, scores: SliceProfileScore):
         """"""
-        return c_lib.gradual_difficulty_nth(self._ctx, n)
+        return c_lib.profile_engine_add_scores(self._ctx, scores)
+
+    def threads(self, threads: int):
+        """ Amount of worker threads, `0` uses the global pool with one thread per logical core."""
+        return c_lib.profile_engine_threads(self._ctx, threads)
 
     def len(self, ) -> int:
-        """"""
-        return c_lib.gradual_difficulty_len(self._ctx, )
+        """ Amount of added scores."""
+        return c_lib.profile_engine_len(self._ctx, )
 
+    def users(self, ) -> int:
+        """ Amount of distinct users of the last [`ProfileEngine::calculate`]."""
+        return c_lib.profile_engine_users(self._ctx, )
 
+    def calculate(self, ):
+        """ Score every added play and sum up the totals of every user."""
+        return c_lib.profile_engine_calculate(self._ctx, )
 
-class GradualPerformance:
+    def totals(self, out: SliceMutProfileTotal):
+        """ Write the totals of every user, sorted by user id.
+
+ `out` must hold [`ProfileEngine::users`] elements."""
+        return c_lib.profile_engine_totals(self._ctx, out)
+
+    def score_pp(self, out: SliceMutf64):
+        """ Write the pp of every score in the order they were added, `NaN` for
+ scores whose beatmap is missing.
+
+ `out` must hold [`ProfileEngine::len`] elements."""
+        return c_lib.profile_engine_score_pp(self._ctx, out)
+
+
+
+class TopPlays:
     __api_lock = object()
 
     def __init__(self, api_lock, ctx):
-        assert(api_lock == GradualPerformance.__api_lock), "You must create this with a static constructor." 
+        assert(api_lock == TopPlays.__api_lock), "You must create this with a static constructor." 
         self._ctx = ctx
 
     @property
@@ -2810,44 +6135,46 @@ class GradualPerformance:
         return self._ctx
 
     @staticmethod
-    def new(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p) -> GradualPerformance:
-        """ Create a [`GradualPerformance`] for a map of any mode."""
-        ctx = ctypes.c_void_p()
-        c_lib.gradual_performance_new(ctx, difficulty, beatmap)
-        self = GradualPerformance(GradualPerformance.__api_lock, ctx)
-        return self
-
-    @staticmethod
-    def new_with_mode(difficulty: ctypes.c_void_p, beatmap: ctypes.c_void_p, mode: ctypes.c_int) -> GradualPerformance:
-        """ Create a [`GradualPerformance`] for a [`Beatmap`] on a specific [`GameMode`]."""
+    def new() -> TopPlays:
+        """"""
         ctx = ctypes.c_void_p()
-        c_lib.gradual_performance_new_with_mode(ctx, difficulty, beatmap, mode)
-        self = GradualPerformance(GradualPerformance.__api_lock, ctx)
+        c_lib.top_plays_new(ctx, )
+        self = TopPlays(TopPlays.__api_lock, ctx)
         return self
 
     def __del__(self):
-        c_lib.gradual_performance_destroy(self._ctx, )
-    def next(self, state: ScoreState) -> OptionPerformanceAttributes:
-        """ Process the next hit object and calculate the performance attributes
- for the resulting score state."""
-        return c_lib.gradual_performance_next(self._ctx, state)
+        c_lib.top_plays_destroy(self._ctx, )
+    def insert(self, beatmap: int, attributes: ctypes.POINTER(PerformanceAttributes)) -> bool:
+        """ Add a play on `beatmap`, replacing the current play on it if the new
+ one is worth more pp.
 
-    def last(self, state: ScoreState) -> OptionPerformanceAttributes:
-        """ Process all remaining hit objects and calculate the final performance
- attributes."""
-        return c_lib.gradual_performance_last(self._ctx, state)
+ Returns whether the top list changed."""
+        return c_lib.top_plays_insert(self._ctx, beatmap, attributes)
 
-    def nth(self, state: ScoreState, n: int) -> OptionPerformanceAttributes:
-        """ Process everything up to the next `n`th hitobject and calculate the
- performance attributes for the resulting score state.
+    def insert_pp(self, beatmap: int, pp: float) -> bool:
+        """ Same as [`TopPlays::insert`] for a play that is worth `pp`."""
+        return c_lib.top_plays_insert_pp(self._ctx, beatmap, pp)
 
- Note that the count is zero-indexed, so `n=0` will process 1 object,
- `n=1` will process 2, and so on."""
-        return c_lib.gradual_performance_nth(self._ctx, state, n)
+    def remove(self, beatmap: int) -> bool:
+        """ Remove the play on `beatmap`, returns whether there was one."""
+        return c_lib.top_plays_remove(self._ctx, beatmap)
 
     def len(self, ) -> int:
-        """ Returns the amount of remaining objects."""
-        return c_lib.gradual_performance_len(self._ctx, )
+        """ Amount of plays, i.e. beatmaps with a play."""
+        return c_lib.top_plays_len(self._ctx, )
+
+    def total(self, ) -> float:
+        """ Weighted pp of all plays including bonus pp."""
+        return c_lib.top_plays_total(self._ctx, )
+
+    def total_after(self, beatmap: int, attributes: ctypes.POINTER(PerformanceAttributes)) -> float:
+        """ What [`TopPlays::total`] would be after [`TopPlays::insert`] with
+ the same arguments, without changing the top list."""
+        return c_lib.top_plays_total_after(self._ctx, beatmap, attributes)
+
+    def total_after_pp(self, beatmap: int, pp: float) -> float:
+        """ Same as [`TopPlays::total_after`] for a play that is worth `pp`."""
+        return c_lib.top_plays_total_after_pp(self._ctx, beatmap, pp)
 
 
 
@@ -0,0 +1,92 @@
+"""asyncio front-end for `RosuFFI` calculations.
+
+Native calculations run on a dedicated thread pool so they never block the
+event loop. At most `max_concurrency` calculations run at once; further calls
+wait in asyncio until a slot frees up. Cancelling a call (directly or through
+its `timeout`) while it is still waiting means it never reaches native code.
+A calculation that already started cannot be interrupted, but it keeps its
+slot until it actually finishes so the limit always holds.
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import os
+import typing
+
+from RosuFFI import (
+    Beatmap,
+    Difficulty,
+    DifficultyAttributes,
+    Performance,
+    PerformanceAttributes,
+    ScoreState,
+)
+
+T = typing.TypeVar("T")
+
+
+class NativeExecutor:
+    """Bounded pool for native calculations, shared by all coroutines of one event loop."""
+
+    def __init__(self, max_concurrency: int | None = None, thread_name_prefix: str = "rosu-pp"):
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._pool = concurrent.futures.ThreadPoolExecutor(self.max_concurrency, thread_name_prefix)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def __aenter__(self) -> NativeExecutor:
+        return self
+
+    async def __aexit__(self, *_):
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and wait for running calculations to finish."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def run(self, fn: typing.Callable[..., T], *args, timeout: float | None = None) -> T:
+        """Run `fn(*args)` on the pool, raising `asyncio.TimeoutError` after `timeout` seconds."""
+        return await asyncio.wait_for(self._run(fn, *args), timeout)
+
+    async def _run(self, fn: typing.Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        await self._semaphore.acquire()
+
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        def release(_):
+            try:
+                loop.call_soon_threadsafe(self._semaphore.release)
+            except RuntimeError:
+                # The loop is already closed, nobody is waiting for the slot anymore.
+                pass
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future, loop=loop)
+
+    async def difficulty(
+        self, difficulty: Difficulty, beatmap: Beatmap, timeout: float | None = None
+    ) -> DifficultyAttributes:
+        return await self.run(difficulty.calculate, beatmap, timeout=timeout)
+
+    async def performance(
+        self, performance: Performance, beatmap: Beatmap, timeout: float | None = None
+    ) -> PerformanceAttributes:
+        return await self.run(performance.calculate, beatmap, timeout=timeout)
+
+    async def performance_from_difficulty(
+        self, performance: Performance, difficulty_attr: DifficultyAttributes, timeout: float | None = None
+    ) -> PerformanceAttributes:
+        return await self.run(performance.calculate_from_difficulty, difficulty_attr, timeout=timeout)
+
+    async def generate_state(
+        self, performance: Performance, beatmap: Beatmap, timeout: float | None = None
+    ) -> ScoreState:
+        return await self.run(performance.generate_state, beatmap, timeout=timeout)
+
+    async def beatmap_from_path(self, path: str | bytes, timeout: float | None = None) -> Beatmap:
+        return await self.run(Beatmap.from_path, os.fsencode(path), timeout=timeout)
@@ -0,0 +1,446 @@
+"""NumPy front-end for the columnar batch entry points of `RosuFFI`.
+
+Every function here crosses the FFI boundary once per call, no matter how many
+rows are passed in. Inputs may be anything `numpy.ascontiguousarray` accepts;
+outputs are freshly allocated `numpy.ndarray`s.
+"""
+from __future__ import annotations
+
+import ctypes
+import typing
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("batch.py needs NumPy, install it with `pip install -r bindings/requirements.txt`") from e
+
+from RosuFFI import (
+    Beatmap,
+    BeatmapAttributes,
+    Difficulty,
+    DifficultyAttributes,
+    DifficultyBatch,
+    FFIError,
+    GradualDifficulty,
+    GradualDifficultyColumns,
+    GradualPerformance,
+    HitObjectColumns,
+    LoadResult,
+    ModSweep,
+    Mods,
+    ObjectJudgement,
+    Performance,
+    PerformanceColumns,
+    RateCurve,
+    ScoreColumns,
+    SeekableGradual,
+    SliceMutBeatmapAttributes,
+    SliceMutDifficultyAttributes,
+    SliceMutLoadResult,
+    SliceMutStrainWindow,
+    SliceMutf32,
+    SliceMutf64,
+    SliceMutu32,
+    SliceObjectJudgement,
+    Slicef64,
+    Sliceu32,
+    Skill,
+    StrainTimeline,
+    StrainWindow,
+)
+
+SCORE_COLUMNS = (
+    "n300",
+    "n100",
+    "n50",
+    "n_katu",
+    "n_geki",
+    "misses",
+    "max_combo",
+    "large_tick_hits",
+    "slider_end_hits",
+    "mods",
+)
+
+PERFORMANCE_COLUMNS = (
+    "pp",
+    "pp_aim",
+    "pp_jump_aim",
+    "pp_flow_aim",
+    "pp_precision",
+    "pp_speed",
+    "pp_stamina",
+    "pp_acc",
+    "pp_difficulty",
+    "effective_miss_count",
+)
+
+HIT_OBJECT_COLUMNS = {
+    "start_time": (np.float64, SliceMutf64, ctypes.c_double),
+    "x": (np.float32, SliceMutf32, ctypes.c_float),
+    "y": (np.float32, SliceMutf32, ctypes.c_float),
+    "kind": (np.uint32, SliceMutu32, ctypes.c_uint32),
+    "repeats": (np.uint32, SliceMutu32, ctypes.c_uint32),
+    "expected_dist": (np.float64, SliceMutf64, ctypes.c_double),
+    "duration": (np.float64, SliceMutf64, ctypes.c_double),
+    "end_time": (np.float64, SliceMutf64, ctypes.c_double),
+}
+
+GRADUAL_DIFFICULTY_COLUMNS = {
+    "stars": (np.float64, SliceMutf64, ctypes.c_double),
+    "aim": (np.float64, SliceMutf64, ctypes.c_double),
+    "jump": (np.float64, SliceMutf64, ctypes.c_double),
+    "flow": (np.float64, SliceMutf64, ctypes.c_double),
+    "precision": (np.float64, SliceMutf64, ctypes.c_double),
+    "speed": (np.float64, SliceMutf64, ctypes.c_double),
+    "stamina": (np.float64, SliceMutf64, ctypes.c_double),
+    "accuracy": (np.float64, SliceMutf64, ctypes.c_double),
+    "rhythm": (np.float64, SliceMutf64, ctypes.c_double),
+    "color": (np.float64, SliceMutf64, ctypes.c_double),
+    "max_combo": (np.uint32, SliceMutu32, ctypes.c_uint32),
+}
+
+COMMON_MODS = ("NM", "HD", "HR", "DT", "HDDT", "HRDT", "EZ", "HT", "FL")
+
+# Every common mod combination on osu!lazer and on osu!stable.
+COMMON_MOD_SETS = tuple((mods, lazer) for lazer in (True, False) for mods in COMMON_MODS)
+
+# Mirrors the layout of `ObjectJudgement`.
+JUDGEMENT_DTYPE = np.dtype(
+    [
+        ("result", np.int32),
+        ("large_tick_hits", np.uint32),
+        ("large_tick_misses", np.uint32),
+        ("small_tick_hits", np.uint32),
+        ("slider_end_hit", np.bool_),
+    ],
+    align=True,
+)
+
+
+def _as_u32(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.uint32)
+
+
+def _slice_u32(array: np.ndarray | None) -> Sliceu32:
+    if array is None:
+        return Sliceu32(data=None, len=0)
+    return Sliceu32(data=array.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32)), len=len(array))
+
+
+def _slice_f64(array: np.ndarray | None) -> Slicef64:
+    if array is None:
+        return Slicef64(data=None, len=0)
+    return Slicef64(data=array.ctypes.data_as(ctypes.POINTER(ctypes.c_double)), len=len(array))
+
+
+def _slice_mut_f64(array: np.ndarray | None) -> SliceMutf64:
+    if array is None:
+        return SliceMutf64(data=None, len=0)
+    return SliceMutf64(data=array.ctypes.data_as(ctypes.POINTER(ctypes.c_double)), len=len(array))
+
+
+def calculate_performance(
+    performance: Performance,
+    difficulty_attr: DifficultyAttributes,
+    columns: typing.Iterable[str] = PERFORMANCE_COLUMNS,
+    **scores,
+) -> dict[str, np.ndarray]:
+    """Score every row of the given columns against one `DifficultyAttributes`.
+
+    `scores` takes the column names of `SCORE_COLUMNS` as keyword arguments, all
+    of the same length. Columns that are not given fall back to whatever is set
+    on `performance`. `mods` holds legacy mod bits per row.
+
+    Returns the requested `PERFORMANCE_COLUMNS` as float64 arrays."""
+    unknown = set(scores) - set(SCORE_COLUMNS)
+    if unknown:
+        raise TypeError(f"unknown score columns: {', '.join(sorted(unknown))}")
+
+    inputs = {name: _as_u32(values) for name, values in scores.items() if values is not None}
+    lengths = {len(array) for array in inputs.values()}
+    if len(lengths) > 1:
+        raise ValueError("all score columns must have the same length")
+    rows = lengths.pop() if lengths else 0
+
+    columns = set(columns) | {"pp"}
+    outputs = {name: np.zeros(rows, dtype=np.float64) for name in PERFORMANCE_COLUMNS if name in columns}
+
+    score_columns = ScoreColumns(**{name: _slice_u32(inputs.get(name)) for name in SCORE_COLUMNS})
+    performance_columns = PerformanceColumns(
+        **{name: _slice_mut_f64(outputs.get(name)) for name in PERFORMANCE_COLUMNS}
+    )
+
+    performance.calculate_batch(difficulty_attr, score_columns, performance_columns)
+
+    return outputs
+
+
+def pp_table(
+    performance: Performance,
+    difficulty_attr: DifficultyAttributes,
+    accuracies=(95.0, 97.0, 98.0, 99.0, 100.0),
+    misses=(0,),
+    combos=None,
+    columns: typing.Iterable[str] = ("pp",),
+) -> dict[str, np.ndarray]:
+    """pp for every accuracy (in percent) and miss count in one call.
+
+    `combos` optionally holds one combo per miss count, otherwise the best
+    possible combo is used. Everything else is taken from `performance`.
+
+    Returns the requested `PERFORMANCE_COLUMNS` as float64 arrays of shape
+    `(len(accuracies), len(misses))`."""
+    accuracies = np.ascontiguousarray(accuracies, dtype=np.float64)
+    misses = _as_u32(misses)
+    combos = _as_u32(combos) if combos is not None else None
+
+    columns = set(columns) | {"pp"}
+    shape = (len(accuracies), len(misses))
+    outputs = {name: np.zeros(shape, dtype=np.float64) for name in PERFORMANCE_COLUMNS if name in columns}
+
+    performance_columns = PerformanceColumns(
+        **{name: _slice_mut_f64(outputs[name].reshape(-1) if name in outputs else None) for name in PERFORMANCE_COLUMNS}
+    )
+    performance.calculate_grid(difficulty_attr, _slice_f64(accuracies), _slice_u32(misses), _slice_u32(combos), performance_columns)
+
+    return outputs
+
+
+def calculate_difficulties(
+    beatmaps: typing.Sequence[Beatmap | str | bytes],
+    difficulties: typing.Sequence[Difficulty],
+    threads: int = 0,
+) -> list[list[DifficultyAttributes] | None]:
+    """Calculate every beatmap with every difficulty on the native thread pool.
+
+    Beatmaps are either parsed `Beatmap`s or paths, which are parsed on the pool.
+    `threads=0` uses one thread per logical core.
+
+    Returns one list per beatmap, holding the attributes in the order of
+    `difficulties`, or `None` for a beatmap that failed to load."""
+    batch = DifficultyBatch.new()
+    batch.threads(threads)
+
+    for beatmap in beatmaps:
+        if isinstance(beatmap, Beatmap):
+            batch.add_beatmap(beatmap)
+        else:
+            batch.add_path(beatmap.encode() if isinstance(beatmap, str) else beatmap)
+
+    for difficulty in difficulties:
+        batch.add_difficulty(difficulty)
+
+    out = (DifficultyAttributes * batch.len())()
+    results = (LoadResult * len(beatmaps))()
+    batch.calculate(
+        SliceMutDifficultyAttributes(data=ctypes.cast(out, ctypes.POINTER(DifficultyAttributes)), len=len(out)),
+        SliceMutLoadResult(data=ctypes.cast(results, ctypes.POINTER(LoadResult)), len=len(results)),
+    )
+
+    width = len(difficulties)
+    return [
+        list(out[i * width:(i + 1) * width]) if result.error == FFIError.Ok else None
+        for i, result in enumerate(results)
+    ]
+
+
+def mod_sweep(
+    beatmap: Beatmap,
+    mod_sets: typing.Iterable[int | str | Mods | tuple[int | str | Mods, bool]] = COMMON_MOD_SETS,
+    base: Difficulty | None = None,
+    lazer: bool = True,
+) -> list[tuple[DifficultyAttributes, BeatmapAttributes]]:
+    """Difficulty and beatmap attributes of `beatmap` for every mod set in one call.
+
+    A mod set is given as legacy bits, acronyms or a `Mods` handle, optionally
+    paired with its own `lazer` flag. Everything else comes from `base`.
+
+    Returns one `(DifficultyAttributes, BeatmapAttributes)` pair per mod set."""
+    sweep = ModSweep.new(base if base is not None else Difficulty.new())
+
+    for mods in mod_sets:
+        mods, is_lazer = mods if isinstance(mods, tuple) else (mods, lazer)
+        if isinstance(mods, Mods):
+            sweep.add_mods(mods, is_lazer)
+        elif isinstance(mods, str):
+            sweep.add_acronyms(b"" if mods == "NM" else mods.encode(), is_lazer)
+        else:
+            sweep.add_bits(mods, is_lazer)
+
+    attributes = (DifficultyAttributes * sweep.len())()
+    beatmap_attributes = (BeatmapAttributes * sweep.len())()
+    sweep.calculate(
+        beatmap,
+        SliceMutDifficultyAttributes(data=ctypes.cast(attributes, ctypes.POINTER(DifficultyAttributes)), len=len(attributes)),
+        SliceMutBeatmapAttributes(data=ctypes.cast(beatmap_attributes, ctypes.POINTER(BeatmapAttributes)), len=len(beatmap_attributes)),
+    )
+
+    return list(zip(attributes, beatmap_attributes))
+
+
+def rate_curve(
+    difficulty: Difficulty,
+    beatmap: Beatmap,
+    min_rate: float = 0.5,
+    max_rate: float = 2.0,
+    steps: int = 31,
+) -> tuple[RateCurve, np.ndarray, np.ndarray]:
+    """Star ratings of `beatmap` on an evenly spaced grid of clock rates.
+
+    Returns the `RateCurve`, whose `estimate` answers rates between grid points
+    without recalculating, along with the grid's rates and stars as float64 arrays."""
+    curve = RateCurve.new(difficulty, beatmap, min_rate, max_rate, steps)
+    rates = np.empty(curve.len(), dtype=np.float64)
+    stars = np.empty(curve.len(), dtype=np.float64)
+    curve.grid(_slice_mut_f64(rates), _slice_mut_f64(stars))
+
+    return curve, rates, stars
+
+
+def hit_object_columns(
+    beatmap: Beatmap,
+    columns: typing.Iterable[str] = HIT_OBJECT_COLUMNS,
+) -> dict[str, np.ndarray]:
+    """Export the hit objects of `beatmap` as one array per requested column.
+
+    The native side writes straight into the returned arrays. `kind` holds
+    `HitObjectKind` values, `expected_dist` is NaN where a slider has none,
+    and so are the slider's `duration` and `end_time`."""
+    columns = set(columns)
+    unknown = columns - set(HIT_OBJECT_COLUMNS)
+    if unknown:
+        raise TypeError(f"unknown hit object columns: {', '.join(sorted(unknown))}")
+
+    outputs, slices = _mut_columns(HIT_OBJECT_COLUMNS, columns, beatmap.n_hit_objects())
+    beatmap.hit_object_columns(HitObjectColumns(**slices))
+
+    return outputs
+
+
+def _mut_columns(
+    spec: dict[str, tuple], columns: set[str], rows: int
+) -> tuple[dict[str, np.ndarray], dict[str, ctypes.Structure]]:
+    outputs = {}
+    slices = {}
+
+    for name, (dtype, slice_type, ctype) in spec.items():
+        if name in columns:
+            array = outputs[name] = np.empty(rows, dtype=dtype)
+            slices[name] = slice_type(data=array.ctypes.data_as(ctypes.POINTER(ctype)), len=rows)
+        else:
+            slices[name] = slice_type(data=None, len=0)
+
+    return outputs, slices
+
+
+def star_curve(
+    gradual: GradualDifficulty,
+    columns: typing.Iterable[str] = ("stars",),
+) -> dict[str, np.ndarray]:
+    """Run `gradual` to the end and return its attributes after every hit object.
+
+    Only the remaining objects are processed, so a fresh `GradualDifficulty`
+    yields one row per hit object. `stars` is always returned; attributes the
+    map's mode does not have are all zeros."""
+    columns = set(columns) | {"stars"}
+    unknown = columns - set(GRADUAL_DIFFICULTY_COLUMNS)
+    if unknown:
+        raise TypeError(f"unknown gradual difficulty columns: {', '.join(sorted(unknown))}")
+
+    outputs, slices = _mut_columns(GRADUAL_DIFFICULTY_COLUMNS, columns, gradual.len())
+    gradual.collect(GradualDifficultyColumns(**slices))
+
+    return outputs
+
+
+def strain_timeline(difficulty: Difficulty, beatmap: Beatmap) -> tuple[np.ndarray, dict[int, np.ndarray]]:
+    """Strain peaks per section of every skill the map's mode has.
+
+    Returns the section start times in map time and the peaks keyed by
+    `Skill` value, all as float64 arrays of the same length."""
+    timeline = StrainTimeline.new(difficulty, beatmap)
+    rows = timeline.len()
+
+    start_times = np.empty(rows, dtype=np.float64)
+    timeline.start_times(_slice_mut_f64(start_times))
+
+    peaks = {}
+    for name, skill in vars(Skill).items():
+        if name.startswith("_") or not timeline.has(skill):
+            continue
+        peaks[skill] = np.empty(rows, dtype=np.float64)
+        timeline.peaks_of(skill, _slice_mut_f64(peaks[skill]))
+
+    return start_times, peaks
+
+
+def hardest_windows(timeline: StrainTimeline, skill: int, window: int, k: int) -> list[StrainWindow]:
+    """The `k` hardest non-overlapping stretches of `window` sections, hardest first."""
+    out = (StrainWindow * k)()
+    written = timeline.hardest_windows(skill, window, SliceMutStrainWindow(data=ctypes.cast(out, ctypes.POINTER(StrainWindow)), len=k))
+    return list(out[:written])
+
+
+def _judgements(results, large_tick_hits, large_tick_misses, small_tick_hits, slider_end_hit) -> np.ndarray:
+    results = np.asarray(results)
+    judgements = np.zeros(len(results), dtype=JUDGEMENT_DTYPE)
+    judgements["result"] = results
+
+    for name, values in (
+        ("large_tick_hits", large_tick_hits),
+        ("large_tick_misses", large_tick_misses),
+        ("small_tick_hits", small_tick_hits),
+        ("slider_end_hit", slider_end_hit),
+    ):
+        if values is not None:
+            judgements[name] = values
+
+    return judgements
+
+
+def _slice_judgements(judgements: np.ndarray) -> SliceObjectJudgement:
+    return SliceObjectJudgement(data=judgements.ctypes.data_as(ctypes.POINTER(ObjectJudgement)), len=len(judgements))
+
+
+def replay_pp(
+    gradual: GradualPerformance | SeekableGradual,
+    results,
+    large_tick_hits=None,
+    large_tick_misses=None,
+    small_tick_hits=None,
+    slider_end_hit=None,
+) -> np.ndarray:
+    """pp after every judged hit object of a replay, in a single native pass.
+
+    `results` holds one `Judgement` value per hit object; the optional osu!lazer
+    tick and slider end columns must be of the same length. The score state
+    keeps accumulating on `gradual`, so a replay can be fed in chunks.
+
+    Returns a float64 array of the same length as `results`."""
+    judgements = _judgements(results, large_tick_hits, large_tick_misses, small_tick_hits, slider_end_hit)
+    pp = np.empty(len(judgements), dtype=np.float64)
+    gradual.replay(_slice_judgements(judgements), _slice_mut_f64(pp))
+
+    return pp
+
+
+def evaluate_branches(gradual: SeekableGradual, branches: typing.Sequence) -> np.ndarray:
+    """Final pp of every hypothetical continuation of `gradual`'s replayed score.
+
+    Each branch is either a sequence of `Judgement` values or an array of
+    `JUDGEMENT_DTYPE`, starting at the object after `gradual`'s position.
+    All branches are evaluated in one native call.
+
+    Returns a float64 array with one value per branch."""
+    parts = [
+        branch if getattr(branch, "dtype", None) == JUDGEMENT_DTYPE else _judgements(branch, None, None, None, None)
+        for branch in branches
+    ]
+    judgements = np.concatenate(parts) if parts else np.zeros(0, dtype=JUDGEMENT_DTYPE)
+    branch_lens = _as_u32([len(part) for part in parts])
+    pp = np.empty(len(parts), dtype=np.float64)
+
+    gradual.evaluate_branches(_slice_judgements(judgements), _slice_u32(branch_lens), _slice_mut_f64(pp))
+
+    return pp
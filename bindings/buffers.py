@@ -0,0 +1,96 @@
+"""Pass any contiguous Python buffer to functions taking a `Sliceu8`.
+
+The generated bindings only accept a `Sliceu8` or a ctypes `c_uint8` array,
+so `bytes`, `bytearray`, `memoryview` or `mmap.mmap` content would first have
+to be copied into one. `borrowed_u8` instead exports the object's memory
+through the buffer protocol for the duration of a `with` block.
+
+`RosuFFI.py` is generated and can't take buffers itself, so this module is
+the supported API for parsing from Python buffers without a copy: use
+`beatmap_from_bytes` and `beatmap_from_bytes_cached` instead of
+`Beatmap.from_bytes` and `Beatmap.from_bytes_cached`.
+"""
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import typing
+
+from RosuFFI import Beatmap, OszArchive, Sliceu8
+
+
+class _PyBuffer(ctypes.Structure):
+    """`Py_buffer` from the CPython buffer protocol."""
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+_PyBUF_SIMPLE = 0
+
+_GetBuffer = ctypes.pythonapi.PyObject_GetBuffer
+_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_PyBuffer), ctypes.c_int]
+_GetBuffer.restype = ctypes.c_int
+
+_ReleaseBuffer = ctypes.pythonapi.PyBuffer_Release
+_ReleaseBuffer.argtypes = [ctypes.POINTER(_PyBuffer)]
+_ReleaseBuffer.restype = None
+
+
+@contextlib.contextmanager
+def borrowed_u8(data) -> typing.Iterator[Sliceu8]:
+    """Borrow the memory of `data` as a `Sliceu8` without copying it.
+
+    `data` is a `Sliceu8`, a ctypes `c_uint8` array or any object supporting
+    the buffer protocol with contiguous memory. The buffer stays exported, so
+    it can't be resized or closed, until the `with` block exits."""
+    if isinstance(data, Sliceu8):
+        yield data
+        return
+
+    if hasattr(data, "_length_") and getattr(data, "_type_", "") == ctypes.c_uint8:
+        yield Sliceu8(data=ctypes.cast(data, ctypes.POINTER(ctypes.c_uint8)), len=len(data))
+        return
+
+    view = _PyBuffer()
+    _GetBuffer(data, ctypes.byref(view), _PyBUF_SIMPLE)
+    try:
+        yield Sliceu8(data=ctypes.cast(view.buf, ctypes.POINTER(ctypes.c_uint8)), len=view.len)
+    finally:
+        _ReleaseBuffer(ctypes.byref(view))
+
+
+def to_bytearray(data: Sliceu8) -> bytearray:
+    """Copy a `Sliceu8` with a single `memmove` instead of item by item."""
+    rval = bytearray(len(data))
+    if rval:
+        ctypes.memmove((ctypes.c_char * len(rval)).from_buffer(rval), data.data, len(rval))
+    return rval
+
+
+def beatmap_from_bytes(data) -> Beatmap:
+    """Parse a beatmap from `.osu` content in any contiguous buffer."""
+    with borrowed_u8(data) as data:
+        return Beatmap.from_bytes(data)
+
+
+def beatmap_from_bytes_cached(data) -> Beatmap:
+    """Same as `beatmap_from_bytes` but through `Beatmap.from_bytes_cached`."""
+    with borrowed_u8(data) as data:
+        return Beatmap.from_bytes_cached(data)
+
+
+def osz_archive_from_bytes(data) -> OszArchive:
+    """Open an `.osz` archive held in any contiguous buffer. `data` is copied."""
+    with borrowed_u8(data) as data:
+        return OszArchive.from_bytes(data)
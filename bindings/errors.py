@@ -0,0 +1,55 @@
+"""Typed exceptions for failed native calls.
+
+The generated bindings raise a plain `Exception` whose message holds the
+`FFIError` code. `call` runs a single binding function and raises
+`FFIException` instead, which keeps the code available as
+`FFIException.code`. `FFIException` subclasses `Exception`, so existing
+handlers keep working.
+
+Importing this module changes nothing else. `install` opts the whole
+process into `FFIException` for every binding function.
+"""
+from __future__ import annotations
+
+import re
+import typing
+
+import RosuFFI
+
+_T = typing.TypeVar("_T")
+
+# Message of the exception raised by the generated `_errcheck`.
+_MESSAGE = re.compile(r"Function returned error: (-?\d+)")
+
+
+class FFIException(Exception):
+    """A native function returned an `FFIError` other than `FFIError.Ok`."""
+    def __init__(self, code: int):
+        super().__init__(f"Function returned error: {code}")
+        self.code = code
+
+
+def call(function: typing.Callable[..., _T], *args, **kwargs) -> _T:
+    """Call a binding function, raising `FFIException` if it fails."""
+    try:
+        return function(*args, **kwargs)
+    except FFIException:
+        raise
+    except Exception as e:
+        match = _MESSAGE.fullmatch(str(e)) if type(e) is Exception else None
+        if match is None:
+            raise
+        raise FFIException(int(match.group(1))) from None
+
+
+def _errcheck(returned, success):
+    if returned == success: return
+    else: raise FFIException(returned)
+
+
+def install() -> None:
+    """Raise `FFIException` from every binding function in this process.
+
+    The generated `errcheck` hooks look `_errcheck` up at call time, so this
+    also affects functions called by other modules."""
+    RosuFFI._errcheck = _errcheck
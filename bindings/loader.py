@@ -0,0 +1,97 @@
+"""Bulk loading of `.osu` files through `BeatmapLoader` and `OszArchive`.
+
+All files are read and parsed on the native thread pool in a single call.
+A file that fails to load is reported with its `FFIError` code instead of
+raising, so one broken file does not abort indexing a whole Songs folder.
+`.osz` mapsets are read straight from the archive without extracting them.
+"""
+from __future__ import annotations
+
+import collections.abc
+import ctypes
+import dataclasses
+import os
+import typing
+
+from buffers import osz_archive_from_bytes
+from errors import FFIException, call
+from RosuFFI import (
+    Beatmap,
+    BeatmapLoader,
+    FFIError,
+    LoadResult,
+    OszArchive,
+    OwnedString,
+    SliceMutLoadResult,
+)
+
+
+@dataclasses.dataclass
+class Loaded:
+    """Outcome of loading the file at `path`."""
+    path: str
+    beatmap: Beatmap | None
+    error: int = FFIError.Ok
+    millis: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error == FFIError.Ok
+
+
+def _load(loader: BeatmapLoader, threads: int) -> list[Loaded]:
+    loader.threads(threads)
+    loader.load()
+
+    results = (LoadResult * loader.len())()
+    loader.results(SliceMutLoadResult(data=ctypes.cast(results, ctypes.POINTER(LoadResult)), len=len(results)))
+
+    path = OwnedString.empty()
+    loaded = []
+
+    for index, result in enumerate(results):
+        loader.path(index, path)
+        beatmap = Beatmap.from_loader(loader, index) if result.error == FFIError.Ok else None
+        loaded.append(Loaded(os.fsdecode(path.to_cstr()), beatmap, result.error, result.millis))
+
+    return loaded
+
+
+def load_many(paths: typing.Iterable[str | bytes | os.PathLike], threads: int = 0) -> list[Loaded]:
+    """Load every path, keeping their order. `threads=0` uses one thread per logical core."""
+    loader = BeatmapLoader.new()
+    for path in paths:
+        loader.add_path(os.fsencode(path))
+    return _load(loader, threads)
+
+
+def load_directory(root: str | bytes | os.PathLike, threads: int = 0) -> list[Loaded]:
+    """Load every `.osu` file below `root`, sorted by path."""
+    loader = BeatmapLoader.new()
+    loader.add_directory(os.fsencode(root))
+    return _load(loader, threads)
+
+
+def load_archive(source: str | os.PathLike | collections.abc.Buffer) -> list[Loaded]:
+    """Parse every `.osu` entry of an `.osz` archive.
+
+    `source` is a path or the archive's content in any contiguous buffer, e.g.
+    `bytes` or an `mmap`. `Loaded.path` is the entry's name inside the archive."""
+    if isinstance(source, (str, os.PathLike)):
+        archive = OszArchive.from_path(os.fsencode(source))
+    else:
+        archive = osz_archive_from_bytes(source)
+
+    name = OwnedString.empty()
+    loaded = []
+
+    for index in range(archive.len()):
+        archive.name(index, name)
+        path = name.to_cstr().decode()
+
+        try:
+            loaded.append(Loaded(path, call(Beatmap.from_archive, archive, index)))
+        except FFIException as e:
+            loaded.append(Loaded(path, None, e.code))
+
+    return loaded
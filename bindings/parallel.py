@@ -0,0 +1,239 @@
+"""Multi-process score recalculation on top of `RosuFFI`.
+
+Jobs are `(beatmap path, score params)` pairs. `score params` maps the names of
+`Performance` setters to their argument, e.g.
+`{"i_mods": 72, "lazer": False, "n300": 950, "n100": 12, "misses": 1, "combo": 1400}`.
+
+Jobs are sharded by beatmap so that every worker parses a map once per shard
+and scores all of its plays against shared difficulty attributes. Jobs are
+read as they arrive with a bounded amount buffered or in flight, so inputs
+larger than memory can be streamed through. Each worker process loads the
+native library exactly once.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import os
+import time
+import typing
+
+import RosuFFI
+from RosuFFI import Beatmap, Difficulty, Mode, Performance, PerformanceAttributes
+
+ScoreParams = typing.Mapping[str, typing.Any]
+
+# Setters that change the difficulty attributes and therefore have to be applied
+# to the `Difficulty` as well as the `Performance`.
+DIFFICULTY_PARAMS = (
+    "i_mods",
+    "s_mods",
+    "passed_objects",
+    "clock_rate",
+    "ar",
+    "cs",
+    "hp",
+    "od",
+    "hardrock_offsets",
+    "lazer",
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class ScoreResult:
+    """Result for the job at position `index` of the input stream."""
+    index: int
+    beatmap: str
+    pp: float = 0.0
+    stars: float = 0.0
+    error: str | None = None
+
+
+@dataclasses.dataclass
+class Throughput:
+    """Progress of a `recalculate` run."""
+    scores: int = 0
+    # Finished shards; a beatmap split over several shards counts once per shard.
+    beatmaps: int = 0
+    failed_beatmaps: int = 0
+    started: float = dataclasses.field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def scores_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.scores / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        return (f"{self.scores} scores on {self.beatmaps} beatmaps ({self.failed_beatmaps} failed) "
+                f"in {self.elapsed:.1f}s, {self.scores_per_second:.0f} scores/s")
+
+
+def _init_worker(lib_path: str):
+    RosuFFI.init_lib(lib_path)
+
+
+def _apply(target, params: ScoreParams, names: typing.Iterable[str]):
+    for name in names:
+        if name not in params:
+            continue
+        value = params[name]
+        if name == "s_mods" and isinstance(value, str):
+            value = value.encode()
+        getattr(target, name)(value)
+
+
+def _pp_and_stars(attrs: PerformanceAttributes) -> tuple[float, float]:
+    if attrs.mode == Mode.Osu:
+        inner = attrs.osu.value
+    elif attrs.mode == Mode.Taiko:
+        inner = attrs.taiko.value
+    elif attrs.mode == Mode.Catch:
+        inner = attrs.fruit.value
+    else:
+        inner = attrs.mania.value
+    return inner.pp, inner.difficulty.stars
+
+
+def _score_beatmap(path: str, rows: list[tuple[int, ScoreParams]]) -> list[ScoreResult]:
+    try:
+        beatmap = Beatmap.from_path(os.fsencode(path))
+    except Exception as e:
+        return [ScoreResult(index, path, error=str(e)) for index, _ in rows]
+
+    # Difficulty attributes per key, or the exception calculating them raised.
+    difficulties: dict[tuple, typing.Any] = {}
+    results = []
+
+    for index, params in rows:
+        try:
+            key = tuple((name, params[name]) for name in DIFFICULTY_PARAMS if name in params)
+            hash(key)
+        except TypeError as e:
+            results.append(ScoreResult(index, path, error=str(e)))
+            continue
+
+        if key not in difficulties:
+            try:
+                difficulty = Difficulty.new()
+                _apply(difficulty, params, DIFFICULTY_PARAMS)
+                difficulties[key] = difficulty.calculate(beatmap)
+            except Exception as e:
+                difficulties[key] = e
+
+        difficulty_attr = difficulties[key]
+
+        if isinstance(difficulty_attr, Exception):
+            results.append(ScoreResult(index, path, error=str(difficulty_attr)))
+            continue
+
+        try:
+            performance = Performance.new()
+            _apply(performance, params, params.keys())
+            pp, stars = _pp_and_stars(performance.calculate_from_difficulty(difficulty_attr))
+        except Exception as e:
+            results.append(ScoreResult(index, path, error=str(e)))
+            continue
+
+        results.append(ScoreResult(index, path, pp, stars))
+
+    return results
+
+
+def shard(
+    jobs: typing.Iterable[tuple[str, ScoreParams]],
+    shard_size: int = 1024,
+    max_buffered: int = 16384,
+) -> typing.Iterator[tuple[str, list[tuple[int, ScoreParams]]]]:
+    """Group jobs by beatmap path as they arrive, remembering each job's position in the stream.
+
+    A beatmap's shard is yielded once it holds `shard_size` jobs. If more than
+    `max_buffered` jobs are waiting in total, the shard of the beatmap that was
+    seen first is yielded early. The rest is yielded when `jobs` is exhausted.
+    A beatmap can therefore end up in several shards, but never more jobs than
+    `max_buffered` are held at once."""
+    if shard_size < 1 or max_buffered < 1:
+        raise ValueError("shard_size and max_buffered must be positive")
+
+    buffered: dict[str, list[tuple[int, ScoreParams]]] = {}
+    total = 0
+
+    for index, (path, params) in enumerate(jobs):
+        path = os.fspath(path)
+        rows = buffered.setdefault(path, [])
+        rows.append((index, params))
+        total += 1
+
+        if len(rows) >= shard_size:
+            total -= len(rows)
+            yield path, buffered.pop(path)
+        elif total > max_buffered:
+            # Dicts keep insertion order, so this is the longest waiting beatmap.
+            oldest = next(iter(buffered))
+            total -= len(buffered[oldest])
+            yield oldest, buffered.pop(oldest)
+
+    yield from buffered.items()
+
+
+def recalculate(
+    jobs: typing.Iterable[tuple[str, ScoreParams]],
+    lib_path: str,
+    processes: int | None = None,
+    progress: typing.Callable[[Throughput], None] | None = None,
+    shard_size: int = 1024,
+    max_buffered: int = 16384,
+    max_pending: int | None = None,
+) -> typing.Iterator[ScoreResult]:
+    """Score all jobs on `processes` worker processes (defaults to the CPU count).
+
+    `jobs` is consumed lazily and split into shards with `shard`. At most
+    `max_pending` shards, by default twice the amount of processes, are
+    submitted but not yet yielded; reading further jobs waits until a shard
+    finishes, so memory stays bounded for any input size.
+
+    Results are yielded per shard as soon as a worker finishes it, so they are
+    not in input order; use `ScoreResult.index` to match them up. `progress` is
+    called with the running `Throughput` after every finished shard."""
+    processes = processes or os.cpu_count() or 1
+    max_pending = max_pending or 2 * processes
+    throughput = Throughput()
+
+    def finished(future: concurrent.futures.Future, path: str, rows: list[tuple[int, ScoreParams]]) -> list[ScoreResult]:
+        try:
+            results = future.result()
+        except Exception as e:
+            # e.g. the worker died; every score of the shard fails instead of the whole run.
+            results = [ScoreResult(index, path, error=str(e)) for index, _ in rows]
+
+        throughput.beatmaps += 1
+        throughput.scores += len(results)
+        if results and all(r.error is not None for r in results):
+            throughput.failed_beatmaps += 1
+
+        if progress is not None:
+            progress(throughput)
+
+        return results
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker, initargs=(lib_path,)
+    ) as pool:
+        pending: dict[concurrent.futures.Future, tuple[str, list[tuple[int, ScoreParams]]]] = {}
+
+        def harvest() -> typing.Iterator[ScoreResult]:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                yield from finished(future, *pending.pop(future))
+
+        for path, rows in shard(jobs, shard_size, max_buffered):
+            while len(pending) >= max_pending:
+                yield from harvest()
+
+            pending[pool.submit(_score_beatmap, path, rows)] = (path, rows)
+
+        while pending:
+            yield from harvest()
@@ -0,0 +1,66 @@
+"""Total pp recalculation of whole profiles through `ProfileEngine`.
+
+Every score is a `ProfileScore` naming its user, the key of its beatmap,
+legacy mod bits and its `ScoreState`. Scores are grouped by beatmap on the
+native side so each map is parsed once and each mod combination on it is
+calculated once, then all beatmaps are scored on the native thread pool.
+Totals use the usual `0.95^i` weighting plus bonus pp, and every pp+ skill
+is weighted on its own.
+"""
+from __future__ import annotations
+
+import ctypes
+import dataclasses
+import os
+import typing
+
+from RosuFFI import (
+    Beatmap,
+    ProfileEngine,
+    ProfileScore,
+    ProfileTotal,
+    SliceMutf64,
+    SliceMutProfileTotal,
+    SliceProfileScore,
+)
+
+
+@dataclasses.dataclass
+class Profiles:
+    """Outcome of `recalculate_profiles`."""
+    totals: dict[int, ProfileTotal]
+    # pp of every score in input order, `nan` if its beatmap is missing or broken.
+    score_pp: list[float]
+
+
+def recalculate_profiles(
+    beatmaps: typing.Mapping[int, Beatmap | str | bytes | os.PathLike],
+    scores: typing.Iterable[ProfileScore],
+    threads: int = 0,
+) -> Profiles:
+    """Score all plays and sum up the totals of every user.
+
+    `beatmaps` maps the keys used by `ProfileScore.beatmap` to a parsed
+    `Beatmap` or to a path that is parsed on the thread pool. `threads=0`
+    uses one thread per logical core."""
+    engine = ProfileEngine.new()
+    engine.threads(threads)
+
+    for key, beatmap in beatmaps.items():
+        if isinstance(beatmap, Beatmap):
+            engine.add_beatmap(key, beatmap)
+        else:
+            engine.add_path(key, os.fsencode(beatmap))
+
+    scores = list(scores)
+    array = (ProfileScore * len(scores))(*scores)
+    engine.add_scores(SliceProfileScore(data=ctypes.cast(array, ctypes.POINTER(ProfileScore)), len=len(array)))
+    engine.calculate()
+
+    totals = (ProfileTotal * engine.users())()
+    engine.totals(SliceMutProfileTotal(data=ctypes.cast(totals, ctypes.POINTER(ProfileTotal)), len=len(totals)))
+
+    pp = (ctypes.c_double * engine.len())()
+    engine.score_pp(SliceMutf64(data=ctypes.cast(pp, ctypes.POINTER(ctypes.c_double)), len=len(pp)))
+
+    return Profiles({total.user_id: total for total in totals}, list(pp))
@@ -0,0 +1,54 @@
+"""Shared fixtures for the binding tests.
+
+Tests that call into native code need the built library. It is looked up at
+`ROSU_PP_FFI_LIB` or in `target/release`, and those tests are skipped if it
+doesn't exist, unless `ROSU_PP_FFI_REQUIRED` is set.
+"""
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+
+import pytest
+
+BINDINGS = pathlib.Path(__file__).resolve().parent.parent
+ROOT = BINDINGS.parent
+RESOURCES = ROOT / "SharpRosuPP" / "RosuPP.Tests" / "resources"
+
+# osu!standard, osu!taiko, osu!catch and osu!mania, in that order.
+BEATMAPS = ["2785319.osu", "1028484.osu", "2118524.osu", "1638954.osu"]
+
+sys.path.insert(0, str(BINDINGS))
+
+import RosuFFI  # noqa: E402
+
+
+def _library() -> pathlib.Path | None:
+    if "ROSU_PP_FFI_LIB" in os.environ:
+        return pathlib.Path(os.environ["ROSU_PP_FFI_LIB"])
+
+    for name in ("librosu_pp_ffi.so", "librosu_pp_ffi.dylib", "rosu_pp_ffi.dll"):
+        path = ROOT / "target" / "release" / name
+        if path.exists():
+            return path
+
+    return None
+
+
+@pytest.fixture(scope="session")
+def native() -> None:
+    """Load the native library, skipping the test if it wasn't built."""
+    path = _library()
+    if path is None or not path.exists():
+        reason = "native library not built, set ROSU_PP_FFI_LIB or run `cargo build --release`"
+        if os.environ.get("ROSU_PP_FFI_REQUIRED"):
+            pytest.fail(reason)
+        pytest.skip(reason)
+    if RosuFFI.c_lib is None:
+        RosuFFI.init_lib(str(path))
+
+
+@pytest.fixture
+def beatmap_path() -> pathlib.Path:
+    return RESOURCES / BEATMAPS[0]
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from conftest import BINDINGS
+
+
+def test_import_without_numpy_names_the_dependency():
+    # Hide NumPy even if it is installed.
+    code = "import sys; sys.modules['numpy'] = None; import batch"
+    result = subprocess.run([sys.executable, "-c", code], cwd=BINDINGS, capture_output=True, text=True)
+
+    assert result.returncode != 0
+    assert "batch.py needs NumPy" in result.stderr
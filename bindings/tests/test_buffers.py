@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import ctypes
+import mmap
+
+import pytest
+
+import buffers
+from conftest import BEATMAPS, RESOURCES
+from RosuFFI import Sliceu8
+
+
+@pytest.mark.parametrize("data", [
+    b"abc",
+    bytearray(b"abcd"),
+    memoryview(b"xabcx")[1:4],
+    (ctypes.c_uint8 * 3)(*b"abc"),
+    b"",
+])
+def test_borrowed_u8_round_trip(data):
+    with buffers.borrowed_u8(data) as borrowed:
+        assert isinstance(borrowed, Sliceu8)
+        assert bytes(buffers.to_bytearray(borrowed)) == bytes(data)
+
+
+def test_borrowed_u8_does_not_copy():
+    data = bytearray(b"abc")
+
+    with buffers.borrowed_u8(data) as borrowed:
+        data[0] = ord("x")
+        assert bytes(buffers.to_bytearray(borrowed)) == b"xbc"
+
+
+def test_borrowed_u8_pins_the_buffer():
+    data = bytearray(b"abc")
+
+    with buffers.borrowed_u8(data):
+        with pytest.raises(BufferError):
+            data.append(0)
+
+    data.append(0)
+
+
+def test_borrowed_u8_rejects_non_contiguous_buffers():
+    with pytest.raises(BufferError):
+        with buffers.borrowed_u8(memoryview(b"abcdef")[::2]):
+            pass
+
+
+def _stars(beatmap) -> float:
+    from RosuFFI import Difficulty
+
+    attrs = Difficulty.new().calculate(beatmap)
+    return (attrs.osu, attrs.taiko, attrs.fruit, attrs.mania)[attrs.mode].value.stars
+
+
+@pytest.mark.parametrize("name", BEATMAPS)
+def test_beatmap_from_any_buffer(native, name):
+    path = RESOURCES / name
+    content = path.read_bytes()
+    expected = _stars(buffers.beatmap_from_bytes(content))
+
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert _stars(buffers.beatmap_from_bytes(mapped)) == expected
+
+    assert _stars(buffers.beatmap_from_bytes(bytearray(content))) == expected
+    assert _stars(buffers.beatmap_from_bytes(memoryview(content))) == expected
+    assert _stars(buffers.beatmap_from_bytes_cached(content)) == expected
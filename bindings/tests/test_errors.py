@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+import RosuFFI
+import errors
+
+
+def _fail(code: int) -> None:
+    RosuFFI._errcheck(code, RosuFFI.FFIError.Ok)
+
+
+def test_call_raises_ffi_exception():
+    with pytest.raises(errors.FFIException) as e:
+        errors.call(_fail, RosuFFI.FFIError.InvalidLength)
+
+    assert e.value.code == RosuFFI.FFIError.InvalidLength
+
+
+def test_call_passes_results_and_other_errors_through():
+    assert errors.call(lambda a, b=0: a + b, 1, b=2) == 3
+
+    with pytest.raises(ValueError):
+        errors.call(int, "not a number")
+
+    with pytest.raises(Exception, match="^unrelated$"):
+        errors.call(_raise, Exception("unrelated"))
+
+
+def _raise(e: Exception) -> None:
+    raise e
+
+
+def test_import_does_not_change_error_behaviour():
+    assert RosuFFI._errcheck is not errors._errcheck
+
+    with pytest.raises(Exception) as e:
+        _fail(RosuFFI.FFIError.Null)
+
+    assert type(e.value) is Exception
+
+
+def test_install(monkeypatch):
+    monkeypatch.setattr(RosuFFI, "_errcheck", RosuFFI._errcheck)
+    errors.install()
+
+    with pytest.raises(errors.FFIException) as e:
+        _fail(RosuFFI.FFIError.Null)
+
+    assert e.value.code == RosuFFI.FFIError.Null
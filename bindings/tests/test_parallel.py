@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+import parallel
+from conftest import BEATMAPS, RESOURCES
+
+
+def _flatten(shards):
+    return sorted(index for _, rows in shards for index, _ in rows)
+
+
+def test_shard_groups_by_beatmap():
+    jobs = [("a", {}), ("b", {}), ("a", {"n300": 1})]
+
+    assert list(parallel.shard(jobs)) == [("a", [(0, {}), (2, {"n300": 1})]), ("b", [(1, {})])]
+
+
+def test_shard_yields_full_shards_early():
+    jobs = ((f"{i % 3}", {}) for i in range(10))
+    shards = list(parallel.shard(jobs, shard_size=2))
+
+    assert all(len(rows) <= 2 for _, rows in shards)
+    assert shards[0] == ("0", [(0, {}), (3, {})])
+    assert _flatten(shards) == list(range(10))
+
+
+def test_shard_bounds_the_buffer():
+    consumed = 0
+
+    def jobs():
+        nonlocal consumed
+        for i in itertools.count():
+            consumed = i + 1
+            yield f"{i}", {}
+
+    stream = parallel.shard(jobs(), shard_size=100, max_buffered=5)
+    shards = list(itertools.islice(stream, 3))
+
+    # Every beatmap is distinct, so each job past the limit flushes the oldest one.
+    assert [path for path, _ in shards] == ["0", "1", "2"]
+    assert consumed == 8
+
+
+def test_shard_rejects_empty_limits():
+    with pytest.raises(ValueError):
+        list(parallel.shard([], shard_size=0))
+
+
+def test_recalculate_streams_every_job(native):
+    import RosuFFI
+
+    lib_path = RosuFFI.c_lib._name
+    paths = [str(RESOURCES / name) for name in BEATMAPS] + [str(RESOURCES / "missing.osu")]
+    jobs = [(paths[i % len(paths)], {"accuracy": 95.0 + i % 5}) for i in range(40)]
+
+    results = list(parallel.recalculate(iter(jobs), lib_path, processes=2, shard_size=3, max_buffered=4, max_pending=2))
+
+    assert sorted(r.index for r in results) == list(range(40))
+    for r in results:
+        if r.beatmap.endswith("missing.osu"):
+            assert r.error is not None
+        else:
+            assert r.error is None and r.pp > 0
@@ -0,0 +1,79 @@
+"""Concurrent use of shared handles must give the same results as sequential use.
+
+On a free-threaded build (e.g. python3.13t) these calls really run in
+parallel; `test_reports_gil_status` records which kind of build ran them.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import os
+import sys
+import threading
+
+import pytest
+
+import threaded
+from conftest import BEATMAPS, RESOURCES
+
+THREADS = 8
+ROUNDS = 32
+
+
+def _pp(attrs) -> float:
+    return (attrs.osu, attrs.taiko, attrs.fruit, attrs.mania)[attrs.mode].value.pp
+
+
+def test_reports_gil_status():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}")
+
+
+@pytest.mark.parametrize("name", BEATMAPS)
+def test_shared_beatmap_and_difficulty(native, name):
+    from RosuFFI import Beatmap, Difficulty
+
+    beatmap = Beatmap.from_path(os.fsencode(RESOURCES / name))
+    difficulty = Difficulty.new()
+    difficulty.i_mods(64)
+    expected = threaded._stars(difficulty.calculate(beatmap))
+
+    # One `Beatmap` and one `Difficulty` handle used by every thread at once.
+    results = threaded.calculate_all(beatmap, [difficulty] * THREADS * ROUNDS, max_workers=THREADS)
+
+    assert [threaded._stars(attrs) for attrs in results] == [expected] * THREADS * ROUNDS
+
+
+@pytest.mark.parametrize("name", BEATMAPS)
+def test_concurrent_performance_matches_sequential(native, name):
+    from RosuFFI import Beatmap, Performance
+
+    beatmap = Beatmap.from_path(os.fsencode(RESOURCES / name))
+    jobs = []
+
+    for i in range(THREADS * 4):
+        performance = Performance.new()
+        performance.i_mods((0, 8, 16, 64, 72)[i % 5])
+        performance.accuracy(90.0 + i % 10)
+        performance.misses(i % 3)
+        jobs.append(performance)
+
+    sequential = [_pp(threaded.calculate(beatmap, job)) for job in jobs]
+
+    # Start all threads at once to maximize overlap.
+    barrier = threading.Barrier(THREADS)
+
+    def run(job):
+        try:
+            barrier.wait(timeout=10)
+        except threading.BrokenBarrierError:
+            pass
+        return _pp(threaded.calculate(beatmap, job))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=THREADS) as pool:
+        for _ in range(ROUNDS // 8):
+            assert list(pool.map(run, jobs)) == sequential
+
+
+def test_rejects_other_jobs():
+    with pytest.raises(TypeError):
+        threaded.calculate(None, object())
@@ -0,0 +1,53 @@
+"""Fan calculations for one parsed `Beatmap` out over a thread pool.
+
+All read-only native methods borrow their handle immutably and ctypes releases
+the GIL for the duration of every foreign call, so a single `Beatmap` can be
+shared by any number of threads, including on free-threaded CPython builds.
+Each `Difficulty` and `Performance` should still only be configured by one
+thread at a time.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+
+from RosuFFI import (
+    Beatmap,
+    Difficulty,
+    DifficultyAttributes,
+    Performance,
+    PerformanceAttributes,
+)
+
+Job = typing.Union[Difficulty, Performance]
+Result = typing.Union[DifficultyAttributes, PerformanceAttributes]
+
+
+def calculate(beatmap: Beatmap, job: Job) -> Result:
+    """Run a single `Difficulty` or `Performance` calculation on `beatmap`."""
+    if not isinstance(job, (Difficulty, Performance)):
+        raise TypeError(f"expected Difficulty or Performance, got {type(job).__name__}")
+    return job.calculate(beatmap)
+
+
+def calculate_all(
+    beatmap: Beatmap,
+    jobs: typing.Iterable[Job],
+    max_workers: int | None = None,
+    executor: concurrent.futures.Executor | None = None,
+) -> list[Result]:
+    """Calculate every job on the same `beatmap` concurrently.
+
+    Uses `executor` if given, otherwise a `ThreadPoolExecutor` with `max_workers`
+    threads that is shut down before returning. Results keep the order of `jobs`."""
+    if executor is not None:
+        return list(executor.map(lambda job: calculate(beatmap, job), jobs))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda job: calculate(beatmap, job), jobs))
+
+
+def _stars(attrs: DifficultyAttributes) -> float:
+    inner = (attrs.osu, attrs.taiko, attrs.fruit, attrs.mania)[attrs.mode]
+    return inner.value.stars
+
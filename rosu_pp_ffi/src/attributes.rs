@@ -65,6 +65,18 @@ pub struct PerformanceAttributes {
     pub mode: Mode,
 }
 
+impl PerformanceAttributes {
+    /// The final performance points, `0.0` if the attributes of the mode are missing.
+    pub fn pp(&self) -> f64 {
+        match self.mode {
+            Mode::Osu => self.osu.as_ref().map_or(0.0, |a| a.pp),
+            Mode::Taiko => self.taiko.as_ref().map_or(0.0, |a| a.pp),
+            Mode::Catch => self.fruit.as_ref().map_or(0.0, |a| a.pp),
+            Mode::Mania => self.mania.as_ref().map_or(0.0, |a| a.pp),
+        }
+    }
+}
+
 impl From<rosu_pp::any::PerformanceAttributes> for PerformanceAttributes {
     fn from(attributes: rosu_pp::any::PerformanceAttributes) -> Self {
         match attributes {
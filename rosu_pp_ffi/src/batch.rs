@@ -0,0 +1,196 @@
+use std::{path::PathBuf, time::Instant};
+
+use crate::*;
+use attributes::DifficultyAttributes;
+use beatmap::Beatmap;
+use difficulty::Difficulty;
+use loader::LoadResult;
+use interoptopus::{
+    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
+    patterns::{slice::FFISliceMut, string::AsciiPointer},
+};
+use rayon::prelude::*;
+
+pub enum BeatmapSource<'a> {
+    Borrowed(&'a rosu_pp::Beatmap),
+    Path(PathBuf),
+}
+
+impl BeatmapSource<'_> {
+    fn calculate(&self, difficulties: &[rosu_pp::Difficulty], out: &mut [DifficultyAttributes]) -> Result<(), Error> {
+        let owned;
+        let map = match self {
+            BeatmapSource::Borrowed(map) => *map,
+            BeatmapSource::Path(path) => {
+                owned = rosu_pp::Beatmap::from_path(path)?;
+                &owned
+            }
+        };
+
+        out.par_iter_mut()
+            .zip(difficulties.par_iter())
+            .for_each(|(slot, difficulty)| *slot = difficulty.calculate(map).into());
+
+        Ok(())
+    }
+
+    /// Same as [`BeatmapSource::calculate`] but resets `out` on failure and
+    /// reports the outcome instead of returning it.
+    fn calculate_into(&self, difficulties: &[rosu_pp::Difficulty], out: &mut [DifficultyAttributes]) -> LoadResult {
+        let start = Instant::now();
+        let result = self.calculate(difficulties, out);
+        let millis = start.elapsed().as_secs_f64() * 1000.0;
+
+        match result {
+            Ok(()) => LoadResult { error: FFIError::Ok, millis },
+            Err(err) => {
+                out.fill_with(DifficultyAttributes::default);
+
+                LoadResult { error: err.into(), millis }
+            }
+        }
+    }
+}
+
+/// Calculates the difficulty of every added beatmap with every added
+/// [`Difficulty`] on a work-stealing thread pool.
+///
+/// Added [`Beatmap`]s are borrowed and must outlive the batch.
+#[ffi_type(opaque)]
+#[derive(Default)]
+pub struct DifficultyBatch<'a> {
+    pub beatmaps: Vec<BeatmapSource<'a>>,
+    pub difficulties: Vec<rosu_pp::Difficulty>,
+    pub pool: pool::WorkerPool,
+}
+
+#[ffi_service(error = "FFIError", prefix = "difficulty_batch_")]
+impl<'a> DifficultyBatch<'a> {
+    #[ffi_service_ctor]
+    pub fn new() -> Result<Self, Error> {
+        Ok(Self::default())
+    }
+
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn add_beatmap(&mut self, beatmap: &'a Beatmap) {
+        self.beatmaps.push(BeatmapSource::Borrowed(&beatmap.inner));
+    }
+
+    /// Add a beatmap by path. It is parsed on the thread pool during [`DifficultyBatch::calculate`].
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn add_path(&mut self, path: AsciiPointer) -> Result<(), Error> {
+        self.beatmaps.push(BeatmapSource::Path(path.as_str()?.into()));
+        Ok(())
+    }
+
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn add_difficulty(&mut self, difficulty: &Difficulty) {
+        self.difficulties.push(difficulty.construct());
+    }
+
+    /// Amount of worker threads, `0` uses the global pool with one thread per logical core.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn threads(&mut self, threads: u32) {
+        self.pool.set_threads(threads);
+    }
+
+    /// Amount of results, i.e. beatmaps times difficulties.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        (self.beatmaps.len() * self.difficulties.len()) as u32
+    }
+
+    /// Calculate every combination of beatmap and difficulty.
+    ///
+    /// `out` must hold [`DifficultyBatch::len`] elements. The attributes of
+    /// the `i`th beatmap with the `j`th difficulty are written to
+    /// `out[i * difficulties + j]`.
+    ///
+    /// `results` must hold one element per added beatmap. A beatmap that
+    /// fails to load only sets the error of its own [`LoadResult`] and leaves
+    /// its attributes at their default, the others are still calculated.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn calculate(
+        &self,
+        out: FFISliceMut<DifficultyAttributes>,
+        results: FFISliceMut<LoadResult>,
+    ) -> Result<(), Error> {
+        let mut out = out;
+        let out = out.as_slice_mut();
+        let mut results = results;
+        let results = results.as_slice_mut();
+
+        if out.len() != self.len() as usize || results.len() != self.beatmaps.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        if self.difficulties.is_empty() {
+            results.fill(LoadResult { error: FFIError::Ok, millis: 0.0 });
+
+            return Ok(());
+        }
+
+        self.pool.install(|| {
+            out.par_chunks_mut(self.difficulties.len())
+                .zip(self.beatmaps.par_iter())
+                .zip(results.par_iter_mut())
+                .for_each(|((out, beatmap), result)| *result = beatmap.calculate_into(&self.difficulties, out));
+        })
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::ffi::CString;
+
+    use super::*;
+    use crate::testing::{self, assert_close};
+
+    fn stars(attrs: &DifficultyAttributes) -> f64 {
+        rosu_pp::any::DifficultyAttributes::from(attrs.clone()).stars()
+    }
+
+    #[test]
+    fn matches_calculate() {
+        let beatmaps = [testing::beatmap(testing::OSU), testing::beatmap(testing::TAIKO)];
+        let mania = CString::new(testing::path(testing::MANIA).to_str().unwrap()).unwrap();
+        let missing = CString::new(testing::path("missing.osu").to_str().unwrap()).unwrap();
+
+        let mut hard_rock = Difficulty::new().unwrap();
+        hard_rock.i_mods(16);
+        let difficulties = [Difficulty::new().unwrap(), hard_rock];
+
+        let mut batch = DifficultyBatch::new().unwrap();
+        batch.threads(2);
+
+        for beatmap in &beatmaps {
+            batch.add_beatmap(beatmap);
+        }
+
+        batch.add_path(AsciiPointer::from_cstr(&mania)).unwrap();
+        batch.add_path(AsciiPointer::from_cstr(&missing)).unwrap();
+
+        for difficulty in &difficulties {
+            batch.add_difficulty(difficulty);
+        }
+
+        let mut out = vec![DifficultyAttributes::default(); batch.len() as usize];
+        let mut results = [LoadResult { error: FFIError::Null, millis: 0.0 }; 4];
+        batch
+            .calculate(FFISliceMut::from_slice(&mut out), FFISliceMut::from_slice(&mut results))
+            .unwrap();
+
+        let mania = testing::beatmap(testing::MANIA);
+
+        for (i, beatmap) in [&beatmaps[0], &beatmaps[1], &mania].into_iter().enumerate() {
+            assert_eq!(results[i].error, FFIError::Ok);
+
+            for (j, difficulty) in difficulties.iter().enumerate() {
+                assert_close(stars(&out[i * 2 + j]), stars(&difficulty.calculate(beatmap)));
+            }
+        }
+
+        assert_ne!(results[3].error, FFIError::Ok);
+        assert!(out[6..].iter().all(|attrs| attrs.osu.as_ref().is_none()));
+    }
+}
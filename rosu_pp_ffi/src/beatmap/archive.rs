@@ -0,0 +1,177 @@
+use std::io::{Cursor, Read};
+
+use crate::*;
+use interoptopus::{
+    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
+    patterns::{slice::FFISlice, string::AsciiPointer},
+};
+use owned_string::OwnedString;
+use zip::ZipArchive;
+
+/// Largest decompressed `.osu` entry that is read, real ones are a few MB at most.
+const MAX_ENTRY_SIZE: u64 = 64 * 1024 * 1024;
+/// Most that is allocated up front for an entry.
+const PREALLOCATE: usize = 1024 * 1024;
+
+pub enum ArchiveData {
+    Mapped(memmap2::Mmap),
+    Owned(Vec<u8>),
+}
+
+impl AsRef<[u8]> for ArchiveData {
+    fn as_ref(&self) -> &[u8] {
+        match self {
+            ArchiveData::Mapped(map) => map,
+            ArchiveData::Owned(bytes) => bytes,
+        }
+    }
+}
+
+/// The `.osu` files of a `.osz` mapset, decompressed on demand.
+///
+/// Open an archive, then parse its entries one by one with
+/// [`Beatmap::from_archive`]; nothing is extracted to disk.
+///
+/// [`Beatmap::from_archive`]: super::Beatmap::from_archive
+#[ffi_type(opaque)]
+pub struct OszArchive {
+    pub inner: ZipArchive<Cursor<ArchiveData>>,
+    /// Zip index and name of every `.osu` entry, in archive order.
+    pub entries: Vec<(usize, String)>,
+}
+
+#[ffi_service(error = "FFIError", prefix = "osz_archive_")]
+impl OszArchive {
+    /// Open the archive at `path` through a memory mapping.
+    #[ffi_service_ctor]
+    pub fn from_path(path: AsciiPointer) -> Result<Self, Error> {
+        Self::new(ArchiveData::Mapped(super::map_file(path.as_str()?)?))
+    }
+
+    /// Open an archive held in memory. `data` is copied.
+    #[ffi_service_ctor]
+    pub fn from_bytes(data: FFISlice<u8>) -> Result<Self, Error> {
+        Self::new(ArchiveData::Owned(data.as_slice().to_vec()))
+    }
+
+    /// Amount of `.osu` entries.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        self.entries.len() as u32
+    }
+
+    /// File name of the `index`th `.osu` entry inside the archive.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn name(&self, index: u32, str: &mut OwnedString) -> Result<(), Error> {
+        let (_, name) = self.entries.get(index as usize).ok_or(Error::InvalidLength)?;
+        str.replace(name.clone());
+        Ok(())
+    }
+}
+
+impl OszArchive {
+    fn new(data: ArchiveData) -> Result<Self, Error> {
+        let mut inner = ZipArchive::new(Cursor::new(data))?;
+        let mut entries = Vec::new();
+
+        for i in 0..inner.len() {
+            let file = inner.by_index_raw(i)?;
+
+            if file.is_file() && file.name().to_ascii_lowercase().ends_with(".osu") {
+                entries.push((i, file.name().to_owned()));
+            }
+        }
+
+        Ok(Self { inner, entries })
+    }
+
+    /// Decompress the `index`th `.osu` entry.
+    pub fn read(&mut self, index: u32) -> Result<Vec<u8>, Error> {
+        let &(i, _) = self.entries.get(index as usize).ok_or(Error::InvalidLength)?;
+        let file = self.inner.by_index(i)?;
+        // The size in the zip header is untrusted, only use it as a hint.
+        let mut bytes = Vec::with_capacity((file.size() as usize).min(PREALLOCATE));
+        file.take(MAX_ENTRY_SIZE + 1).read_to_end(&mut bytes)?;
+
+        if bytes.len() as u64 > MAX_ENTRY_SIZE {
+            return Err(zip::result::ZipError::UnsupportedArchive("entry exceeds the size limit").into());
+        }
+
+        Ok(bytes)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::{ffi::CString, io::Write};
+
+    use zip::{write::SimpleFileOptions, CompressionMethod, ZipWriter};
+
+    use super::*;
+    use crate::testing;
+    use beatmap::Beatmap;
+
+    /// A mapset with two `.osu` entries, one stored and one deflated, next
+    /// to entries that must be skipped.
+    fn osz() -> Vec<u8> {
+        let mut zip = ZipWriter::new(Cursor::new(Vec::new()));
+        let stored = SimpleFileOptions::default().compression_method(CompressionMethod::Stored);
+        let deflated = SimpleFileOptions::default().compression_method(CompressionMethod::Deflated);
+
+        zip.start_file("audio.mp3", stored).unwrap();
+        zip.write_all(b"not a beatmap").unwrap();
+        zip.start_file(testing::OSU, stored).unwrap();
+        zip.write_all(&testing::bytes(testing::OSU)).unwrap();
+        zip.add_directory("sb.osu/", stored).unwrap();
+        zip.start_file(testing::TAIKO.to_uppercase(), deflated).unwrap();
+        zip.write_all(&testing::bytes(testing::TAIKO)).unwrap();
+
+        zip.finish().unwrap().into_inner()
+    }
+
+    fn name(archive: &OszArchive, index: u32) -> String {
+        let mut str = OwnedString::empty().unwrap();
+        archive.name(index, &mut str).unwrap();
+
+        str.to_cstr().as_str().unwrap().to_owned()
+    }
+
+    fn assert_entries(archive: &mut OszArchive) {
+        assert_eq!(archive.len(), 2);
+        assert_eq!(name(archive, 0), testing::OSU);
+        assert_eq!(name(archive, 1), testing::TAIKO.to_uppercase());
+
+        for (index, entry) in [testing::OSU, testing::TAIKO].into_iter().enumerate() {
+            let beatmap = Beatmap::from_archive(archive, index as u32).unwrap();
+            let expected = testing::beatmap(entry);
+
+            assert_eq!(beatmap.md5, expected.md5, "{entry}");
+            assert_eq!(beatmap.n_hit_objects(), expected.n_hit_objects(), "{entry}");
+        }
+
+        assert!(Beatmap::from_archive(archive, 2).is_err());
+    }
+
+    #[test]
+    fn from_bytes_round_trip() {
+        let mut archive = OszArchive::from_bytes(FFISlice::from_slice(&osz())).unwrap();
+        assert_entries(&mut archive);
+    }
+
+    #[test]
+    fn from_path_round_trip() {
+        let path = std::env::temp_dir().join(format!("rosu_pp_ffi_archive_{}.osz", std::process::id()));
+        std::fs::write(&path, osz()).unwrap();
+
+        let c_path = CString::new(path.to_str().unwrap()).unwrap();
+        let archive = OszArchive::from_path(AsciiPointer::from_cstr(&c_path));
+        let _ = std::fs::remove_file(&path);
+
+        assert_entries(&mut archive.unwrap());
+    }
+
+    #[test]
+    fn rejects_other_files() {
+        assert!(OszArchive::from_bytes(FFISlice::from_slice(&testing::bytes(testing::OSU))).is_err());
+    }
+}
@@ -135,7 +135,7 @@ impl BeatmapAttributesBuilder {
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn get_clock_rate(&mut self) -> f64 {
+    pub fn get_clock_rate(&self) -> f64 {
         if let Some(mods) = self.mods.as_ref() {
             return mods.clock_rate().unwrap_or(1.0)
         }
@@ -1,6 +1,6 @@
 use crate::*;
 use interoptopus::{
-    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type, patterns::option::FFIOption
+    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type, patterns::{option::FFIOption, slice::FFISliceMut}
 };
 
 use super::{pos::Pos, Beatmap};
@@ -115,12 +115,12 @@ impl<'a> HitObjects<'a> {
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn len(&mut self) -> u32 {
+    pub fn len(&self) -> u32 {
         self.len
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn get(&mut self, index: u32) -> FFIOption<HitObject> {
+    pub fn get(&self, index: u32) -> FFIOption<HitObject> {
         if index < self.len {
             FFIOption::some(unsafe { self.get_unchecked(index) })
         } else {
@@ -153,8 +153,124 @@ impl<'a> HitObjects<'a> {
         self.index = 0;
     }
 
-    unsafe fn get_unchecked(&mut self, index: u32) -> HitObject {
+    unsafe fn get_unchecked(&self, index: u32) -> HitObject {
         self.inner.get_unchecked(index as usize).into()
     }
 }
 
+
+/// Output columns for [`Beatmap::hit_object_columns`].
+///
+/// Every column may be left empty, otherwise it must hold one element per
+/// hit object. `kind` holds [`HitObjectKind`] values. `expected_dist` is NaN
+/// for objects without one and `repeats` is `0` for anything but sliders.
+/// `duration` is `end_time - start_time`: `0` for circles, the time until
+/// the tail for sliders and the length of spinners and holds.
+/// `duration` and `end_time` are NaN for sliders without an expected distance.
+///
+/// [`Beatmap::hit_object_columns`]: super::Beatmap::hit_object_columns
+#[ffi_type]
+#[repr(C)]
+pub struct HitObjectColumns<'a> {
+    pub start_time: FFISliceMut<'a, f64>,
+    pub x: FFISliceMut<'a, f32>,
+    pub y: FFISliceMut<'a, f32>,
+    pub kind: FFISliceMut<'a, u32>,
+    pub repeats: FFISliceMut<'a, u32>,
+    pub expected_dist: FFISliceMut<'a, f64>,
+    pub duration: FFISliceMut<'a, f64>,
+    pub end_time: FFISliceMut<'a, f64>,
+}
+
+// Same defaults and scale rosu-pp uses when converting sliders.
+const DEFAULT_BEAT_LEN: f64 = 60_000.0 / 60.0;
+const DEFAULT_SLIDER_VELOCITY: f64 = 1.0;
+const BASE_SCORING_DIST: f64 = 100.0;
+
+impl HitObjectColumns<'_> {
+    pub fn fill(&mut self, map: &rosu_pp::Beatmap) -> Result<(), Error> {
+        let rows = map.hit_objects.len();
+
+        let HitObjectColumns {
+            start_time,
+            x,
+            y,
+            kind,
+            repeats,
+            expected_dist,
+            duration,
+            end_time,
+        } = self;
+
+        let mut start_time = column(start_time, rows)?;
+        let mut x = column(x, rows)?;
+        let mut y = column(y, rows)?;
+        let mut kind = column(kind, rows)?;
+        let mut repeats = column(repeats, rows)?;
+        let mut expected_dist = column(expected_dist, rows)?;
+        let mut duration = column(duration, rows)?;
+        let mut end_time = column(end_time, rows)?;
+
+        fn set<T>(column: &mut Option<&mut [T]>, row: usize, value: T) {
+            if let Some(column) = column {
+                column[row] = value;
+            }
+        }
+
+        for (row, h) in map.hit_objects.iter().enumerate() {
+            use rosu_pp::model::hit_object::HitObjectKind as Kind;
+
+            let (k, r, dist, d) = match &h.kind {
+                Kind::Circle => (HitObjectKind::Circle, 0, None, 0.0),
+                Kind::Slider(slider) => {
+                    // Without an expected distance the duration would depend on the
+                    // curve's length, which rosu-pp doesn't expose.
+                    let d = slider.expected_dist.map_or(f64::NAN, |dist| {
+                        slider_duration(map, h.start_time, slider.repeats, dist)
+                    });
+
+                    (HitObjectKind::Slider, slider.repeats as u32, slider.expected_dist, d)
+                }
+                Kind::Spinner(spinner) => (HitObjectKind::Spinner, 0, None, spinner.duration),
+                Kind::Hold(hold) => (HitObjectKind::Hold, 0, None, hold.duration),
+            };
+
+            set(&mut start_time, row, h.start_time);
+            set(&mut x, row, h.pos.x);
+            set(&mut y, row, h.pos.y);
+            set(&mut kind, row, k as u32);
+            set(&mut repeats, row, r);
+            set(&mut expected_dist, row, dist.unwrap_or(f64::NAN));
+            set(&mut duration, row, d);
+            set(&mut end_time, row, h.start_time + d);
+        }
+
+        Ok(())
+    }
+}
+
+/// Time from the head to the tail of a slider, as rosu-pp derives it from
+/// the timing and difficulty points.
+fn slider_duration(map: &rosu_pp::Beatmap, start_time: f64, repeats: usize, expected_dist: f64) -> f64 {
+    let beat_len = map
+        .timing_point_at(start_time)
+        .map_or(DEFAULT_BEAT_LEN, |point| point.beat_len);
+
+    let slider_velocity = map
+        .difficulty_point_at(start_time)
+        .map_or(DEFAULT_SLIDER_VELOCITY, |point| point.slider_velocity);
+
+    let velocity = BASE_SCORING_DIST * map.slider_multiplier * slider_velocity / beat_len;
+    let span_count = (repeats + 1) as f64;
+
+    span_count * expected_dist / velocity
+}
+
+/// Returns `None` for an empty column and errors if it does not have `rows` elements.
+fn column<'a, T>(column: &'a mut FFISliceMut<'_, T>, rows: usize) -> Result<Option<&'a mut [T]>, Error> {
+    match column.as_slice_mut() {
+        [] => Ok(None),
+        slice if slice.len() == rows => Ok(Some(slice)),
+        _ => Err(Error::InvalidLength),
+    }
+}
@@ -1,21 +1,33 @@
+pub mod archive;
 pub mod attributes;
 pub mod hitobjects;
 pub mod pos;
 pub mod too_suspicious;
 
+use std::sync::Arc;
+
 use crate::*;
 use interoptopus::{
     ffi_service, ffi_service_ctor, ffi_service_method, ffi_type, patterns::{slice::FFISlice, string::AsciiPointer, option::FFIOption}
 };
 use mode::Mode;
 use mods::Mods;
+use owned_string::OwnedString;
 use rosu_pp::GameMods;
 use too_suspicious::TooSuspicious;
 
 #[ffi_type(opaque)]
 #[derive(Default)]
 pub struct Beatmap {
-    pub inner: rosu_pp::Beatmap,
+    /// Shared with the parsed beatmap cache and other handles, copied on
+    /// the first modification.
+    pub inner: Arc<rosu_pp::Beatmap>,
+    /// MD5 of the `.osu` content.
+    pub md5: [u8; 16],
+    /// Hash of the `.osu` content and every conversion applied since, used
+    /// to key the difficulty attribute cache. `0` if unknown, which bypasses
+    /// the cache.
+    pub hash: u64,
 }
 
 // Regular implementation of methods.
@@ -23,92 +35,161 @@ pub struct Beatmap {
 impl Beatmap {
     #[ffi_service_ctor]
     pub fn from_bytes(data: FFISlice<u8>) -> Result<Self, Error> {
-        Ok(Self {
-            inner: rosu_pp::Beatmap::from_bytes(data.as_slice())?,
-        })
+        Self::parse(data.as_slice())
     }
 
     #[ffi_service_ctor]
     pub fn from_path(path: AsciiPointer) -> Result<Self, Error> {
-        Ok(Self {
-            inner: rosu_pp::Beatmap::from_path(
-                path.as_str()?,
-            )?,
-        })
+        Self::parse(&std::fs::read(path.as_str()?)?)
+    }
+
+    /// Like [`Beatmap::from_path`] but parses straight from a memory mapping
+    /// of the file instead of reading it into a buffer first.
+    ///
+    /// The file must not be truncated while it is being parsed.
+    #[ffi_service_ctor]
+    pub fn from_path_mmap(path: AsciiPointer) -> Result<Self, Error> {
+        Self::parse(&map_file(path.as_str()?)?)
+    }
+
+    /// Like [`Beatmap::from_bytes`] but shares the parsed beatmap with
+    /// earlier calls for the same content, see [`beatmap_cache_stats`].
+    ///
+    /// [`beatmap_cache_stats`]: cache::beatmap_cache_stats
+    #[ffi_service_ctor]
+    pub fn from_bytes_cached(data: FFISlice<u8>) -> Result<Self, Error> {
+        Self::parse_cached(data.as_slice())
+    }
+
+    /// Like [`Beatmap::from_path`] but shares the parsed beatmap with
+    /// earlier calls for the same content, see [`beatmap_cache_stats`].
+    ///
+    /// [`beatmap_cache_stats`]: cache::beatmap_cache_stats
+    #[ffi_service_ctor]
+    pub fn from_path_cached(path: AsciiPointer) -> Result<Self, Error> {
+        Self::parse_cached(&map_file(path.as_str()?)?)
+    }
+
+    /// Move the `index`th beatmap out of a loader after [`BeatmapLoader::load`].
+    ///
+    /// Fails with [`FFIError::Null`] if that file failed to load or was
+    /// already taken.
+    ///
+    /// [`BeatmapLoader::load`]: loader::BeatmapLoader::load
+    #[ffi_service_ctor]
+    pub fn from_loader(loader: &mut loader::BeatmapLoader, index: u32) -> Result<Self, Error> {
+        loader.take(index).ok_or(Error::Null)
+    }
+
+    /// Decompress and parse the `index`th `.osu` entry of an archive.
+    #[ffi_service_ctor]
+    pub fn from_archive(archive: &mut archive::OszArchive, index: u32) -> Result<Self, Error> {
+        Self::parse(&archive.read(index)?)
     }
 
     #[ffi_service_ctor]
     pub fn from_clone(beatmap: &Beatmap) -> Result<Self, Error> {
         Ok(Self {
-            inner: beatmap.inner.clone(),
+            inner: Arc::clone(&beatmap.inner),
+            md5: beatmap.md5,
+            hash: beatmap.hash,
         })
     }
 
     /// Convert a Beatmap to the specified mode
     #[ffi_service_method(on_panic = "undefined_behavior")]
     pub fn convert(&mut self, mode: Mode, mods: &Mods) -> bool {
-        self.inner.convert_mut(mode.into(), &GameMods::from(mods.mods.clone())).is_ok()
+        let converted = Arc::make_mut(&mut self.inner).convert_mut(mode.into(), &GameMods::from(mods.mods.clone())).is_ok();
+
+        // A beatmap without a hash stays uncached.
+        if converted && self.hash != 0 {
+            self.hash = cache::hash_of((self.hash, mode, cache::ModsKey::Full(mods.mods.clone())));
+        }
+
+        converted
+    }
+
+    /// MD5 of the `.osu` content as lowercase hex, as used by osu! itself.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn md5(&self, str: &mut OwnedString) {
+        str.replace(self.md5.iter().map(|byte| format!("{byte:02x}")).collect())
+    }
+
+    /// Export every hit object into parallel arrays in a single call, see
+    /// [`HitObjectColumns`].
+    ///
+    /// [`HitObjectColumns`]: hitobjects::HitObjectColumns
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn hit_object_columns(&self, out: hitobjects::HitObjectColumns) -> Result<(), Error> {
+        let mut out = out;
+        out.fill(&self.inner)
+    }
+
+    /// Amount of hit objects.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn n_hit_objects(&self) -> u32 {
+        self.inner.hit_objects.len() as u32
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn bpm(&mut self) -> f64 {
+    pub fn bpm(&self) -> f64 {
         self.inner.bpm()
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn total_break_time(&mut self) -> f64 {
+    pub fn total_break_time(&self) -> f64 {
         self.inner.total_break_time()
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn version(&mut self) -> i32 {
+    pub fn version(&self) -> i32 {
         self.inner.version
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn is_convert(&mut self) -> bool {
+    pub fn is_convert(&self) -> bool {
         self.inner.is_convert
     }
 
     // General
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn stack_leniency(&mut self) -> f32 {
+    pub fn stack_leniency(&self) -> f32 {
         self.inner.stack_leniency
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn mode(&mut self) -> Mode {
+    pub fn mode(&self) -> Mode {
         self.inner.mode.into()
     }
 
     // Difficulty
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn ar(&mut self) -> f32 {
+    pub fn ar(&self) -> f32 {
         self.inner.ar
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn cs(&mut self) -> f32 {
+    pub fn cs(&self) -> f32 {
         self.inner.ar
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn hp(&mut self) -> f32 {
+    pub fn hp(&self) -> f32 {
         self.inner.ar
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn od(&mut self) -> f32 {
+    pub fn od(&self) -> f32 {
         self.inner.ar
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn slider_multiplier(&mut self) -> f64 {
+    pub fn slider_multiplier(&self) -> f64 {
         self.inner.slider_multiplier
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn slider_tick_rate(&mut self) -> f64 {
+    pub fn slider_tick_rate(&self) -> f64 {
         self.inner.slider_tick_rate
     }
 
@@ -119,7 +200,82 @@ impl Beatmap {
     /// should likely be avoided on these maps due to potential performance
     /// issues.
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn check_suspicion(&mut self) -> FFIOption<TooSuspicious> {
+    pub fn check_suspicion(&self) -> FFIOption<TooSuspicious> {
         self.inner.check_suspicion().map_err(Into::into).err().into()
     }
 }
+
+impl Beatmap {
+    pub fn parse(bytes: &[u8]) -> Result<Self, Error> {
+        Ok(Self::new(Arc::new(rosu_pp::Beatmap::from_bytes(bytes)?), cache::md5_of(bytes)))
+    }
+
+    pub fn parse_cached(bytes: &[u8]) -> Result<Self, Error> {
+        let md5 = cache::md5_of(bytes);
+        let inner = cache::get_or_parse(md5, bytes.len(), || rosu_pp::Beatmap::from_bytes(bytes))?;
+
+        Ok(Self::new(inner, md5))
+    }
+
+    fn new(inner: Arc<rosu_pp::Beatmap>, md5: [u8; 16]) -> Self {
+        Self {
+            inner,
+            md5,
+            hash: u64::from_le_bytes(md5[..8].try_into().unwrap()),
+        }
+    }
+}
+
+pub fn map_file(path: impl AsRef<std::path::Path>) -> Result<memmap2::Mmap, Error> {
+    let file = std::fs::File::open(path)?;
+
+    Ok(unsafe { memmap2::Mmap::map(&file)? })
+}
+
+#[cfg(test)]
+mod tests {
+    use std::ffi::CString;
+
+    use super::*;
+    use crate::testing;
+
+    fn c_path(name: &str) -> CString {
+        CString::new(testing::path(name).to_str().unwrap()).unwrap()
+    }
+
+    fn stars(beatmap: &Beatmap) -> f64 {
+        rosu_pp::Difficulty::new().calculate(&beatmap.inner).stars()
+    }
+
+    /// Same content, hashes and difficulty as parsing `name` from bytes.
+    fn assert_loaded(beatmap: &Beatmap, name: &str) {
+        let expected = testing::beatmap(name);
+
+        assert_eq!(beatmap.md5, expected.md5, "{name}");
+        assert_eq!(beatmap.hash, expected.hash, "{name}");
+        assert_eq!(beatmap.n_hit_objects(), expected.n_hit_objects(), "{name}");
+        assert_eq!(stars(beatmap), stars(&expected), "{name}");
+    }
+
+    #[test]
+    fn from_path_mmap_matches_from_bytes() {
+        for name in testing::ALL {
+            let beatmap = Beatmap::from_path_mmap(AsciiPointer::from_cstr(&c_path(name))).unwrap();
+            assert_loaded(&beatmap, name);
+        }
+
+        assert!(Beatmap::from_path_mmap(AsciiPointer::from_cstr(&c_path("missing.osu"))).is_err());
+    }
+
+    #[test]
+    fn cached_loads_share_the_parsed_beatmap() {
+        for name in testing::ALL {
+            let from_bytes = Beatmap::from_bytes_cached(FFISlice::from_slice(&testing::bytes(name))).unwrap();
+            let from_path = Beatmap::from_path_cached(AsciiPointer::from_cstr(&c_path(name))).unwrap();
+
+            assert_loaded(&from_bytes, name);
+            assert_loaded(&from_path, name);
+            assert!(Arc::ptr_eq(&from_bytes.inner, &from_path.inner), "{name}");
+        }
+    }
+}
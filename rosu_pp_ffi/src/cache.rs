@@ -0,0 +1,489 @@
+use std::{
+    hash::{DefaultHasher, Hash, Hasher},
+    num::NonZeroUsize,
+    sync::{Arc, LazyLock, Mutex},
+};
+
+use interoptopus::{ffi_function, ffi_type};
+use lru::LruCache;
+use md5::{Digest, Md5};
+use rosu_mods::{GameMods, GameModsIntermode};
+
+use crate::difficulty::Difficulty;
+
+/// Amount of [`DifficultyAttributes`] kept by default.
+///
+/// [`DifficultyAttributes`]: rosu_pp::any::DifficultyAttributes
+pub const DEFAULT_CAPACITY: usize = 1024;
+
+/// Bytes of `.osu` content whose parsed [`Beatmap`]s are kept by default.
+///
+/// [`Beatmap`]: rosu_pp::Beatmap
+pub const DEFAULT_BEATMAP_CAPACITY: u64 = 256 * 1024 * 1024;
+
+static CACHE: LazyLock<Mutex<DifficultyCache>> = LazyLock::new(|| Mutex::new(DifficultyCache::new(DEFAULT_CAPACITY)));
+
+static BEATMAPS: LazyLock<Mutex<BeatmapCache>> = LazyLock::new(|| Mutex::new(BeatmapCache::new(DEFAULT_BEATMAP_CAPACITY)));
+
+pub fn hash_of(value: impl Hash) -> u64 {
+    let mut hasher = DefaultHasher::new();
+    value.hash(&mut hasher);
+    hasher.finish()
+}
+
+pub fn md5_of(bytes: &[u8]) -> [u8; 16] {
+    Md5::digest(bytes).into()
+}
+
+/// Mods of a [`DifficultyKey`].
+///
+/// Both mod types are sorted sets, so the order mods were given in doesn't
+/// matter.
+#[derive(Clone, Debug, Default, PartialEq)]
+pub enum ModsKey {
+    #[default]
+    None,
+    Intermode(GameModsIntermode),
+    /// Compared with their settings, which are never `NaN`.
+    Full(GameMods),
+}
+
+impl Eq for ModsKey {}
+
+impl Hash for ModsKey {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        match self {
+            Self::None => state.write_u8(0),
+            Self::Intermode(mods) => {
+                state.write_u8(1);
+                mods.hash(state);
+            }
+            // Equal mods have equal bits; settings are left to `eq`.
+            Self::Full(mods) => {
+                state.write_u8(2);
+                state.write_u32(mods.bits());
+            }
+        }
+    }
+}
+
+/// Everything that determines the result of [`Difficulty::calculate`].
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+pub struct DifficultyKey {
+    pub beatmap: u64,
+    pub mods: ModsKey,
+    pub passed_objects: Option<u32>,
+    pub clock_rate: Option<u64>,
+    pub ar: Option<u32>,
+    pub cs: Option<u32>,
+    pub hp: Option<u32>,
+    pub od: Option<u32>,
+    pub hardrock_offsets: Option<bool>,
+    pub lazer: Option<bool>,
+}
+
+impl DifficultyKey {
+    pub fn new(beatmap: u64, difficulty: &Difficulty) -> Self {
+        let Difficulty {
+            mods,
+            mods_intermode,
+            passed_objects,
+            clock_rate,
+            ar,
+            cs,
+            hp,
+            od,
+            hardrock_offsets,
+            lazer,
+        } = difficulty;
+
+        // Mirrors `Difficulty::construct`: full mods take precedence.
+        let mods = if let Some(mods) = mods {
+            ModsKey::Full(mods.clone())
+        } else if let Some(mods_intermode) = mods_intermode {
+            ModsKey::Intermode(mods_intermode.clone())
+        } else {
+            ModsKey::None
+        };
+
+        Self {
+            beatmap,
+            mods,
+            passed_objects: *passed_objects,
+            clock_rate: clock_rate.map(f64::to_bits),
+            ar: ar.map(f32::to_bits),
+            cs: cs.map(f32::to_bits),
+            hp: hp.map(f32::to_bits),
+            od: od.map(f32::to_bits),
+            hardrock_offsets: *hardrock_offsets,
+            lazer: *lazer,
+        }
+    }
+}
+
+pub struct DifficultyCache {
+    pub entries: Option<LruCache<DifficultyKey, rosu_pp::any::DifficultyAttributes>>,
+    pub hits: u64,
+    pub misses: u64,
+    pub evictions: u64,
+}
+
+impl DifficultyCache {
+    pub fn new(capacity: usize) -> Self {
+        Self {
+            entries: NonZeroUsize::new(capacity).map(LruCache::new),
+            hits: 0,
+            misses: 0,
+            evictions: 0,
+        }
+    }
+
+    pub fn resize(&mut self, capacity: usize) {
+        match (self.entries.as_mut(), NonZeroUsize::new(capacity)) {
+            (Some(entries), Some(capacity)) => {
+                let len = entries.len();
+                entries.resize(capacity);
+                self.evictions += (len - entries.len()) as u64;
+            }
+            (Some(entries), None) => {
+                self.evictions += entries.len() as u64;
+                self.entries = None;
+            }
+            (None, capacity) => self.entries = capacity.map(LruCache::new),
+        }
+    }
+}
+
+/// Look up the attributes for `key`, calculating and storing them on a miss.
+///
+/// The lock is not held during the calculation so concurrent misses on
+/// different keys don't serialize. Beatmaps without a hash, e.g.
+/// [`Beatmap::default`], are never cached.
+///
+/// [`Beatmap::default`]: crate::beatmap::Beatmap
+pub fn get_or_calculate(
+    key: DifficultyKey,
+    calculate: impl FnOnce() -> rosu_pp::any::DifficultyAttributes,
+) -> rosu_pp::any::DifficultyAttributes {
+    get_or_calculate_in(&CACHE, key, calculate)
+}
+
+fn get_or_calculate_in(
+    cache: &Mutex<DifficultyCache>,
+    key: DifficultyKey,
+    calculate: impl FnOnce() -> rosu_pp::any::DifficultyAttributes,
+) -> rosu_pp::any::DifficultyAttributes {
+    if key.beatmap == 0 {
+        return calculate();
+    }
+
+    {
+        let mut guard = cache.lock().unwrap_or_else(|e| e.into_inner());
+        let cache = &mut *guard;
+
+        let Some(entries) = cache.entries.as_mut() else {
+            drop(guard);
+            return calculate();
+        };
+
+        if let Some(attrs) = entries.get(&key) {
+            let attrs = attrs.clone();
+            cache.hits += 1;
+            return attrs;
+        }
+
+        cache.misses += 1;
+    }
+
+    let attrs = calculate();
+
+    let mut guard = cache.lock().unwrap_or_else(|e| e.into_inner());
+    let cache = &mut *guard;
+
+    if let Some(entries) = cache.entries.as_mut() {
+        if let Some((evicted, _)) = entries.push(key.clone(), attrs.clone()) {
+            if evicted != key {
+                cache.evictions += 1;
+            }
+        }
+    }
+
+    attrs
+}
+
+/// Counters of the difficulty attribute cache.
+#[ffi_type]
+#[repr(C)]
+#[derive(Clone, Debug, Default)]
+pub struct DifficultyCacheStats {
+    /// Lookups that were answered from the cache.
+    pub hits: u64,
+    /// Lookups that had to calculate the attributes.
+    pub misses: u64,
+    /// Entries that were dropped to make room for new ones.
+    pub evictions: u64,
+    /// Amount of cached entries.
+    pub len: u32,
+    /// Maximum amount of cached entries, `0` if caching is disabled.
+    pub capacity: u32,
+}
+
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn difficulty_cache_stats() -> DifficultyCacheStats {
+    let cache = CACHE.lock().unwrap_or_else(|e| e.into_inner());
+
+    DifficultyCacheStats {
+        hits: cache.hits,
+        misses: cache.misses,
+        evictions: cache.evictions,
+        len: cache.entries.as_ref().map_or(0, |entries| entries.len() as u32),
+        capacity: cache.entries.as_ref().map_or(0, |entries| entries.cap().get() as u32),
+    }
+}
+
+/// Set the maximum amount of cached difficulty attributes, `0` disables the cache.
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn difficulty_cache_capacity(capacity: u32) {
+    CACHE.lock().unwrap_or_else(|e| e.into_inner()).resize(capacity as usize);
+}
+
+/// Drop all cached difficulty attributes and reset the counters.
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn difficulty_cache_clear() {
+    let mut cache = CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    let capacity = cache.entries.as_ref().map_or(0, |entries| entries.cap().get());
+    *cache = DifficultyCache::new(capacity);
+}
+
+/// Parsed beatmaps by the MD5 of their `.osu` content.
+///
+/// Entries are weighed by the size of the content they were parsed from,
+/// which grows roughly in step with the parsed representation.
+pub struct BeatmapCache {
+    pub entries: LruCache<[u8; 16], (Arc<rosu_pp::Beatmap>, u64)>,
+    pub bytes: u64,
+    pub capacity: u64,
+    pub hits: u64,
+    pub misses: u64,
+    pub evictions: u64,
+}
+
+impl BeatmapCache {
+    pub fn new(capacity: u64) -> Self {
+        Self {
+            entries: LruCache::unbounded(),
+            bytes: 0,
+            capacity,
+            hits: 0,
+            misses: 0,
+            evictions: 0,
+        }
+    }
+
+    pub fn resize(&mut self, capacity: u64) {
+        self.capacity = capacity;
+        self.shrink();
+    }
+
+    fn shrink(&mut self) {
+        while self.bytes > self.capacity {
+            let Some((_, (_, size))) = self.entries.pop_lru() else {
+                break;
+            };
+
+            self.bytes -= size;
+            self.evictions += 1;
+        }
+    }
+}
+
+/// Look up the parsed beatmap for `md5`, parsing and storing it on a miss.
+///
+/// `size` is the length of the content. Content larger than the whole cache
+/// is parsed but not stored.
+pub fn get_or_parse(
+    md5: [u8; 16],
+    size: usize,
+    parse: impl FnOnce() -> Result<rosu_pp::Beatmap, std::io::Error>,
+) -> Result<Arc<rosu_pp::Beatmap>, std::io::Error> {
+    {
+        let mut cache = BEATMAPS.lock().unwrap_or_else(|e| e.into_inner());
+
+        if let Some((beatmap, _)) = cache.entries.get(&md5) {
+            let beatmap = Arc::clone(beatmap);
+            cache.hits += 1;
+            return Ok(beatmap);
+        }
+
+        cache.misses += 1;
+    }
+
+    let beatmap = Arc::new(parse()?);
+    let size = size as u64;
+
+    let mut guard = BEATMAPS.lock().unwrap_or_else(|e| e.into_inner());
+    let cache = &mut *guard;
+
+    if size <= cache.capacity {
+        // Another thread may have parsed the same content in the meantime.
+        if let Some((_, old)) = cache.entries.put(md5, (Arc::clone(&beatmap), size)) {
+            cache.bytes -= old;
+        }
+
+        cache.bytes += size;
+        cache.shrink();
+    }
+
+    Ok(beatmap)
+}
+
+/// Counters of the parsed beatmap cache.
+#[ffi_type]
+#[repr(C)]
+#[derive(Clone, Debug, Default)]
+pub struct BeatmapCacheStats {
+    /// Lookups that were answered from the cache.
+    pub hits: u64,
+    /// Lookups that had to parse the beatmap.
+    pub misses: u64,
+    /// Entries that were dropped to make room for new ones.
+    pub evictions: u64,
+    /// Size of the `.osu` content of all cached beatmaps.
+    pub bytes: u64,
+    /// Maximum of `bytes`, `0` if caching is disabled.
+    pub capacity: u64,
+    /// Amount of cached beatmaps.
+    pub len: u32,
+}
+
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn beatmap_cache_stats() -> BeatmapCacheStats {
+    let cache = BEATMAPS.lock().unwrap_or_else(|e| e.into_inner());
+
+    BeatmapCacheStats {
+        hits: cache.hits,
+        misses: cache.misses,
+        evictions: cache.evictions,
+        bytes: cache.bytes,
+        capacity: cache.capacity,
+        len: cache.entries.len() as u32,
+    }
+}
+
+/// Set the maximum size in bytes of the `.osu` content of cached beatmaps, `0` disables the cache.
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn beatmap_cache_capacity(capacity: u64) {
+    BEATMAPS.lock().unwrap_or_else(|e| e.into_inner()).resize(capacity);
+}
+
+/// Drop all cached beatmaps and reset the counters.
+///
+/// Beatmaps that are still in use stay valid.
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn beatmap_cache_clear() {
+    let mut cache = BEATMAPS.lock().unwrap_or_else(|e| e.into_inner());
+    let capacity = cache.capacity;
+    *cache = BeatmapCache::new(capacity);
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn key(beatmap: u64, mods: &str) -> DifficultyKey {
+        let difficulty = Difficulty {
+            mods_intermode: Some(GameModsIntermode::from_acronyms(mods)),
+            ..Default::default()
+        };
+
+        DifficultyKey::new(beatmap, &difficulty)
+    }
+
+    fn attrs(stars: f64) -> rosu_pp::any::DifficultyAttributes {
+        let attrs = crate::mania::attributes::ManiaDifficultyAttributes { stars, ..Default::default() };
+
+        rosu_pp::any::DifficultyAttributes::Mania(attrs.into())
+    }
+
+    fn counters(cache: &Mutex<DifficultyCache>) -> (u64, u64, u64, usize) {
+        let cache = cache.lock().unwrap();
+        let len = cache.entries.as_ref().map_or(0, |entries| entries.len());
+
+        (cache.hits, cache.misses, cache.evictions, len)
+    }
+
+    #[test]
+    fn mods_order_does_not_matter() {
+        let by_bits = DifficultyKey::new(1, &Difficulty {
+            mods_intermode: Some(GameModsIntermode::from_bits(8 + 64)),
+            ..Default::default()
+        });
+
+        assert_eq!(key(1, "HDDT"), key(1, "DTHD"));
+        assert_eq!(key(1, "HDDT"), by_bits);
+        assert_eq!(hash_of(key(1, "HDDT")), hash_of(key(1, "DTHD")));
+        assert_ne!(key(1, "HDDT"), key(1, "HD"));
+        assert_ne!(key(1, "HD"), key(2, "HD"));
+    }
+
+    #[test]
+    fn counts_hits_misses_and_evictions() {
+        let cache = Mutex::new(DifficultyCache::new(2));
+
+        assert_eq!(get_or_calculate_in(&cache, key(1, ""), || attrs(1.0)).stars(), 1.0);
+        assert_eq!(get_or_calculate_in(&cache, key(1, ""), || unreachable!()).stars(), 1.0);
+        assert_eq!(counters(&cache), (1, 1, 0, 1));
+
+        get_or_calculate_in(&cache, key(2, ""), || attrs(2.0));
+        get_or_calculate_in(&cache, key(3, ""), || attrs(3.0));
+        assert_eq!(counters(&cache), (1, 3, 1, 2));
+
+        // The least recently used entry was evicted.
+        assert_eq!(get_or_calculate_in(&cache, key(1, ""), || attrs(4.0)).stars(), 4.0);
+        assert_eq!(counters(&cache), (1, 4, 2, 2));
+
+        cache.lock().unwrap().resize(1);
+        assert_eq!(counters(&cache), (1, 4, 3, 1));
+    }
+
+    #[test]
+    fn skips_beatmaps_without_hash() {
+        let cache = Mutex::new(DifficultyCache::new(2));
+
+        get_or_calculate_in(&cache, key(0, ""), || attrs(1.0));
+        assert_eq!(get_or_calculate_in(&cache, key(0, ""), || attrs(2.0)).stars(), 2.0);
+        assert_eq!(counters(&cache), (0, 0, 0, 0));
+    }
+
+    #[test]
+    fn disabled_cache_calculates_every_time() {
+        let cache = Mutex::new(DifficultyCache::new(0));
+
+        get_or_calculate_in(&cache, key(1, ""), || attrs(1.0));
+        assert_eq!(get_or_calculate_in(&cache, key(1, ""), || attrs(2.0)).stars(), 2.0);
+        assert_eq!(counters(&cache), (0, 0, 0, 0));
+    }
+
+    #[test]
+    fn beatmap_cache_evicts_by_size() {
+        let mut cache = BeatmapCache::new(10);
+
+        for (md5, size) in [([1; 16], 4), ([2; 16], 4), ([3; 16], 4)] {
+            cache.entries.put(md5, (Arc::new(rosu_pp::Beatmap::default()), size));
+            cache.bytes += size;
+            cache.shrink();
+        }
+
+        assert_eq!((cache.bytes, cache.evictions, cache.entries.len()), (8, 1, 2));
+        assert!(!cache.entries.contains(&[1; 16]));
+
+        cache.resize(0);
+        assert_eq!((cache.bytes, cache.evictions, cache.entries.len()), (0, 3, 0));
+    }
+}
@@ -8,7 +8,7 @@ use mods::Mods;
 use rosu_mods::{GameModsIntermode, GameMods};
 
 #[ffi_type(opaque)]
-#[derive(Default)]
+#[derive(Clone, Default)]
 #[allow(non_snake_case)]
 pub struct Difficulty {
     pub mods: Option<GameMods>,
@@ -100,11 +100,11 @@ impl Difficulty {
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
     pub fn calculate(&self, beatmap: &Beatmap) -> attributes::DifficultyAttributes {
-        self.construct().calculate(&beatmap.inner).into()
+        self.calculate_cached(beatmap).into()
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn get_clock_rate(&mut self) -> f64 {
+    pub fn get_clock_rate(&self) -> f64 {
         if let Some(mods) = self.mods.as_ref() {
             return mods.clock_rate().unwrap_or(1.0)
         }
@@ -118,6 +118,22 @@ impl Difficulty {
 }
 
 impl Difficulty {
+    /// The beatmap's attributes after applying mods, clock rate and custom
+    /// attributes of these settings.
+    pub fn beatmap_attributes(&self, beatmap: &Beatmap) -> rosu_pp::model::beatmap::BeatmapAttributes {
+        rosu_pp::model::beatmap::BeatmapAttributesBuilder::new()
+            .map(&beatmap.inner)
+            .difficulty(&self.construct())
+            .build()
+    }
+
+    /// Calculate the attributes through the difficulty attribute cache.
+    pub fn calculate_cached(&self, beatmap: &Beatmap) -> rosu_pp::any::DifficultyAttributes {
+        cache::get_or_calculate(cache::DifficultyKey::new(beatmap.hash, self), || {
+            self.construct().calculate(&beatmap.inner)
+        })
+    }
+
     pub fn construct(&self) -> rosu_pp::Difficulty {
         let mut diff = rosu_pp::Difficulty::new();
 
@@ -7,6 +7,7 @@ use interoptopus::ffi_type;
 // almost any way you want.
 #[ffi_type(patterns(ffi_error))]
 #[repr(C)]
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
 pub enum FFIError {
     Ok = 0,
     Null = 100,
@@ -16,6 +17,8 @@ pub enum FFIError {
     InvalidString = 500,
     SerializeError = 600,
     ConvertError = 700,
+    InvalidLength = 800,
+    ArchiveError = 900,
     Unknown = 1000
 }
 
@@ -52,6 +55,10 @@ pub enum Error {
     Serialize(#[from] serde_json::Error),
     #[error("ConvertError")]
     Convert(#[from] rosu_pp::model::mode::ConvertError),
+    #[error("InvalidLength")]
+    InvalidLength,
+    #[error("ArchiveError")]
+    Archive(#[from] zip::result::ZipError),
 
 }
 
@@ -72,7 +79,9 @@ impl From<Error> for FFIError {
             Error::InvalidString => Self::InvalidString,
             Error::UTF8(_) => Self::Utf8Error,
             Error::Serialize(_) => Self::SerializeError,
-            Error::Convert(_) => Self::ConvertError
+            Error::Convert(_) => Self::ConvertError,
+            Error::InvalidLength => Self::InvalidLength,
+            Error::Archive(_) => Self::ArchiveError,
         }
     }
 }
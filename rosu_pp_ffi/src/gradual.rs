@@ -3,10 +3,15 @@ use mode::Mode;
 use beatmap::Beatmap;
 use difficulty::Difficulty;
 use state::ScoreState;
+use std::sync::Arc;
 use interoptopus::{
     ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
-    patterns::option::FFIOption,
+    patterns::{
+        option::FFIOption,
+        slice::{FFISlice, FFISliceMut},
+    },
 };
+use rayon::prelude::*;
 
 
 #[ffi_type(opaque)]
@@ -45,6 +50,114 @@ impl GradualDifficulty {
     pub fn len(&self) -> u32 {
         self.inner.len() as u32
     }
+
+    /// Process the next `out.stars.len()` hit objects and write the
+    /// attributes after each of them into `out`, see [`GradualDifficultyColumns`].
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn collect(&mut self, out: GradualDifficultyColumns) -> Result<(), Error> {
+        let mut out = out;
+        let rows = out.stars.as_slice().len();
+
+        if rows > self.inner.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        out.check_len(rows)?;
+
+        for row in 0..rows {
+            let Some(attrs) = self.inner.next() else {
+                break;
+            };
+
+            out.write(row, &attrs);
+        }
+
+        Ok(())
+    }
+}
+
+/// Output columns for [`GradualDifficulty::collect`].
+///
+/// `stars` decides the amount of processed objects and may not exceed
+/// [`GradualDifficulty::len`]. Every other column may be left empty,
+/// otherwise it must be as long as `stars`. Values that do not exist for
+/// the map's mode are written as `0`.
+#[ffi_type]
+#[repr(C)]
+pub struct GradualDifficultyColumns<'a> {
+    pub stars: FFISliceMut<'a, f64>,
+    pub aim: FFISliceMut<'a, f64>,
+    pub jump: FFISliceMut<'a, f64>,
+    pub flow: FFISliceMut<'a, f64>,
+    pub precision: FFISliceMut<'a, f64>,
+    pub speed: FFISliceMut<'a, f64>,
+    pub stamina: FFISliceMut<'a, f64>,
+    pub accuracy: FFISliceMut<'a, f64>,
+    pub rhythm: FFISliceMut<'a, f64>,
+    pub color: FFISliceMut<'a, f64>,
+    pub max_combo: FFISliceMut<'a, u32>,
+}
+
+impl GradualDifficultyColumns<'_> {
+    fn check_len(&self, rows: usize) -> Result<(), Error> {
+        let GradualDifficultyColumns {
+            stars: _,
+            aim,
+            jump,
+            flow,
+            precision,
+            speed,
+            stamina,
+            accuracy,
+            rhythm,
+            color,
+            max_combo,
+        } = self;
+
+        let lens = [aim, jump, flow, precision, speed, stamina, accuracy, rhythm, color]
+            .map(|column| column.as_slice().len());
+
+        for len in lens.into_iter().chain([max_combo.as_slice().len()]) {
+            if len != 0 && len != rows {
+                return Err(Error::InvalidLength);
+            }
+        }
+
+        Ok(())
+    }
+
+    fn write(&mut self, row: usize, attrs: &rosu_pp::any::DifficultyAttributes) {
+        fn set<T>(column: &mut FFISliceMut<T>, row: usize, value: T) {
+            if let Some(slot) = column.as_slice_mut().get_mut(row) {
+                *slot = value;
+            }
+        }
+
+        set(&mut self.stars, row, attrs.stars());
+        set(&mut self.max_combo, row, attrs.max_combo());
+
+        let (aim, jump, flow, precision, speed, stamina, accuracy, rhythm, color) = match attrs {
+            rosu_pp::any::DifficultyAttributes::Osu(a) => {
+                (a.aim, a.jump, a.flow, a.precision, a.speed, a.stamina, a.accuracy, 0.0, 0.0)
+            }
+            rosu_pp::any::DifficultyAttributes::Taiko(a) => {
+                (0.0, 0.0, 0.0, 0.0, 0.0, a.stamina, 0.0, a.rhythm, a.color)
+            }
+            rosu_pp::any::DifficultyAttributes::Catch(_) | rosu_pp::any::DifficultyAttributes::Mania(_) => {
+                (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            }
+        };
+
+        set(&mut self.aim, row, aim);
+        set(&mut self.jump, row, jump);
+        set(&mut self.flow, row, flow);
+        set(&mut self.precision, row, precision);
+        set(&mut self.speed, row, speed);
+        set(&mut self.stamina, row, stamina);
+        set(&mut self.accuracy, row, accuracy);
+        set(&mut self.rhythm, row, rhythm);
+        set(&mut self.color, row, color);
+    }
 }
 
 
@@ -53,6 +166,8 @@ impl GradualDifficulty {
 #[allow(non_snake_case)]
 pub struct GradualPerformance {
     pub inner: rosu_pp::GradualPerformance,
+    /// Score accumulated by [`GradualPerformance::replay`].
+    pub replayed: ReplayState,
 }
 
 
@@ -61,13 +176,13 @@ impl GradualPerformance {
     /// Create a [`GradualPerformance`] for a map of any mode.
     #[ffi_service_ctor]
     pub fn new(difficulty: &Difficulty, beatmap: &Beatmap) -> Result<Self, Error> {
-        Ok(Self { inner: rosu_pp::GradualPerformance::new(difficulty.construct(), &beatmap.inner) })
+        Ok(Self::from_inner(rosu_pp::GradualPerformance::new(difficulty.construct(), &beatmap.inner)))
     }
 
     /// Create a [`GradualPerformance`] for a [`Beatmap`] on a specific [`GameMode`].
     #[ffi_service_ctor]
     pub fn new_with_mode(difficulty: &Difficulty, beatmap: &Beatmap, mode: Mode) -> Result<Self, Error> {
-        Ok(Self { inner: rosu_pp::GradualPerformance::new_with_mode(difficulty.construct(), &beatmap.inner, mode.into())? })
+        Ok(Self::from_inner(rosu_pp::GradualPerformance::new_with_mode(difficulty.construct(), &beatmap.inner, mode.into())?))
     }
 
     /// Process the next hit object and calculate the performance attributes
@@ -99,5 +214,631 @@ impl GradualPerformance {
     pub fn len(&self) -> u32 {
         self.inner.len() as u32
     }
+
+    /// Process the next `judgements.len()` hit objects, one judgement each,
+    /// and write the pp after each of them into `pp`.
+    ///
+    /// The score state and combo are accumulated natively across calls,
+    /// starting from an empty score. `pp` must be exactly as long as
+    /// `judgements` and `judgements` may not exceed [`GradualPerformance::len`].
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn replay(&mut self, judgements: FFISlice<ObjectJudgement>, pp: FFISliceMut<f64>) -> Result<(), Error> {
+        let mut pp = pp;
+        let judgements = judgements.as_slice();
+        let pp = pp.as_slice_mut();
+
+        if judgements.len() != pp.len() || judgements.len() > self.inner.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        for (judgement, pp) in judgements.iter().zip(pp) {
+            self.replayed.apply(judgement);
+
+            *pp = match self.inner.next(self.replayed.state.clone()) {
+                Some(attrs) => attrs.pp(),
+                None => break,
+            };
+        }
+
+        Ok(())
+    }
+
+    /// Returns the score state accumulated by [`GradualPerformance::replay`].
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn replay_state(&self) -> ScoreState {
+        self.replayed.state.clone().into()
+    }
+}
+
+impl GradualPerformance {
+    fn from_inner(inner: rosu_pp::GradualPerformance) -> Self {
+        Self {
+            inner,
+            replayed: ReplayState::default(),
+        }
+    }
+}
+
+/// Score built up from [`ObjectJudgement`]s.
+#[derive(Clone, Debug, Default)]
+pub struct ReplayState {
+    pub state: rosu_pp::any::ScoreState,
+    /// Current combo, as opposed to the state's maximum combo.
+    pub combo: u32,
+}
+
+impl ReplayState {
+    /// Add a single object's judgement to the score.
+    ///
+    /// The order of hits within an object is unknown so a miss or any missed
+    /// large tick resets the combo before the object's hits are added.
+    pub fn apply(&mut self, judgement: &ObjectJudgement) {
+        let state = &mut self.state;
+
+        match judgement.result {
+            Judgement::Miss => state.misses += 1,
+            Judgement::Meh | Judgement::SmallTickHit => state.n50 += 1,
+            Judgement::Ok | Judgement::LargeTickHit => state.n100 += 1,
+            Judgement::Good | Judgement::SmallTickMiss => state.n_katu += 1,
+            Judgement::Great => state.n300 += 1,
+            Judgement::Perfect => state.n_geki += 1,
+        }
+
+        state.osu_large_tick_hits += judgement.large_tick_hits;
+        state.osu_small_tick_hits += judgement.small_tick_hits;
+        state.slider_end_hits += u32::from(judgement.slider_end_hit);
+
+        if judgement.result == Judgement::Miss || judgement.large_tick_misses > 0 {
+            self.combo = 0;
+        }
+
+        let object_combo = match judgement.result {
+            Judgement::Miss | Judgement::SmallTickHit | Judgement::SmallTickMiss => 0,
+            _ => 1,
+        };
+
+        self.combo += object_combo + judgement.large_tick_hits + u32::from(judgement.slider_end_hit);
+        state.max_combo = state.max_combo.max(self.combo);
+    }
+}
+
+/// Result of a single hit object, named after osu!lazer's hit results.
+#[ffi_type]
+#[repr(C)]
+#[derive(Copy, Clone, Debug, Hash, PartialEq, Eq, Default)]
+pub enum Judgement {
+    #[default]
+    Miss = 0,
+    /// 50
+    Meh = 1,
+    /// 100
+    Ok = 2,
+    /// 200 in osu!mania
+    Good = 3,
+    /// 300, or a fruit in osu!catch
+    Great = 4,
+    /// 320 in osu!mania
+    Perfect = 5,
+    /// Droplet in osu!catch
+    LargeTickHit = 6,
+    /// Tiny droplet in osu!catch
+    SmallTickHit = 7,
+    /// Missed tiny droplet in osu!catch
+    SmallTickMiss = 8,
+}
+
+/// Judgement of a hit object for [`GradualPerformance::replay`].
+///
+/// The tick and slider end fields are only relevant for osu!standard
+/// scores set on osu!lazer, see [`ScoreState`] for their meaning.
+#[ffi_type]
+#[repr(C)]
+#[derive(Copy, Clone, Debug, Default, PartialEq, Eq)]
+pub struct ObjectJudgement {
+    pub result: Judgement,
+    pub large_tick_hits: u32,
+    pub large_tick_misses: u32,
+    pub small_tick_hits: u32,
+    pub slider_end_hit: bool,
+}
+
+
+/// Gradual calculator that can seek back and forth between hit objects.
+///
+/// The difficulty attributes after every `interval`th processed object are
+/// kept as checkpoints, see [`SeekableGradual::checkpoint_interval`]. Seeking
+/// to a checkpoint costs no recalculation and seeking forward only processes
+/// the objects in between. Seeking back to any other object replays forward
+/// from the start of the map: `rosu_pp::GradualDifficulty` holds pinned,
+/// self-referential state and can't be cloned, so a checkpoint can't restore
+/// it and the start is the nearest state to replay from. Performance
+/// attributes are calculated on demand from the difficulty attributes at the
+/// current position and a given [`ScoreState`].
+///
+/// Forks share the checkpoints, see [`SeekableGradual::fork`].
+#[ffi_type(opaque)]
+pub struct SeekableGradual {
+    /// Calculator after processing `processed` objects, `None` until it is
+    /// needed again after a fork.
+    pub inner: Option<rosu_pp::GradualDifficulty>,
+    pub processed: usize,
+    pub beatmap: Arc<rosu_pp::Beatmap>,
+    pub mode: Option<Mode>,
+    pub difficulty: rosu_pp::Difficulty,
+    /// Amount of objects between checkpoints.
+    pub interval: usize,
+    /// Attributes after processing the first `(i + 1) * interval` objects at index `i`.
+    pub checkpoints: Arc<Vec<rosu_pp::any::DifficultyAttributes>>,
+    /// Attributes at the current position.
+    pub current: Option<rosu_pp::any::DifficultyAttributes>,
+    /// Amount of processed objects at the current position.
+    pub position: usize,
+    /// Total amount of objects.
+    pub total: usize,
+    /// Score accumulated by [`SeekableGradual::replay`].
+    pub replayed: ReplayState,
+}
+
+
+#[ffi_service(error = "FFIError", prefix = "seekable_gradual_")]
+impl SeekableGradual {
+    /// Create a [`SeekableGradual`] for a map of any mode.
+    #[ffi_service_ctor]
+    pub fn new(difficulty: &Difficulty, beatmap: &Beatmap) -> Result<Self, Error> {
+        let difficulty = difficulty.construct();
+        let inner = rosu_pp::GradualDifficulty::new(difficulty.clone(), &beatmap.inner);
+
+        Ok(Self::from_inner(inner, difficulty, beatmap, None))
+    }
+
+    /// Create a [`SeekableGradual`] for a [`Beatmap`] on a specific [`GameMode`].
+    #[ffi_service_ctor]
+    pub fn new_with_mode(difficulty: &Difficulty, beatmap: &Beatmap, mode: Mode) -> Result<Self, Error> {
+        let difficulty = difficulty.construct();
+        let inner = rosu_pp::GradualDifficulty::new_with_mode(difficulty.clone(), &beatmap.inner, mode.into())?;
+
+        Ok(Self::from_inner(inner, difficulty, beatmap, Some(mode)))
+    }
+
+    /// Create a copy of `other` at its current position and with its replayed
+    /// score, which can then continue independently.
+    ///
+    /// The first fork calculates the checkpoints of all remaining objects of
+    /// `other` once; after that, forking is only a reference count increment
+    /// and both share the checkpoints.
+    #[ffi_service_ctor]
+    pub fn fork(other: &mut SeekableGradual) -> Result<Self, Error> {
+        other.calculate_all();
+
+        Ok(Self {
+            inner: None,
+            processed: 0,
+            beatmap: Arc::clone(&other.beatmap),
+            mode: other.mode,
+            difficulty: other.difficulty.clone(),
+            interval: other.interval,
+            checkpoints: Arc::clone(&other.checkpoints),
+            current: other.current.clone(),
+            position: other.position,
+            total: other.total,
+            replayed: other.replayed.clone(),
+        })
+    }
+
+    /// Keep the attributes after every `interval`th object as a checkpoint,
+    /// `1` by default.
+    ///
+    /// Larger intervals keep fewer attributes but seeking back to an object
+    /// between checkpoints replays from the start of the map. Changing the
+    /// interval drops the checkpoints kept so far, the position stays.
+    /// `0` is treated as `1`.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn checkpoint_interval(&mut self, interval: u32) {
+        let interval = (interval as usize).max(1);
+
+        if interval != self.interval {
+            self.interval = interval;
+            self.checkpoints = Arc::new(Vec::with_capacity(self.total / interval));
+            self.inner = None;
+        }
+    }
+
+    /// Move to the state after processing the hit object at `index` and
+    /// return the difficulty attributes at that point.
+    ///
+    /// Only the position changes, the score of [`SeekableGradual::replay`]
+    /// is kept as is.
+    ///
+    /// Returns `None` and keeps the current position if `index` is out of range.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn seek(&mut self, index: u32) -> FFIOption<attributes::DifficultyAttributes> {
+        let objects = index as usize + 1;
+
+        let Some(attrs) = self.attributes_at(objects) else {
+            return None.into();
+        };
+
+        self.position = objects;
+        self.current = Some(attrs.clone());
+
+        Some(attributes::DifficultyAttributes::from(attrs)).into()
+    }
+
+    /// Move back to the state before any hit object was processed.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn rewind(&mut self) {
+        self.position = 0;
+        self.current = None;
+    }
+
+    /// Returns the amount of processed objects at the current position.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn position(&self) -> u32 {
+        self.position as u32
+    }
+
+    /// Returns the total amount of objects.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        self.total as u32
+    }
+
+    /// Difficulty attributes at the current position, `None` before the
+    /// first object.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn difficulty(&self) -> FFIOption<attributes::DifficultyAttributes> {
+        self.current.clone().map(attributes::DifficultyAttributes::from).into()
+    }
+
+    /// Performance attributes of `state` at the current position, `None`
+    /// before the first object.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn performance(&self, state: ScoreState) -> FFIOption<attributes::PerformanceAttributes> {
+        self.current
+            .as_ref()
+            .map(|attrs| performance_at(attrs, &self.difficulty, self.position, state.into()))
+            .map(attributes::PerformanceAttributes::from)
+            .into()
+    }
+
+    /// Process the next `judgements.len()` hit objects after the current
+    /// position, one judgement each, and write the pp after each of them
+    /// into `pp`.
+    ///
+    /// Works like [`GradualPerformance::replay`], the score is accumulated
+    /// across calls and copied by [`SeekableGradual::fork`].
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn replay(&mut self, judgements: FFISlice<ObjectJudgement>, pp: FFISliceMut<f64>) -> Result<(), Error> {
+        let mut pp = pp;
+        let judgements = judgements.as_slice();
+        let pp = pp.as_slice_mut();
+
+        if judgements.len() != pp.len() || self.position + judgements.len() > self.total {
+            return Err(Error::InvalidLength);
+        }
+
+        for (judgement, pp) in judgements.iter().zip(pp) {
+            let attrs = self.attributes_at(self.position + 1).ok_or(Error::Unknown)?;
+
+            self.replayed.apply(judgement);
+            self.position += 1;
+            *pp = performance_at(&attrs, &self.difficulty, self.position, self.replayed.state.clone()).pp();
+            self.current = Some(attrs);
+        }
+
+        Ok(())
+    }
+
+    /// Returns the score accumulated by [`SeekableGradual::replay`].
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn replay_state(&self) -> ScoreState {
+        self.replayed.state.clone().into()
+    }
+
+    /// Evaluate many hypothetical continuations of the replayed score from
+    /// the current position without moving it.
+    ///
+    /// `judgements` holds the judgements of all branches back to back and
+    /// `branch_lens` how many of them belong to each branch. The pp of the
+    /// score at the end of every branch is written into `pp`, which must be
+    /// as long as `branch_lens`. Branches are evaluated on the global thread pool.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn evaluate_branches(
+        &mut self,
+        judgements: FFISlice<ObjectJudgement>,
+        branch_lens: FFISlice<u32>,
+        pp: FFISliceMut<f64>,
+    ) -> Result<(), Error> {
+        let mut pp = pp;
+        let judgements = judgements.as_slice();
+        let branch_lens = branch_lens.as_slice();
+        let pp = pp.as_slice_mut();
+
+        if branch_lens.len() != pp.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        let mut branches = Vec::with_capacity(branch_lens.len());
+        let mut start = 0;
+
+        for &len in branch_lens {
+            let len = len as usize;
+
+            if self.position + len > self.total || start + len > judgements.len() {
+                return Err(Error::InvalidLength);
+            }
+
+            branches.push(&judgements[start..start + len]);
+            start += len;
+        }
+
+        if start != judgements.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        // Attributes at the end of every branch, calculated in one forward pass.
+        let mut ends: Vec<usize> = branches.iter().map(|branch| self.position + branch.len()).collect();
+        ends.sort_unstable();
+        ends.dedup();
+
+        let attrs: Vec<_> = ends.iter().map(|&end| self.attributes_at(end)).collect();
+
+        let Self { difficulty, position, replayed, .. } = &*self;
+
+        pp.par_iter_mut().zip(branches).for_each(|(pp, branch)| {
+            let mut replayed = replayed.clone();
+
+            for judgement in branch {
+                replayed.apply(judgement);
+            }
+
+            let end = position + branch.len();
+            let at_end = &attrs[ends.binary_search(&end).unwrap()];
+
+            *pp = at_end
+                .as_ref()
+                .map_or(0.0, |attrs| performance_at(attrs, difficulty, end, replayed.state).pp());
+        });
+
+        Ok(())
+    }
+}
+
+impl SeekableGradual {
+    fn from_inner(
+        inner: rosu_pp::GradualDifficulty,
+        difficulty: rosu_pp::Difficulty,
+        beatmap: &Beatmap,
+        mode: Option<Mode>,
+    ) -> Self {
+        let total = inner.len();
+
+        Self {
+            inner: Some(inner),
+            processed: 0,
+            beatmap: Arc::clone(&beatmap.inner),
+            mode,
+            difficulty,
+            interval: 1,
+            checkpoints: Arc::new(Vec::with_capacity(total)),
+            current: None,
+            position: 0,
+            total,
+            replayed: ReplayState::default(),
+        }
+    }
+
+    /// A new calculator at the start of the map.
+    fn start(&self) -> Option<rosu_pp::GradualDifficulty> {
+        match self.mode {
+            Some(mode) => rosu_pp::GradualDifficulty::new_with_mode(self.difficulty.clone(), &self.beatmap, mode.into()).ok(),
+            None => Some(rosu_pp::GradualDifficulty::new(self.difficulty.clone(), &self.beatmap)),
+        }
+    }
+
+    /// Attributes after processing the first `objects` objects.
+    ///
+    /// Looks them up if they are at the current position or a checkpoint.
+    /// Otherwise the calculator processes the objects up to there, first
+    /// restarting from the start of the map if it is already past them, and
+    /// keeps new checkpoints on the way.
+    ///
+    /// Returns `None` if `objects` is `0` or larger than the map.
+    fn attributes_at(&mut self, objects: usize) -> Option<rosu_pp::any::DifficultyAttributes> {
+        if objects == 0 || objects > self.total {
+            return None;
+        }
+
+        if objects == self.position {
+            return self.current.clone();
+        }
+
+        if objects % self.interval == 0 {
+            if let Some(attrs) = self.checkpoints.get(objects / self.interval - 1) {
+                return Some(attrs.clone());
+            }
+        }
+
+        if self.inner.is_none() || self.processed >= objects {
+            self.inner = Some(self.start()?);
+            self.processed = 0;
+        }
+
+        let inner = self.inner.as_mut()?;
+
+        loop {
+            let attrs = inner.next()?;
+            self.processed += 1;
+
+            if self.processed % self.interval == 0 && self.checkpoints.len() == self.processed / self.interval - 1 {
+                Arc::make_mut(&mut self.checkpoints).push(attrs.clone());
+            }
+
+            if self.processed == objects {
+                return Some(attrs);
+            }
+        }
+    }
+
+    /// Keep the checkpoints of the whole map and drop the calculator.
+    fn calculate_all(&mut self) {
+        if self.checkpoints.len() < self.total / self.interval {
+            self.attributes_at(self.total / self.interval * self.interval);
+        }
+
+        self.inner = None;
+    }
 }
 
+/// Performance of `state` after the first `objects` objects with the
+/// difficulty attributes `attrs` at that point.
+fn performance_at(
+    attrs: &rosu_pp::any::DifficultyAttributes,
+    difficulty: &rosu_pp::Difficulty,
+    objects: usize,
+    state: rosu_pp::any::ScoreState,
+) -> rosu_pp::any::PerformanceAttributes {
+    rosu_pp::Performance::new(attrs.clone())
+        .difficulty(difficulty.clone())
+        .passed_objects(objects as u32)
+        .state(state)
+        .calculate()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::testing::{self, assert_close};
+
+    /// Attributes after the first `objects` objects, calculated from scratch.
+    fn fresh(beatmap: &Beatmap, objects: usize) -> rosu_pp::any::DifficultyAttributes {
+        Difficulty::new().unwrap().construct().passed_objects(objects as u32).calculate(&beatmap.inner)
+    }
+
+    fn fresh_pp(beatmap: &Beatmap, objects: usize, state: rosu_pp::any::ScoreState) -> f64 {
+        performance_at(&fresh(beatmap, objects), &Difficulty::new().unwrap().construct(), objects, state).pp()
+    }
+
+    /// Hits every object but every 7th, which is missed.
+    fn judgements(len: usize) -> Vec<ObjectJudgement> {
+        (0..len)
+            .map(|i| ObjectJudgement {
+                result: if i % 7 == 3 { Judgement::Miss } else { Judgement::Great },
+                ..Default::default()
+            })
+            .collect()
+    }
+
+    #[test]
+    fn gradual_replay_matches_a_fresh_calculation() {
+        for name in testing::ALL {
+            let beatmap = testing::beatmap(name);
+            let mut gradual = GradualPerformance::new(&Difficulty::new().unwrap(), &beatmap).unwrap();
+            let total = gradual.len() as usize;
+            let judgements = judgements(total);
+
+            let mut pp = vec![0.0; total];
+            let (first, second) = pp.split_at_mut(total / 2);
+            gradual.replay(FFISlice::from_slice(&judgements[..total / 2]), FFISliceMut::from_slice(first)).unwrap();
+            gradual.replay(FFISlice::from_slice(&judgements[total / 2..]), FFISliceMut::from_slice(second)).unwrap();
+            assert_eq!(gradual.len(), 0);
+
+            let mut replayed = ReplayState::default();
+
+            for (i, judgement) in judgements.iter().enumerate() {
+                replayed.apply(judgement);
+
+                if [0, 10, total / 2 - 1, total / 2, total - 1].contains(&i) {
+                    assert_close(pp[i], fresh_pp(&beatmap, i + 1, replayed.state.clone()));
+                }
+            }
+
+            assert_eq!(gradual.replayed.state, replayed.state);
+        }
+    }
+
+    #[test]
+    fn seek_matches_a_fresh_calculation() {
+        for name in testing::ALL {
+            let beatmap = testing::beatmap(name);
+
+            for interval in [1, 5] {
+                let mut gradual = SeekableGradual::new(&Difficulty::new().unwrap(), &beatmap).unwrap();
+                gradual.checkpoint_interval(interval);
+                let total = gradual.len() as usize;
+
+                for index in [total / 2, total - 1, 0, total / 2 + 1, 9, 4, total - 1] {
+                    let attrs: rosu_pp::any::DifficultyAttributes = gradual.seek(index as u32).into_option().unwrap().into();
+
+                    assert_close(attrs.stars(), fresh(&beatmap, index + 1).stars());
+                    assert_eq!(gradual.position() as usize, index + 1, "{name}");
+                }
+
+                assert!(gradual.seek(total as u32).into_option().is_none());
+                assert_eq!(gradual.position() as usize, total);
+
+                gradual.rewind();
+                assert!(gradual.difficulty().into_option().is_none());
+            }
+        }
+    }
+
+    #[test]
+    fn checkpoints_are_kept_every_interval() {
+        let beatmap = testing::beatmap(testing::OSU);
+        let mut gradual = SeekableGradual::new(&Difficulty::new().unwrap(), &beatmap).unwrap();
+        gradual.checkpoint_interval(10);
+        gradual.seek(104);
+
+        assert_eq!(gradual.checkpoints.len(), 10);
+        assert_close(gradual.checkpoints[9].stars(), fresh(&beatmap, 100).stars());
+
+        gradual.checkpoint_interval(0);
+        assert_eq!(gradual.interval, 1);
+        assert!(gradual.checkpoints.is_empty());
+        assert_eq!(gradual.position(), 105);
+    }
+
+    #[test]
+    fn replay_and_fork_match_a_fresh_calculation() {
+        for name in testing::ALL {
+            let beatmap = testing::beatmap(name);
+
+            for interval in [1, 5] {
+                let mut gradual = SeekableGradual::new(&Difficulty::new().unwrap(), &beatmap).unwrap();
+                gradual.checkpoint_interval(interval);
+                let total = gradual.len() as usize;
+                let half = total / 2;
+                let judgements = judgements(total);
+
+                let mut pp = vec![0.0; total];
+                gradual.replay(FFISlice::from_slice(&judgements[..half]), FFISliceMut::from_slice(&mut pp[..half])).unwrap();
+                assert_close(pp[half - 1], fresh_pp(&beatmap, half, gradual.replayed.state.clone()));
+
+                let mut fork = SeekableGradual::fork(&mut gradual).unwrap();
+                let mut branch_pp = [0.0; 2];
+                fork.evaluate_branches(
+                    FFISlice::from_slice(&judgements[half..]),
+                    FFISlice::from_slice(&[0, (total - half) as u32]),
+                    FFISliceMut::from_slice(&mut branch_pp),
+                )
+                .unwrap();
+                assert_eq!(fork.position() as usize, half);
+
+                gradual.replay(FFISlice::from_slice(&judgements[half..]), FFISliceMut::from_slice(&mut pp[half..])).unwrap();
+                let state = gradual.replayed.state.clone();
+                assert_close(pp[total - 1], fresh_pp(&beatmap, total, state.clone()));
+                assert_close(branch_pp[0], pp[half - 1]);
+                assert_close(branch_pp[1], pp[total - 1]);
+
+                let mut fork_pp = vec![0.0; total - half];
+                fork.replay(FFISlice::from_slice(&judgements[half..]), FFISliceMut::from_slice(&mut fork_pp)).unwrap();
+                assert_close(fork_pp[total - half - 1], pp[total - 1]);
+
+                gradual.seek(half as u32 - 1);
+                let performance = gradual.performance(state.clone().into()).into_option().unwrap();
+                assert_close(performance.pp(), fresh_pp(&beatmap, half, state));
+            }
+        }
+    }
+}
@@ -6,6 +6,9 @@ mod error;
 mod mode;
 // mod calculator;
 // mod params;
+mod pool;
+#[cfg(test)]
+mod testing;
 // mod result;
 mod beatmap;
 mod difficulty;
@@ -20,8 +23,37 @@ mod state;
 mod mods;
 mod hitresult_priority;
 mod gradual;
+mod batch;
+mod cache;
+mod store;
+mod loader;
+mod strains;
+mod sweep;
+mod rates;
+mod solver;
+mod profile;
+mod top;
+mod params;
 use error::{FFIError, Error};
 
+// The bindings hand these out as plain pointers that may be used from several
+// threads at once; read-only methods take `&self`, so keep them `Send + Sync`.
+const _: () = {
+    const fn assert_send_sync<T: Send + Sync>() {}
+
+    assert_send_sync::<beatmap::Beatmap>();
+    assert_send_sync::<difficulty::Difficulty>();
+    assert_send_sync::<sweep::ModSweep>();
+    assert_send_sync::<rates::RateCurve>();
+    assert_send_sync::<profile::ProfileEngine>();
+    assert_send_sync::<top::TopPlays>();
+    assert_send_sync::<performance::Performance>();
+    assert_send_sync::<mods::Mods>();
+    assert_send_sync::<store::AttributeStore>();
+    assert_send_sync::<loader::BeatmapLoader>();
+    assert_send_sync::<beatmap::archive::OszArchive>();
+};
+
 #[ffi_function]
 #[no_mangle]
 pub extern "C" fn pattern_api_guard() -> APIVersion {
@@ -47,19 +79,42 @@ pub fn ffi_inventory() -> Inventory {
         .register(extra_type!(attributes::PerformanceAttributes))
         .register(extra_type!(beatmap::attributes::BeatmapAttributes))
         .register(extra_type!(beatmap::attributes::HitWindows))
+        .register(extra_type!(strains::Skill))
+        .register(extra_type!(gradual::Judgement))
+        .register(extra_type!(params::ScoreParam))
         .register(pattern!(beatmap::attributes::BeatmapAttributesBuilder))
         .register(pattern!(beatmap::Beatmap))
         .register(pattern!(beatmap::hitobjects::HitObjects))
+        .register(pattern!(beatmap::archive::OszArchive))
         .register(pattern!(difficulty::Difficulty))
         .register(pattern!(performance::Performance))
         .register(pattern!(gradual::GradualDifficulty))
         .register(pattern!(gradual::GradualPerformance))
+        .register(pattern!(gradual::SeekableGradual))
+        .register(pattern!(batch::DifficultyBatch))
+        .register(pattern!(strains::StrainTimeline))
+        .register(pattern!(sweep::ModSweep))
+        .register(pattern!(rates::RateCurve))
+        .register(pattern!(profile::ProfileEngine))
+        .register(pattern!(top::TopPlays))
+        .register(pattern!(store::AttributeStore))
+        .register(pattern!(loader::BeatmapLoader))
         .register(pattern!(owned_string::OwnedString))
         .register(pattern!(mods::Mods))
         .register(function!(attributes::debug_difficylty_attributes))
         .register(function!(attributes::debug_performance_attributes))
         .register(function!(state::debug_score_state))
         .register(function!(state::calculate_accuacy))
+        .register(function!(solver::performance_min_accuracy))
+        .register(function!(solver::performance_max_misses))
+        .register(function!(params::performance_calculate_params))
+        .register(function!(params::performance_calculate_params_from_difficulty))
+        .register(function!(cache::difficulty_cache_stats))
+        .register(function!(cache::difficulty_cache_capacity))
+        .register(function!(cache::difficulty_cache_clear))
+        .register(function!(cache::beatmap_cache_stats))
+        .register(function!(cache::beatmap_cache_capacity))
+        .register(function!(cache::beatmap_cache_clear))
         .inventory()
 
 }
@@ -0,0 +1,215 @@
+use std::{
+    path::{Path, PathBuf},
+    time::Instant,
+};
+
+use crate::*;
+use beatmap::Beatmap;
+use interoptopus::{
+    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
+    patterns::{slice::FFISliceMut, string::AsciiPointer},
+};
+use owned_string::OwnedString;
+use rayon::prelude::*;
+
+/// Outcome of loading a single file of a [`BeatmapLoader`] or a single
+/// beatmap of a `DifficultyBatch`.
+#[ffi_type]
+#[repr(C)]
+#[derive(Clone, Copy, Debug)]
+pub struct LoadResult {
+    /// [`FFIError::Ok`] if the file was parsed, otherwise why it wasn't.
+    pub error: FFIError,
+    /// Time spent reading and parsing the file in milliseconds, for a
+    /// `DifficultyBatch` including the calculation.
+    pub millis: f64,
+}
+
+/// Parses many `.osu` files on a work-stealing thread pool.
+///
+/// A file that fails to load only sets the error of its own
+/// [`LoadResult`], the others are still loaded.
+#[ffi_type(opaque)]
+#[derive(Default)]
+pub struct BeatmapLoader {
+    pub paths: Vec<PathBuf>,
+    pub beatmaps: Vec<Option<Beatmap>>,
+    pub results: Vec<LoadResult>,
+    pub pool: pool::WorkerPool,
+}
+
+#[ffi_service(error = "FFIError", prefix = "beatmap_loader_")]
+impl BeatmapLoader {
+    #[ffi_service_ctor]
+    pub fn new() -> Result<Self, Error> {
+        Ok(Self::default())
+    }
+
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn add_path(&mut self, path: AsciiPointer) -> Result<(), Error> {
+        self.paths.push(path.as_str()?.into());
+        Ok(())
+    }
+
+    /// Add every `.osu` file below `root`, including subdirectories, in
+    /// lexicographic order.
+    ///
+    /// Only fails if `root` can't be read, unreadable entries below it are skipped.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn add_directory(&mut self, root: AsciiPointer) -> Result<(), Error> {
+        let mut paths = Vec::new();
+        collect_osu_files(Path::new(root.as_str()?), &mut paths)?;
+        paths.sort_unstable();
+        self.paths.append(&mut paths);
+        Ok(())
+    }
+
+    /// Amount of worker threads, `0` uses the global pool with one thread per logical core.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn threads(&mut self, threads: u32) {
+        self.pool.set_threads(threads);
+    }
+
+    /// Amount of added files.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        self.paths.len() as u32
+    }
+
+    /// Path of the `index`th file.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn path(&self, index: u32, str: &mut OwnedString) -> Result<(), Error> {
+        let path = self.paths.get(index as usize).ok_or(Error::InvalidLength)?;
+        str.replace(path.to_string_lossy().into_owned());
+        Ok(())
+    }
+
+    /// Load all added files.
+    ///
+    /// Fails only if the thread pool can't be created; errors of single
+    /// files are reported by [`BeatmapLoader::results`].
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn load(&mut self) -> Result<(), Error> {
+        let loaded: Vec<_> = self.pool.install(|| {
+            self.paths
+                .par_iter()
+                .map(|path| {
+                    let start = Instant::now();
+                    let beatmap = load(path);
+                    let millis = start.elapsed().as_secs_f64() * 1000.0;
+
+                    match beatmap {
+                        Ok(beatmap) => (Some(beatmap), LoadResult { error: FFIError::Ok, millis }),
+                        Err(err) => (None, LoadResult { error: err.into(), millis }),
+                    }
+                })
+                .collect()
+        })?;
+
+        (self.beatmaps, self.results) = loaded.into_iter().unzip();
+
+        Ok(())
+    }
+
+    /// Write the [`LoadResult`] of every file, in the order they were added.
+    ///
+    /// `out` must hold [`BeatmapLoader::len`] elements.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn results(&self, out: FFISliceMut<LoadResult>) -> Result<(), Error> {
+        let mut out = out;
+        let out = out.as_slice_mut();
+
+        if out.len() != self.results.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        out.copy_from_slice(&self.results);
+
+        Ok(())
+    }
+}
+
+impl BeatmapLoader {
+    /// Move the `index`th loaded beatmap out of the loader.
+    pub fn take(&mut self, index: u32) -> Option<Beatmap> {
+        self.beatmaps.get_mut(index as usize)?.take()
+    }
+}
+
+fn load(path: &Path) -> Result<Beatmap, Error> {
+    Beatmap::parse(&beatmap::map_file(path)?)
+}
+
+/// Only fails if `dir` itself can't be read. Entries and subdirectories
+/// that can't be read are skipped so one bad folder doesn't hide all others,
+/// `.osu` files whose type can't be determined are still added so loading
+/// them reports the error.
+fn collect_osu_files(dir: &Path, paths: &mut Vec<PathBuf>) -> Result<(), Error> {
+    for entry in std::fs::read_dir(dir)? {
+        let Ok(entry) = entry else { continue };
+        let path = entry.path();
+        let is_osu = path.extension().is_some_and(|ext| ext.eq_ignore_ascii_case("osu"));
+
+        match entry.file_type() {
+            Ok(file_type) if file_type.is_dir() => {
+                let _ = collect_osu_files(&path, paths);
+            }
+            _ if is_osu => paths.push(path),
+            _ => {}
+        }
+    }
+
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use std::ffi::CString;
+
+    use super::*;
+    use crate::testing;
+
+    fn c_str(path: &Path) -> CString {
+        CString::new(path.to_str().unwrap()).unwrap()
+    }
+
+    #[test]
+    fn loads_a_directory_like_parse() {
+        let root = testing::path("");
+        let missing = testing::path("missing.osu");
+
+        let mut loader = BeatmapLoader::new().unwrap();
+        loader.threads(2);
+        loader.add_directory(AsciiPointer::from_cstr(&c_str(&root))).unwrap();
+        loader.add_path(AsciiPointer::from_cstr(&c_str(&missing))).unwrap();
+        loader.load().unwrap();
+
+        let mut names: Vec<_> = std::fs::read_dir(&root)
+            .unwrap()
+            .map(|entry| entry.unwrap().file_name().into_string().unwrap())
+            .filter(|name| name.ends_with(".osu"))
+            .collect();
+        names.sort_unstable();
+
+        let len = names.len();
+        assert_eq!(loader.len() as usize, len + 1);
+
+        let mut results = vec![LoadResult { error: FFIError::Null, millis: 0.0 }; len + 1];
+        loader.results(FFISliceMut::from_slice(&mut results)).unwrap();
+
+        for (i, name) in names.iter().enumerate() {
+            assert_eq!(results[i].error, FFIError::Ok, "{name}");
+            assert_eq!(loader.paths[i], root.join(name));
+
+            let beatmap = Beatmap::from_loader(&mut loader, i as u32).unwrap();
+            let expected = testing::beatmap(name);
+            assert_eq!(beatmap.md5, expected.md5, "{name}");
+            assert_eq!(beatmap.n_hit_objects(), expected.n_hit_objects(), "{name}");
+
+            assert!(Beatmap::from_loader(&mut loader, i as u32).is_err(), "taken twice");
+        }
+
+        assert_ne!(results[len].error, FFIError::Ok);
+        assert!(Beatmap::from_loader(&mut loader, len as u32).is_err());
+    }
+}
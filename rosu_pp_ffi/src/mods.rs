@@ -68,17 +68,17 @@ impl Mods {
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn bits(&mut self) -> u32 {
+    pub fn bits(&self) -> u32 {
         self.mods.bits()
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn len(&mut self) -> u32 {
+    pub fn len(&self) -> u32 {
         self.mods.len() as u32
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn json(&mut self, str: &mut OwnedString) {
+    pub fn json(&self, str: &mut OwnedString) {
         str.replace(serde_json::to_string_pretty(&self.mods).unwrap())
     }
 
@@ -105,7 +105,7 @@ impl Mods {
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn contains(&mut self, str: AsciiPointer) -> bool {
+    pub fn contains(&self, str: AsciiPointer) -> bool {
         if let Ok(s) = str.as_str() {
             if let Ok(m) = s.parse::<Acronym>(){
                 return self.mods.contains_acronym(m);
@@ -120,7 +120,7 @@ impl Mods {
     }
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn clock_rate(&mut self) -> FFIOption<f64> {
+    pub fn clock_rate(&self) -> FFIOption<f64> {
         self.mods.clock_rate().into()
     }
 }
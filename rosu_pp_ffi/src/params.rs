@@ -0,0 +1,299 @@
+use crate::*;
+use attributes::{DifficultyAttributes, PerformanceAttributes};
+use beatmap::Beatmap;
+use hitresult_priority::HitResultPriority;
+use interoptopus::{ffi_function, ffi_type};
+use mode::Mode;
+use state::ScoreState;
+
+/// Flags of [`ScoreParams::set`], one per field of [`ScoreParams`].
+#[ffi_type]
+#[repr(C)]
+#[derive(Copy, Clone, Debug, Hash, PartialEq, Eq)]
+pub enum ScoreParam {
+    Mode = 1,
+    Mods = 2,
+    PassedObjects = 4,
+    ClockRate = 8,
+    Ar = 16,
+    Cs = 32,
+    Hp = 64,
+    Od = 128,
+    HardrockOffsets = 256,
+    Accuracy = 512,
+    Misses = 1024,
+    Combo = 2048,
+    HitresultPriority = 4096,
+    Lazer = 8192,
+    LargeTickHits = 16384,
+    SmallTickHits = 32768,
+    SliderEndHits = 65536,
+    N300 = 131072,
+    N100 = 262144,
+    N50 = 524288,
+    NKatu = 1048576,
+    NGeki = 2097152,
+    State = 4194304,
+}
+
+/// Everything a [`performance::Performance`] can be configured with, as a
+/// single plain struct that is passed by pointer instead of through one call
+/// per setter.
+///
+/// Only fields whose [`ScoreParam`] is in `set` are used. The others must
+/// still hold valid values since the struct is read as a whole, i.e. `mode`,
+/// `hitresult_priority` and the enums in `state` must be one of their
+/// variants and every `bool` must be `0` or `1`. A zero-initialized struct
+/// is valid.
+#[ffi_type]
+#[repr(C)]
+#[derive(Clone, Debug, Default)]
+pub struct ScoreParams {
+    /// Bitwise OR of the [`ScoreParam`]s of all used fields.
+    pub set: u32,
+    pub mode: Mode,
+    /// Legacy mod bits.
+    pub mods: u32,
+    pub passed_objects: u32,
+    pub clock_rate: f64,
+    pub ar: f32,
+    pub cs: f32,
+    pub hp: f32,
+    pub od: f32,
+    pub hardrock_offsets: bool,
+    pub accuracy: f64,
+    pub misses: u32,
+    pub combo: u32,
+    pub hitresult_priority: HitResultPriority,
+    pub lazer: bool,
+    pub large_tick_hits: u32,
+    pub small_tick_hits: u32,
+    pub slider_end_hits: u32,
+    pub n300: u32,
+    pub n100: u32,
+    pub n50: u32,
+    pub n_katu: u32,
+    pub n_geki: u32,
+    pub state: ScoreState,
+}
+
+impl ScoreParams {
+    fn has(&self, param: ScoreParam) -> bool {
+        self.set & param as u32 != 0
+    }
+
+    /// Same as [`performance::Performance::apply`] for the fields in `set`.
+    pub fn apply<'a>(&self, mut perf: rosu_pp::Performance<'a>) -> rosu_pp::Performance<'a> {
+        if self.has(ScoreParam::Mode) {
+            perf = perf.mode_or_ignore(self.mode.into());
+        }
+
+        if self.has(ScoreParam::Mods) {
+            perf = perf.mods(self.mods);
+        }
+
+        if self.has(ScoreParam::PassedObjects) {
+            perf = perf.passed_objects(self.passed_objects);
+        }
+
+        if self.has(ScoreParam::ClockRate) {
+            perf = perf.clock_rate(self.clock_rate);
+        }
+
+        if self.has(ScoreParam::Ar) {
+            perf = perf.ar(self.ar, false);
+        }
+
+        if self.has(ScoreParam::Cs) {
+            perf = perf.cs(self.cs, false);
+        }
+
+        if self.has(ScoreParam::Hp) {
+            perf = perf.hp(self.hp, false);
+        }
+
+        if self.has(ScoreParam::Od) {
+            perf = perf.od(self.od, false);
+        }
+
+        if self.has(ScoreParam::HardrockOffsets) {
+            perf = perf.hardrock_offsets(self.hardrock_offsets);
+        }
+
+        if self.has(ScoreParam::State) {
+            perf = perf.state((&self.state).into());
+        }
+
+        if self.has(ScoreParam::Accuracy) {
+            perf = perf.accuracy(self.accuracy);
+        }
+
+        if self.has(ScoreParam::Misses) {
+            perf = perf.misses(self.misses);
+        }
+
+        if self.has(ScoreParam::Combo) {
+            perf = perf.combo(self.combo);
+        }
+
+        if self.has(ScoreParam::HitresultPriority) {
+            perf = perf.hitresult_priority(self.hitresult_priority.into());
+        }
+
+        if self.has(ScoreParam::Lazer) {
+            perf = perf.lazer(self.lazer);
+        }
+
+        if self.has(ScoreParam::LargeTickHits) {
+            perf = perf.large_tick_hits(self.large_tick_hits);
+        }
+
+        if self.has(ScoreParam::SmallTickHits) {
+            perf = perf.small_tick_hits(self.small_tick_hits);
+        }
+
+        if self.has(ScoreParam::SliderEndHits) {
+            perf = perf.slider_end_hits(self.slider_end_hits);
+        }
+
+        if self.has(ScoreParam::N300) {
+            perf = perf.n300(self.n300);
+        }
+
+        if self.has(ScoreParam::N100) {
+            perf = perf.n100(self.n100);
+        }
+
+        if self.has(ScoreParam::N50) {
+            perf = perf.n50(self.n50);
+        }
+
+        if self.has(ScoreParam::NKatu) {
+            perf = perf.n_katu(self.n_katu);
+        }
+
+        if self.has(ScoreParam::NGeki) {
+            perf = perf.n_geki(self.n_geki);
+        }
+
+        perf
+    }
+}
+
+/// Calculate the performance of a score on `beatmap` in a single call.
+///
+/// The difficulty is calculated as part of the call, which allocates, and
+/// the difficulty attribute cache is not used. For many scores on the same
+/// beatmap and settings, calculate the difficulty once and use
+/// [`performance_calculate_params_from_difficulty`] instead.
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn performance_calculate_params(params: &ScoreParams, beatmap: &Beatmap) -> PerformanceAttributes {
+    params.apply(rosu_pp::Performance::new(&*beatmap.inner)).calculate().into()
+}
+
+/// Calculate the performance of a score from already calculated difficulty
+/// attributes in a single call.
+///
+/// This is the hot path for many scores: there is no difficulty calculation
+/// and no cache lookup, only the performance calculation itself.
+///
+/// Fields that only affect the difficulty, e.g. the clock rate or `passed_objects`,
+/// must already be reflected in `difficulty_attr`.
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn performance_calculate_params_from_difficulty(
+    params: &ScoreParams,
+    difficulty_attr: &DifficultyAttributes,
+) -> PerformanceAttributes {
+    let attrs = rosu_pp::any::DifficultyAttributes::from(difficulty_attr.clone());
+
+    params.apply(rosu_pp::Performance::new(attrs)).calculate().into()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::testing::{self, assert_close};
+    use performance::Performance;
+
+    /// HDDT, 97.5% accuracy and 3 misses on stable.
+    fn params() -> ScoreParams {
+        ScoreParams {
+            set: ScoreParam::Mods as u32 | ScoreParam::Accuracy as u32 | ScoreParam::Misses as u32 | ScoreParam::Lazer as u32,
+            mods: 8 + 64,
+            accuracy: 97.5,
+            misses: 3,
+            lazer: false,
+            ..Default::default()
+        }
+    }
+
+    /// The same score as [`params`] through the setters.
+    fn performance() -> Performance {
+        let mut performance = Performance::default();
+        performance.i_mods(8 + 64);
+        performance.accuracy(97.5);
+        performance.misses(3);
+        performance.lazer(false);
+
+        performance
+    }
+
+    #[test]
+    fn matches_the_setters() {
+        for name in testing::ALL {
+            let beatmap = testing::beatmap(name);
+
+            let expected = performance().calculate(&beatmap).pp();
+            assert!(expected > 0.0, "{name}");
+            assert_close(performance_calculate_params(&params(), &beatmap).pp(), expected);
+        }
+    }
+
+    #[test]
+    fn matches_the_setters_from_difficulty() {
+        for name in testing::ALL {
+            let beatmap = testing::beatmap(name);
+            let difficulty_attr = performance().difficulty().calculate(&beatmap);
+
+            let expected = performance().calculate_from_difficulty(difficulty_attr.clone()).pp();
+            assert_close(performance_calculate_params_from_difficulty(&params(), &difficulty_attr).pp(), expected);
+        }
+    }
+
+    #[test]
+    fn ignores_fields_that_are_not_set() {
+        let beatmap = testing::beatmap(testing::OSU);
+        let params = ScoreParams {
+            set: ScoreParam::Accuracy as u32,
+            accuracy: 95.0,
+            mods: 16,
+            misses: 10,
+            ..Default::default()
+        };
+
+        let mut performance = Performance::default();
+        performance.accuracy(95.0);
+
+        assert_close(performance_calculate_params(&params, &beatmap).pp(), performance.calculate(&beatmap).pp());
+    }
+
+    #[test]
+    fn applies_the_state() {
+        let beatmap = testing::beatmap(testing::OSU);
+        let state = performance().generate_state(&beatmap);
+        let params = ScoreParams {
+            set: ScoreParam::Mods as u32 | ScoreParam::State as u32,
+            mods: 8 + 64,
+            state: state.clone(),
+            ..Default::default()
+        };
+
+        let mut performance = Performance::default();
+        performance.i_mods(8 + 64);
+        performance.state(state);
+
+        assert_close(performance_calculate_params(&params, &beatmap).pp(), performance.calculate(&beatmap).pp());
+    }
+}
@@ -1,10 +1,11 @@
 use crate::*;
 use attributes::DifficultyAttributes;
 use beatmap::Beatmap;
+use difficulty::Difficulty;
 use hitresult_priority::HitResultPriority;
 use interoptopus::{
     ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
-    patterns::string::AsciiPointer,
+    patterns::{slice::{FFISlice, FFISliceMut}, string::AsciiPointer},
 };
 use mode::Mode;
 use mods::Mods;
@@ -44,6 +45,47 @@ pub struct Performance {
     pub state: Option<ScoreState>
 }
 
+/// Score statistics for [`Performance::calculate_batch`], one row per score.
+///
+/// Every column is optional: empty columns are left unset, non-empty columns
+/// must have exactly one element per row.
+#[ffi_type]
+#[repr(C)]
+pub struct ScoreColumns<'a> {
+    pub n300: FFISlice<'a, u32>,
+    pub n100: FFISlice<'a, u32>,
+    pub n50: FFISlice<'a, u32>,
+    pub n_katu: FFISlice<'a, u32>,
+    pub n_geki: FFISlice<'a, u32>,
+    pub misses: FFISlice<'a, u32>,
+    pub max_combo: FFISlice<'a, u32>,
+    pub large_tick_hits: FFISlice<'a, u32>,
+    pub slider_end_hits: FFISlice<'a, u32>,
+    /// Legacy mod bits, overriding the mods of the [`Performance`] per row.
+    pub mods: FFISlice<'a, u32>,
+}
+
+/// Output columns for [`Performance::calculate_batch`] and
+/// [`Performance::calculate_grid`].
+///
+/// `pp` decides the amount of rows. Every other column may be left empty,
+/// otherwise it must be as long as `pp`. Components that do not exist for
+/// the map's mode are written as `0.0`.
+#[ffi_type]
+#[repr(C)]
+pub struct PerformanceColumns<'a> {
+    pub pp: FFISliceMut<'a, f64>,
+    pub pp_aim: FFISliceMut<'a, f64>,
+    pub pp_jump_aim: FFISliceMut<'a, f64>,
+    pub pp_flow_aim: FFISliceMut<'a, f64>,
+    pub pp_precision: FFISliceMut<'a, f64>,
+    pub pp_speed: FFISliceMut<'a, f64>,
+    pub pp_stamina: FFISliceMut<'a, f64>,
+    pub pp_acc: FFISliceMut<'a, f64>,
+    pub pp_difficulty: FFISliceMut<'a, f64>,
+    pub effective_miss_count: FFISliceMut<'a, f64>,
+}
+
 // Regular implementation of methods.
 #[ffi_service(error = "FFIError", prefix = "performance_")]
 impl Performance {
@@ -181,7 +223,7 @@ impl Performance {
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
     pub fn generate_state(&self, beatmap: &Beatmap) -> state::ScoreState {
-        let mut performance = self.apply(rosu_pp::Performance::new(&beatmap.inner));
+        let mut performance = self.apply(rosu_pp::Performance::new(&*beatmap.inner));
         performance.generate_state().into()
     }
 
@@ -198,7 +240,13 @@ impl Performance {
 
     #[ffi_service_method(on_panic = "undefined_behavior")]
     pub fn calculate(&self, beatmap: &Beatmap) -> attributes::PerformanceAttributes {
-        let performance = self.apply(rosu_pp::Performance::new(&beatmap.inner));
+        // Converting to another mode happens inside rosu-pp and is not cached.
+        let performance = if self.mode.is_some_and(|mode| mode != Mode::from(beatmap.inner.mode)) {
+            self.apply(rosu_pp::Performance::new(&*beatmap.inner))
+        } else {
+            self.apply(rosu_pp::Performance::new(self.difficulty().calculate_cached(beatmap)))
+        };
+
         performance.calculate().into()
     }
 
@@ -213,8 +261,151 @@ impl Performance {
         performance.calculate().into()
     }
 
+    /// Calculate the performance of many scores on the same difficulty
+    /// attributes in one call.
+    ///
+    /// Each row of `scores` is applied on top of this [`Performance`] and the
+    /// results are written into the matching row of `out`.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn calculate_batch(
+        &self,
+        difficulty_attr: &DifficultyAttributes,
+        scores: ScoreColumns,
+        out: PerformanceColumns,
+    ) -> Result<(), Error> {
+        let mut out = out;
+        let rows = out.pp.as_slice().len();
+        out.check_len(rows)?;
+
+        let ScoreColumns {
+            n300,
+            n100,
+            n50,
+            n_katu,
+            n_geki,
+            misses,
+            max_combo,
+            large_tick_hits,
+            slider_end_hits,
+            mods,
+        } = &scores;
+
+        let n300 = column(n300, rows)?;
+        let n100 = column(n100, rows)?;
+        let n50 = column(n50, rows)?;
+        let n_katu = column(n_katu, rows)?;
+        let n_geki = column(n_geki, rows)?;
+        let misses = column(misses, rows)?;
+        let max_combo = column(max_combo, rows)?;
+        let large_tick_hits = column(large_tick_hits, rows)?;
+        let slider_end_hits = column(slider_end_hits, rows)?;
+        let mods = column(mods, rows)?;
+
+        let attrs = rosu_pp::any::DifficultyAttributes::from(difficulty_attr.clone());
+
+        for i in 0..rows {
+            let mut perf = self.apply(rosu_pp::Performance::new(attrs.clone()));
+
+            if let Some(mods) = mods {
+                perf = perf.mods(&GameModsIntermode::from_bits(mods[i]));
+            }
+
+            if let Some(n300) = n300 {
+                perf = perf.n300(n300[i]);
+            }
+
+            if let Some(n100) = n100 {
+                perf = perf.n100(n100[i]);
+            }
+
+            if let Some(n50) = n50 {
+                perf = perf.n50(n50[i]);
+            }
+
+            if let Some(n_katu) = n_katu {
+                perf = perf.n_katu(n_katu[i]);
+            }
+
+            if let Some(n_geki) = n_geki {
+                perf = perf.n_geki(n_geki[i]);
+            }
+
+            if let Some(misses) = misses {
+                perf = perf.misses(misses[i]);
+            }
+
+            if let Some(max_combo) = max_combo {
+                perf = perf.combo(max_combo[i]);
+            }
+
+            if let Some(large_tick_hits) = large_tick_hits {
+                perf = perf.large_tick_hits(large_tick_hits[i]);
+            }
+
+            if let Some(slider_end_hits) = slider_end_hits {
+                perf = perf.slider_end_hits(slider_end_hits[i]);
+            }
+
+            out.write(i, &perf.calculate());
+        }
+
+        Ok(())
+    }
+
+    /// Calculate the performance for every combination of accuracy and
+    /// miss count on the same difficulty attributes in one call.
+    ///
+    /// `accuracies` are in percent, i.e. between `0` and `100`. Every cell is
+    /// this [`Performance`] with the cell's accuracy and misses set, so hit
+    /// results are generated just like for a single calculation. `combos` is either
+    /// empty, which means the best possible combo, or holds one combo per
+    /// entry of `misses`.
+    ///
+    /// The result for `accuracies[i]` and `misses[j]` is written into row
+    /// `i * misses.len() + j` of `out`, which must hold that many rows.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn calculate_grid(
+        &self,
+        difficulty_attr: &DifficultyAttributes,
+        accuracies: FFISlice<f64>,
+        misses: FFISlice<u32>,
+        combos: FFISlice<u32>,
+        out: PerformanceColumns,
+    ) -> Result<(), Error> {
+        let mut out = out;
+        let accuracies = accuracies.as_slice();
+        let misses = misses.as_slice();
+        let combos = column(&combos, misses.len())?;
+        let rows = accuracies.len() * misses.len();
+
+        if out.pp.as_slice().len() != rows {
+            return Err(Error::InvalidLength);
+        }
+
+        out.check_len(rows)?;
+
+        let attrs = rosu_pp::any::DifficultyAttributes::from(difficulty_attr.clone());
+
+        for (i, &accuracy) in accuracies.iter().enumerate() {
+            for (j, &n_misses) in misses.iter().enumerate() {
+                let mut perf = self
+                    .apply(rosu_pp::Performance::new(attrs.clone()))
+                    .accuracy(accuracy)
+                    .misses(n_misses);
+
+                if let Some(combos) = combos {
+                    perf = perf.combo(combos[j]);
+                }
+
+                out.write(i * misses.len() + j, &perf.calculate());
+            }
+        }
+
+        Ok(())
+    }
+
     #[ffi_service_method(on_panic = "undefined_behavior")]
-    pub fn get_clock_rate(&mut self) -> f64 {
+    pub fn get_clock_rate(&self) -> f64 {
         if let Some(mods) = self.mods.as_ref() {
             return mods.clock_rate().unwrap_or(1.0);
         }
@@ -228,6 +419,22 @@ impl Performance {
 }
 
 impl Performance {
+    /// The [`Difficulty`] settings of this performance calculation.
+    pub fn difficulty(&self) -> Difficulty {
+        Difficulty {
+            mods: self.mods.clone(),
+            mods_intermode: self.mods_intermode.clone(),
+            passed_objects: self.passed_objects,
+            clock_rate: self.clock_rate,
+            ar: self.ar,
+            cs: self.cs,
+            hp: self.hp,
+            od: self.od,
+            hardrock_offsets: self.hardrock_offsets,
+            lazer: self.lazer,
+        }
+    }
+
     pub fn apply<'a>(&self, mut perf: rosu_pp::Performance<'a>) -> rosu_pp::Performance<'a> {
         let Performance {
             mode,
@@ -353,3 +560,205 @@ impl Performance {
         perf
     }
 }
+
+impl PerformanceColumns<'_> {
+    fn check_len(&self, rows: usize) -> Result<(), Error> {
+        let PerformanceColumns {
+            pp: _,
+            pp_aim,
+            pp_jump_aim,
+            pp_flow_aim,
+            pp_precision,
+            pp_speed,
+            pp_stamina,
+            pp_acc,
+            pp_difficulty,
+            effective_miss_count,
+        } = self;
+
+        for column in [
+            pp_aim,
+            pp_jump_aim,
+            pp_flow_aim,
+            pp_precision,
+            pp_speed,
+            pp_stamina,
+            pp_acc,
+            pp_difficulty,
+            effective_miss_count,
+        ] {
+            let len = column.as_slice().len();
+
+            if len != 0 && len != rows {
+                return Err(Error::InvalidLength);
+            }
+        }
+
+        Ok(())
+    }
+
+    fn write(&mut self, row: usize, attrs: &rosu_pp::any::PerformanceAttributes) {
+        fn set(column: &mut FFISliceMut<f64>, row: usize, value: f64) {
+            if let Some(slot) = column.as_slice_mut().get_mut(row) {
+                *slot = value;
+            }
+        }
+
+        set(&mut self.pp, row, attrs.pp());
+
+        let (aim, jump_aim, flow_aim, precision, speed, stamina, acc, difficulty, effective_miss_count) = match attrs {
+            rosu_pp::any::PerformanceAttributes::Osu(a) => (
+                a.pp_aim,
+                a.pp_jump_aim,
+                a.pp_flow_aim,
+                a.pp_precision,
+                a.pp_speed,
+                a.pp_stamina,
+                a.pp_acc,
+                0.0,
+                a.effective_miss_count,
+            ),
+            rosu_pp::any::PerformanceAttributes::Taiko(a) => {
+                (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, a.pp_acc, a.pp_difficulty, a.effective_miss_count)
+            }
+            rosu_pp::any::PerformanceAttributes::Catch(_) => (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+            rosu_pp::any::PerformanceAttributes::Mania(a) => {
+                (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, a.pp_difficulty, 0.0)
+            }
+        };
+
+        set(&mut self.pp_aim, row, aim);
+        set(&mut self.pp_jump_aim, row, jump_aim);
+        set(&mut self.pp_flow_aim, row, flow_aim);
+        set(&mut self.pp_precision, row, precision);
+        set(&mut self.pp_speed, row, speed);
+        set(&mut self.pp_stamina, row, stamina);
+        set(&mut self.pp_acc, row, acc);
+        set(&mut self.pp_difficulty, row, difficulty);
+        set(&mut self.effective_miss_count, row, effective_miss_count);
+    }
+}
+
+/// Returns `None` for an empty column and errors if it does not have `rows` elements.
+fn column<'a, T>(column: &'a FFISlice<'_, T>, rows: usize) -> Result<Option<&'a [T]>, Error> {
+    match column.as_slice() {
+        [] => Ok(None),
+        slice if slice.len() == rows => Ok(Some(slice)),
+        _ => Err(Error::InvalidLength),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::testing::{self, assert_close};
+
+    fn scores<'a>(misses: &'a [u32], max_combo: &'a [u32], mods: &'a [u32]) -> ScoreColumns<'a> {
+        ScoreColumns {
+            n300: FFISlice::from_slice(&[]),
+            n100: FFISlice::from_slice(&[]),
+            n50: FFISlice::from_slice(&[]),
+            n_katu: FFISlice::from_slice(&[]),
+            n_geki: FFISlice::from_slice(&[]),
+            misses: FFISlice::from_slice(misses),
+            max_combo: FFISlice::from_slice(max_combo),
+            large_tick_hits: FFISlice::from_slice(&[]),
+            slider_end_hits: FFISlice::from_slice(&[]),
+            mods: FFISlice::from_slice(mods),
+        }
+    }
+
+    fn out(pp: &mut [f64]) -> PerformanceColumns<'_> {
+        PerformanceColumns {
+            pp: FFISliceMut::from_slice(pp),
+            pp_aim: FFISliceMut::from_slice(&mut []),
+            pp_jump_aim: FFISliceMut::from_slice(&mut []),
+            pp_flow_aim: FFISliceMut::from_slice(&mut []),
+            pp_precision: FFISliceMut::from_slice(&mut []),
+            pp_speed: FFISliceMut::from_slice(&mut []),
+            pp_stamina: FFISliceMut::from_slice(&mut []),
+            pp_acc: FFISliceMut::from_slice(&mut []),
+            pp_difficulty: FFISliceMut::from_slice(&mut []),
+            effective_miss_count: FFISliceMut::from_slice(&mut []),
+        }
+    }
+
+    #[test]
+    fn batch_matches_calculate() {
+        for name in testing::ALL {
+            let beatmap = testing::beatmap(name);
+            let performance = Performance::default();
+            let difficulty_attr = performance.difficulty().calculate(&beatmap);
+            let max_combo = rosu_pp::any::DifficultyAttributes::from(difficulty_attr.clone()).max_combo();
+
+            let misses = [0, 3, 10];
+            let combos = [max_combo, max_combo / 2, 1];
+            let mods = [0, 8, 16 + 64];
+
+            let mut pp = [0.0; 3];
+            performance
+                .calculate_batch(&difficulty_attr, scores(&misses, &combos, &mods), out(&mut pp))
+                .unwrap();
+
+            for i in 0..pp.len() {
+                let mut expected = performance.clone();
+                expected.misses(misses[i]);
+                expected.combo(combos[i]);
+                expected.i_mods(mods[i]);
+
+                assert_close(pp[i], expected.calculate_from_difficulty(difficulty_attr.clone()).pp());
+            }
+        }
+    }
+
+    #[test]
+    fn grid_matches_calculate() {
+        for name in testing::ALL {
+            let beatmap = testing::beatmap(name);
+            let performance = Performance::default();
+            let difficulty_attr = performance.difficulty().calculate(&beatmap);
+
+            let accuracies = [100.0, 98.5, 91.0];
+            let misses = [0, 1, 7];
+
+            for combos in [&[][..], &[500, 200, 50][..]] {
+                let mut pp = [0.0; 9];
+                performance
+                    .calculate_grid(
+                        &difficulty_attr,
+                        FFISlice::from_slice(&accuracies),
+                        FFISlice::from_slice(&misses),
+                        FFISlice::from_slice(combos),
+                        out(&mut pp),
+                    )
+                    .unwrap();
+
+                for (i, &accuracy) in accuracies.iter().enumerate() {
+                    for (j, &n_misses) in misses.iter().enumerate() {
+                        let mut expected = performance.clone();
+                        expected.accuracy(accuracy);
+                        expected.misses(n_misses);
+
+                        if let Some(&combo) = combos.get(j) {
+                            expected.combo(combo);
+                        }
+
+                        let expected = expected.calculate_from_difficulty(difficulty_attr.clone()).pp();
+                        assert_close(pp[i * misses.len() + j], expected);
+                    }
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn batch_rejects_columns_of_another_length() {
+        let beatmap = testing::beatmap(testing::OSU);
+        let performance = Performance::default();
+        let difficulty_attr = performance.difficulty().calculate(&beatmap);
+
+        let mut pp = [0.0; 3];
+        let result = performance.calculate_batch(&difficulty_attr, scores(&[0, 1], &[], &[]), out(&mut pp));
+        assert!(matches!(result, Err(Error::InvalidLength)));
+    }
+}
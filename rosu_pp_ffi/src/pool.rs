@@ -0,0 +1,72 @@
+use std::sync::OnceLock;
+
+use crate::*;
+
+/// Thread pool of a service with a configurable amount of threads.
+///
+/// `0` threads runs on rayon's global pool with one thread per logical core.
+/// Any other amount builds a dedicated pool on first use, which is reused
+/// until the amount changes.
+#[derive(Default)]
+pub struct WorkerPool {
+    pub threads: u32,
+    pub pool: OnceLock<rayon::ThreadPool>,
+}
+
+impl WorkerPool {
+    pub fn set_threads(&mut self, threads: u32) {
+        if threads != self.threads {
+            self.threads = threads;
+            self.pool = OnceLock::new();
+        }
+    }
+
+    /// Run `op` on the pool.
+    ///
+    /// Fails only if the dedicated pool can't be created.
+    pub fn install<R: Send>(&self, op: impl FnOnce() -> R + Send) -> Result<R, Error> {
+        if self.threads == 0 {
+            return Ok(op());
+        }
+
+        let pool = match self.pool.get() {
+            Some(pool) => pool,
+            None => {
+                let pool = rayon::ThreadPoolBuilder::new()
+                    .num_threads(self.threads as usize)
+                    .build()
+                    .map_err(|_| Error::Unknown)?;
+
+                self.pool.get_or_init(|| pool)
+            }
+        };
+
+        Ok(pool.install(op))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn reuses_the_dedicated_pool() {
+        let mut pool = WorkerPool::default();
+
+        assert_eq!(pool.install(rayon::current_num_threads).unwrap(), rayon::current_num_threads());
+        assert!(pool.pool.get().is_none());
+
+        pool.set_threads(3);
+        assert_eq!(pool.install(rayon::current_num_threads).unwrap(), 3);
+        let first: *const rayon::ThreadPool = pool.pool.get().unwrap();
+        pool.install(|| ()).unwrap();
+        assert!(std::ptr::eq(first, pool.pool.get().unwrap()));
+
+        pool.set_threads(3);
+        assert!(pool.pool.get().is_some());
+
+        pool.set_threads(2);
+        assert!(pool.pool.get().is_none());
+        assert_eq!(pool.install(rayon::current_num_threads).unwrap(), 2);
+    }
+}
@@ -0,0 +1,399 @@
+use std::{
+    collections::{BTreeMap, HashMap},
+    path::PathBuf,
+    sync::Arc,
+};
+
+use crate::*;
+use beatmap::Beatmap;
+use interoptopus::{
+    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
+    patterns::{
+        slice::{FFISlice, FFISliceMut},
+        string::AsciiPointer,
+    },
+};
+use rayon::prelude::*;
+use rosu_mods::GameModsIntermode;
+use state::ScoreState;
+
+/// Weight of the `i`th best play of a profile is `WEIGHT^i`.
+pub const WEIGHT: f64 = 0.95;
+/// Bonus pp are capped at this many plays.
+const BONUS_PLAYS: u32 = 1000;
+
+/// A single play to score with a [`ProfileEngine`].
+#[ffi_type]
+#[repr(C)]
+#[derive(Clone, Debug, Default)]
+pub struct ProfileScore {
+    pub user_id: u64,
+    /// Key the beatmap was added to the [`ProfileEngine`] with.
+    pub beatmap: u64,
+    /// Legacy mod bits.
+    pub mods: u32,
+    pub lazer: bool,
+    pub state: ScoreState,
+}
+
+/// Weighted totals of a single user, see [`ProfileEngine::totals`].
+///
+/// Every skill is weighted on its own, i.e. plays are sorted by that
+/// skill's pp before the weights are applied, like on pp+ profiles.
+#[ffi_type]
+#[repr(C)]
+#[derive(Clone, Copy, Debug, Default)]
+pub struct ProfileTotal {
+    pub user_id: u64,
+    /// Weighted pp of all plays including [`ProfileTotal::bonus_pp`].
+    pub pp: f64,
+    /// Bonus pp for the amount of beatmaps the user has a play on.
+    pub bonus_pp: f64,
+    pub pp_aim: f64,
+    pub pp_jump_aim: f64,
+    pub pp_flow_aim: f64,
+    pub pp_precision: f64,
+    pub pp_speed: f64,
+    pub pp_stamina: f64,
+    pub pp_acc: f64,
+    /// Amount of beatmaps that count towards the totals.
+    pub plays: u32,
+    /// Amount of plays that were skipped because their beatmap was never
+    /// added or failed to parse.
+    pub failed: u32,
+}
+
+pub enum ProfileBeatmap {
+    Parsed(Arc<rosu_pp::Beatmap>),
+    Path(PathBuf),
+}
+
+/// Total pp and the skill components of a single play, in the field order
+/// of [`ProfileTotal`].
+type Skills = [f64; 8];
+
+/// Recalculates the total pp of many users at once.
+///
+/// Plays are grouped by beatmap so every beatmap is parsed once and every
+/// mod combination on it has its difficulty calculated once, no matter how
+/// many users played it. Beatmaps are scored in parallel on a work-stealing
+/// thread pool.
+///
+/// Plays are scored in the mode of their beatmap, so converts need an
+/// already converted [`Beatmap`]. Only the play with the most pp of a user
+/// on each beatmap counts towards their totals, skills included.
+#[ffi_type(opaque)]
+#[derive(Default)]
+pub struct ProfileEngine {
+    pub beatmaps: HashMap<u64, ProfileBeatmap>,
+    pub scores: Vec<ProfileScore>,
+    pub pool: pool::WorkerPool,
+    /// Result of every score after [`ProfileEngine::calculate`], `None` if
+    /// its beatmap is missing.
+    pub results: Vec<Option<Skills>>,
+    pub totals: Vec<ProfileTotal>,
+}
+
+#[ffi_service(error = "FFIError", prefix = "profile_engine_")]
+impl ProfileEngine {
+    #[ffi_service_ctor]
+    pub fn new() -> Result<Self, Error> {
+        Ok(Self::default())
+    }
+
+    /// Add a parsed beatmap under `key`, replacing any beatmap previously
+    /// added with the same key.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn add_beatmap(&mut self, key: u64, beatmap: &Beatmap) {
+        self.beatmaps.insert(key, ProfileBeatmap::Parsed(Arc::clone(&beatmap.inner)));
+    }
+
+    /// Add a beatmap by path under `key`. It is parsed on the thread pool
+    /// during [`ProfileEngine::calculate`].
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn add_path(&mut self, key: u64, path: AsciiPointer) -> Result<(), Error> {
+        self.beatmaps.insert(key, ProfileBeatmap::Path(path.as_str()?.into()));
+        Ok(())
+    }
+
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn add_scores(&mut self, scores: FFISlice<ProfileScore>) {
+        self.scores.extend_from_slice(scores.as_slice());
+    }
+
+    /// Amount of worker threads, `0` uses the global pool with one thread per logical core.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn threads(&mut self, threads: u32) {
+        self.pool.set_threads(threads);
+    }
+
+    /// Amount of added scores.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        self.scores.len() as u32
+    }
+
+    /// Amount of distinct users of the last [`ProfileEngine::calculate`].
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn users(&self) -> u32 {
+        self.totals.len() as u32
+    }
+
+    /// Score every added play and sum up the totals of every user.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn calculate(&mut self) -> Result<(), Error> {
+        let mut groups: HashMap<u64, Vec<usize>> = HashMap::new();
+
+        for (i, score) in self.scores.iter().enumerate() {
+            groups.entry(score.beatmap).or_default().push(i);
+        }
+
+        let scored: Vec<(usize, Option<Skills>)> = self.pool.install(|| {
+            groups
+                .par_iter()
+                .flat_map(|(key, indices)| self.score_beatmap(*key, indices))
+                .collect()
+        })?;
+
+        let mut results = vec![None; self.scores.len()];
+
+        for (i, skills) in scored {
+            results[i] = skills;
+        }
+
+        self.totals = totals(&self.scores, &results);
+        self.results = results;
+
+        Ok(())
+    }
+
+    /// Write the totals of every user, sorted by user id.
+    ///
+    /// `out` must hold [`ProfileEngine::users`] elements.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn totals(&self, out: FFISliceMut<ProfileTotal>) -> Result<(), Error> {
+        let mut out = out;
+        let out = out.as_slice_mut();
+
+        if out.len() != self.totals.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        out.copy_from_slice(&self.totals);
+
+        Ok(())
+    }
+
+    /// Write the pp of every score in the order they were added, `NaN` for
+    /// scores whose beatmap is missing.
+    ///
+    /// `out` must hold [`ProfileEngine::len`] elements.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn score_pp(&self, out: FFISliceMut<f64>) -> Result<(), Error> {
+        let mut out = out;
+        let out = out.as_slice_mut();
+
+        if out.len() != self.results.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        for (slot, skills) in out.iter_mut().zip(&self.results) {
+            *slot = skills.map_or(f64::NAN, |skills| skills[0]);
+        }
+
+        Ok(())
+    }
+}
+
+impl ProfileEngine {
+    /// Score the plays at `indices`, which are all on the beatmap `key`.
+    fn score_beatmap(&self, key: u64, indices: &[usize]) -> Vec<(usize, Option<Skills>)> {
+        let map = match self.beatmaps.get(&key) {
+            Some(ProfileBeatmap::Parsed(map)) => Some(Arc::clone(map)),
+            Some(ProfileBeatmap::Path(path)) => rosu_pp::Beatmap::from_path(path).ok().map(Arc::new),
+            None => None,
+        };
+
+        let Some(map) = map else {
+            return indices.iter().map(|&i| (i, None)).collect();
+        };
+
+        let mut mod_groups: HashMap<(u32, bool), Vec<usize>> = HashMap::new();
+
+        for &i in indices {
+            let score = &self.scores[i];
+            mod_groups.entry((score.mods, score.lazer)).or_default().push(i);
+        }
+
+        mod_groups
+            .into_par_iter()
+            .flat_map_iter(|((mods, lazer), indices)| {
+                let mods = GameModsIntermode::from_bits(mods);
+                let attrs = rosu_pp::Difficulty::new().mods(&mods).lazer(lazer).calculate(&map);
+
+                indices
+                    .into_iter()
+                    .map(|i| {
+                        let perf = rosu_pp::Performance::new(attrs.clone())
+                            .mods(&mods)
+                            .lazer(lazer)
+                            .state((&self.scores[i].state).into())
+                            .calculate();
+
+                        (i, Some(skills(&perf)))
+                    })
+                    .collect::<Vec<_>>()
+            })
+            .collect()
+    }
+}
+
+fn skills(attrs: &rosu_pp::any::PerformanceAttributes) -> Skills {
+    match attrs {
+        rosu_pp::any::PerformanceAttributes::Osu(a) => [
+            a.pp,
+            a.pp_aim,
+            a.pp_jump_aim,
+            a.pp_flow_aim,
+            a.pp_precision,
+            a.pp_speed,
+            a.pp_stamina,
+            a.pp_acc,
+        ],
+        rosu_pp::any::PerformanceAttributes::Taiko(a) => [a.pp, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, a.pp_acc],
+        _ => [attrs.pp(), 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    }
+}
+
+/// Bonus pp of a profile with plays on `plays` beatmaps.
+pub fn bonus_pp(plays: u32) -> f64 {
+    416.6667 * (1.0 - 0.995_f64.powi(plays.min(BONUS_PLAYS) as i32))
+}
+
+fn totals(scores: &[ProfileScore], results: &[Option<Skills>]) -> Vec<ProfileTotal> {
+    // Best play per user and beatmap; all skills are taken from that play.
+    let mut users: BTreeMap<u64, (HashMap<u64, Skills>, u32)> = BTreeMap::new();
+
+    for (score, skills) in scores.iter().zip(results) {
+        let (best, failed) = users.entry(score.user_id).or_default();
+
+        let Some(skills) = skills else {
+            *failed += 1;
+            continue;
+        };
+
+        best.entry(score.beatmap)
+            .and_modify(|best| {
+                if skills[0] > best[0] {
+                    *best = *skills;
+                }
+            })
+            .or_insert(*skills);
+    }
+
+    users
+        .into_iter()
+        .map(|(user_id, (best, failed))| {
+            let mut weighted = [0.0; 8];
+            let mut values = Vec::with_capacity(best.len());
+
+            for (k, total) in weighted.iter_mut().enumerate() {
+                values.clear();
+                values.extend(best.values().map(|skills| skills[k]));
+                values.sort_unstable_by(|a, b| b.total_cmp(a));
+
+                *total = values
+                    .iter()
+                    .zip(std::iter::successors(Some(1.0), |weight| Some(weight * WEIGHT)))
+                    .map(|(value, weight)| value * weight)
+                    .sum();
+            }
+
+            let plays = best.len() as u32;
+            let bonus_pp = bonus_pp(plays);
+            let [pp, pp_aim, pp_jump_aim, pp_flow_aim, pp_precision, pp_speed, pp_stamina, pp_acc] = weighted;
+
+            ProfileTotal {
+                user_id,
+                pp: pp + bonus_pp,
+                bonus_pp,
+                pp_aim,
+                pp_jump_aim,
+                pp_flow_aim,
+                pp_precision,
+                pp_speed,
+                pp_stamina,
+                pp_acc,
+                plays,
+                failed,
+            }
+        })
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn score(user_id: u64, beatmap: u64) -> ProfileScore {
+        ProfileScore {
+            user_id,
+            beatmap,
+            ..Default::default()
+        }
+    }
+
+    fn assert_close(a: f64, b: f64) {
+        assert!((a - b).abs() <= 1e-9, "{a} != {b}");
+    }
+
+    #[test]
+    fn bonus_pp_is_capped() {
+        assert_eq!(bonus_pp(0), 0.0);
+        assert_close(bonus_pp(1), 416.6667 * 0.005);
+        assert!(bonus_pp(500) < bonus_pp(BONUS_PLAYS));
+        assert_eq!(bonus_pp(BONUS_PLAYS), bonus_pp(BONUS_PLAYS + 1));
+        assert_eq!(bonus_pp(BONUS_PLAYS), bonus_pp(u32::MAX));
+    }
+
+    #[test]
+    fn totals_take_every_skill_from_the_best_play() {
+        let scores = [score(2, 1), score(1, 1), score(1, 1), score(1, 2), score(1, 3), score(2, 2)];
+        let results = [
+            Some([50.0, 5.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]),
+            Some([100.0, 60.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0]),
+            Some([80.0, 70.0, 0.0, 0.0, 0.0, 0.0, 0.0, 2.0]),
+            Some([90.0, 10.0, 0.0, 0.0, 0.0, 0.0, 0.0, 3.0]),
+            None,
+            None,
+        ];
+
+        let totals = totals(&scores, &results);
+        assert_eq!(totals.len(), 2);
+
+        let user = &totals[0];
+        assert_eq!((user.user_id, user.plays, user.failed), (1, 2, 1));
+        assert_close(user.bonus_pp, bonus_pp(2));
+        // The 100pp play counts on beatmap 1, with its aim and accuracy
+        // even though the other play has more of both. Each skill is then
+        // sorted on its own.
+        assert_close(user.pp, 100.0 + 90.0 * WEIGHT + bonus_pp(2));
+        assert_close(user.pp_aim, 60.0 + 10.0 * WEIGHT);
+        assert_close(user.pp_acc, 3.0 + 1.0 * WEIGHT);
+        assert_eq!(user.pp_speed, 0.0);
+
+        let user = &totals[1];
+        assert_eq!((user.user_id, user.plays, user.failed), (2, 1, 1));
+        assert_close(user.pp, 50.0 + bonus_pp(1));
+        assert_close(user.pp_aim, 5.0);
+    }
+
+    #[test]
+    fn totals_of_failed_plays_only() {
+        let totals = totals(&[score(7, 1)], &[None]);
+
+        assert_eq!(totals.len(), 1);
+        assert_eq!((totals[0].plays, totals[0].failed), (0, 1));
+        assert_eq!(totals[0].pp, 0.0);
+    }
+}
@@ -0,0 +1,228 @@
+use crate::*;
+use beatmap::Beatmap;
+use difficulty::Difficulty;
+use interoptopus::{
+    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
+    patterns::{option::FFIOption, slice::FFISliceMut},
+};
+use rayon::prelude::*;
+
+/// Star rating at a clock rate, see [`RateCurve::estimate`].
+#[ffi_type]
+#[repr(C)]
+#[derive(Clone, Copy, Debug, Default, PartialEq)]
+pub struct RateEstimate {
+    pub clock_rate: f64,
+    pub stars: f64,
+    /// Estimated upper bound of the interpolation error in stars.
+    ///
+    /// `0` if `clock_rate` is a grid point.
+    pub error_bound: f64,
+}
+
+/// Difficulty attributes of a beatmap on an evenly spaced grid of clock rates.
+///
+/// The grid is calculated in parallel when creating the curve, every grid
+/// point goes through the difficulty attribute cache so rebuilding a curve
+/// for the same beatmap and settings is cheap. Rates in between grid points
+/// are answered by linear interpolation without any further calculation.
+#[ffi_type(opaque)]
+pub struct RateCurve {
+    pub min_rate: f64,
+    pub step: f64,
+    pub attributes: Vec<rosu_pp::any::DifficultyAttributes>,
+}
+
+#[ffi_service(error = "FFIError", prefix = "rate_curve_")]
+impl RateCurve {
+    /// Calculate `steps` evenly spaced clock rates from `min_rate` to
+    /// `max_rate`, both inclusive, with the other settings of `difficulty`.
+    ///
+    /// Requires at least two steps and `min_rate < max_rate`.
+    #[ffi_service_ctor]
+    pub fn new(
+        difficulty: &Difficulty,
+        beatmap: &Beatmap,
+        min_rate: f64,
+        max_rate: f64,
+        steps: u32,
+    ) -> Result<Self, Error> {
+        if steps < 2 || !(min_rate < max_rate) {
+            return Err(Error::InvalidLength);
+        }
+
+        let step = (max_rate - min_rate) / f64::from(steps - 1);
+
+        let attributes = (0..steps)
+            .into_par_iter()
+            .map(|i| {
+                let mut difficulty = difficulty.clone();
+                difficulty.clock_rate = Some(min_rate + step * f64::from(i));
+
+                difficulty.calculate_cached(beatmap)
+            })
+            .collect();
+
+        Ok(Self { min_rate, step, attributes })
+    }
+
+    /// Amount of grid points.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        self.attributes.len() as u32
+    }
+
+    /// Clock rate of the `index`th grid point.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn rate(&self, index: u32) -> f64 {
+        self.rate_at(index as usize)
+    }
+
+    /// Full difficulty attributes of the `index`th grid point.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn attributes(&self, index: u32) -> FFIOption<attributes::DifficultyAttributes> {
+        self.attributes
+            .get(index as usize)
+            .cloned()
+            .map(attributes::DifficultyAttributes::from)
+            .into()
+    }
+
+    /// Write the clock rate and star rating of every grid point into `rates`
+    /// and `stars`, both of which must hold [`RateCurve::len`] elements.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn grid(&self, rates: FFISliceMut<f64>, stars: FFISliceMut<f64>) -> Result<(), Error> {
+        let mut rates = rates;
+        let mut stars = stars;
+        let rates = rates.as_slice_mut();
+        let stars = stars.as_slice_mut();
+
+        if rates.len() != self.attributes.len() || stars.len() != self.attributes.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        for (i, (rate, stars)) in rates.iter_mut().zip(stars).enumerate() {
+            *rate = self.rate_at(i);
+            *stars = self.stars_at(i);
+        }
+
+        Ok(())
+    }
+
+    /// Interpolate the star rating at `clock_rate`.
+    ///
+    /// The error bound is derived from the curvature of the neighbouring grid
+    /// points: linear interpolation is off by at most `h² / 8 * |f''|` for a
+    /// grid spacing `h`, with `f''` estimated by second differences.
+    ///
+    /// Returns `None` if `clock_rate` lies outside of the grid.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn estimate(&self, clock_rate: f64) -> FFIOption<RateEstimate> {
+        let last = self.attributes.len() - 1;
+        let pos = (clock_rate - self.min_rate) / self.step;
+
+        if !(0.0..=last as f64).contains(&pos) {
+            return None.into();
+        }
+
+        let i = (pos.floor() as usize).min(last - 1);
+        let t = pos - i as f64;
+        let stars = self.stars_at(i) + (self.stars_at(i + 1) - self.stars_at(i)) * t;
+
+        let error_bound = if t == 0.0 || t == 1.0 {
+            0.0
+        } else {
+            // Largest second difference touching the interval; a second
+            // difference already is `f'' * h²`.
+            let curvature = [i.checked_sub(1), Some(i), Some(i + 1)]
+                .into_iter()
+                .flatten()
+                .filter(|&j| j >= 1 && j < last)
+                .map(|j| (self.stars_at(j - 1) - 2.0 * self.stars_at(j) + self.stars_at(j + 1)).abs())
+                .fold(0.0, f64::max);
+
+            curvature / 8.0
+        };
+
+        Some(RateEstimate { clock_rate, stars, error_bound }).into()
+    }
+}
+
+impl RateCurve {
+    fn rate_at(&self, index: usize) -> f64 {
+        self.min_rate + self.step * index as f64
+    }
+
+    fn stars_at(&self, index: usize) -> f64 {
+        self.attributes[index].stars()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Curve from `min_rate` in steps of `step` with the given star ratings.
+    fn curve(min_rate: f64, step: f64, stars: &[f64]) -> RateCurve {
+        let attributes = stars
+            .iter()
+            .map(|&stars| {
+                let attrs = mania::attributes::ManiaDifficultyAttributes { stars, ..Default::default() };
+
+                rosu_pp::any::DifficultyAttributes::Mania(attrs.into())
+            })
+            .collect();
+
+        RateCurve { min_rate, step, attributes }
+    }
+
+    fn estimate(curve: &RateCurve, clock_rate: f64) -> RateEstimate {
+        *curve.estimate(clock_rate).as_ref().expect("clock rate on the grid")
+    }
+
+    #[test]
+    fn grid_points_are_exact() {
+        let curve = curve(0.5, 0.25, &[2.0, 3.5, 4.0, 6.0, 7.5]);
+
+        for i in 0..curve.attributes.len() {
+            let estimate = estimate(&curve, curve.rate_at(i));
+
+            assert_eq!(estimate.stars, curve.stars_at(i));
+            assert_eq!(estimate.error_bound, 0.0);
+        }
+    }
+
+    #[test]
+    fn interpolates_linearly() {
+        let curve = curve(1.0, 0.5, &[4.0, 5.0, 7.0]);
+
+        assert!((estimate(&curve, 1.25).stars - 4.5).abs() < 1e-12);
+        assert!((estimate(&curve, 1.625).stars - 5.5).abs() < 1e-12);
+        assert!((estimate(&curve, 1.875).stars - 6.5).abs() < 1e-12);
+    }
+
+    #[test]
+    fn rejects_rates_outside_of_the_grid() {
+        let curve = curve(1.0, 0.5, &[4.0, 5.0, 7.0]);
+
+        assert!(curve.estimate(0.999).as_ref().is_none());
+        assert!(curve.estimate(2.001).as_ref().is_none());
+        assert!(curve.estimate(f64::NAN).as_ref().is_none());
+        assert!(curve.estimate(2.0).as_ref().is_some());
+    }
+
+    #[test]
+    fn error_bound_covers_quadratic_curves() {
+        let stars = |rate: f64| 3.0 * rate * rate;
+        let grid: Vec<_> = (0..9).map(|i| stars(0.5 + 0.125 * f64::from(i))).collect();
+        let curve = curve(0.5, 0.125, &grid);
+
+        for i in 0..=800 {
+            let rate = 0.5 + f64::from(i) / 800.0;
+            let estimate = estimate(&curve, rate);
+            let error = (estimate.stars - stars(rate)).abs();
+
+            assert!(error <= estimate.error_bound + 1e-12, "{rate}: {error} > {}", estimate.error_bound);
+        }
+    }
+}
@@ -0,0 +1,262 @@
+use crate::*;
+use attributes::DifficultyAttributes;
+use interoptopus::{ffi_function, ffi_type};
+use performance::Performance;
+use state::{OsuScoreOrigin, ScoreState};
+
+/// Accuracies closer than this, in percent, are considered equal.
+const ACCURACY_TOLERANCE: f64 = 1e-6;
+
+/// Result of [`performance_min_accuracy`] and [`performance_max_misses`].
+#[ffi_type]
+#[repr(C)]
+#[derive(Clone, Debug, Default)]
+pub struct PpTarget {
+    /// Whether the target pp can be reached at all with the given settings.
+    ///
+    /// If not, the other fields describe the best possible score instead.
+    pub reachable: bool,
+    /// Accuracy of `state` in percent, as calculated for the given origin.
+    pub accuracy: f64,
+    pub misses: u32,
+    /// pp of the resulting score, at least the target if reachable.
+    pub pp: f64,
+    /// Hit results of the resulting score.
+    pub state: ScoreState,
+}
+
+/// Find the lowest accuracy that reaches `target_pp`.
+///
+/// Everything except the accuracy is taken from `performance`, e.g. its miss
+/// count, combo, mods or whether the score is set on lazer. `origin` only
+/// decides how the accuracy of the resulting state is reported.
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn performance_min_accuracy(
+    performance: &Performance,
+    difficulty_attr: &DifficultyAttributes,
+    target_pp: f64,
+    origin: OsuScoreOrigin,
+) -> PpTarget {
+    let attrs = rosu_pp::any::DifficultyAttributes::from(difficulty_attr.clone());
+    let misses = performance.misses;
+    let pp_at = |accuracy| probe(performance, &attrs, Some(accuracy), misses).calculate().pp();
+
+    let (mut low, mut high) = (0.0, 100.0);
+
+    if pp_at(high) < target_pp {
+        return target(performance, difficulty_attr, origin, false, Some(high), misses);
+    }
+
+    while high - low > ACCURACY_TOLERANCE {
+        let mid = (low + high) / 2.0;
+
+        if pp_at(mid) >= target_pp {
+            high = mid;
+        } else {
+            low = mid;
+        }
+    }
+
+    target(performance, difficulty_attr, origin, true, Some(high), misses)
+}
+
+/// Find the highest miss count that still reaches `target_pp`.
+///
+/// Everything except the miss count is taken from `performance`; without an
+/// accuracy set, it is the highest possible one for each miss count. `origin`
+/// only decides how the accuracy of the resulting state is reported.
+#[ffi_function]
+#[no_mangle]
+pub extern "C" fn performance_max_misses(
+    performance: &Performance,
+    difficulty_attr: &DifficultyAttributes,
+    target_pp: f64,
+    origin: OsuScoreOrigin,
+) -> PpTarget {
+    let attrs = rosu_pp::any::DifficultyAttributes::from(difficulty_attr.clone());
+    let accuracy = performance.accuracy;
+    let pp_at = |misses| probe(performance, &attrs, accuracy, Some(misses)).calculate().pp();
+
+    if pp_at(0) < target_pp {
+        return target(performance, difficulty_attr, origin, false, accuracy, Some(0));
+    }
+
+    // Invariant: `low` reaches the target, `high + 1` does not.
+    let (mut low, mut high) = (0, n_objects(&attrs));
+
+    while low < high {
+        let mid = low + (high - low + 1) / 2;
+
+        if pp_at(mid) >= target_pp {
+            low = mid;
+        } else {
+            high = mid - 1;
+        }
+    }
+
+    target(performance, difficulty_attr, origin, true, accuracy, Some(low))
+}
+
+/// Amount of objects that can be missed.
+fn n_objects(attrs: &rosu_pp::any::DifficultyAttributes) -> u32 {
+    match attrs {
+        rosu_pp::any::DifficultyAttributes::Osu(a) => a.n_circles + a.n_sliders + a.n_spinners,
+        rosu_pp::any::DifficultyAttributes::Mania(a) => a.n_objects,
+        // Only hit circles, fruits and droplets can be missed, each of
+        // which adds one combo.
+        rosu_pp::any::DifficultyAttributes::Taiko(_) | rosu_pp::any::DifficultyAttributes::Catch(_) => {
+            attrs.max_combo()
+        }
+    }
+}
+
+/// `performance` on top of `attrs` with the given accuracy and misses, if any.
+fn probe(
+    performance: &Performance,
+    attrs: &rosu_pp::any::DifficultyAttributes,
+    accuracy: Option<f64>,
+    misses: Option<u32>,
+) -> rosu_pp::Performance<'static> {
+    let mut perf = performance.apply(rosu_pp::Performance::new(attrs.clone()));
+
+    if let Some(accuracy) = accuracy {
+        perf = perf.accuracy(accuracy);
+    }
+
+    if let Some(misses) = misses {
+        perf = perf.misses(misses);
+    }
+
+    perf
+}
+
+fn target(
+    performance: &Performance,
+    difficulty_attr: &DifficultyAttributes,
+    origin: OsuScoreOrigin,
+    reachable: bool,
+    accuracy: Option<f64>,
+    misses: Option<u32>,
+) -> PpTarget {
+    let attrs = rosu_pp::any::DifficultyAttributes::from(difficulty_attr.clone());
+    let mut perf = probe(performance, &attrs, accuracy, misses);
+    let state = ScoreState::from(perf.generate_state());
+    let pp = perf.calculate().pp();
+
+    PpTarget {
+        reachable,
+        accuracy: state::calculate_accuacy(&state, difficulty_attr, origin) * 100.0,
+        misses: state.misses,
+        pp,
+        state,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use interoptopus::patterns::option::FFIOption;
+    use mode::Mode;
+    use osu::attributes::OsuDifficultyAttributes;
+
+    use super::*;
+
+    fn difficulty() -> DifficultyAttributes {
+        DifficultyAttributes {
+            osu: FFIOption::some(OsuDifficultyAttributes {
+                aim: 3.1,
+                aim_difficult_slider_count: 60.0,
+                jump: 2.8,
+                flow: 1.9,
+                precision: 1.2,
+                speed: 2.7,
+                stamina: 2.1,
+                accuracy: 1.4,
+                slider_factor: 0.97,
+                speed_note_count: 280.0,
+                aim_difficult_strain_count: 150.0,
+                jump_aim_difficult_strain_count: 120.0,
+                flow_aim_difficult_strain_count: 90.0,
+                speed_difficult_strain_count: 110.0,
+                stamina_difficult_strain_count: 100.0,
+                ar: 9.3,
+                great_hit_window: 31.5,
+                ok_hit_window: 71.5,
+                meh_hit_window: 111.5,
+                hp: 5.0,
+                n_circles: 420,
+                n_sliders: 180,
+                n_spinners: 2,
+                stars: 6.0,
+                max_combo: 950,
+                ..Default::default()
+            }),
+            mode: Mode::Osu,
+            ..Default::default()
+        }
+    }
+
+    fn pp(difficulty: &DifficultyAttributes, accuracy: Option<f64>, misses: Option<u32>) -> f64 {
+        let attrs = rosu_pp::any::DifficultyAttributes::from(difficulty.clone());
+
+        probe(&Performance::default(), &attrs, accuracy, misses).calculate().pp()
+    }
+
+    #[test]
+    fn min_accuracy_reaches_the_target() {
+        let difficulty = difficulty();
+        let target_pp = pp(&difficulty, Some(100.0), None) * 0.8;
+        assert!(target_pp > 0.0);
+
+        let result = performance_min_accuracy(&Performance::default(), &difficulty, target_pp, OsuScoreOrigin::Stable);
+
+        assert!(result.reachable);
+        assert!(result.pp >= target_pp, "{} < {target_pp}", result.pp);
+        assert!(result.accuracy < 100.0);
+        assert!(pp(&difficulty, Some(result.accuracy - 1.0), None) < target_pp);
+    }
+
+    #[test]
+    fn min_accuracy_of_an_unreachable_target() {
+        let difficulty = difficulty();
+        let result = performance_min_accuracy(&Performance::default(), &difficulty, 1e9, OsuScoreOrigin::Stable);
+
+        assert!(!result.reachable);
+        assert!(result.pp < 1e9);
+        assert!(result.accuracy > 99.99);
+    }
+
+    #[test]
+    fn max_misses_reach_the_target() {
+        let difficulty = difficulty();
+        let target_pp = pp(&difficulty, None, Some(0)) * 0.7;
+        assert!(target_pp > 0.0);
+
+        let result = performance_max_misses(&Performance::default(), &difficulty, target_pp, OsuScoreOrigin::Stable);
+
+        assert!(result.reachable);
+        assert!(result.misses > 0);
+        assert!(result.pp >= target_pp, "{} < {target_pp}", result.pp);
+        assert!(pp(&difficulty, None, Some(result.misses + 1)) < target_pp);
+    }
+
+    #[test]
+    fn max_misses_are_bounded_by_the_object_count() {
+        let difficulty = difficulty();
+        let n_objects = difficulty.osu.as_ref().unwrap().n_objects();
+        let result = performance_max_misses(&Performance::default(), &difficulty, 0.0, OsuScoreOrigin::Stable);
+
+        assert!(result.reachable);
+        assert_eq!(result.misses, n_objects);
+    }
+
+    #[test]
+    fn max_misses_of_an_unreachable_target() {
+        let difficulty = difficulty();
+        let result = performance_max_misses(&Performance::default(), &difficulty, 1e9, OsuScoreOrigin::Stable);
+
+        assert!(!result.reachable);
+        assert_eq!(result.misses, 0);
+        assert!(result.pp < 1e9);
+    }
+}
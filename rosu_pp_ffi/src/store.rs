@@ -0,0 +1,856 @@
+use std::{
+    collections::{hash_map::RandomState, HashMap},
+    ffi::OsString,
+    fs::{File, OpenOptions},
+    hash::BuildHasher,
+    io::{self, BufWriter, Write},
+    mem::{offset_of, size_of, MaybeUninit},
+    path::{Path, PathBuf},
+};
+
+use crate::*;
+use attributes::DifficultyAttributes;
+use fruit::attributes::CatchDifficultyAttributes;
+use mania::attributes::ManiaDifficultyAttributes;
+use mode::Mode;
+use osu::attributes::OsuDifficultyAttributes;
+use taiko::attributes::TaikoDifficultyAttributes;
+use interoptopus::{
+    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
+    patterns::string::AsciiPointer,
+};
+use memmap2::Mmap;
+
+const MAGIC: [u8; 8] = *b"RPPATTRS";
+const INDEX_MAGIC: [u8; 8] = *b"RPPINDEX";
+const VERSION: u32 = 1;
+/// Written in native byte order so stores from a machine with a different
+/// endianness are rejected instead of misread.
+const BYTE_ORDER: u32 = 0x0102_0304;
+/// Least amount of unindexed records before a writable store rewrites its
+/// index on refresh, see [`AttributeStore::write_index`].
+const INDEX_TAIL: usize = 4096;
+
+/// Leading bytes of every store file, padded so records stay 8 byte aligned.
+#[repr(C)]
+#[derive(Clone, Copy)]
+struct Header {
+    magic: [u8; 8],
+    version: u32,
+    byte_order: u32,
+    record_size: u32,
+    key_size: u32,
+    /// Random per store, ties an index file to the store it was written for.
+    id: u64,
+    reserved: [u8; 32],
+}
+
+const HEADER_SIZE: usize = size_of::<Header>();
+const RECORD_SIZE: usize = size_of::<Record>();
+
+impl Header {
+    fn current() -> Self {
+        Self {
+            magic: MAGIC,
+            version: VERSION,
+            byte_order: BYTE_ORDER,
+            record_size: RECORD_SIZE as u32,
+            key_size: size_of::<StoreKey>() as u32,
+            id: 0,
+            reserved: [0; 32],
+        }
+    }
+
+    fn matches(&self, other: &Self) -> bool {
+        self.magic == other.magic
+            && self.version == other.version
+            && self.byte_order == other.byte_order
+            && self.record_size == other.record_size
+            && self.key_size == other.key_size
+    }
+}
+
+/// Leading bytes of an index file, followed by `entries` [`IndexEntry`]s
+/// sorted by key.
+#[repr(C)]
+#[derive(Clone, Copy)]
+struct IndexHeader {
+    magic: [u8; 8],
+    version: u32,
+    byte_order: u32,
+    entry_size: u32,
+    reserved: u32,
+    /// [`Header::id`] of the store.
+    store: u64,
+    /// Amount of store records covered by the index.
+    records: u64,
+    entries: u64,
+}
+
+/// Latest record of a key within the records covered by an index.
+#[repr(C)]
+#[derive(Clone, Copy)]
+struct IndexEntry {
+    key: StoreKey,
+    record: u64,
+}
+
+const INDEX_HEADER_SIZE: usize = size_of::<IndexHeader>();
+const ENTRY_SIZE: usize = size_of::<IndexEntry>();
+
+/// What a record is looked up by.
+#[repr(C)]
+#[derive(Clone, Copy, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
+struct StoreKey {
+    beatmap: u64,
+    clock_rate: u64,
+    mods: u32,
+    lazer: u32,
+}
+
+impl StoreKey {
+    fn new(beatmap: u64, mods: u32, clock_rate: f64, lazer: bool) -> Self {
+        Self {
+            beatmap,
+            // `-0.0` and `0.0` should not be two different keys.
+            clock_rate: (clock_rate + 0.0).to_bits(),
+            mods,
+            lazer: lazer as u32,
+        }
+    }
+}
+
+/// Fixed size entry of the store, the attributes are stored in their FFI layout.
+#[repr(C)]
+struct Record {
+    key: StoreKey,
+    attributes: DifficultyAttributes,
+}
+
+const _: () = assert!(HEADER_SIZE % 8 == 0 && RECORD_SIZE % 8 == 0);
+const _: () = assert!(INDEX_HEADER_SIZE % 8 == 0 && ENTRY_SIZE % 8 == 0);
+const _: () = assert!(size_of::<Mode>() == size_of::<u32>());
+
+/// Offset of the attributes within a record.
+const ATTRIBUTES: usize = offset_of!(Record, attributes);
+
+/// Per mode in [`Mode`] order: offset of its `FFIOption` in the attributes,
+/// size of the wrapped attributes and offset of their `bool`, if any.
+///
+/// An `FFIOption` is the value followed by a `u8` tag, so the tag is at
+/// offset plus size.
+const OPTIONS: [(usize, usize, Option<usize>); 4] = [
+    (
+        offset_of!(DifficultyAttributes, osu),
+        size_of::<OsuDifficultyAttributes>(),
+        None,
+    ),
+    (
+        offset_of!(DifficultyAttributes, taiko),
+        size_of::<TaikoDifficultyAttributes>(),
+        Some(offset_of!(TaikoDifficultyAttributes, is_convert)),
+    ),
+    (
+        offset_of!(DifficultyAttributes, fruit),
+        size_of::<CatchDifficultyAttributes>(),
+        Some(offset_of!(CatchDifficultyAttributes, is_convert)),
+    ),
+    (
+        offset_of!(DifficultyAttributes, mania),
+        size_of::<ManiaDifficultyAttributes>(),
+        Some(offset_of!(ManiaDifficultyAttributes, is_convert)),
+    ),
+];
+
+/// Append-only file of [`DifficultyAttributes`] that is read through a
+/// shared memory mapping.
+///
+/// Records are keyed by beatmap hash, legacy mod bits, clock rate and whether
+/// the attributes are for lazer. The beatmap hash is chosen by the caller,
+/// e.g. a beatmap id or part of the beatmap's MD5, and must be stable across
+/// processes. Inserting a key again shadows the previous record.
+///
+/// Next to the store at `<path>.index` lies a table of keys sorted for
+/// binary search, which is looked up through its own mapping. Opening a
+/// store only reads the records appended after the index was written, see
+/// [`AttributeStore::write_index`].
+///
+/// Any number of processes can map the same store. Records appended by
+/// [`AttributeStore::insert`], whether from this or another process, become
+/// visible after [`AttributeStore::refresh`]. Writers must not run
+/// concurrently on the same file.
+///
+/// Every record is validated before it is returned, so a damaged store or
+/// index can only make keys go missing, never expose invalid attributes.
+#[ffi_type(opaque)]
+pub struct AttributeStore {
+    pub file: File,
+    pub index_path: PathBuf,
+    pub writable: bool,
+    /// Random id from the store's header.
+    pub id: u64,
+    /// Mapping of the file as of the last refresh.
+    pub map: Mmap,
+    /// Mappings replaced by refreshes, kept until the store is destroyed so
+    /// pointers returned by [`AttributeStore::get`] stay valid.
+    pub retired: Vec<Mmap>,
+    /// Mapping of the index file, if there is a valid one.
+    pub index: Option<Mmap>,
+    /// Amount of records covered by the index.
+    pub indexed: usize,
+    /// Latest record of every key in the records after the index, these
+    /// shadow the index.
+    tail: HashMap<StoreKey, usize>,
+    /// Amount of distinct keys.
+    pub keys: usize,
+    /// Amount of records covered by the current mapping.
+    pub records: usize,
+}
+
+#[ffi_service(error = "FFIError", prefix = "attribute_store_")]
+impl AttributeStore {
+    /// Open the store at `path` for reading and appending, creating it if it doesn't exist.
+    #[ffi_service_ctor]
+    pub fn open(path: AsciiPointer) -> Result<Self, Error> {
+        let path = Path::new(path.as_str()?);
+
+        loop {
+            match OpenOptions::new().read(true).append(true).open(path) {
+                Ok(file) => return Self::from_file(file, path, true),
+                Err(e) if e.kind() == io::ErrorKind::NotFound => {}
+                Err(e) => return Err(e.into()),
+            }
+
+            // Only the process that creates the file writes the header.
+            match OpenOptions::new().read(true).append(true).create_new(true).open(path) {
+                Ok(file) => {
+                    let header = Header {
+                        id: RandomState::new().hash_one((std::process::id(), std::time::SystemTime::now())),
+                        ..Header::current()
+                    };
+
+                    (&file).write_all(header_bytes(&header))?;
+
+                    return Self::from_file(file, path, true);
+                }
+                // Created by another process in the meantime, open that one.
+                Err(e) if e.kind() == io::ErrorKind::AlreadyExists => {}
+                Err(e) => return Err(e.into()),
+            }
+        }
+    }
+
+    /// Open an existing store at `path` for reading only.
+    #[ffi_service_ctor]
+    pub fn open_read_only(path: AsciiPointer) -> Result<Self, Error> {
+        let path = Path::new(path.as_str()?);
+        let file = File::open(path)?;
+
+        Self::from_file(file, path, false)
+    }
+
+    /// Look up the attributes of a key.
+    ///
+    /// Returns a pointer into the mapped file or null if the key is unknown.
+    /// The pointer stays valid until the store is destroyed.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn get(&self, beatmap: u64, mods: u32, clock_rate: f64, lazer: bool) -> *const DifficultyAttributes {
+        let key = StoreKey::new(beatmap, mods, clock_rate, lazer);
+
+        match self.find(&key) {
+            Some(i) => &self.record(i).attributes,
+            None => std::ptr::null(),
+        }
+    }
+
+    /// Append the attributes of a key to the file.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn insert(
+        &mut self,
+        beatmap: u64,
+        mods: u32,
+        clock_rate: f64,
+        lazer: bool,
+        attributes: &DifficultyAttributes,
+    ) -> Result<(), Error> {
+        if !self.writable {
+            return Err(io::Error::from(io::ErrorKind::PermissionDenied).into());
+        }
+
+        let mut record = MaybeUninit::<Record>::zeroed();
+        let ptr = record.as_mut_ptr();
+
+        // Write the fields separately so the padding keeps its zeroes.
+        unsafe {
+            std::ptr::addr_of_mut!((*ptr).key).write(StoreKey::new(beatmap, mods, clock_rate, lazer));
+            std::ptr::addr_of_mut!((*ptr).attributes).write(attributes.clone());
+        }
+
+        // A single write with `O_APPEND` so readers never see a torn record
+        // in the middle of the file, only possibly a partial one at its end.
+        let bytes = unsafe { std::slice::from_raw_parts(ptr.cast::<u8>(), RECORD_SIZE) };
+        (&self.file).write_all(bytes)?;
+
+        Ok(())
+    }
+
+    /// Map records appended since the last refresh and look up their keys.
+    ///
+    /// If there are any, the file is mapped anew. The previous mapping is
+    /// kept until the store is destroyed, so pointers returned by
+    /// [`AttributeStore::get`] stay valid. A writable store also rewrites
+    /// the index once enough records were appended after it.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn refresh(&mut self) -> Result<(), Error> {
+        let map = unsafe { Mmap::map(&self.file)? };
+        let records = record_count(&map);
+
+        if records < self.records {
+            return Err(io::Error::new(io::ErrorKind::InvalidData, "attribute store was truncated").into());
+        }
+
+        if records == self.records {
+            return Ok(());
+        }
+
+        check_header(&map)?;
+        self.retired.push(std::mem::replace(&mut self.map, map));
+        self.index_records(records);
+        self.write_index_if_behind()
+    }
+
+    /// Write the sorted key table of all records mapped so far to
+    /// `<path>.index`, so opening the store doesn't need to read them.
+    ///
+    /// The table is written to a temporary file first and then renamed, so
+    /// other processes read either the old or the new index. Fails for
+    /// read-only stores.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn write_index(&mut self) -> Result<(), Error> {
+        if !self.writable {
+            return Err(io::Error::from(io::ErrorKind::PermissionDenied).into());
+        }
+
+        let mut entries: Vec<IndexEntry> = self
+            .entries()
+            .iter()
+            .filter(|entry| !self.tail.contains_key(&entry.key))
+            .copied()
+            .chain(self.tail.iter().map(|(&key, &i)| IndexEntry { key, record: i as u64 }))
+            .collect();
+
+        entries.sort_unstable_by_key(|entry| entry.key);
+
+        let header = IndexHeader {
+            store: self.id,
+            records: self.records as u64,
+            entries: entries.len() as u64,
+            ..IndexHeader::current()
+        };
+
+        let mut temp = self.index_path.clone().into_os_string();
+        temp.push(".tmp");
+
+        let file = OpenOptions::new().read(true).write(true).create(true).truncate(true).open(&temp)?;
+        let mut writer = BufWriter::new(&file);
+        writer.write_all(index_header_bytes(&header))?;
+
+        for entry in &entries {
+            writer.write_all(entry_bytes(entry))?;
+        }
+
+        writer.flush()?;
+        drop(writer);
+
+        let map = unsafe { Mmap::map(&file)? };
+        std::fs::rename(&temp, &self.index_path)?;
+
+        self.index = Some(map);
+        self.indexed = self.records;
+        self.keys = entries.len();
+        self.tail.clear();
+
+        Ok(())
+    }
+
+    /// Amount of distinct keys.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        self.keys as u32
+    }
+}
+
+impl AttributeStore {
+    fn from_file(file: File, path: &Path, writable: bool) -> Result<Self, Error> {
+        let map = unsafe { Mmap::map(&file)? };
+        let header = check_header(&map)?;
+        let records = record_count(&map);
+
+        let mut index_path = OsString::from(path);
+        index_path.push(".index");
+        let index_path = PathBuf::from(index_path);
+
+        let (index, indexed) = match load_index(&index_path, header.id, records) {
+            Some((index, indexed)) => (Some(index), indexed),
+            None => (None, 0),
+        };
+
+        let mut store = Self {
+            file,
+            index_path,
+            writable,
+            id: header.id,
+            map,
+            retired: Vec::new(),
+            index,
+            indexed,
+            tail: HashMap::new(),
+            keys: 0,
+            records: indexed,
+        };
+
+        store.keys = store.entries().len();
+        store.index_records(records);
+        store.write_index_if_behind()?;
+
+        Ok(store)
+    }
+
+    /// Look up the keys of the valid records from `self.records` up to `records`.
+    fn index_records(&mut self, records: usize) {
+        for i in self.records..records {
+            if let Some(key) = self.valid_key(i) {
+                if self.tail.insert(key, i).is_none() && self.find_indexed(&key).is_none() {
+                    self.keys += 1;
+                }
+            }
+        }
+
+        self.records = records;
+    }
+
+    /// Rewrite the index of a writable store once the records after it
+    /// reach an eighth of the records in it, so rewrites stay amortized.
+    fn write_index_if_behind(&mut self) -> Result<(), Error> {
+        if self.writable && self.records - self.indexed >= INDEX_TAIL.max(self.indexed / 8) {
+            self.write_index()?;
+        }
+
+        Ok(())
+    }
+
+    /// Sorted entries of the index, empty without one.
+    fn entries(&self) -> &[IndexEntry] {
+        let Some(index) = &self.index else {
+            return &[];
+        };
+
+        let len = (index.len() - INDEX_HEADER_SIZE) / ENTRY_SIZE;
+
+        // Mappings are page aligned and the header and entries are multiples
+        // of 8 bytes. Every bit pattern is a valid entry.
+        unsafe { std::slice::from_raw_parts(index.as_ptr().add(INDEX_HEADER_SIZE).cast::<IndexEntry>(), len) }
+    }
+
+    /// Record of `key` according to the index, not validated.
+    fn find_indexed(&self, key: &StoreKey) -> Option<usize> {
+        let entries = self.entries();
+        let i = entries.binary_search_by(|entry| entry.key.cmp(key)).ok()?;
+
+        Some(entries[i].record as usize)
+    }
+
+    /// Latest valid record of `key`.
+    fn find(&self, key: &StoreKey) -> Option<usize> {
+        if let Some(&i) = self.tail.get(key) {
+            return Some(i);
+        }
+
+        // The index is only trusted as far as the record it points to is
+        // valid and has the same key.
+        self.find_indexed(key)
+            .filter(|&i| i < self.indexed && self.valid_key(i) == Some(*key))
+    }
+
+    fn record(&self, i: usize) -> &Record {
+        // Mappings are page aligned and header and records are multiples of 8
+        // bytes, so every record is properly aligned. Only found records are
+        // read, which are in bounds and were validated by `valid_key`.
+        unsafe { &*self.map.as_ptr().add(HEADER_SIZE + i * RECORD_SIZE).cast::<Record>() }
+    }
+
+    /// Key of the `i`th record, or `None` if it can't be read as a [`Record`],
+    /// e.g. because the file was damaged.
+    ///
+    /// Every byte that doesn't allow all values, i.e. the mode, the tags of
+    /// the options and the `bool`s, is checked, and the option of the
+    /// record's mode must hold a value.
+    fn valid_key(&self, i: usize) -> Option<StoreKey> {
+        let start = HEADER_SIZE + i * RECORD_SIZE;
+        let record = self.map.get(start..start + RECORD_SIZE)?;
+        let attributes = &record[ATTRIBUTES..];
+        let mode = offset_of!(DifficultyAttributes, mode);
+        let mode = u32::from_ne_bytes(attributes[mode..mode + 4].try_into().unwrap());
+
+        if mode > Mode::Mania as u32 {
+            return None;
+        }
+
+        for (option, &(offset, size, flag)) in OPTIONS.iter().enumerate() {
+            let is_some = attributes[offset + size];
+            let flag = flag.map_or(0, |flag| attributes[offset + flag]);
+
+            if is_some > 1 || flag > 1 || (option as u32 == mode && is_some == 0) {
+                return None;
+            }
+        }
+
+        let key = unsafe { record.as_ptr().cast::<StoreKey>().read_unaligned() };
+
+        (key.lazer <= 1).then_some(key)
+    }
+}
+
+impl IndexHeader {
+    fn current() -> Self {
+        Self {
+            magic: INDEX_MAGIC,
+            version: VERSION,
+            byte_order: BYTE_ORDER,
+            entry_size: ENTRY_SIZE as u32,
+            reserved: 0,
+            store: 0,
+            records: 0,
+            entries: 0,
+        }
+    }
+}
+
+/// Map the index at `path` and return it with the amount of records it
+/// covers, or `None` if there is none or it doesn't belong to the store
+/// with id `store` and `records` records.
+fn load_index(path: &Path, store: u64, records: usize) -> Option<(Mmap, usize)> {
+    let file = File::open(path).ok()?;
+    let map = unsafe { Mmap::map(&file).ok()? };
+
+    if map.len() < INDEX_HEADER_SIZE {
+        return None;
+    }
+
+    let header = unsafe { map.as_ptr().cast::<IndexHeader>().read_unaligned() };
+    let current = IndexHeader::current();
+
+    let valid = header.magic == current.magic
+        && header.version == current.version
+        && header.byte_order == current.byte_order
+        && header.entry_size == current.entry_size
+        && header.store == store
+        && header.records <= records as u64
+        && header
+            .entries
+            .checked_mul(ENTRY_SIZE as u64)
+            .and_then(|len| len.checked_add(INDEX_HEADER_SIZE as u64))
+            == Some(map.len() as u64);
+
+    valid.then_some((map, header.records as usize))
+}
+
+/// Amount of complete records in `map`.
+fn record_count(map: &[u8]) -> usize {
+    map.len().saturating_sub(HEADER_SIZE) / RECORD_SIZE
+}
+
+fn check_header(map: &[u8]) -> Result<Header, Error> {
+    if map.len() < HEADER_SIZE {
+        return Err(io::Error::from(io::ErrorKind::UnexpectedEof).into());
+    }
+
+    let header = unsafe { map.as_ptr().cast::<Header>().read_unaligned() };
+
+    if !header.matches(&Header::current()) {
+        return Err(io::Error::new(io::ErrorKind::InvalidData, "incompatible attribute store").into());
+    }
+
+    Ok(header)
+}
+
+fn header_bytes(header: &Header) -> &[u8] {
+    unsafe { std::slice::from_raw_parts((header as *const Header).cast::<u8>(), HEADER_SIZE) }
+}
+
+fn index_header_bytes(header: &IndexHeader) -> &[u8] {
+    unsafe { std::slice::from_raw_parts((header as *const IndexHeader).cast::<u8>(), INDEX_HEADER_SIZE) }
+}
+
+fn entry_bytes(entry: &IndexEntry) -> &[u8] {
+    unsafe { std::slice::from_raw_parts((entry as *const IndexEntry).cast::<u8>(), ENTRY_SIZE) }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::ffi::CString;
+
+    use interoptopus::patterns::option::FFIOption;
+
+    use super::*;
+
+    /// Fresh path in the temp directory, removed again with its index on drop.
+    struct TempPath(PathBuf);
+
+    impl TempPath {
+        fn new(name: &str) -> Self {
+            let path = std::env::temp_dir().join(format!("rosu_pp_ffi_store_{}_{name}", std::process::id()));
+            let temp = Self(path);
+            temp.remove();
+
+            temp
+        }
+
+        fn index(&self) -> PathBuf {
+            PathBuf::from(format!("{}.index", self.0.display()))
+        }
+
+        fn c_path(&self) -> CString {
+            CString::new(self.0.to_str().unwrap()).unwrap()
+        }
+
+        fn open(&self) -> Result<AttributeStore, Error> {
+            AttributeStore::open(AsciiPointer::from_cstr(&self.c_path()))
+        }
+
+        fn open_read_only(&self) -> Result<AttributeStore, Error> {
+            AttributeStore::open_read_only(AsciiPointer::from_cstr(&self.c_path()))
+        }
+
+        fn remove(&self) {
+            let _ = std::fs::remove_file(&self.0);
+            let _ = std::fs::remove_file(self.index());
+        }
+    }
+
+    impl Drop for TempPath {
+        fn drop(&mut self) {
+            self.remove();
+        }
+    }
+    fn taiko(stars: f64) -> DifficultyAttributes {
+        DifficultyAttributes {
+            taiko: FFIOption::some(TaikoDifficultyAttributes {
+                stars,
+                max_combo: 500,
+                is_convert: true,
+                ..Default::default()
+            }),
+            mode: Mode::Taiko,
+            ..Default::default()
+        }
+    }
+
+    fn stars(store: &AttributeStore, beatmap: u64, mods: u32, clock_rate: f64, lazer: bool) -> Option<f64> {
+        let attributes = unsafe { store.get(beatmap, mods, clock_rate, lazer).as_ref()? };
+        assert_eq!(attributes.mode, Mode::Taiko);
+
+        attributes.taiko.as_ref().map(|taiko| taiko.stars)
+    }
+
+    #[test]
+    fn round_trip() {
+        let path = TempPath::new("round_trip");
+        let mut store = path.open().unwrap();
+
+        store.insert(1, 64, 1.5, true, &taiko(3.0)).unwrap();
+        store.insert(1, 64, 1.5, false, &taiko(4.0)).unwrap();
+        assert_eq!(store.len(), 0, "inserts are only visible after a refresh");
+
+        store.refresh().unwrap();
+        assert_eq!(store.len(), 2);
+        assert_eq!(stars(&store, 1, 64, 1.5, true), Some(3.0));
+        assert_eq!(stars(&store, 1, 64, 1.5, false), Some(4.0));
+        assert_eq!(stars(&store, 1, 0, 1.5, true), None);
+
+        // Shadows the first record.
+        store.insert(1, 64, 1.5, true, &taiko(5.0)).unwrap();
+        drop(store);
+
+        let store = path.open().unwrap();
+        assert_eq!(store.len(), 2);
+        assert_eq!(stars(&store, 1, 64, 1.5, true), Some(5.0));
+
+        let mut store = path.open_read_only().unwrap();
+        assert_eq!(stars(&store, 1, 64, 1.5, false), Some(4.0));
+        assert!(store.insert(2, 0, 1.0, false, &taiko(1.0)).is_err());
+        assert!(store.write_index().is_err());
+    }
+
+    #[test]
+    fn creates_the_file_once() {
+        let path = TempPath::new("create");
+        let mut store = path.open().unwrap();
+        store.insert(1, 0, 1.0, false, &taiko(2.0)).unwrap();
+
+        let other = path.open().unwrap();
+        assert_eq!(other.id, store.id);
+        assert_eq!(stars(&other, 1, 0, 1.0, false), Some(2.0));
+        assert_eq!(std::fs::metadata(&path.0).unwrap().len() as usize, HEADER_SIZE + RECORD_SIZE);
+    }
+
+    #[test]
+    fn opens_from_the_index() {
+        let path = TempPath::new("index");
+        let mut store = path.open().unwrap();
+
+        for beatmap in 1..=3 {
+            store.insert(beatmap, 0, 1.0, false, &taiko(beatmap as f64)).unwrap();
+        }
+
+        store.refresh().unwrap();
+        store.write_index().unwrap();
+
+        // Shadows an indexed key and adds a new one after the index.
+        store.insert(2, 0, 1.0, false, &taiko(20.0)).unwrap();
+        store.insert(4, 0, 1.0, false, &taiko(4.0)).unwrap();
+        drop(store);
+
+        for store in [path.open().unwrap(), path.open_read_only().unwrap()] {
+            assert_eq!(store.indexed, 3);
+            assert_eq!(store.records, 5);
+            assert_eq!(store.tail.len(), 2);
+            assert_eq!(store.len(), 4);
+            assert_eq!(stars(&store, 1, 0, 1.0, false), Some(1.0));
+            assert_eq!(stars(&store, 2, 0, 1.0, false), Some(20.0));
+            assert_eq!(stars(&store, 3, 0, 1.0, false), Some(3.0));
+            assert_eq!(stars(&store, 4, 0, 1.0, false), Some(4.0));
+            assert_eq!(stars(&store, 5, 0, 1.0, false), None);
+        }
+
+        let mut store = path.open().unwrap();
+        store.write_index().unwrap();
+        assert_eq!((store.indexed, store.tail.len(), store.len()), (5, 0, 4));
+        assert_eq!(stars(&store, 2, 0, 1.0, false), Some(20.0));
+    }
+
+    #[test]
+    fn rewrites_the_index_when_behind() {
+        let path = TempPath::new("rewrite");
+        let mut store = path.open().unwrap();
+
+        for beatmap in 0..INDEX_TAIL as u64 {
+            store.insert(beatmap, 0, 1.0, false, &taiko(1.0)).unwrap();
+        }
+
+        store.refresh().unwrap();
+        assert_eq!(store.indexed, INDEX_TAIL);
+        assert!(store.tail.is_empty());
+        assert!(path.index().exists());
+        assert_eq!(path.open_read_only().unwrap().indexed, INDEX_TAIL);
+    }
+
+    #[test]
+    fn ignores_foreign_or_damaged_indexes() {
+        let path = TempPath::new("foreign_index");
+        let mut store = path.open().unwrap();
+
+        for beatmap in 1..=2 {
+            store.insert(beatmap, 0, 1.0, false, &taiko(beatmap as f64)).unwrap();
+        }
+
+        store.refresh().unwrap();
+        store.write_index().unwrap();
+        drop(store);
+
+        // Entries pointing at each other's records are only misses.
+        let mut index = std::fs::read(path.index()).unwrap();
+        let record = |i: usize| INDEX_HEADER_SIZE + i * ENTRY_SIZE + offset_of!(IndexEntry, record);
+        index[record(0)..record(0) + 8].copy_from_slice(&1_u64.to_ne_bytes());
+        index[record(1)..record(1) + 8].copy_from_slice(&0_u64.to_ne_bytes());
+        std::fs::write(path.index(), &index).unwrap();
+
+        let store = path.open_read_only().unwrap();
+        assert_eq!(store.indexed, 2);
+        assert_eq!(stars(&store, 1, 0, 1.0, false), None);
+        assert_eq!(stars(&store, 2, 0, 1.0, false), None);
+
+        // A new store at the same path has another id.
+        std::fs::remove_file(&path.0).unwrap();
+        let mut store = path.open().unwrap();
+        store.insert(1, 0, 1.0, false, &taiko(10.0)).unwrap();
+        store.insert(3, 0, 1.0, false, &taiko(30.0)).unwrap();
+        drop(store);
+
+        let store = path.open().unwrap();
+        assert!(store.index.is_none());
+        assert_eq!(store.len(), 2);
+        assert_eq!(stars(&store, 1, 0, 1.0, false), Some(10.0));
+        assert_eq!(stars(&store, 2, 0, 1.0, false), None);
+    }
+
+    #[test]
+    fn pointers_outlive_refreshes() {
+        let path = TempPath::new("pointers");
+        let mut store = path.open().unwrap();
+
+        store.insert(1, 0, 1.0, false, &taiko(3.0)).unwrap();
+        store.refresh().unwrap();
+        let attributes = store.get(1, 0, 1.0, false);
+        let retired = store.retired.len();
+
+        store.insert(2, 0, 1.0, false, &taiko(4.0)).unwrap();
+        store.refresh().unwrap();
+        assert_eq!(store.retired.len(), retired + 1);
+
+        let attributes = unsafe { attributes.as_ref().unwrap() };
+        assert_eq!(attributes.taiko.as_ref().map(|taiko| taiko.stars), Some(3.0));
+    }
+
+    #[test]
+    fn negative_zero_clock_rate() {
+        let path = TempPath::new("negative_zero");
+        let mut store = path.open().unwrap();
+
+        store.insert(7, 0, 0.0, false, &taiko(1.0)).unwrap();
+        store.refresh().unwrap();
+        assert_eq!(stars(&store, 7, 0, -0.0, false), Some(1.0));
+    }
+
+    #[test]
+    fn skips_damaged_records() {
+        let path = TempPath::new("damaged");
+        let mut store = path.open().unwrap();
+
+        for beatmap in 1..=4 {
+            store.insert(beatmap, 0, 1.0, false, &taiko(beatmap as f64)).unwrap();
+        }
+
+        drop(store);
+
+        let mut bytes = std::fs::read(&path.0).unwrap();
+        let record = |i: usize| HEADER_SIZE + i * RECORD_SIZE + ATTRIBUTES;
+        let (offset, size, is_convert) = OPTIONS[Mode::Taiko as usize];
+        let mode = offset_of!(DifficultyAttributes, mode);
+
+        // Invalid bool, option of the mode without a value, invalid mode and
+        // a record cut short.
+        bytes[record(0) + offset + is_convert.unwrap()] = 2;
+        bytes[record(1) + offset + size] = 0;
+        bytes[record(2) + mode..record(2) + mode + 4].copy_from_slice(&7_u32.to_ne_bytes());
+        bytes.truncate(bytes.len() - 1);
+        std::fs::write(&path.0, bytes).unwrap();
+
+        let store = path.open().unwrap();
+        assert_eq!(store.records, 3);
+        assert_eq!(store.len(), 0);
+    }
+
+    #[test]
+    fn rejects_foreign_files() {
+        let path = TempPath::new("foreign");
+
+        std::fs::write(&path.0, b"RPPATTRS").unwrap();
+        assert!(path.open().is_err());
+
+        let mut header = Header::current();
+        header.version += 1;
+        std::fs::write(&path.0, header_bytes(&header)).unwrap();
+        assert!(path.open().is_err());
+    }
+}
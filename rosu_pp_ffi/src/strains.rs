@@ -0,0 +1,232 @@
+use crate::*;
+use beatmap::Beatmap;
+use difficulty::Difficulty;
+use interoptopus::{
+    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
+    patterns::slice::FFISliceMut,
+};
+use rosu_pp::any::Strains;
+
+/// A strain skill of any mode.
+#[ffi_type]
+#[repr(C)]
+#[derive(Copy, Clone, Debug, Hash, PartialEq, Eq, Default)]
+pub enum Skill {
+    /// osu!standard
+    #[default]
+    Aim = 0,
+    /// osu!standard
+    JumpAim = 1,
+    /// osu!standard
+    FlowAim = 2,
+    /// osu!standard
+    Precision = 3,
+    /// osu!standard
+    Speed = 4,
+    /// osu!standard and osu!taiko
+    Stamina = 5,
+    /// osu!taiko
+    Color = 6,
+    /// osu!taiko
+    Rhythm = 7,
+    /// osu!catch
+    Movement = 8,
+    /// osu!mania
+    Strain = 9,
+}
+
+/// A stretch of consecutive strain sections, see [`StrainTimeline::hardest_windows`].
+#[ffi_type]
+#[repr(C)]
+#[derive(Clone, Copy, Debug, Default)]
+pub struct StrainWindow {
+    /// Index of the first section.
+    pub section: u32,
+    /// Start of the first section in milliseconds of map time.
+    pub start_time: f64,
+    /// End of the last section in milliseconds of map time.
+    pub end_time: f64,
+    /// Mean strain peak of the sections.
+    pub strain: f64,
+}
+
+/// Strain peaks of every skill per section of a map.
+///
+/// Every skill has one peak per section. Sections are
+/// [`StrainTimeline::section_len`] milliseconds long after applying the clock
+/// rate; start times are reported in map time so they line up with hit
+/// objects.
+#[ffi_type(opaque)]
+pub struct StrainTimeline {
+    pub skills: Vec<(Skill, Vec<f64>)>,
+    /// Section length in map time.
+    pub section_len: f64,
+    /// Start of the first section in map time.
+    pub start_time: f64,
+}
+
+#[ffi_service(error = "FFIError", prefix = "strain_timeline_")]
+impl StrainTimeline {
+    #[ffi_service_ctor]
+    pub fn new(difficulty: &Difficulty, beatmap: &Beatmap) -> Result<Self, Error> {
+        let clock_rate = difficulty.clock_rate.unwrap_or_else(|| difficulty.get_clock_rate());
+        let strains = difficulty.construct().strains(&beatmap.inner);
+        let section_len = strains.section_len();
+
+        // Difficulty objects start at the second hit object; the first
+        // section ends on the first multiple of the section length after it.
+        let first = beatmap.inner.hit_objects.get(1).map_or(0.0, |h| h.start_time / clock_rate);
+        let first_end = (first / section_len).ceil() * section_len;
+
+        Ok(Self {
+            skills: skills(strains),
+            section_len: section_len * clock_rate,
+            start_time: (first_end - section_len) * clock_rate,
+        })
+    }
+
+    /// Amount of sections.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        self.skills.first().map_or(0, |(_, peaks)| peaks.len() as u32)
+    }
+
+    /// Length of a section in milliseconds of map time.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn section_len(&self) -> f64 {
+        self.section_len
+    }
+
+    /// Whether the map's mode has the skill.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn has(&self, skill: Skill) -> bool {
+        self.peaks(skill).is_some()
+    }
+
+    /// Write the start time of every section, `out` must hold
+    /// [`StrainTimeline::len`] elements.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn start_times(&self, out: FFISliceMut<f64>) -> Result<(), Error> {
+        let mut out = out;
+        let out = out.as_slice_mut();
+
+        if out.len() != self.len() as usize {
+            return Err(Error::InvalidLength);
+        }
+
+        for (i, slot) in out.iter_mut().enumerate() {
+            *slot = self.section_start(i);
+        }
+
+        Ok(())
+    }
+
+    /// Write the peaks of a skill, `out` must hold [`StrainTimeline::len`]
+    /// elements. Fails with [`FFIError::Null`] if the mode has no such skill.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn peaks_of(&self, skill: Skill, out: FFISliceMut<f64>) -> Result<(), Error> {
+        let mut out = out;
+        let out = out.as_slice_mut();
+        let peaks = self.peaks(skill).ok_or(Error::Null)?;
+
+        if out.len() != peaks.len() {
+            return Err(Error::InvalidLength);
+        }
+
+        out.copy_from_slice(peaks);
+
+        Ok(())
+    }
+
+    /// Find the hardest non-overlapping windows of `window` consecutive
+    /// sections for a skill, hardest first.
+    ///
+    /// Writes up to `out.len()` windows and returns how many were written.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn hardest_windows(&self, skill: Skill, window: u32, out: FFISliceMut<StrainWindow>) -> u32 {
+        let mut out = out;
+        let out = out.as_slice_mut();
+
+        let Some(peaks) = self.peaks(skill) else {
+            return 0;
+        };
+
+        let window = window.max(1) as usize;
+
+        if peaks.len() < window || out.is_empty() {
+            return 0;
+        }
+
+        // Sum of every window, by its first section.
+        let mut sums = Vec::with_capacity(peaks.len() - window + 1);
+        let mut sum: f64 = peaks[..window].iter().sum();
+        sums.push(sum);
+
+        for i in window..peaks.len() {
+            sum += peaks[i] - peaks[i - window];
+            sums.push(sum);
+        }
+
+        let mut order: Vec<usize> = (0..sums.len()).collect();
+        order.sort_by(|&a, &b| sums[b].total_cmp(&sums[a]).then(a.cmp(&b)));
+
+        let mut taken = vec![false; peaks.len()];
+        let mut written = 0;
+
+        for start in order {
+            if written == out.len() {
+                break;
+            }
+
+            if taken[start..start + window].iter().any(|&taken| taken) {
+                continue;
+            }
+
+            taken[start..start + window].fill(true);
+
+            out[written] = StrainWindow {
+                section: start as u32,
+                start_time: self.section_start(start),
+                end_time: self.section_start(start + window),
+                strain: sums[start] / window as f64,
+            };
+
+            written += 1;
+        }
+
+        written as u32
+    }
+}
+
+impl StrainTimeline {
+    fn peaks(&self, skill: Skill) -> Option<&[f64]> {
+        self.skills
+            .iter()
+            .find(|(s, _)| *s == skill)
+            .map(|(_, peaks)| peaks.as_slice())
+    }
+
+    fn section_start(&self, section: usize) -> f64 {
+        self.start_time + section as f64 * self.section_len
+    }
+}
+
+fn skills(strains: Strains) -> Vec<(Skill, Vec<f64>)> {
+    match strains {
+        Strains::Osu(strains) => vec![
+            (Skill::Aim, strains.aim),
+            (Skill::JumpAim, strains.jump_aim),
+            (Skill::FlowAim, strains.flow_aim),
+            (Skill::Precision, strains.precision),
+            (Skill::Speed, strains.speed),
+            (Skill::Stamina, strains.stamina),
+        ],
+        Strains::Taiko(strains) => vec![
+            (Skill::Color, strains.color),
+            (Skill::Rhythm, strains.rhythm),
+            (Skill::Stamina, strains.stamina),
+        ],
+        Strains::Catch(strains) => vec![(Skill::Movement, strains.movement)],
+        Strains::Mania(strains) => vec![(Skill::Strain, strains.strains)],
+    }
+}
@@ -0,0 +1,158 @@
+use std::collections::HashMap;
+
+use crate::*;
+use beatmap::{attributes::BeatmapAttributes, Beatmap};
+use difficulty::Difficulty;
+use interoptopus::{
+    ffi_service, ffi_service_ctor, ffi_service_method, ffi_type,
+    patterns::{slice::FFISliceMut, string::AsciiPointer},
+};
+use mods::Mods;
+use rayon::prelude::*;
+use rosu_mods::GameModsIntermode;
+
+/// Calculates one [`Beatmap`] with many mod combinations in a single call.
+///
+/// Every mod set is applied on top of a base [`Difficulty`], so settings
+/// like custom attributes or a passed object count are shared. Mod sets that
+/// end up with identical settings are calculated once and all calculations
+/// go through the difficulty attribute cache.
+#[ffi_type(opaque)]
+pub struct ModSweep {
+    pub base: Difficulty,
+    pub difficulties: Vec<Difficulty>,
+}
+
+#[ffi_service(error = "FFIError", prefix = "mod_sweep_")]
+impl ModSweep {
+    #[ffi_service_ctor]
+    pub fn new(base: &Difficulty) -> Result<Self, Error> {
+        Ok(Self {
+            base: base.clone(),
+            difficulties: Vec::new(),
+        })
+    }
+
+    /// Add a mod set by legacy bits.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn add_bits(&mut self, bits: u32, lazer: bool) {
+        self.push(None, Some(GameModsIntermode::from_bits(bits)), lazer);
+    }
+
+    /// Add a mod set by acronyms, e.g. `"HDDT"`.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn add_acronyms(&mut self, str: AsciiPointer, lazer: bool) -> Result<(), Error> {
+        self.push(None, Some(GameModsIntermode::from_acronyms(str.as_str()?)), lazer);
+        Ok(())
+    }
+
+    /// Add a mod set including the mods' settings.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn add_mods(&mut self, mods: &Mods, lazer: bool) {
+        self.push(Some(mods.mods.clone()), None, lazer);
+    }
+
+    /// Amount of added mod sets.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        self.difficulties.len() as u32
+    }
+
+    /// Calculate `beatmap` with every mod set in the order they were added.
+    ///
+    /// `attributes` must hold [`ModSweep::len`] elements. `beatmap_attributes`
+    /// is either empty or of the same length and then receives the
+    /// [`BeatmapAttributes`] of every mod set, including its hit windows.
+    #[ffi_service_method(on_panic = "ffi_error")]
+    pub fn calculate(
+        &self,
+        beatmap: &Beatmap,
+        attributes: FFISliceMut<attributes::DifficultyAttributes>,
+        beatmap_attributes: FFISliceMut<BeatmapAttributes>,
+    ) -> Result<(), Error> {
+        let mut attributes = attributes;
+        let mut beatmap_attributes = beatmap_attributes;
+        let attributes = attributes.as_slice_mut();
+        let beatmap_attributes = beatmap_attributes.as_slice_mut();
+        let len = self.difficulties.len();
+
+        if attributes.len() != len || !(beatmap_attributes.is_empty() || beatmap_attributes.len() == len) {
+            return Err(Error::InvalidLength);
+        }
+
+        let first = self.first_occurrences(beatmap.hash);
+
+        let calculated: Vec<_> = (0..len)
+            .into_par_iter()
+            .map(|i| (first[i] == i).then(|| self.difficulties[i].calculate_cached(beatmap)))
+            .collect();
+
+        for (slot, &i) in attributes.iter_mut().zip(&first) {
+            *slot = calculated[i].clone().expect("calculated first occurrence").into();
+        }
+
+        for (slot, difficulty) in beatmap_attributes.iter_mut().zip(&self.difficulties) {
+            *slot = difficulty.beatmap_attributes(beatmap).into();
+        }
+
+        Ok(())
+    }
+}
+
+impl ModSweep {
+    /// Index of the first mod set with the same settings for every mod set.
+    fn first_occurrences(&self, hash: u64) -> Vec<usize> {
+        let mut unique = HashMap::with_capacity(self.difficulties.len());
+
+        self.difficulties
+            .iter()
+            .enumerate()
+            .map(|(i, difficulty)| *unique.entry(cache::DifficultyKey::new(hash, difficulty)).or_insert(i))
+            .collect()
+    }
+
+    fn push(&mut self, mods: Option<rosu_mods::GameMods>, mods_intermode: Option<GameModsIntermode>, lazer: bool) {
+        let mut difficulty = self.base.clone();
+        difficulty.mods = mods;
+        difficulty.mods_intermode = mods_intermode;
+        difficulty.lazer = Some(lazer);
+        self.difficulties.push(difficulty);
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::ffi::CString;
+
+    use super::*;
+    use crate::testing;
+
+    fn stars(attrs: &attributes::DifficultyAttributes) -> f64 {
+        rosu_pp::any::DifficultyAttributes::from(attrs.clone()).stars()
+    }
+
+    #[test]
+    fn calculates_equal_mod_sets_once() {
+        let beatmap = testing::beatmap(testing::OSU);
+        let hddt = CString::new("DTHD").unwrap();
+
+        let mut sweep = ModSweep::new(&Difficulty::new().unwrap()).unwrap();
+        sweep.add_bits(8 + 64, false);
+        sweep.add_acronyms(AsciiPointer::from_cstr(&hddt), false).unwrap();
+        sweep.add_bits(64, false);
+        sweep.add_bits(8 + 64, true);
+        sweep.add_bits(64, false);
+
+        assert_eq!(sweep.first_occurrences(beatmap.hash), [0, 0, 2, 3, 2]);
+
+        let mut attributes = vec![attributes::DifficultyAttributes::default(); sweep.len() as usize];
+        sweep
+            .calculate(&beatmap, FFISliceMut::from_slice(&mut attributes), FFISliceMut::from_slice(&mut []))
+            .unwrap();
+
+        for (attrs, difficulty) in attributes.iter().zip(&sweep.difficulties) {
+            let expected = difficulty.construct().calculate(&beatmap.inner).stars();
+            testing::assert_close(stars(attrs), expected);
+        }
+    }
+}
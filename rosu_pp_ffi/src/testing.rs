@@ -0,0 +1,33 @@
+//! Beatmaps shared by the unit tests.
+
+use std::path::PathBuf;
+
+use crate::beatmap::Beatmap;
+
+/// osu!standard, 601 objects.
+pub const OSU: &str = "2785319.osu";
+/// osu!taiko, 295 objects.
+pub const TAIKO: &str = "1028484.osu";
+/// osu!catch, 477 objects.
+pub const CATCH: &str = "2118524.osu";
+/// osu!mania, 594 objects.
+pub const MANIA: &str = "1638954.osu";
+
+/// Every test beatmap, one per mode.
+pub const ALL: [&str; 4] = [OSU, TAIKO, CATCH, MANIA];
+
+pub fn path(name: &str) -> PathBuf {
+    PathBuf::from(env!("CARGO_MANIFEST_DIR")).join("../SharpRosuPP/RosuPP.Tests/resources").join(name)
+}
+
+pub fn bytes(name: &str) -> Vec<u8> {
+    std::fs::read(path(name)).unwrap()
+}
+
+pub fn beatmap(name: &str) -> Beatmap {
+    Beatmap::parse(&bytes(name)).unwrap()
+}
+
+pub fn assert_close(a: f64, b: f64) {
+    assert!((a - b).abs() <= 1e-9 * a.abs().max(1.0), "{a} != {b}");
+}
@@ -0,0 +1,405 @@
+use std::{cmp::Ordering, collections::HashMap};
+
+use crate::*;
+use attributes::PerformanceAttributes;
+use interoptopus::{ffi_service, ffi_service_ctor, ffi_service_method, ffi_type};
+use profile::{bonus_pp, WEIGHT};
+
+const NIL: u32 = u32::MAX;
+
+/// Position of a play in the top list: higher pp first, ties broken by beatmap.
+#[derive(Clone, Copy, Debug)]
+struct Key {
+    pp: f64,
+    beatmap: u64,
+}
+
+impl Key {
+    fn cmp(&self, other: &Key) -> Ordering {
+        other.pp.total_cmp(&self.pp).then(self.beatmap.cmp(&other.beatmap))
+    }
+}
+
+/// Amount and weighted pp of consecutive plays, weighted as if the first of
+/// them was the best play.
+#[derive(Clone, Copy, Debug, Default)]
+struct Part {
+    count: u32,
+    weighted: f64,
+}
+
+impl Part {
+    fn single(pp: f64) -> Self {
+        Self { count: 1, weighted: pp }
+    }
+
+    /// The plays of `self` followed by the plays of `next`.
+    fn then(self, next: Part) -> Part {
+        Part {
+            count: self.count + next.count,
+            weighted: self.weighted + WEIGHT.powi(self.count as i32) * next.weighted,
+        }
+    }
+}
+
+/// Treap node, its [`Part`] covers its whole subtree.
+#[derive(Clone, Copy, Debug)]
+struct Node {
+    key: Key,
+    priority: u64,
+    left: u32,
+    right: u32,
+    part: Part,
+}
+
+/// The best play of a user on every beatmap, sorted by pp.
+///
+/// Plays are kept in a treap whose nodes know the weighted pp of their
+/// subtree, so inserting a play and [`TopPlays::total_after`] take
+/// logarithmic time in the amount of plays. Totals are weighted and include
+/// bonus pp like [`profile::ProfileEngine`], so the pp a new score gains
+/// is `total_after(...) - total()`.
+#[ffi_type(opaque)]
+pub struct TopPlays {
+    nodes: Vec<Node>,
+    /// Indices of removed nodes that can be reused.
+    free: Vec<u32>,
+    root: u32,
+    /// pp of the play on every beatmap.
+    pub plays: HashMap<u64, f64>,
+    seed: u64,
+}
+
+impl Default for TopPlays {
+    fn default() -> Self {
+        Self {
+            nodes: Vec::new(),
+            free: Vec::new(),
+            root: NIL,
+            plays: HashMap::new(),
+            seed: 0,
+        }
+    }
+}
+
+#[ffi_service(error = "FFIError", prefix = "top_plays_")]
+impl TopPlays {
+    #[ffi_service_ctor]
+    pub fn new() -> Result<Self, Error> {
+        Ok(Self::default())
+    }
+
+    /// Add a play on `beatmap`, replacing the current play on it if the new
+    /// one is worth more pp.
+    ///
+    /// Returns whether the top list changed.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn insert(&mut self, beatmap: u64, attributes: &PerformanceAttributes) -> bool {
+        self.insert_pp(beatmap, attributes.pp())
+    }
+
+    /// Same as [`TopPlays::insert`] for a play that is worth `pp`.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn insert_pp(&mut self, beatmap: u64, pp: f64) -> bool {
+        let Some(old) = self.replaces(beatmap, pp) else {
+            return false;
+        };
+
+        if let Some(old) = old {
+            self.remove_key(&Key { pp: old, beatmap });
+        }
+
+        self.insert_key(Key { pp, beatmap });
+        self.plays.insert(beatmap, pp);
+
+        true
+    }
+
+    /// Remove the play on `beatmap`, returns whether there was one.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn remove(&mut self, beatmap: u64) -> bool {
+        let Some(pp) = self.plays.remove(&beatmap) else {
+            return false;
+        };
+
+        self.remove_key(&Key { pp, beatmap });
+
+        true
+    }
+
+    /// Amount of plays, i.e. beatmaps with a play.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn len(&self) -> u32 {
+        self.plays.len() as u32
+    }
+
+    /// Weighted pp of all plays including bonus pp.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn total(&self) -> f64 {
+        self.part(self.root).weighted + bonus_pp(self.len())
+    }
+
+    /// What [`TopPlays::total`] would be after [`TopPlays::insert`] with
+    /// the same arguments, without changing the top list.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn total_after(&self, beatmap: u64, attributes: &PerformanceAttributes) -> f64 {
+        self.total_after_pp(beatmap, attributes.pp())
+    }
+
+    /// Same as [`TopPlays::total_after`] for a play that is worth `pp`.
+    #[ffi_service_method(on_panic = "undefined_behavior")]
+    pub fn total_after_pp(&self, beatmap: u64, pp: f64) -> f64 {
+        let Some(old) = self.replaces(beatmap, pp) else {
+            return self.total();
+        };
+
+        let key = Key { pp, beatmap };
+        let before = self.range(self.root, None, Some(&key));
+
+        // A replaced play is always worth less, i.e. comes after the new one.
+        let after = match old {
+            Some(old) => {
+                let old = Key { pp: old, beatmap };
+
+                self.range(self.root, Some(&key), Some(&old))
+                    .then(self.range(self.root, Some(&old), None))
+            }
+            None => self.range(self.root, Some(&key), None),
+        };
+
+        let plays = self.len() + old.is_none() as u32;
+
+        before.then(Part::single(pp)).then(after).weighted + bonus_pp(plays)
+    }
+}
+
+impl TopPlays {
+    /// `None` if a play worth `pp` on `beatmap` would not make it into the
+    /// top list, otherwise the pp of the play it replaces, if any.
+    fn replaces(&self, beatmap: u64, pp: f64) -> Option<Option<f64>> {
+        if pp.is_nan() {
+            return None;
+        }
+
+        match self.plays.get(&beatmap) {
+            Some(&old) if old >= pp => None,
+            old => Some(old.copied()),
+        }
+    }
+
+    fn part(&self, node: u32) -> Part {
+        if node == NIL {
+            Part::default()
+        } else {
+            self.nodes[node as usize].part
+        }
+    }
+
+    fn update(&mut self, node: u32) {
+        let Node { key, left, right, .. } = self.nodes[node as usize];
+        let part = self.part(left).then(Part::single(key.pp)).then(self.part(right));
+        self.nodes[node as usize].part = part;
+    }
+
+    /// Aggregate of the plays strictly between `lo` and `hi` in the subtree of `node`.
+    fn range(&self, node: u32, lo: Option<&Key>, hi: Option<&Key>) -> Part {
+        if node == NIL {
+            return Part::default();
+        }
+
+        let n = &self.nodes[node as usize];
+
+        if lo.is_none() && hi.is_none() {
+            return n.part;
+        }
+
+        if lo.is_some_and(|lo| n.key.cmp(lo).is_le()) {
+            return self.range(n.right, lo, hi);
+        }
+
+        if hi.is_some_and(|hi| n.key.cmp(hi).is_ge()) {
+            return self.range(n.left, lo, hi);
+        }
+
+        self.range(n.left, lo, None)
+            .then(Part::single(n.key.pp))
+            .then(self.range(n.right, None, hi))
+    }
+
+    /// Split the subtree of `node` into the plays before `key` and the rest.
+    /// With `inclusive`, a play equal to `key` goes to the first part.
+    fn split(&mut self, node: u32, key: &Key, inclusive: bool) -> (u32, u32) {
+        if node == NIL {
+            return (NIL, NIL);
+        }
+
+        let ord = self.nodes[node as usize].key.cmp(key);
+
+        if ord.is_lt() || (inclusive && ord.is_eq()) {
+            let (left, right) = self.split(self.nodes[node as usize].right, key, inclusive);
+            self.nodes[node as usize].right = left;
+            self.update(node);
+
+            (node, right)
+        } else {
+            let (left, right) = self.split(self.nodes[node as usize].left, key, inclusive);
+            self.nodes[node as usize].left = right;
+            self.update(node);
+
+            (left, node)
+        }
+    }
+
+    /// Join two subtrees where all plays of `a` come before those of `b`.
+    fn merge(&mut self, a: u32, b: u32) -> u32 {
+        if a == NIL {
+            return b;
+        }
+
+        if b == NIL {
+            return a;
+        }
+
+        if self.nodes[a as usize].priority > self.nodes[b as usize].priority {
+            let right = self.merge(self.nodes[a as usize].right, b);
+            self.nodes[a as usize].right = right;
+            self.update(a);
+
+            a
+        } else {
+            let left = self.merge(a, self.nodes[b as usize].left);
+            self.nodes[b as usize].left = left;
+            self.update(b);
+
+            b
+        }
+    }
+
+    fn insert_key(&mut self, key: Key) {
+        let node = Node {
+            key,
+            priority: self.next_priority(),
+            left: NIL,
+            right: NIL,
+            part: Part::single(key.pp),
+        };
+
+        let index = match self.free.pop() {
+            Some(index) => {
+                self.nodes[index as usize] = node;
+                index
+            }
+            None => {
+                self.nodes.push(node);
+                (self.nodes.len() - 1) as u32
+            }
+        };
+
+        let (left, right) = self.split(self.root, &key, false);
+        let left = self.merge(left, index);
+        self.root = self.merge(left, right);
+    }
+
+    fn remove_key(&mut self, key: &Key) {
+        let (left, rest) = self.split(self.root, key, false);
+        let (removed, right) = self.split(rest, key, true);
+
+        if removed != NIL {
+            self.free.push(removed);
+        }
+
+        self.root = self.merge(left, right);
+    }
+
+    /// SplitMix64, priorities only need to look random to keep the treap balanced.
+    fn next_priority(&mut self) -> u64 {
+        self.seed = self.seed.wrapping_add(0x9E37_79B9_7F4A_7C15);
+
+        let mut z = self.seed;
+        z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+        z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+
+        z ^ (z >> 31)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Total of `plays` by sorting and weighting all of them.
+    fn brute_force(plays: &HashMap<u64, f64>) -> f64 {
+        let mut pp: Vec<f64> = plays.values().copied().collect();
+        pp.sort_unstable_by(|a, b| b.total_cmp(a));
+
+        let weighted: f64 = pp.iter().enumerate().map(|(i, pp)| pp * WEIGHT.powi(i as i32)).sum();
+
+        weighted + bonus_pp(pp.len() as u32)
+    }
+
+    fn assert_close(a: f64, b: f64) {
+        assert!((a - b).abs() <= 1e-9 * b.abs().max(1.0), "{a} != {b}");
+    }
+
+    #[test]
+    fn empty() {
+        let top = TopPlays::default();
+
+        assert_eq!(top.len(), 0);
+        assert_eq!(top.total(), 0.0);
+        assert_close(top.total_after_pp(1, 100.0), 100.0 + bonus_pp(1));
+    }
+
+    #[test]
+    fn keeps_best_play_per_beatmap() {
+        let mut top = TopPlays::default();
+
+        assert!(top.insert_pp(1, 100.0));
+        assert!(!top.insert_pp(1, 90.0));
+        assert!(!top.insert_pp(1, 100.0));
+        assert!(!top.insert_pp(2, f64::NAN));
+        assert_eq!(top.total_after_pp(1, 90.0), top.total());
+
+        assert!(top.insert_pp(1, 120.0));
+        assert_eq!(top.len(), 1);
+        assert_close(top.total(), 120.0 + bonus_pp(1));
+
+        assert!(top.remove(1));
+        assert!(!top.remove(1));
+        assert_eq!(top.total(), 0.0);
+    }
+
+    #[test]
+    fn matches_brute_force() {
+        let mut top = TopPlays::default();
+        let mut expected = HashMap::new();
+        let mut state = 0x1234_5678_u64;
+        let mut next = move || {
+            state ^= state << 13;
+            state ^= state >> 7;
+            state ^= state << 17;
+            state
+        };
+
+        for _ in 0..5000 {
+            let beatmap = next() % 300;
+            // Few distinct values so ties are common.
+            let pp = (next() % 400) as f64 / 2.0;
+
+            if next() % 8 == 0 {
+                assert_eq!(top.remove(beatmap), expected.remove(&beatmap).is_some());
+            } else {
+                let mut after = expected.clone();
+                let entry = after.entry(beatmap).or_insert(pp);
+                *entry = entry.max(pp);
+
+                assert_close(top.total_after_pp(beatmap, pp), brute_force(&after));
+                top.insert_pp(beatmap, pp);
+                expected = after;
+            }
+
+            assert_eq!(top.len() as usize, expected.len());
+            assert_close(top.total(), brute_force(&expected));
+        }
+    }
+}
@@ -0,0 +1,426 @@
+//! Streaming score recalculation.
+//!
+//! Reads score records as JSONL or CSV from files or stdin and writes one pp
+//! result per record, in input order, as JSONL or CSV to stdout.
+//!
+//! Records are processed in chunks so memory stays bounded no matter how
+//! long the input is. Within a chunk records are grouped by beatmap, every
+//! beatmap is scored on its own worker thread and every combination of mods,
+//! clock rate and lazer on it has its difficulty calculated once. Parsed
+//! beatmaps are kept in a bounded LRU cache across chunks.
+
+mod output;
+mod record;
+
+use std::{
+    collections::HashMap,
+    fs::File,
+    io::{self, BufReader, BufWriter},
+    num::NonZeroUsize,
+    path::{Path, PathBuf},
+    process::ExitCode,
+    sync::{Arc, Mutex, PoisonError},
+};
+
+use lru::LruCache;
+use output::{Output, ScoreResult};
+use rayon::prelude::*;
+use record::{Format, ScoreRecord};
+
+const USAGE: &str = "\
+Usage: rosu_pp_recalc [OPTIONS] [FILE]...
+
+Recalculate the pp of score records read from FILEs, or stdin if there are
+none or FILE is `-`, and write one result per record to stdout.
+
+Options:
+  --input <jsonl|csv>   Format of the input, defaults to the file extension
+                        or jsonl for stdin
+  --output <jsonl|csv>  Format of the output [default: jsonl]
+  --beatmaps <DIR>      Directory of `<beatmap_id>.osu` files [default: .]
+  --threads <N>         Worker threads, 0 uses one per logical core [default: 0]
+  --cache <N>           Parsed beatmaps to keep in memory [default: 256]
+  --chunk <N>           Records to read before calculating them [default: 65536]
+  -h, --help            Print this help
+";
+
+struct Args {
+    inputs: Vec<PathBuf>,
+    input: Option<Format>,
+    output: Format,
+    beatmaps: Option<PathBuf>,
+    /// `None` uses one thread per logical core.
+    threads: Option<NonZeroUsize>,
+    cache: usize,
+    chunk: usize,
+}
+
+impl Args {
+    fn parse(mut args: impl Iterator<Item = String>) -> Result<Option<Self>, String> {
+        let mut parsed = Self {
+            inputs: Vec::new(),
+            input: None,
+            output: Format::Jsonl,
+            beatmaps: None,
+            threads: None,
+            cache: 256,
+            chunk: 65536,
+        };
+
+        fn value(args: &mut impl Iterator<Item = String>, name: &str) -> Result<String, String> {
+            args.next()
+                .ok_or_else(|| format!("missing value for {name}"))
+        }
+
+        fn number(args: &mut impl Iterator<Item = String>, name: &str) -> Result<usize, String> {
+            let value = value(args, name)?;
+            value
+                .parse()
+                .map_err(|_| format!("invalid value for {name}: {value}"))
+        }
+
+        fn format(args: &mut impl Iterator<Item = String>, name: &str) -> Result<Format, String> {
+            let value = value(args, name)?;
+            Format::parse(&value).ok_or_else(|| format!("invalid value for {name}: {value}"))
+        }
+
+        while let Some(arg) = args.next() {
+            match arg.as_str() {
+                "-h" | "--help" => return Ok(None),
+                "--input" => parsed.input = Some(format(&mut args, &arg)?),
+                "--output" => parsed.output = format(&mut args, &arg)?,
+                "--beatmaps" => parsed.beatmaps = Some(value(&mut args, &arg)?.into()),
+                "--threads" => parsed.threads = NonZeroUsize::new(number(&mut args, &arg)?),
+                "--cache" => parsed.cache = number(&mut args, &arg)?,
+                "--chunk" => parsed.chunk = number(&mut args, &arg)?.max(1),
+                "-" => parsed.inputs.push(arg.into()),
+                _ if arg.starts_with('-') => return Err(format!("unknown option {arg}")),
+                _ => parsed.inputs.push(arg.into()),
+            }
+        }
+
+        Ok(Some(parsed))
+    }
+}
+
+/// Parsed beatmaps shared by all workers.
+struct Beatmaps {
+    cache: Option<Mutex<LruCache<PathBuf, Arc<rosu_pp::Beatmap>>>>,
+}
+
+impl Beatmaps {
+    fn new(capacity: usize) -> Self {
+        Self {
+            cache: NonZeroUsize::new(capacity).map(|capacity| Mutex::new(LruCache::new(capacity))),
+        }
+    }
+
+    /// Look up the beatmap at `path`, parsing and storing it on a miss.
+    ///
+    /// The lock is not held while parsing so workers don't serialize on it.
+    /// A poisoned lock is still used, the cache holds no invariants a
+    /// panicking worker could break.
+    fn get(&self, path: &Path) -> io::Result<Arc<rosu_pp::Beatmap>> {
+        if let Some(cache) = &self.cache {
+            if let Some(map) = cache.lock().unwrap_or_else(PoisonError::into_inner).get(path) {
+                return Ok(Arc::clone(map));
+            }
+        }
+
+        let map = Arc::new(rosu_pp::Beatmap::from_path(path)?);
+
+        if let Some(cache) = &self.cache {
+            cache.lock().unwrap_or_else(PoisonError::into_inner).put(path.to_owned(), Arc::clone(&map));
+        }
+
+        Ok(map)
+    }
+}
+
+/// Everything that determines the difficulty attributes of a score on a given beatmap.
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+struct DifficultyKey {
+    mods: String,
+    lazer: Option<bool>,
+    clock_rate: Option<u64>,
+}
+
+/// Score the records at `indices` of `chunk`, which are all on the beatmap at `path`.
+fn score_beatmap(
+    beatmaps: &Beatmaps,
+    path: &Path,
+    chunk: &[(u64, Result<ScoreRecord, String>)],
+    indices: &[usize],
+) -> Vec<(usize, ScoreResult)> {
+    let map = match beatmaps.get(path) {
+        Ok(map) => map,
+        Err(e) => {
+            let error = format!("failed to load {}: {e}", path.display());
+
+            return indices
+                .iter()
+                .map(|&i| {
+                    let (index, record) = &chunk[i];
+                    let id = record.as_ref().ok().and_then(|record| record.id);
+
+                    (i, ScoreResult::failed(*index, id, error.as_str()))
+                })
+                .collect();
+        }
+    };
+
+    let mut difficulties: HashMap<DifficultyKey, rosu_pp::any::DifficultyAttributes> =
+        HashMap::new();
+
+    indices
+        .iter()
+        .map(|&i| {
+            let (index, record) = &chunk[i];
+            let record = record.as_ref().expect("only valid records are grouped");
+            let mods = record
+                .mods
+                .as_ref()
+                .map(record::Mods::intermode)
+                .unwrap_or_default();
+
+            let key = DifficultyKey {
+                mods: format!("{mods:?}"),
+                lazer: record.lazer,
+                clock_rate: record.clock_rate.map(f64::to_bits),
+            };
+
+            let attrs = difficulties.entry(key).or_insert_with(|| {
+                let mut difficulty = rosu_pp::Difficulty::new().mods(&mods);
+
+                if let Some(lazer) = record.lazer {
+                    difficulty = difficulty.lazer(lazer);
+                }
+
+                if let Some(clock_rate) = record.clock_rate {
+                    difficulty = difficulty.clock_rate(clock_rate);
+                }
+
+                difficulty.calculate(&map)
+            });
+
+            let attrs = performance(attrs.clone(), &mods, record).calculate();
+
+            (i, ScoreResult::new(*index, record.id, &attrs))
+        })
+        .collect()
+}
+
+fn performance<'a>(
+    attrs: rosu_pp::any::DifficultyAttributes,
+    mods: &rosu_mods::GameModsIntermode,
+    record: &ScoreRecord,
+) -> rosu_pp::Performance<'a> {
+    let mut perf = rosu_pp::Performance::new(attrs).mods(mods);
+
+    let ScoreRecord {
+        id: _,
+        path: _,
+        beatmap_id: _,
+        mods: _,
+        lazer,
+        clock_rate,
+        accuracy,
+        combo,
+        n300,
+        n100,
+        n50,
+        n_geki,
+        n_katu,
+        misses,
+        large_tick_hits,
+        small_tick_hits,
+        slider_end_hits,
+    } = *record;
+
+    if let Some(lazer) = lazer {
+        perf = perf.lazer(lazer);
+    }
+
+    if let Some(clock_rate) = clock_rate {
+        perf = perf.clock_rate(clock_rate);
+    }
+
+    if let Some(accuracy) = accuracy {
+        perf = perf.accuracy(accuracy);
+    }
+
+    if let Some(combo) = combo {
+        perf = perf.combo(combo);
+    }
+
+    if let Some(misses) = misses {
+        perf = perf.misses(misses);
+    }
+
+    if let Some(large_tick_hits) = large_tick_hits {
+        perf = perf.large_tick_hits(large_tick_hits);
+    }
+
+    if let Some(small_tick_hits) = small_tick_hits {
+        perf = perf.small_tick_hits(small_tick_hits);
+    }
+
+    if let Some(slider_end_hits) = slider_end_hits {
+        perf = perf.slider_end_hits(slider_end_hits);
+    }
+
+    if let Some(n300) = n300 {
+        perf = perf.n300(n300);
+    }
+
+    if let Some(n100) = n100 {
+        perf = perf.n100(n100);
+    }
+
+    if let Some(n50) = n50 {
+        perf = perf.n50(n50);
+    }
+
+    if let Some(n_katu) = n_katu {
+        perf = perf.n_katu(n_katu);
+    }
+
+    if let Some(n_geki) = n_geki {
+        perf = perf.n_geki(n_geki);
+    }
+
+    perf
+}
+
+/// Score a chunk of records, returning their results in the same order.
+fn score_chunk(
+    chunk: &[(u64, Result<ScoreRecord, String>)],
+    beatmaps: &Beatmaps,
+    beatmap_dir: Option<&Path>,
+) -> Vec<ScoreResult> {
+    let mut results: Vec<Option<ScoreResult>> = vec![None; chunk.len()];
+    let mut groups: HashMap<PathBuf, Vec<usize>> = HashMap::new();
+
+    for (i, (index, record)) in chunk.iter().enumerate() {
+        match record {
+            Ok(record) => match record.beatmap_path(beatmap_dir) {
+                Some(path) => groups.entry(path).or_default().push(i),
+                None => {
+                    results[i] = Some(ScoreResult::failed(
+                        *index,
+                        record.id,
+                        "missing path or beatmap_id",
+                    ))
+                }
+            },
+            Err(e) => results[i] = Some(ScoreResult::failed(*index, None, e.as_str())),
+        }
+    }
+
+    let scored: Vec<(usize, ScoreResult)> = groups
+        .par_iter()
+        .flat_map_iter(|(path, indices)| score_beatmap(beatmaps, path, chunk, indices))
+        .collect();
+
+    for (i, result) in scored {
+        results[i] = Some(result);
+    }
+
+    results
+        .into_iter()
+        .map(|result| result.expect("every record is scored"))
+        .collect()
+}
+
+fn run(args: Args) -> Result<(), String> {
+    if let Some(threads) = args.threads {
+        rayon::ThreadPoolBuilder::new()
+            .num_threads(threads.get())
+            .build_global()
+            .map_err(|e| e.to_string())?;
+    }
+
+    let inputs = if args.inputs.is_empty() {
+        vec![PathBuf::from("-")]
+    } else {
+        args.inputs
+    };
+
+    if inputs
+        .iter()
+        .filter(|input| input.as_os_str() == "-")
+        .count()
+        > 1
+    {
+        return Err("stdin can only be read once".to_owned());
+    }
+
+    let mut records: Vec<record::Records> = Vec::with_capacity(inputs.len());
+
+    for input in &inputs {
+        if input.as_os_str() == "-" {
+            let format = args.input.unwrap_or(Format::Jsonl);
+            records.push(record::read(io::stdin().lock(), format));
+        } else {
+            let format = args
+                .input
+                .or_else(|| Format::of_path(input))
+                .ok_or_else(|| format!("unknown format of {}, use --input", input.display()))?;
+            let file = File::open(input)
+                .map_err(|e| format!("failed to open {}: {e}", input.display()))?;
+            records.push(record::read(BufReader::new(file), format));
+        }
+    }
+
+    let mut records = records.into_iter().flatten().zip(0..);
+    let beatmaps = Beatmaps::new(args.cache);
+    let mut output = Output::new(BufWriter::new(io::stdout().lock()), args.output);
+    let mut chunk = Vec::with_capacity(args.chunk.min(65536));
+
+    loop {
+        chunk.clear();
+        chunk.extend(
+            records
+                .by_ref()
+                .take(args.chunk)
+                .map(|(record, index)| (index, record)),
+        );
+
+        if chunk.is_empty() {
+            break;
+        }
+
+        for result in score_chunk(&chunk, &beatmaps, args.beatmaps.as_deref()) {
+            output.write(&result).map_err(|e| e.to_string())?;
+        }
+
+        output.flush().map_err(|e| e.to_string())?;
+    }
+
+    Ok(())
+}
+
+fn main() -> ExitCode {
+    let args = match Args::parse(std::env::args().skip(1)) {
+        Ok(Some(args)) => args,
+        Ok(None) => {
+            print!("{USAGE}");
+
+            return ExitCode::SUCCESS;
+        }
+        Err(e) => {
+            eprintln!("error: {e}\n\n{USAGE}");
+
+            return ExitCode::from(2);
+        }
+    };
+
+    match run(args) {
+        Ok(()) => ExitCode::SUCCESS,
+        Err(e) => {
+            eprintln!("error: {e}");
+
+            ExitCode::FAILURE
+        }
+    }
+}
@@ -0,0 +1,99 @@
+use std::io::{self, Write};
+
+use serde::Serialize;
+
+use crate::record::Format;
+
+/// Result of the record at position `index` of the input, counting across
+/// all input files.
+#[derive(Clone, Debug, Default, Serialize)]
+pub struct ScoreResult {
+    pub index: u64,
+    pub id: Option<u64>,
+    pub pp: Option<f64>,
+    pub stars: Option<f64>,
+    pub pp_aim: Option<f64>,
+    pub pp_jump_aim: Option<f64>,
+    pub pp_flow_aim: Option<f64>,
+    pub pp_precision: Option<f64>,
+    pub pp_speed: Option<f64>,
+    pub pp_stamina: Option<f64>,
+    pub pp_acc: Option<f64>,
+    pub pp_difficulty: Option<f64>,
+    pub error: Option<String>,
+}
+
+impl ScoreResult {
+    pub fn failed(index: u64, id: Option<u64>, error: impl Into<String>) -> Self {
+        Self {
+            index,
+            id,
+            error: Some(error.into()),
+            ..Default::default()
+        }
+    }
+
+    pub fn new(index: u64, id: Option<u64>, attrs: &rosu_pp::any::PerformanceAttributes) -> Self {
+        let mut result = Self {
+            index,
+            id,
+            pp: Some(attrs.pp()),
+            stars: Some(attrs.stars()),
+            ..Default::default()
+        };
+
+        match attrs {
+            rosu_pp::any::PerformanceAttributes::Osu(a) => {
+                result.pp_aim = Some(a.pp_aim);
+                result.pp_jump_aim = Some(a.pp_jump_aim);
+                result.pp_flow_aim = Some(a.pp_flow_aim);
+                result.pp_precision = Some(a.pp_precision);
+                result.pp_speed = Some(a.pp_speed);
+                result.pp_stamina = Some(a.pp_stamina);
+                result.pp_acc = Some(a.pp_acc);
+            }
+            rosu_pp::any::PerformanceAttributes::Taiko(a) => {
+                result.pp_acc = Some(a.pp_acc);
+                result.pp_difficulty = Some(a.pp_difficulty);
+            }
+            rosu_pp::any::PerformanceAttributes::Catch(_) => {}
+            rosu_pp::any::PerformanceAttributes::Mania(a) => {
+                result.pp_difficulty = Some(a.pp_difficulty);
+            }
+        }
+
+        result
+    }
+}
+
+/// Writes results in the order they're given.
+pub enum Output<W: Write> {
+    Jsonl(W),
+    Csv(csv::Writer<W>),
+}
+
+impl<W: Write> Output<W> {
+    pub fn new(writer: W, format: Format) -> Self {
+        match format {
+            Format::Jsonl => Self::Jsonl(writer),
+            Format::Csv => Self::Csv(csv::Writer::from_writer(writer)),
+        }
+    }
+
+    pub fn write(&mut self, result: &ScoreResult) -> io::Result<()> {
+        match self {
+            Output::Jsonl(writer) => {
+                serde_json::to_writer(&mut *writer, result)?;
+                writer.write_all(b"\n")
+            }
+            Output::Csv(writer) => writer.serialize(result).map_err(io::Error::other),
+        }
+    }
+
+    pub fn flush(&mut self) -> io::Result<()> {
+        match self {
+            Output::Jsonl(writer) => writer.flush(),
+            Output::Csv(writer) => writer.flush(),
+        }
+    }
+}
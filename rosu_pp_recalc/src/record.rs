@@ -0,0 +1,112 @@
+use std::{
+    io::BufRead,
+    path::{Path, PathBuf},
+};
+
+use rosu_mods::GameModsIntermode;
+use serde::Deserialize;
+
+/// Format of the score records read from an input.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum Format {
+    /// One JSON object per line.
+    Jsonl,
+    /// Comma separated with a header row naming the fields.
+    Csv,
+}
+
+impl Format {
+    pub fn parse(s: &str) -> Option<Self> {
+        match s {
+            "jsonl" | "json" => Some(Self::Jsonl),
+            "csv" => Some(Self::Csv),
+            _ => None,
+        }
+    }
+
+    /// Guess the format of a file from its extension.
+    pub fn of_path(path: &Path) -> Option<Self> {
+        Self::parse(&path.extension()?.to_str()?.to_ascii_lowercase())
+    }
+}
+
+/// Mods of a score, either legacy bits or acronyms like `"HDDT"`.
+#[derive(Clone, Debug, Deserialize)]
+#[serde(untagged)]
+pub enum Mods {
+    Bits(u32),
+    Acronyms(String),
+}
+
+impl Mods {
+    pub fn intermode(&self) -> GameModsIntermode {
+        match self {
+            Mods::Bits(bits) => GameModsIntermode::from_bits(*bits),
+            Mods::Acronyms(acronyms) => GameModsIntermode::from_acronyms(acronyms),
+        }
+    }
+}
+
+/// A single score to recalculate. Every statistic is optional, missing ones
+/// are filled in the same way as by `rosu_pp::Performance`.
+#[derive(Clone, Debug, Default, Deserialize)]
+pub struct ScoreRecord {
+    /// Passed through to the output to match results up with their scores.
+    pub id: Option<u64>,
+    /// Path of the `.osu` file.
+    pub path: Option<PathBuf>,
+    /// Looked up as `<id>.osu` in the beatmap directory if there's no `path`.
+    pub beatmap_id: Option<u32>,
+    pub mods: Option<Mods>,
+    pub lazer: Option<bool>,
+    pub clock_rate: Option<f64>,
+    pub accuracy: Option<f64>,
+    pub combo: Option<u32>,
+    pub n300: Option<u32>,
+    pub n100: Option<u32>,
+    pub n50: Option<u32>,
+    pub n_geki: Option<u32>,
+    pub n_katu: Option<u32>,
+    pub misses: Option<u32>,
+    pub large_tick_hits: Option<u32>,
+    pub small_tick_hits: Option<u32>,
+    pub slider_end_hits: Option<u32>,
+}
+
+impl ScoreRecord {
+    /// Path of the score's beatmap, `None` if the record names none.
+    pub fn beatmap_path(&self, beatmaps: Option<&Path>) -> Option<PathBuf> {
+        if let Some(path) = &self.path {
+            return Some(path.clone());
+        }
+
+        let id = self.beatmap_id?;
+
+        Some(beatmaps.unwrap_or(Path::new(".")).join(format!("{id}.osu")))
+    }
+}
+
+pub type Records<'a> = Box<dyn Iterator<Item = Result<ScoreRecord, String>> + 'a>;
+
+/// Lazily read records from `reader`. A record that can't be read is
+/// yielded as an error and doesn't stop the rest of the input.
+pub fn read<'a>(reader: impl BufRead + 'a, format: Format) -> Records<'a> {
+    match format {
+        Format::Jsonl => Box::new(
+            reader
+                .lines()
+                .filter(|line| !matches!(line, Ok(line) if line.trim().is_empty()))
+                .map(|line| {
+                    let line = line.map_err(|e| e.to_string())?;
+                    serde_json::from_str(&line).map_err(|e| format!("invalid record: {e}"))
+                }),
+        ),
+        Format::Csv => Box::new(
+            csv::ReaderBuilder::new()
+                .trim(csv::Trim::All)
+                .from_reader(reader)
+                .into_deserialize()
+                .map(|record| record.map_err(|e| format!("invalid record: {e}"))),
+        ),
+    }
+}